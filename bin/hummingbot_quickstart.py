@@ -8,9 +8,10 @@ import os
 import pwd
 import subprocess
 from pathlib import Path
-from typing import Coroutine, List
+from typing import Coroutine, List, Optional, Set
 
 import path_util  # noqa: F401
+import yaml
 
 from bin.hummingbot import UIStartListener, detect_available_port
 from hummingbot import init_logging
@@ -25,7 +26,7 @@ from hummingbot.client.config.config_helpers import (
 )
 from hummingbot.client.config.security import Security
 from hummingbot.client.hummingbot_application import HummingbotApplication
-from hummingbot.client.settings import STRATEGIES_CONF_DIR_PATH, AllConnectorSettings
+from hummingbot.client.settings import SCRIPT_STRATEGY_CONF_DIR_PATH, STRATEGIES_CONF_DIR_PATH, AllConnectorSettings
 from hummingbot.client.ui import login_prompt
 from hummingbot.client.ui.style import load_style
 from hummingbot.core.event.events import HummingbotUIEvent
@@ -75,6 +76,36 @@ def autofix_permissions(user_group_spec: str):
     os.setuid(uid)
 
 
+def _config_values(config) -> Set[str]:
+    if isinstance(config, dict):
+        return set().union(*(_config_values(value) for value in config.values()))
+    if isinstance(config, list):
+        return set().union(*(_config_values(value) for value in config))
+    return {config} if isinstance(config, str) else set()
+
+
+def connector_names_to_decrypt(args: argparse.Namespace) -> Optional[Set[str]]:
+    """
+    Returns the names that can refer to a connector in the strategy (or script) config file of the quickstart, so
+    that only those connector configs are decrypted at login. The other connector configs are decrypted when they are
+    requested. Returns None, to decrypt all the configs, when the config file does not list the connectors.
+    """
+    config_file_name = args.config_file_name
+    if config_file_name is None:
+        return None
+    if config_file_name.split(".")[-1] == "py":
+        if not args.script_conf:
+            return None
+        config_path = SCRIPT_STRATEGY_CONF_DIR_PATH / args.script_conf
+    else:
+        config_path = STRATEGIES_CONF_DIR_PATH / config_file_name
+    try:
+        with open(config_path) as config_file:
+            return _config_values(yaml.safe_load(config_file))
+    except Exception:
+        return None
+
+
 async def quick_start(args: argparse.Namespace, secrets_manager: BaseSecretsManager):
     config_file_name = args.config_file_name
     client_config_map = load_client_config_map_from_file()
@@ -82,7 +113,7 @@ async def quick_start(args: argparse.Namespace, secrets_manager: BaseSecretsMana
     if args.auto_set_permissions is not None:
         autofix_permissions(args.auto_set_permissions)
 
-    if not Security.login(secrets_manager):
+    if not Security.login(secrets_manager, connector_names=connector_names_to_decrypt(args)):
         logging.getLogger().error("Invalid password.")
         return
 
@@ -63,6 +63,9 @@ client_configs_to_display = ["autofill_import",
                              "mqtt_notifier",
                              "mqtt_commands",
                              "mqtt_events",
+                             "mqtt_events_batch_interval",
+                             "mqtt_events_batch_size",
+                             "mqtt_events_batch_compression",
                              "mqtt_external_events",
                              "mqtt_autostart",
                              "instance_id",
@@ -71,6 +74,8 @@ client_configs_to_display = ["autofill_import",
                              "gateway",
                              "gateway_api_host",
                              "gateway_api_port",
+                             "gateway_price_cache_ttl",
+                             "gateway_max_connections",
                              "rate_oracle_source",
                              "extra_tokens",
                              "fetch_pairs_from_all_exchanges",
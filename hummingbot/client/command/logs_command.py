@@ -0,0 +1,25 @@
+import re
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from hummingbot.client.hummingbot_application import HummingbotApplication  # noqa: F401
+
+
+class LogsCommand:
+    def logs(self,  # type: HummingbotApplication
+             pattern: str,
+             max_results: int = 100):
+        if threading.current_thread() != threading.main_thread():
+            self.ev_loop.call_soon_threadsafe(self.logs, pattern, max_results)
+            return
+        try:
+            matches = self.app.log_field.log_buffer.search(pattern, max_results=max_results)
+        except re.error as e:
+            self.notify(f"\nInvalid search pattern {pattern}: {e}")
+            return
+        if len(matches) == 0:
+            self.notify(f"\nNo log lines match {pattern}.")
+            return
+        lines = [f"\n  Log lines matching {pattern}:"] + [f"    {line}" for line in matches]
+        self.notify("\n".join(lines))
@@ -15,10 +15,12 @@ from hummingbot.client.config.config_helpers import (
 )
 from hummingbot.client.config.security import Security
 from hummingbot.client.settings import ethereum_wallet_required, required_exchanges
+from hummingbot.client.ui.live_status_renderer import LiveStatusRenderer
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.logger.application_warning import ApplicationWarning
+from hummingbot.strategy.status_model import StatusModel
 from hummingbot.user.user_balances import UserBalances
 
 if TYPE_CHECKING:
@@ -67,11 +69,16 @@ class StatusCommand:
 
         return "\n".join(lines)
 
-    async def strategy_status(self, live: bool = False):
+    def _paper_trade_status(self,  # type: HummingbotApplication
+                            ) -> str:
         active_paper_exchanges = [exchange for exchange in self.markets.keys() if exchange.endswith("paper_trade")]
 
         paper_trade = "\n  Paper Trading Active: All orders are simulated, and no real orders are placed." if len(active_paper_exchanges) > 0 \
             else ""
+        return paper_trade
+
+    async def strategy_status(self, live: bool = False):
+        paper_trade = self._paper_trade_status()
         if asyncio.iscoroutinefunction(self.strategy.format_status):
             st_status = await self.strategy.format_status()
         else:
@@ -79,6 +86,31 @@ class StatusCommand:
         status = paper_trade + "\n" + st_status
         return status
 
+    async def _live_status_from_model(self,  # type: HummingbotApplication
+                                      status_model: StatusModel):
+        """
+        Displays the status published by the strategy, refreshing the output only when it changes. As in
+        `cls_display_delay`, each frame is logged after saving the output to the undo stack, and undone before the next
+        frame is logged.
+        """
+        renderer = LiveStatusRenderer()
+        output_buffer = self.app.output_field.buffer
+        frame_displayed = False
+        try:
+            while self.app.live_updates and self.strategy:
+                frame = renderer.render(status_model)
+                if frame is not None:
+                    if frame_displayed:
+                        output_buffer.undo()
+                    output_buffer.save_to_undo_stack()
+                    self.app.log(self._paper_trade_status() + "\n" + frame.text + "\n\n Press escape key to stop update.",
+                                 save_log=False)
+                    frame_displayed = True
+                await asyncio.sleep(renderer.min_refresh_interval)
+        finally:
+            if frame_displayed:
+                output_buffer.undo()
+
     def application_warning(self):
         # Application warnings.
         self._expire_old_application_warnings()
@@ -138,10 +170,14 @@ class StatusCommand:
             if live:
                 await self.stop_live_update()
                 self.app.live_updates = True
-                while self.app.live_updates and self.strategy:
-                    await self.cls_display_delay(
-                        await self.strategy_status(live=True) + "\n\n Press escape key to stop update.", 0.1
-                    )
+                status_model = getattr(self.strategy, "status_model", None)
+                if status_model is not None and not status_model.is_empty():
+                    await self._live_status_from_model(status_model)
+                else:
+                    while self.app.live_updates and self.strategy:
+                        await self.cls_display_delay(
+                            await self.strategy_status(live=True) + "\n\n Press escape key to stop update.", 0.1
+                        )
                 self.app.live_updates = False
                 self.notify("Stopped live status display update.")
             else:
@@ -120,6 +120,33 @@ class MQTTBridgeConfigMap(BaseClientModel):
             ),
         ),
     )
+    mqtt_events_batch_interval: float = Field(
+        default=0.0,
+        ge=0.0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Seconds to buffer market events before forwarding them to the MQTT broker as a single"
+                " batch message (0 forwards each event on its own)"
+            ),
+        ),
+    )
+    mqtt_events_batch_size: int = Field(
+        default=100,
+        ge=1,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Maximum number of market events per MQTT batch message"
+            ),
+        ),
+    )
+    mqtt_events_batch_compression: bool = Field(
+        default=False,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Enable/Disable compression of the MQTT market events batch messages"
+            ),
+        ),
+    )
     mqtt_external_events: bool = Field(
         default=True,
         client_data=ClientFieldData(
@@ -316,6 +343,15 @@ class PaperTradeConfigMap(BaseClientModel):
             ),
         ),
     )
+    paper_trade_queue_simulation: bool = Field(
+        default=False,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Would you like paper trade limit orders to wait behind the order book volume at their price level and"
+                " fill partially from trades? (Yes/No)"
+            ),
+        ),
+    )
 
     @validator("paper_trade_account_balance", pre=True)
     def validate_paper_trade_account_balance(cls, v: Union[str, Dict[str, float]]):
@@ -512,6 +548,23 @@ class GatewayConfigMap(BaseClientModel):
             prompt=lambda cm: "Please enter your Gateway API port",
         ),
     )
+    gateway_price_cache_ttl: float = Field(
+        default=0.0,
+        ge=0.0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Seconds to reuse the prices quoted by Gateway, up to the block time of the chain"
+                " (0 disables the cache)"
+            ),
+        ),
+    )
+    gateway_max_connections: int = Field(
+        default=0,
+        ge=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Maximum number of concurrent connections to Gateway (0 for no limit)",
+        ),
+    )
 
     class Config:
         title = "gateway"
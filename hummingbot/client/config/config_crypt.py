@@ -1,6 +1,10 @@
 import binascii
+import hashlib
+import hmac
 import json
+import threading
 from abc import ABC, abstractmethod
+from typing import Any, Dict
 
 from eth_account import Account
 from eth_keyfile.keyfile import (
@@ -11,19 +15,34 @@ from eth_keyfile.keyfile import (
     _pbkdf2_hash,
     _scrypt_hash,
     big_endian_to_int,
+    decrypt_aes_ctr,
     encode_hex_no_prefix,
     encrypt_aes_ctr,
     get_default_work_factor_for_kdf,
     int_to_big_endian,
     keccak,
 )
+from eth_utils import decode_hex
 from pydantic import SecretStr
 
 from hummingbot.client.settings import CONF_DIR_PATH
 
+try:
+    from eth_keyfile.keyfile import _derive_pbkdf_key, _derive_scrypt_key
+except ImportError:  # pragma: no cover
+    # The key derivation helpers are private to eth_keyfile. Without them the secrets are decrypted by eth_account,
+    # which works the same way but does not cache the derived keys.
+    _derive_pbkdf_key = _derive_scrypt_key = None
+
 PASSWORD_VERIFICATION_WORD = "HummingBot"
 PASSWORD_VERIFICATION_PATH = CONF_DIR_PATH / ".password_verification"
 
+# Keys derived from the password are kept for the lifetime of the process, so that decrypting the same secret again
+# (e.g. when the connector configs are reloaded) does not repeat the deliberately slow key derivation. The cache is
+# keyed by a digest of the password and the key derivation parameters, the password itself is never stored.
+_derived_keys_cache: Dict[str, bytes] = {}
+_derived_keys_cache_lock = threading.Lock()
+
 
 class BaseSecretsManager(ABC):
     def __init__(self, password: str):
@@ -56,8 +75,8 @@ class ETHKeyFileSecretManger(BaseSecretsManager):
     def decrypt_secret_value(self, attr: str, value: str) -> str:
         if self._password is None:
             raise ValueError(f"Could not decrypt secret attribute {attr} because no password was provided.")
-        value = binascii.unhexlify(value)
-        decrypted_value = Account.decrypt(value.decode(), self._password).decode()
+        keyfile_json = json.loads(binascii.unhexlify(value).decode())
+        decrypted_value = _decrypt_v3_keyfile_json(keyfile_json, self._password).decode()
         return decrypted_value
 
 
@@ -80,6 +99,61 @@ def validate_password(secrets_manager: BaseSecretsManager) -> bool:
     return valid
 
 
+def clear_derived_keys_cache():
+    with _derived_keys_cache_lock:
+        _derived_keys_cache.clear()
+
+
+def _derived_key_cache_key(kdf: str, kdfparams: Dict[str, Any], password: str) -> str:
+    # The salt of the key derivation parameters is unique per secret, so the digest can not be looked up in a
+    # precomputed table
+    digest = hashlib.sha256()
+    digest.update(json.dumps(kdfparams, sort_keys=True).encode())
+    digest.update(kdf.encode())
+    digest.update(password.encode())
+    return digest.hexdigest()
+
+
+def _derive_key(kdf: str, kdfparams: Dict[str, Any], password: str) -> bytes:
+    if kdf == "pbkdf2":
+        derived_key = _derive_pbkdf_key(kdfparams, password.encode())
+    elif kdf == "scrypt":
+        derived_key = _derive_scrypt_key(kdfparams, password.encode())
+    else:
+        raise TypeError(f"Unsupported key derivation function: {kdf}")
+    return derived_key
+
+
+def _decrypt_v3_keyfile_json(keyfile_json: Dict[str, Any], password: str) -> bytes:
+    """
+    Decrypt a message encrypted with _create_v3_keyfile_json.
+    This is the same process followed by eth_keyfile.keyfile.decode_keyfile_json, but the derived keys are cached.
+    """
+    if _derive_pbkdf_key is None or _derive_scrypt_key is None:
+        return Account.decrypt(keyfile_json, password)
+
+    crypto = keyfile_json["crypto"]
+    kdf = crypto["kdf"]
+    cache_key = _derived_key_cache_key(kdf, crypto["kdfparams"], password)
+    with _derived_keys_cache_lock:
+        derived_key = _derived_keys_cache.get(cache_key)
+    if derived_key is None:
+        derived_key = _derive_key(kdf, crypto["kdfparams"], password)
+
+    ciphertext = decode_hex(crypto["ciphertext"])
+    mac = keccak(derived_key[16:32] + ciphertext)
+    expected_mac = decode_hex(crypto["mac"])
+    if not hmac.compare_digest(mac, expected_mac):
+        raise ValueError("MAC mismatch")
+    # only the keys derived from the right password are kept
+    with _derived_keys_cache_lock:
+        _derived_keys_cache[cache_key] = derived_key
+
+    encrypt_key = derived_key[:16]
+    iv = big_endian_to_int(decode_hex(crypto["cipherparams"]["iv"]))
+    return decrypt_aes_ctr(ciphertext, encrypt_key, iv)
+
+
 def _create_v3_keyfile_json(message_to_encrypt, password, kdf="pbkdf2", work_factor=None):
     """
     Encrypt message by a given password.
@@ -1,7 +1,8 @@
 import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from hummingbot.client.config.config_crypt import PASSWORD_VERIFICATION_PATH, BaseSecretsManager, validate_password
 from hummingbot.client.config.config_helpers import (
@@ -23,7 +24,9 @@ from hummingbot.logger import HummingbotLogger
 class Security:
     __instance = None
     secrets_manager: Optional[BaseSecretsManager] = None
+    decryption_max_workers: int = 8
     _secure_configs = {}
+    _all_configs_decrypted: bool = False
     _decryption_done = asyncio.Event()
 
     _logger: Optional[HummingbotLogger] = None
@@ -48,27 +51,66 @@ class Security:
         return connector_configs_path.exists()
 
     @classmethod
-    def login(cls, secrets_manager: BaseSecretsManager) -> bool:
+    def login(cls, secrets_manager: BaseSecretsManager, connector_names: Optional[Iterable[str]] = None) -> bool:
+        """
+        :param secrets_manager: the secrets manager holding the password
+        :param connector_names: if provided, only the configs of these connectors are decrypted after the login. The
+        other connector configs are decrypted the first time they are requested.
+        """
         if not validate_password(secrets_manager):
             return False
         cls.secrets_manager = secrets_manager
-        coro = AsyncCallScheduler.shared_instance().call_async(cls.decrypt_all, timeout_seconds=30)
+        coro = AsyncCallScheduler.shared_instance().call_async(
+            cls.decrypt_all, connector_names, timeout_seconds=30
+        )
         safe_ensure_future(coro)
         return True
 
     @classmethod
-    def decrypt_all(cls):
+    def decrypt_all(cls, connector_names: Optional[Iterable[str]] = None):
+        """
+        Decrypts the connector config files in parallel. Each decryption spends most of its time in the password key
+        derivation, which releases the GIL, so a thread pool is enough to use all the available cores.
+
+        :param connector_names: if provided, only the configs of these connectors are decrypted
+        """
         cls._secure_configs.clear()
         cls._decryption_done.clear()
         encrypted_files = list_connector_configs()
-        for file in encrypted_files:
-            cls.decrypt_connector_config(file)
+        if connector_names is not None:
+            connector_names = set(connector_names)
+            encrypted_files = [file for file in encrypted_files if file.stem in connector_names]
+        cls._secure_configs.update(cls._decrypt_connector_configs(encrypted_files))
+        cls._all_configs_decrypted = connector_names is None
         cls._decryption_done.set()
 
     @classmethod
     def decrypt_connector_config(cls, file_path: Path):
+        connector_name, config_map = cls._load_connector_config(file_path)
+        cls._secure_configs[connector_name] = config_map
+
+    @classmethod
+    def _decrypt_connector_configs(cls, file_paths: List[Path]) -> Dict[str, ClientConfigAdapter]:
+        if len(file_paths) <= 1:
+            results = [cls._load_connector_config(file_path) for file_path in file_paths]
+        else:
+            with ThreadPoolExecutor(max_workers=min(len(file_paths), cls.decryption_max_workers)) as executor:
+                results = list(executor.map(cls._load_connector_config, file_paths))
+        return dict(results)
+
+    @staticmethod
+    def _load_connector_config(file_path: Path) -> Tuple[str, ClientConfigAdapter]:
         connector_name = connector_name_from_file(file_path)
-        cls._secure_configs[connector_name] = load_connector_config_map_from_file(file_path)
+        return connector_name, load_connector_config_map_from_file(file_path)
+
+    @classmethod
+    def _decrypt_remaining_configs(cls):
+        if not cls._all_configs_decrypted and cls.secrets_manager is not None:
+            remaining_files = [
+                file for file in list_connector_configs() if file.stem not in cls._secure_configs
+            ]
+            cls._secure_configs.update(cls._decrypt_connector_configs(remaining_files))
+            cls._all_configs_decrypted = True
 
     @classmethod
     def update_secure_config(cls, connector_config: ClientConfigAdapter):
@@ -91,10 +133,16 @@ class Security:
 
     @classmethod
     def decrypted_value(cls, key: str) -> Optional[ClientConfigAdapter]:
+        if (key not in cls._secure_configs
+                and not cls._all_configs_decrypted
+                and cls.secrets_manager is not None
+                and cls.connector_config_file_exists(key)):
+            cls.decrypt_connector_config(get_connector_config_yml_path(key))
         return cls._secure_configs.get(key, None)
 
     @classmethod
     def all_decrypted_values(cls) -> Dict[str, ClientConfigAdapter]:
+        cls._decrypt_remaining_configs()
         return cls._secure_configs.copy()
 
     @classmethod
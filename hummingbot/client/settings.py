@@ -1,16 +1,19 @@
+import hashlib
 import importlib
 import json
+import logging
+import os
 from decimal import Decimal
 from enum import Enum
 from os import DirEntry, scandir
-from os.path import exists, join, realpath
+from os.path import exists, getmtime, join, realpath
 from types import ModuleType
-from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Set, Union, cast
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, NamedTuple, Optional, Set, Tuple, Union, cast
 
 from pydantic import SecretStr
 
-from hummingbot import get_strategy_list, root_path
-from hummingbot.core.data_type.trade_fee import TradeFeeSchema
+from hummingbot import data_path, get_strategy_list, root_path
+from hummingbot.core.data_type.trade_fee import TokenAmount, TradeFeeSchema
 from hummingbot.core.utils.gateway_config_utils import SUPPORTED_CHAINS
 
 if TYPE_CHECKING:
@@ -57,6 +60,7 @@ GATEAWAY_CLIENT_CERT_PATH = DEFAULT_GATEWAY_CERTS_PATH / "client_cert.pem"
 GATEAWAY_CLIENT_KEY_PATH = DEFAULT_GATEWAY_CERTS_PATH / "client_key.pem"
 
 CONNECTOR_SUBMODULES_THAT_ARE_NOT_CEX_TYPES = ["test_support", "utilities", "gateway"]
+CONNECTOR_MANIFEST_FILE_NAME = "connector_manifest.json"
 
 
 class ConnectorType(Enum):
@@ -358,77 +362,68 @@ class ConnectorSetting(NamedTuple):
         return self.type.name.lower()
 
 
+class ConnectorConfigKeysLoader:
+    """
+    Placeholder for the config keys of a connector registered from the connector manifest. The connector utils module
+    (and with it the connector dependencies) is only imported the first time the keys are requested.
+    """
+
+    def __init__(self, util_module_path: str, domain: Optional[str] = None):
+        self.util_module_path = util_module_path
+        self.domain = domain
+        self._loaded = False
+        self._config_keys: Optional["BaseConnectorConfigMap"] = None
+
+    def load(self) -> Optional["BaseConnectorConfigMap"]:
+        if not self._loaded:
+            util_module = importlib.import_module(self.util_module_path)
+            if self.domain is None:
+                self._config_keys = getattr(util_module, "KEYS", None)
+            else:
+                self._config_keys = getattr(util_module, "OTHER_DOMAINS_KEYS")[self.domain]
+            self._loaded = True
+        return self._config_keys
+
+
+class LazyConnectorSetting(ConnectorSetting):
+    """
+    A ConnectorSetting created from the connector manifest. It behaves as a regular ConnectorSetting, but resolves its
+    config keys on first access instead of at client startup.
+    """
+    __slots__ = ()
+
+    @property
+    def config_keys(self) -> Optional["BaseConnectorConfigMap"]:
+        config_keys = tuple.__getitem__(self, ConnectorSetting._fields.index("config_keys"))
+        if isinstance(config_keys, ConnectorConfigKeysLoader):
+            config_keys = config_keys.load()
+        return config_keys
+
+
 class AllConnectorSettings:
     paper_trade_connectors_names: List[str] = []
     all_connector_settings: Dict[str, ConnectorSetting] = {}
 
     @classmethod
-    def create_connector_settings(cls):
+    def create_connector_settings(cls, use_manifest: bool = True):
         """
-        Iterate over files in specific Python directories to create a dictionary of exchange names to ConnectorSetting.
+        Create a dictionary of exchange names to ConnectorSetting.
+
+        The settings are read from the cached connector manifest when it is up-to-date, so that connector modules are
+        only imported once the connector is actually used. Otherwise, the connector directories are scanned, every
+        connector utils module is imported and the manifest is regenerated.
+
+        :param use_manifest: if False, the connector directories are always scanned and no manifest is read or written
         """
         cls.all_connector_settings = {}  # reset
-        connector_exceptions = ["mock_paper_exchange", "mock_pure_python_paper_exchange", "paper_trade"]
-        # connector_exceptions = ["mock_paper_exchange", "mock_pure_python_paper_exchange", "paper_trade", "injective_v2", "injective_v2_perpetual"]
-
-        type_dirs: List[DirEntry] = [
-            cast(DirEntry, f) for f in scandir(f"{root_path() / 'hummingbot' / 'connector'}")
-            if f.is_dir() and f.name not in CONNECTOR_SUBMODULES_THAT_ARE_NOT_CEX_TYPES
-        ]
-        for type_dir in type_dirs:
-            if type_dir.name == 'gateway':
-                continue
-            connector_dirs: List[DirEntry] = [
-                cast(DirEntry, f) for f in scandir(type_dir.path)
-                if f.is_dir() and exists(join(f.path, "__init__.py"))
-            ]
-            for connector_dir in connector_dirs:
-                if connector_dir.name.startswith("_") or connector_dir.name in connector_exceptions:
-                    continue
-                if connector_dir.name in cls.all_connector_settings:
-                    raise Exception(f"Multiple connectors with the same {connector_dir.name} name.")
-                try:
-                    util_module_path: str = f"hummingbot.connector.{type_dir.name}." \
-                                            f"{connector_dir.name}.{connector_dir.name}_utils"
-                    util_module = importlib.import_module(util_module_path)
-                except ModuleNotFoundError:
-                    continue
-                trade_fee_settings: List[float] = getattr(util_module, "DEFAULT_FEES", None)
-                trade_fee_schema: TradeFeeSchema = cls._validate_trade_fee_schema(
-                    connector_dir.name, trade_fee_settings
-                )
-                cls.all_connector_settings[connector_dir.name] = ConnectorSetting(
-                    name=connector_dir.name,
-                    type=ConnectorType[type_dir.name.capitalize()],
-                    centralised=getattr(util_module, "CENTRALIZED", True),
-                    example_pair=getattr(util_module, "EXAMPLE_PAIR", ""),
-                    use_ethereum_wallet=getattr(util_module, "USE_ETHEREUM_WALLET", False),
-                    trade_fee_schema=trade_fee_schema,
-                    config_keys=getattr(util_module, "KEYS", None),
-                    is_sub_domain=False,
-                    parent_name=None,
-                    domain_parameter=None,
-                    use_eth_gas_lookup=getattr(util_module, "USE_ETH_GAS_LOOKUP", False),
-                )
-                # Adds other domains of connector
-                other_domains = getattr(util_module, "OTHER_DOMAINS", [])
-                for domain in other_domains:
-                    trade_fee_settings = getattr(util_module, "OTHER_DOMAINS_DEFAULT_FEES")[domain]
-                    trade_fee_schema = cls._validate_trade_fee_schema(domain, trade_fee_settings)
-                    parent = cls.all_connector_settings[connector_dir.name]
-                    cls.all_connector_settings[domain] = ConnectorSetting(
-                        name=domain,
-                        type=parent.type,
-                        centralised=parent.centralised,
-                        example_pair=getattr(util_module, "OTHER_DOMAINS_EXAMPLE_PAIR")[domain],
-                        use_ethereum_wallet=parent.use_ethereum_wallet,
-                        trade_fee_schema=trade_fee_schema,
-                        config_keys=getattr(util_module, "OTHER_DOMAINS_KEYS")[domain],
-                        is_sub_domain=True,
-                        parent_name=parent.name,
-                        domain_parameter=getattr(util_module, "OTHER_DOMAINS_PARAMETER")[domain],
-                        use_eth_gas_lookup=parent.use_eth_gas_lookup,
-                    )
+        fingerprint = cls._connector_manifest_fingerprint()
+        manifest_entries = cls._load_connector_manifest(fingerprint) if use_manifest else None
+        if manifest_entries is None:
+            manifest_entries = cls._build_connector_manifest_entries()
+            if use_manifest:
+                cls._save_connector_manifest(fingerprint, manifest_entries)
+        for entry in manifest_entries:
+            cls.all_connector_settings[entry["name"]] = cls._connector_setting_from_manifest_entry(entry)
 
         # add gateway connectors
         gateway_connections_conf: List[Dict[str, str]] = GatewayConnectionSetting.load()
@@ -453,6 +448,174 @@ class AllConnectorSettings:
 
         return cls.all_connector_settings
 
+    @staticmethod
+    def connector_manifest_path() -> str:
+        return join(data_path(), CONNECTOR_MANIFEST_FILE_NAME)
+
+    @staticmethod
+    def _iter_connector_dirs() -> Iterator[Tuple[DirEntry, DirEntry]]:
+        connector_exceptions = ["mock_paper_exchange", "mock_pure_python_paper_exchange", "paper_trade"]
+        # connector_exceptions = ["mock_paper_exchange", "mock_pure_python_paper_exchange", "paper_trade", "injective_v2", "injective_v2_perpetual"]
+
+        type_dirs: List[DirEntry] = sorted(
+            [
+                cast(DirEntry, f) for f in scandir(f"{root_path() / 'hummingbot' / 'connector'}")
+                if f.is_dir() and f.name not in CONNECTOR_SUBMODULES_THAT_ARE_NOT_CEX_TYPES
+            ],
+            key=lambda f: f.name,
+        )
+        for type_dir in type_dirs:
+            if type_dir.name == 'gateway':
+                continue
+            connector_dirs: List[DirEntry] = sorted(
+                [
+                    cast(DirEntry, f) for f in scandir(type_dir.path)
+                    if f.is_dir() and exists(join(f.path, "__init__.py"))
+                ],
+                key=lambda f: f.name,
+            )
+            for connector_dir in connector_dirs:
+                if connector_dir.name.startswith("_") or connector_dir.name in connector_exceptions:
+                    continue
+                yield type_dir, connector_dir
+
+    @classmethod
+    def _connector_manifest_fingerprint(cls) -> str:
+        """
+        The manifest is valid for one client version and one set of connector utils modules. Only the directory
+        entries and the utils files modification times are checked, no connector module is imported.
+        """
+        with open(realpath(join(root_path(), "hummingbot", "VERSION"))) as version_file:
+            version = version_file.read().strip()
+        hasher = hashlib.sha256(version.encode("utf-8"))
+        for type_dir, connector_dir in cls._iter_connector_dirs():
+            util_file_path = join(connector_dir.path, f"{connector_dir.name}_utils.py")
+            modified_time = getmtime(util_file_path) if exists(util_file_path) else 0
+            hasher.update(f"{type_dir.name}/{connector_dir.name}:{modified_time}".encode("utf-8"))
+        return hasher.hexdigest()
+
+    @classmethod
+    def _load_connector_manifest(cls, fingerprint: str) -> Optional[List[Dict[str, Any]]]:
+        manifest_path = cls.connector_manifest_path()
+        if not exists(manifest_path):
+            return None
+        try:
+            with open(manifest_path) as fd:
+                manifest = json.load(fd)
+        except (OSError, ValueError):
+            return None
+        if manifest.get("fingerprint") != fingerprint:
+            return None
+        return manifest.get("connectors")
+
+    @classmethod
+    def _save_connector_manifest(cls, fingerprint: str, manifest_entries: List[Dict[str, Any]]):
+        manifest_path = cls.connector_manifest_path()
+        temp_path = f"{manifest_path}.tmp"
+        try:
+            with open(temp_path, "w") as fd:
+                json.dump({"fingerprint": fingerprint, "connectors": manifest_entries}, fd)
+            os.replace(temp_path, manifest_path)
+        except OSError:
+            logging.getLogger(__name__).warning(
+                f"Could not write the connector manifest to {manifest_path}.", exc_info=True
+            )
+
+    @classmethod
+    def _build_connector_manifest_entries(cls) -> List[Dict[str, Any]]:
+        """
+        Iterate over files in specific Python directories and import each connector utils module to collect the
+        connectors metadata.
+        """
+        entries: Dict[str, Dict[str, Any]] = {}
+        for type_dir, connector_dir in cls._iter_connector_dirs():
+            if connector_dir.name in entries:
+                raise Exception(f"Multiple connectors with the same {connector_dir.name} name.")
+            try:
+                util_module_path: str = f"hummingbot.connector.{type_dir.name}." \
+                                        f"{connector_dir.name}.{connector_dir.name}_utils"
+                util_module = importlib.import_module(util_module_path)
+            except ModuleNotFoundError:
+                continue
+            trade_fee_settings: List[float] = getattr(util_module, "DEFAULT_FEES", None)
+            trade_fee_schema: TradeFeeSchema = cls._validate_trade_fee_schema(
+                connector_dir.name, trade_fee_settings
+            )
+            parent = {
+                "name": connector_dir.name,
+                "type": ConnectorType[type_dir.name.capitalize()].name,
+                "centralised": getattr(util_module, "CENTRALIZED", True),
+                "example_pair": getattr(util_module, "EXAMPLE_PAIR", ""),
+                "use_ethereum_wallet": getattr(util_module, "USE_ETHEREUM_WALLET", False),
+                "trade_fee_schema": cls._trade_fee_schema_to_json(trade_fee_schema),
+                "util_module_path": util_module_path,
+                "is_sub_domain": False,
+                "parent_name": None,
+                "domain_parameter": None,
+                "use_eth_gas_lookup": getattr(util_module, "USE_ETH_GAS_LOOKUP", False),
+            }
+            entries[connector_dir.name] = parent
+            # Adds other domains of connector
+            other_domains = getattr(util_module, "OTHER_DOMAINS", [])
+            for domain in other_domains:
+                trade_fee_settings = getattr(util_module, "OTHER_DOMAINS_DEFAULT_FEES")[domain]
+                trade_fee_schema = cls._validate_trade_fee_schema(domain, trade_fee_settings)
+                entries[domain] = {
+                    "name": domain,
+                    "type": parent["type"],
+                    "centralised": parent["centralised"],
+                    "example_pair": getattr(util_module, "OTHER_DOMAINS_EXAMPLE_PAIR")[domain],
+                    "use_ethereum_wallet": parent["use_ethereum_wallet"],
+                    "trade_fee_schema": cls._trade_fee_schema_to_json(trade_fee_schema),
+                    "util_module_path": util_module_path,
+                    "is_sub_domain": True,
+                    "parent_name": parent["name"],
+                    "domain_parameter": getattr(util_module, "OTHER_DOMAINS_PARAMETER")[domain],
+                    "use_eth_gas_lookup": parent["use_eth_gas_lookup"],
+                }
+        return list(entries.values())
+
+    @staticmethod
+    def _connector_setting_from_manifest_entry(entry: Dict[str, Any]) -> ConnectorSetting:
+        return LazyConnectorSetting(
+            name=entry["name"],
+            type=ConnectorType[entry["type"]],
+            centralised=entry["centralised"],
+            example_pair=entry["example_pair"],
+            use_ethereum_wallet=entry["use_ethereum_wallet"],
+            trade_fee_schema=AllConnectorSettings._trade_fee_schema_from_json(entry["trade_fee_schema"]),
+            config_keys=ConnectorConfigKeysLoader(
+                util_module_path=entry["util_module_path"],
+                domain=entry["name"] if entry["is_sub_domain"] else None,
+            ),
+            is_sub_domain=entry["is_sub_domain"],
+            parent_name=entry["parent_name"],
+            domain_parameter=entry["domain_parameter"],
+            use_eth_gas_lookup=entry["use_eth_gas_lookup"],
+        )
+
+    @staticmethod
+    def _trade_fee_schema_to_json(trade_fee_schema: TradeFeeSchema) -> Dict[str, Any]:
+        return {
+            "percent_fee_token": trade_fee_schema.percent_fee_token,
+            "maker_percent_fee_decimal": str(trade_fee_schema.maker_percent_fee_decimal),
+            "taker_percent_fee_decimal": str(trade_fee_schema.taker_percent_fee_decimal),
+            "buy_percent_fee_deducted_from_returns": trade_fee_schema.buy_percent_fee_deducted_from_returns,
+            "maker_fixed_fees": [[fee.token, str(fee.amount)] for fee in trade_fee_schema.maker_fixed_fees],
+            "taker_fixed_fees": [[fee.token, str(fee.amount)] for fee in trade_fee_schema.taker_fixed_fees],
+        }
+
+    @staticmethod
+    def _trade_fee_schema_from_json(data: Dict[str, Any]) -> TradeFeeSchema:
+        return TradeFeeSchema(
+            percent_fee_token=data["percent_fee_token"],
+            maker_percent_fee_decimal=Decimal(data["maker_percent_fee_decimal"]),
+            taker_percent_fee_decimal=Decimal(data["taker_percent_fee_decimal"]),
+            buy_percent_fee_deducted_from_returns=data["buy_percent_fee_deducted_from_returns"],
+            maker_fixed_fees=[TokenAmount(token, Decimal(amount)) for token, amount in data["maker_fixed_fees"]],
+            taker_fixed_fees=[TokenAmount(token, Decimal(amount)) for token, amount in data["taker_fixed_fees"]],
+        )
+
     @classmethod
     def initialize_paper_trade_settings(cls, paper_trade_exchanges: List[str]):
         cls.paper_trade_connectors_names = paper_trade_exchanges
@@ -607,6 +770,7 @@ def gateway_connector_trading_pairs(connector: str) -> List[str]:
 
 MAXIMUM_OUTPUT_PANE_LINE_COUNT = 1000
 MAXIMUM_LOG_PANE_LINE_COUNT = 1000
+LOG_PANE_SPILL_FILE_NAME = "log_pane_history_{instance_id}.log"
 MAXIMUM_TRADE_FILLS_DISPLAY_OUTPUT = 100
 
 STRATEGIES: List[str] = get_strategy_list()
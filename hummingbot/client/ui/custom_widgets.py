@@ -1,8 +1,8 @@
 from __future__ import unicode_literals
 
 import re
-from collections import deque
-from typing import Callable, Deque, Dict, List, Tuple
+from functools import lru_cache
+from typing import Callable, Deque, Dict, List, Optional, Tuple
 
 import six
 from prompt_toolkit.auto_suggest import DynamicAutoSuggest
@@ -20,6 +20,7 @@ from prompt_toolkit.lexers.base import Lexer
 from prompt_toolkit.widgets.toolbars import SearchToolbar
 
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.client.ui.log_pane_buffer import LogPaneBuffer
 from hummingbot.client.ui.style import load_style, text_ui_style
 
 
@@ -38,6 +39,7 @@ class CustomBuffer(Buffer):
 class FormattedTextLexer(Lexer):
 
     PROMPT_TEXT = ">>> "
+    LEXED_LINES_CACHE_SIZE = 4096
 
     def __init__(self, client_config_map: ClientConfigAdapter) -> None:
         super().__init__()
@@ -53,6 +55,9 @@ class FormattedTextLexer(Lexer):
         # Maps specific text to its corresponding UI styles
         self.text_style_tag_map: Dict[str, str] = text_ui_style
 
+        # Only the visible lines are lexed on each redraw, and most of them did not change since the previous one
+        self._lex_line = lru_cache(maxsize=self.LEXED_LINES_CACHE_SIZE)(self._lex_line_fragments)
+
     def get_css_style(self, tag: str) -> str:
         style = self.html_tag_css_style_map.get(tag, "")
         return style
@@ -64,36 +69,38 @@ class FormattedTextLexer(Lexer):
             "Return the tokens for the given line."
             try:
                 current_line = lines[lineno]
-
-                # Apply styling to command prompt
-                if current_line.startswith(self.PROMPT_TEXT):
-                    return [(self.get_css_style("primary_label"), current_line)]
-
-                matched_indexes: List[Tuple[int, int, str]] = [(match.start(), match.end(), style)
-                                                               for special_word, style in self.text_style_tag_map.items()
-                                                               for match in list(re.finditer(special_word, current_line))
-                                                               ]
-                if len(matched_indexes) == 0:
-                    return [("", current_line)]
-
-                previous_idx = 0
-                line_fragments = []
-                for start_idx, end_idx, style in matched_indexes:
-                    line_fragments.extend([
-                        ("", current_line[previous_idx:start_idx]),
-                        (self.get_css_style("output_pane"), current_line[start_idx:start_idx + 2]),
-                        (self.get_css_style(style), current_line[start_idx + 2:end_idx])
-                    ])
-                    previous_idx = end_idx
-
-                line_fragments.append(("", current_line[previous_idx:]))
-
-                return line_fragments
             except IndexError:
                 return []
+            return list(self._lex_line(current_line))
 
         return get_line
 
+    def _lex_line_fragments(self, current_line: str) -> Tuple[Tuple[str, str], ...]:
+        # Apply styling to command prompt
+        if current_line.startswith(self.PROMPT_TEXT):
+            return ((self.get_css_style("primary_label"), current_line),)
+
+        matched_indexes: List[Tuple[int, int, str]] = [(match.start(), match.end(), style)
+                                                       for special_word, style in self.text_style_tag_map.items()
+                                                       for match in list(re.finditer(special_word, current_line))
+                                                       ]
+        if len(matched_indexes) == 0:
+            return (("", current_line),)
+
+        previous_idx = 0
+        line_fragments = []
+        for start_idx, end_idx, style in matched_indexes:
+            line_fragments.extend([
+                ("", current_line[previous_idx:start_idx]),
+                (self.get_css_style("output_pane"), current_line[start_idx:start_idx + 2]),
+                (self.get_css_style(style), current_line[start_idx + 2:end_idx])
+            ])
+            previous_idx = end_idx
+
+        line_fragments.append(("", current_line[previous_idx:]))
+
+        return tuple(line_fragments)
+
 
 class CustomTextArea:
     def __init__(self, text='', multiline=True, password=False,
@@ -104,7 +111,8 @@ class CustomTextArea:
                  dont_extend_height=False, dont_extend_width=False,
                  line_numbers=False, get_line_prefix=None, scrollbar=False,
                  style='', search_field=None, preview_search=True, prompt='',
-                 input_processors=None, max_line_count=1000, initial_text="", align=WindowAlign.LEFT):
+                 input_processors=None, max_line_count=1000, initial_text="", align=WindowAlign.LEFT,
+                 spill_file_path: Optional[str] = None):
         assert isinstance(text, six.text_type)
         assert search_field is None or isinstance(search_field, SearchToolbar)
 
@@ -182,9 +190,13 @@ class CustomTextArea:
             get_line_prefix=get_line_prefix,
             align=align)
 
-        self.log_lines: Deque[str] = deque()
+        self.log_buffer = LogPaneBuffer(max_line_count=max_line_count, spill_file_path=spill_file_path)
         self.log(initial_text)
 
+    @property
+    def log_lines(self) -> Deque[str]:
+        return self.log_buffer.lines
+
     @property
     def text(self):
         """
@@ -244,10 +256,8 @@ class CustomTextArea:
             new_lines.append(line)
 
         if save_log:
-            self.log_lines.extend(new_lines)
-            while len(self.log_lines) > self.max_line_count:
-                self.log_lines.popleft()
-            new_text: str = "\n".join(self.log_lines)
+            self.log_buffer.append_lines(new_lines)
+            new_text: str = self.log_buffer.text
         else:
             new_text: str = "\n".join(new_lines)
         if not silent:
@@ -62,7 +62,7 @@ class HummingbotCLI(PubSub):
         self.search_field = create_search_field()
         self.input_field = create_input_field(completer=completer)
         self.output_field = create_output_field(client_config_map)
-        self.log_field = create_log_field(self.search_field)
+        self.log_field = create_log_field(self.search_field, client_config_map)
         self.right_pane_toggle = create_log_toggle(self.toggle_right_pane)
         self.live_field = create_live_field()
         self.log_field_button = create_tab_button("logs", self.log_button_clicked)
@@ -117,6 +117,7 @@ class HummingbotCLI(PubSub):
         )
         await self.app.run_async(pre_run=self.did_start_ui)
         self._stdout_redirect_context.close()
+        self.log_field.log_buffer.close()
 
     def accept(self, buff):
         self.pending_input = self.input_field.text.strip()
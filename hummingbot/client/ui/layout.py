@@ -19,7 +19,12 @@ from prompt_toolkit.layout.menus import CompletionsMenu
 from prompt_toolkit.widgets import Box, Button, SearchToolbar
 
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
-from hummingbot.client.settings import MAXIMUM_LOG_PANE_LINE_COUNT, MAXIMUM_OUTPUT_PANE_LINE_COUNT
+from hummingbot.client.settings import (
+    DEFAULT_LOG_FILE_PATH,
+    LOG_PANE_SPILL_FILE_NAME,
+    MAXIMUM_LOG_PANE_LINE_COUNT,
+    MAXIMUM_OUTPUT_PANE_LINE_COUNT,
+)
 from hummingbot.client.tab.data_types import CommandTab
 from hummingbot.client.ui.custom_widgets import CustomTextArea as TextArea, FormattedTextLexer
 
@@ -144,7 +149,7 @@ def create_search_field() -> SearchToolbar:
                          ignore_case=True)
 
 
-def create_log_field(search_field: SearchToolbar):
+def create_log_field(search_field: SearchToolbar, client_config_map: ClientConfigAdapter):
     return TextArea(
         style='class:log_field',
         text="Running Logs\n",
@@ -155,6 +160,8 @@ def create_log_field(search_field: SearchToolbar):
         initial_text="Running Logs \n",
         search_field=search_field,
         preview_search=False,
+        spill_file_path=str(DEFAULT_LOG_FILE_PATH / LOG_PANE_SPILL_FILE_NAME.format(
+            instance_id=client_config_map.instance_id)),
     )
 
 
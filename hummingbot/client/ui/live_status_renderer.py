@@ -0,0 +1,83 @@
+import time
+from decimal import Decimal
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from hummingbot.strategy.status_model import StatusModel, StatusSection
+
+
+class StatusFrame(NamedTuple):
+    lines: List[str]
+
+    @property
+    def text(self) -> str:
+        return "\n".join(self.lines)
+
+
+class LiveStatusRenderer:
+    """
+    Formats a `StatusModel` as text for the live status display without building data frames.
+
+    The formatted lines of each section are cached by section version, and a new frame is produced only when the model
+    changed and the minimum refresh interval elapsed since the last one.
+    """
+
+    def __init__(self, min_refresh_interval: float = 0.5, indent: int = 4):
+        self._min_refresh_interval = min_refresh_interval
+        self._indent = " " * indent
+        self._section_lines: Dict[int, Tuple[int, List[str]]] = {}
+        self._last_model_version: Optional[Tuple[int, ...]] = None
+        self._last_render_timestamp = 0.0
+
+    @property
+    def min_refresh_interval(self) -> float:
+        return self._min_refresh_interval
+
+    def render(self, model: StatusModel, timestamp: Optional[float] = None) -> Optional[StatusFrame]:
+        """
+        :returns the new frame, or None if the model did not change or the refresh interval has not elapsed yet
+        """
+        timestamp = time.time() if timestamp is None else timestamp
+        if timestamp - self._last_render_timestamp < self._min_refresh_interval:
+            return None
+        model_version = model.version
+        if model_version == self._last_model_version:
+            return None
+
+        lines = []
+        sections_ids = set()
+        for section in model.sections:
+            sections_ids.add(id(section))
+            lines.extend(self._format_section(section))
+        # Forget the cached lines of the removed sections
+        for section_id in [section_id for section_id in self._section_lines if section_id not in sections_ids]:
+            del self._section_lines[section_id]
+
+        self._last_model_version = model_version
+        self._last_render_timestamp = timestamp
+        return StatusFrame(lines=lines)
+
+    def _format_section(self, section: StatusSection) -> List[str]:
+        cached = self._section_lines.get(id(section))
+        if cached is not None and cached[0] == section.version:
+            return cached[1]
+
+        lines = ["", f"  {section.title}:"]
+        for name, value in section.fields.items():
+            lines.append(f"{self._indent}{name}: {self.format_value(value)}")
+        if len(section.columns) > 0 and len(section.rows) > 0:
+            lines.extend(self._format_table(section.columns, section.rows))
+        self._section_lines[id(section)] = (section.version, lines)
+        return lines
+
+    def _format_table(self, columns: Tuple[str, ...], rows: List[Tuple[Any, ...]]) -> List[str]:
+        cells = [list(columns)] + [[self.format_value(value) for value in row] for row in rows]
+        widths = [max(len(row[index]) for row in cells) for index in range(len(columns))]
+        return [self._indent + " ".join(cell.rjust(width) for cell, width in zip(row, widths)) for row in cells]
+
+    @staticmethod
+    def format_value(value: Any) -> str:
+        if isinstance(value, float):
+            return f"{value:.6g}"
+        if isinstance(value, Decimal):
+            return f"{value:.6g}" if value.is_finite() else str(value)
+        return str(value)
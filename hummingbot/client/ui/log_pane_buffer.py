@@ -0,0 +1,101 @@
+import os
+import re
+from collections import deque
+from itertools import chain, islice
+from typing import Deque, Iterable, List, Optional, TextIO
+
+
+class LogPaneBuffer:
+    """
+    Fixed capacity buffer with the lines displayed in a text pane.
+
+    The lines evicted from the buffer can be spilled to a file on disk, so they are still available to `search` without
+    growing the memory used by the pane (and the cost of redrawing it) over long runs. The spill file is rotated when it
+    reaches its maximum size, keeping the previous one as `<spill_file_path>.1`. The spill files left by a previous run
+    are deleted when the buffer is created.
+    """
+
+    def __init__(self,
+                 max_line_count: int,
+                 spill_file_path: Optional[str] = None,
+                 max_spill_file_size: int = 50 * 1024 * 1024):
+        self._lines: Deque[str] = deque(maxlen=max_line_count)
+        self._spill_file_path = spill_file_path
+        self._max_spill_file_size = max_spill_file_size
+        self._spill_file: Optional[TextIO] = None
+        self._text: Optional[str] = ""
+        if self._spill_file_path is not None:
+            self._remove_spill_files()
+
+    @property
+    def lines(self) -> Deque[str]:
+        return self._lines
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = "\n".join(self._lines)
+        return self._text
+
+    @property
+    def spill_file_path(self) -> Optional[str]:
+        return self._spill_file_path
+
+    def append_lines(self, lines: Iterable[str]):
+        lines = list(lines)
+        overflow = len(self._lines) + len(lines) - self._lines.maxlen
+        if overflow > 0 and self._spill_file_path is not None:
+            self._spill(list(islice(chain(self._lines, lines), overflow)))
+        self._lines.extend(lines)
+        self._text = None
+
+    def search(self, pattern: str, max_results: int = 100, ignore_case: bool = True) -> List[str]:
+        """
+        Searches the lines matching the regular expression, both in the spill files and in the buffer.
+
+        :returns the most recent matching lines, from oldest to newest
+        """
+        regex = re.compile(pattern, re.IGNORECASE if ignore_case else 0)
+        matches: Deque[str] = deque(maxlen=max_results)
+        if self._spill_file_path is not None:
+            if self._spill_file is not None:
+                self._spill_file.flush()
+            for path in (f"{self._spill_file_path}.1", self._spill_file_path):
+                if os.path.exists(path):
+                    with open(path, encoding="utf-8") as spill_file:
+                        matches.extend(line.rstrip("\n") for line in spill_file if regex.search(line))
+        matches.extend(line for line in self._lines if regex.search(line))
+        return list(matches)
+
+    def clear(self):
+        self._lines.clear()
+        self._text = ""
+
+    def close(self):
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+
+    def _remove_spill_files(self):
+        try:
+            for path in (self._spill_file_path, f"{self._spill_file_path}.1"):
+                if os.path.exists(path):
+                    os.remove(path)
+        except OSError:
+            self._spill_file_path = None
+
+    def _spill(self, lines: List[str]):
+        try:
+            if self._spill_file is None:
+                os.makedirs(os.path.dirname(self._spill_file_path) or ".", exist_ok=True)
+                self._spill_file = open(self._spill_file_path, "a", encoding="utf-8")
+            self._spill_file.write("".join(f"{line}\n" for line in lines))
+            self._spill_file.flush()
+            if self._spill_file.tell() >= self._max_spill_file_size:
+                self._spill_file.close()
+                self._spill_file = None
+                os.replace(self._spill_file_path, f"{self._spill_file_path}.1")
+        except OSError:
+            # The spill file is a convenience for searching, failing to write it must not break the UI
+            self._spill_file_path = None
+            self._spill_file = None
@@ -142,6 +142,12 @@ def load_parser(hummingbot: "HummingbotApplication", command_tabs) -> [ThrowingA
     ticker_parser.add_argument("--market", type=str, dest="market", help="The market (trading pair) of the order book")
     ticker_parser.set_defaults(func=hummingbot.ticker)
 
+    logs_parser = subparsers.add_parser("logs", help="Search the log pane, including the lines no longer displayed")
+    logs_parser.add_argument("pattern", type=str, help="Regular expression to search for (case insensitive)")
+    logs_parser.add_argument("-n", "--max-results", type=int, default=100, dest="max_results",
+                             help="Maximum number of matching lines to show (the most recent ones)")
+    logs_parser.set_defaults(func=hummingbot.logs)
+
     previous_strategy_parser = subparsers.add_parser("previous", help="Imports the last strategy used")
     previous_strategy_parser.add_argument("option", nargs="?", choices=["Yes,No"], default=None)
     previous_strategy_parser.set_defaults(func=hummingbot.previous_strategy)
@@ -3,9 +3,10 @@ import json
 import logging
 import platform
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from decimal import Decimal
 from os.path import dirname, join, realpath
-from typing import TYPE_CHECKING, List, Tuple
+from typing import TYPE_CHECKING, Dict, List, Tuple
 
 from hummingbot.connector.utils import combine_to_hb_trading_pair, split_hb_trading_pair
 from hummingbot.core.event.event_forwarder import EventForwarder
@@ -117,21 +118,30 @@ class TradeVolumeMetricCollector(MetricsCollector):
         try:
             total_volume = Decimal("0")
 
+            # The volumes are aggregated by asset first, so the rates are requested once per asset and not per event
+            quote_volumes: Dict[str, Decimal] = defaultdict(lambda: Decimal("0"))
+            base_volumes: Dict[str, Dict[str, Decimal]] = defaultdict(lambda: defaultdict(lambda: Decimal("0")))
             for fill_event in events:
                 trade_base, trade_quote = split_hb_trading_pair(fill_event.trading_pair)
+                quote_volumes[trade_quote] += fill_event.amount * fill_event.price
+                base_volumes[trade_quote][trade_base] += fill_event.amount
+
+            for trade_quote, quote_volume in quote_volumes.items():
                 from_quote_conversion_pair = combine_to_hb_trading_pair(base=trade_quote, quote=self._valuation_token)
                 rate = await self._rate_provider.stored_or_live_rate(from_quote_conversion_pair)
 
                 if rate is not None:
-                    total_volume += fill_event.amount * fill_event.price * rate
+                    total_volume += quote_volume * rate
                 else:
-                    from_base_conversion_pair = combine_to_hb_trading_pair(base=trade_base, quote=self._valuation_token)
-                    rate = await self._rate_provider.stored_or_live_rate(from_base_conversion_pair)
-                    if rate is not None:
-                        total_volume += fill_event.amount * rate
-                    else:
-                        self.logger().debug(f"Could not find a conversion rate rate using Rate Oracle for any of "
-                                            f"the pairs {from_quote_conversion_pair} or {from_base_conversion_pair}")
+                    for trade_base, base_volume in base_volumes[trade_quote].items():
+                        from_base_conversion_pair = combine_to_hb_trading_pair(base=trade_base,
+                                                                               quote=self._valuation_token)
+                        rate = await self._rate_provider.stored_or_live_rate(from_base_conversion_pair)
+                        if rate is not None:
+                            total_volume += base_volume * rate
+                        else:
+                            self.logger().debug(f"Could not find a conversion rate rate using Rate Oracle for any of "
+                                                f"the pairs {from_quote_conversion_pair} or {from_base_conversion_pair}")
 
             if total_volume > Decimal("0"):
                 self._dispatch_trade_volume(total_volume)
@@ -51,14 +51,33 @@ class BinancePerpetualAPIOrderBookDataSource(PerpetualAPIOrderBookDataSource):
 
     async def get_funding_info(self, trading_pair: str) -> FundingInfo:
         symbol_info: Dict[str, Any] = await self._request_complete_funding_info(trading_pair)
-        funding_info = FundingInfo(
+        return self._funding_info_from_symbol_info(trading_pair=trading_pair, symbol_info=symbol_info)
+
+    async def get_bulk_funding_info(self, trading_pairs: List[str]) -> Dict[str, FundingInfo]:
+        # The premium index endpoint returns the information of all symbols when no symbol is specified
+        data = await self._connector._api_get(
+            path_url=CONSTANTS.MARK_PRICE_URL,
+            is_auth_required=True,
+            limit_id=CONSTANTS.ALL_MARK_PRICES_LIMIT_ID)
+        trading_pairs_by_symbol = {
+            await self._connector.exchange_symbol_associated_to_pair(trading_pair=trading_pair): trading_pair
+            for trading_pair in trading_pairs
+        }
+        return {
+            trading_pairs_by_symbol[symbol_info["symbol"]]: self._funding_info_from_symbol_info(
+                trading_pair=trading_pairs_by_symbol[symbol_info["symbol"]], symbol_info=symbol_info)
+            for symbol_info in data
+            if symbol_info["symbol"] in trading_pairs_by_symbol
+        }
+
+    def _funding_info_from_symbol_info(self, trading_pair: str, symbol_info: Dict[str, Any]) -> FundingInfo:
+        return FundingInfo(
             trading_pair=trading_pair,
             index_price=Decimal(symbol_info["indexPrice"]),
             mark_price=Decimal(symbol_info["markPrice"]),
             next_funding_utc_timestamp=int(float(symbol_info["nextFundingTime"]) * 1e-3),
             rate=Decimal(symbol_info["lastFundingRate"]),
         )
-        return funding_info
 
     async def _request_order_book_snapshot(self, trading_pair: str) -> Dict[str, Any]:
         ex_trading_pair = await self._connector.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
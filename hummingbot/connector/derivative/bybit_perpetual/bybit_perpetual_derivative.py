@@ -41,6 +41,8 @@ s_decimal_0 = Decimal(0)
 class BybitPerpetualDerivative(PerpetualDerivativePyBase):
 
     web_utils = web_utils
+    # Bybit sets the position mode per symbol, so the pairs can be configured in parallel
+    POSITION_MODE_SET_CONCURRENCY = 5
 
     def __init__(
         self,
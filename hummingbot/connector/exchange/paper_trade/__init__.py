@@ -3,6 +3,7 @@ from typing import List
 from hummingbot.client.config.config_helpers import ClientConfigAdapter, get_connector_class
 from hummingbot.client.settings import AllConnectorSettings
 from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import PaperTradeExchange
+from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 
 
@@ -18,7 +19,28 @@ def get_order_book_tracker(connector_name: str, trading_pairs: List[str]) -> Ord
 
 def create_paper_trade_market(exchange_name: str, client_config_map: ClientConfigAdapter, trading_pairs: List[str]):
     tracker = get_order_book_tracker(connector_name=exchange_name, trading_pairs=trading_pairs)
-    return PaperTradeExchange(client_config_map,
-                              tracker,
-                              get_connector_class(exchange_name),
-                              exchange_name=exchange_name)
+    market = PaperTradeExchange(client_config_map,
+                                tracker,
+                                get_connector_class(exchange_name),
+                                exchange_name=exchange_name)
+    market.queue_position_simulation = client_config_map.paper_trade.paper_trade_queue_simulation
+    return market
+
+
+def create_mirror_paper_trade_market(connector: ExchangeBase, client_config_map: ClientConfigAdapter):
+    """
+    Creates a paper trade market that mirrors a live connector. It reads the live connector order books and trades
+    directly, so any number of mirrors can run strategies on the same market data without opening new streams.
+    The mirror has to be added to the clock like any other market.
+    """
+    market = PaperTradeExchange(client_config_map,
+                                connector.order_book_tracker,
+                                get_connector_class(connector.name),
+                                exchange_name=connector.name,
+                                shared_order_book_tracker=True)
+    market.queue_position_simulation = client_config_map.paper_trade.paper_trade_queue_simulation
+    paper_trade_account_balance = client_config_map.paper_trade.paper_trade_account_balance
+    if paper_trade_account_balance is not None:
+        for asset, balance in paper_trade_account_balance.items():
+            market.set_balance(asset, balance)
+    return market
@@ -17,6 +17,7 @@ ctypedef cpp_set[CPPLimitOrder].iterator SingleTradingPairLimitOrdersIterator
 ctypedef cpp_set[CPPLimitOrder].reverse_iterator SingleTradingPairLimitOrdersRIterator
 ctypedef cpp_set[CPPOrderExpirationEntry] LimitOrderExpirationSet
 ctypedef cpp_set[CPPOrderExpirationEntry].iterator LimitOrderExpirationSetIterator
+ctypedef unordered_map[string, double] OrderPrices
 
 cdef class QuantizationParams:
     cdef:
@@ -31,11 +32,20 @@ cdef class PaperTradeExchange(ExchangeBase):
     cdef:
         LimitOrders _bid_limit_orders
         LimitOrders _ask_limit_orders
+        OrderPrices _best_bid_order_prices
+        OrderPrices _best_ask_order_prices
+        unordered_map[string, double] _order_queue_ahead
+        unordered_map[string, long long] _order_queue_sequence
+        long long _next_order_queue_sequence
+        bint _queue_position_simulation
+        dict _partial_fill_totals
         bint _paper_trade_market_initialized
+        bint _shared_order_book_tracker
         dict _trading_pairs
         object _queued_orders
         dict _quantization_params
         object _order_book_trade_listener
+        dict _listened_order_books
         object _market_order_filled_listener
         LimitOrderExpirationSet _limit_order_expiration_set
         object _target_market
@@ -57,6 +67,22 @@ cdef class PaperTradeExchange(ExchangeBase):
                               LimitOrders *limit_orders_map_ptr,
                               LimitOrdersIterator *map_it_ptr,
                               const SingleTradingPairLimitOrdersIterator orders_it)
+    cdef c_update_best_order_price(self, bint is_buy, string cpp_trading_pair)
+    cdef c_update_order_book_trade_listeners(self)
+    cdef c_remove_order_book_trade_listeners(self)
+    cdef c_set_order_queue_position(self, bint is_buy, str trading_pair_str, string cpp_order_id, object price)
+    cdef c_process_limit_order_partial_fill(self,
+                                            bint is_buy,
+                                            LimitOrders *limit_orders_map_ptr,
+                                            LimitOrdersIterator *map_it_ptr,
+                                            SingleTradingPairLimitOrdersIterator orders_it,
+                                            object fill_amount)
+    cdef c_match_trade_to_limit_orders_queue(self,
+                                             bint is_maker_buy,
+                                             double trade_price,
+                                             double trade_quantity,
+                                             LimitOrders *limit_orders_map_ptr,
+                                             LimitOrdersIterator *map_it_ptr)
     cdef c_process_limit_order(self,
                                bint is_buy,
                                LimitOrders *limit_orders_map_ptr,
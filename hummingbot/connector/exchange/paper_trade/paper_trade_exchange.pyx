@@ -157,8 +157,15 @@ cdef class PaperTradeExchange(ExchangeBase):
         order_book_tracker: OrderBookTracker,
         target_market: Callable,
         exchange_name: str,
+        shared_order_book_tracker: bool = False,
     ):
-        order_book_tracker.data_source.order_book_create_function = lambda: CompositeOrderBook()
+        """
+        :param shared_order_book_tracker: when True the order book tracker belongs to a live connector. The paper
+        exchange mirrors its order books and trades without starting, stopping or modifying them.
+        """
+        self._shared_order_book_tracker = shared_order_book_tracker
+        if not shared_order_book_tracker:
+            order_book_tracker.data_source.order_book_create_function = lambda: CompositeOrderBook()
         self._set_order_book_tracker(order_book_tracker)
         self._budget_checker = BudgetChecker(exchange=self)
         super(ExchangeBase, self).__init__(client_config_map)
@@ -169,10 +176,16 @@ cdef class PaperTradeExchange(ExchangeBase):
         self._trading_pairs = {}
         self._queued_orders = deque()
         self._quantization_params = {}
+        self._queue_position_simulation = False
+        self._next_order_queue_sequence = 0
+        self._partial_fill_totals = {}
         self._order_book_trade_listener = OrderBookTradeListener(self)
+        self._listened_order_books = {}
         self._target_market = target_market
         self._market_order_filled_listener = OrderBookMarketOrderFillListener(self)
-        self.c_add_listener(self.ORDER_FILLED_EVENT_TAG, self._market_order_filled_listener)
+        # Shared order books are read only, the consumption of the paper market orders is not recorded in them
+        if not shared_order_book_tracker:
+            self.c_add_listener(self.ORDER_FILLED_EVENT_TAG, self._market_order_filled_listener)
 
         # Trade volume metrics should never be gather for paper trade connector
         self._trade_volume_metric_collector = DummyMetricsCollector()
@@ -181,6 +194,22 @@ cdef class PaperTradeExchange(ExchangeBase):
     def budget_checker(self) -> BudgetChecker:
         return self._budget_checker
 
+    @property
+    def queue_position_simulation(self) -> bool:
+        """
+        When enabled, resting limit orders join the back of their order book price level. Trades at the order price
+        consume the volume ahead of them first, and then fill the order partially with the remaining traded volume.
+        """
+        return self._queue_position_simulation
+
+    @queue_position_simulation.setter
+    def queue_position_simulation(self, value: bool):
+        self._queue_position_simulation = value
+
+    @property
+    def shared_order_book_tracker(self) -> bool:
+        return self._shared_order_book_tracker
+
     @classmethod
     def random_order_id(cls, order_side: str, trading_pair: str) -> str:
         vals = [random.choice(range(0, 256)) for i in range(0, 13)]
@@ -188,13 +217,36 @@ cdef class PaperTradeExchange(ExchangeBase):
 
     def init_paper_trade_market(self):
         for trading_pair_str, order_book in self.order_book_tracker.order_books.items():
-            assert type(order_book) is CompositeOrderBook
+            if self._shared_order_book_tracker:
+                assert isinstance(order_book, OrderBook)
+            else:
+                assert type(order_book) is CompositeOrderBook
             base_asset, quote_asset = self.split_trading_pair(trading_pair_str)
             self._trading_pairs[self._target_market.convert_from_exchange_trading_pair(trading_pair_str)] = TradingPair(trading_pair_str, base_asset, quote_asset)
-            (<CompositeOrderBook>order_book).c_add_listener(
-                self.ORDER_BOOK_TRADE_EVENT_TAG,
-                self._order_book_trade_listener
-            )
+        self.c_update_order_book_trade_listeners()
+
+    cdef c_update_order_book_trade_listeners(self):
+        """
+        Keeps the order book trade listener attached to the current order books of the tracker. The tracker replaces
+        its order books when it is reinitialized, and the listener is moved from the replaced books to the new ones.
+        """
+        order_books = self.order_book_tracker.order_books
+        for trading_pair_str, order_book in list(self._listened_order_books.items()):
+            if order_books.get(trading_pair_str) is not order_book:
+                (<OrderBook>order_book).c_remove_listener(self.ORDER_BOOK_TRADE_EVENT_TAG,
+                                                         self._order_book_trade_listener)
+                del self._listened_order_books[trading_pair_str]
+        for trading_pair_str, order_book in order_books.items():
+            if trading_pair_str not in self._listened_order_books:
+                (<OrderBook>order_book).c_add_listener(self.ORDER_BOOK_TRADE_EVENT_TAG,
+                                                      self._order_book_trade_listener)
+                self._listened_order_books[trading_pair_str] = order_book
+
+    cdef c_remove_order_book_trade_listeners(self):
+        for order_book in self._listened_order_books.values():
+            (<OrderBook>order_book).c_remove_listener(self.ORDER_BOOK_TRADE_EVENT_TAG,
+                                                     self._order_book_trade_listener)
+        self._listened_order_books.clear()
 
     def split_trading_pair(self, trading_pair: str) -> Tuple[str, str]:
         return self._target_market.split_trading_pair(trading_pair)
@@ -278,10 +330,13 @@ cdef class PaperTradeExchange(ExchangeBase):
     def on_hold_balances(self) -> Dict[str, Decimal]:
         _on_hold_balances = defaultdict(Decimal)
         for limit_order in self.limit_orders:
+            remaining_quantity = limit_order.quantity
+            if limit_order.filled_quantity is not None and limit_order.filled_quantity.is_finite():
+                remaining_quantity -= limit_order.filled_quantity
             if limit_order.is_buy:
-                _on_hold_balances[limit_order.quote_currency] += limit_order.quantity * limit_order.price
+                _on_hold_balances[limit_order.quote_currency] += remaining_quantity * limit_order.price
             else:
-                _on_hold_balances[limit_order.base_currency] += limit_order.quantity
+                _on_hold_balances[limit_order.base_currency] += remaining_quantity
         return _on_hold_balances
 
     @property
@@ -298,10 +353,18 @@ cdef class PaperTradeExchange(ExchangeBase):
 
     async def start_network(self):
         await self.stop_network()
-        self.order_book_tracker.start()
+        # A shared order book tracker is started and stopped by the live connector that owns it
+        if not self._shared_order_book_tracker:
+            self.order_book_tracker.start()
+        else:
+            self.c_update_order_book_trade_listeners()
 
     async def stop_network(self):
-        self.order_book_tracker.stop()
+        if not self._shared_order_book_tracker:
+            self.order_book_tracker.stop()
+        else:
+            # The shared order books keep running, the stopped mirror must not receive their trades
+            self.c_remove_order_book_trade_listeners()
 
     async def check_network(self) -> NetworkStatus:
         return NetworkStatus.CONNECTED
@@ -317,6 +380,9 @@ cdef class PaperTradeExchange(ExchangeBase):
 
     cdef c_tick(self, double timestamp):
         ExchangeBase.c_tick(self, timestamp)
+        # The listeners are only refreshed while they are attached, they stay removed after stop_network
+        if len(self._listened_order_books) > 0:
+            self.c_update_order_book_trade_listeners()
         self.c_process_market_orders()
         self.c_process_crossed_limit_orders()
 
@@ -373,6 +439,9 @@ cdef class PaperTradeExchange(ExchangeBase):
                 0,
                 cpp_position,
             ))
+            self.c_update_best_order_price(True, cpp_trading_pair_str)
+            if self._queue_position_simulation:
+                self.c_set_order_queue_position(True, trading_pair_str, cpp_order_id, quantized_price)
         safe_ensure_future(self.trigger_event_async(
             self.MARKET_BUY_ORDER_CREATED_EVENT_TAG,
             BuyOrderCreatedEvent(self._current_timestamp,
@@ -436,6 +505,9 @@ cdef class PaperTradeExchange(ExchangeBase):
                 0,
                 cpp_position,
             ))
+            self.c_update_best_order_price(False, cpp_trading_pair_str)
+            if self._queue_position_simulation:
+                self.c_set_order_queue_position(False, trading_pair_str, cpp_order_id, quantized_price)
         safe_ensure_future(self.trigger_event_async(
             self.MARKET_SELL_ORDER_CREATED_EVENT_TAG,
             SellOrderCreatedEvent(self._current_timestamp,
@@ -634,15 +706,73 @@ cdef class PaperTradeExchange(ExchangeBase):
                               const SingleTradingPairLimitOrdersIterator orders_it):
         cdef:
             SingleTradingPairLimitOrders *orders_collection_ptr = address(deref(deref(map_it_ptr)).second)
+            string cpp_trading_pair = deref(deref(map_it_ptr)).first
+            string cpp_order_id = deref(orders_it).getClientOrderID()
+            bint is_buy = limit_orders_map_ptr == address(self._bid_limit_orders)
         try:
             orders_collection_ptr.erase(orders_it)
             if orders_collection_ptr.empty():
                 map_it_ptr[0] = limit_orders_map_ptr.erase(deref(map_it_ptr))
+            self.c_update_best_order_price(is_buy, cpp_trading_pair)
+            self._order_queue_ahead.erase(cpp_order_id)
+            self._order_queue_sequence.erase(cpp_order_id)
+            self._partial_fill_totals.pop(cpp_order_id.decode("utf8"), None)
             return True
         except Exception as err:
             self.logger().error("Error deleting limit order.", exc_info=True)
             return False
 
+    cdef c_update_best_order_price(self, bint is_buy, string cpp_trading_pair):
+        """
+        Caches the most aggressive resting limit order price of a trading pair, so the order book checks on every tick
+        and trade can be skipped without walking the limit orders when nothing crosses.
+        """
+        cdef:
+            LimitOrders *limit_orders_map_ptr = address(self._bid_limit_orders) if is_buy else address(
+                self._ask_limit_orders)
+            OrderPrices *best_prices_ptr = address(self._best_bid_order_prices) if is_buy else address(
+                self._best_ask_order_prices)
+            LimitOrdersIterator map_it = limit_orders_map_ptr.find(cpp_trading_pair)
+            SingleTradingPairLimitOrders *orders_collection_ptr = NULL
+            const CPPLimitOrder *cpp_limit_order_ptr = NULL
+
+        if map_it == limit_orders_map_ptr.end() or deref(map_it).second.empty():
+            best_prices_ptr.erase(cpp_trading_pair)
+            return
+
+        orders_collection_ptr = address(deref(map_it).second)
+        if is_buy:
+            cpp_limit_order_ptr = address(deref(orders_collection_ptr.rbegin()))
+        else:
+            cpp_limit_order_ptr = address(deref(orders_collection_ptr.begin()))
+        deref(best_prices_ptr)[cpp_trading_pair] = float(<object> cpp_limit_order_ptr.getPrice())
+
+    cdef c_set_order_queue_position(self, bint is_buy, str trading_pair_str, string cpp_order_id, object price):
+        """
+        Records the volume resting in the order book at the limit order price when the order is placed. That volume
+        has to trade before the order starts to fill when queue position simulation is enabled. The placement sequence
+        number breaks the ties between paper orders with the same queue ahead of them.
+        """
+        cdef:
+            double order_price = float(price)
+            double queue_ahead = 0
+
+        try:
+            entries = (self.c_get_order_book(trading_pair_str).bid_entries()
+                       if is_buy
+                       else self.c_get_order_book(trading_pair_str).ask_entries())
+            for entry in entries:
+                if (is_buy and entry.price < order_price) or (not is_buy and entry.price > order_price):
+                    break
+                if entry.price == order_price:
+                    queue_ahead = entry.amount
+                    break
+        except Exception:
+            self.logger().error(f"Error reading the order book queue for {trading_pair_str}.", exc_info=True)
+        self._order_queue_ahead[cpp_order_id] = queue_ahead
+        self._order_queue_sequence[cpp_order_id] = self._next_order_queue_sequence
+        self._next_order_queue_sequence += 1
+
     cdef c_process_limit_bid_order(self,
                                    LimitOrders *limit_orders_map_ptr,
                                    LimitOrdersIterator *map_it_ptr,
@@ -654,10 +784,15 @@ cdef class PaperTradeExchange(ExchangeBase):
             str base_asset = cpp_limit_order_ptr.getBaseCurrency().decode("utf8")
             str order_id = cpp_limit_order_ptr.getClientOrderID().decode("utf8")
             object amount = <object> cpp_limit_order_ptr.getQuantity()
+            object filled_amount = <object> cpp_limit_order_ptr.getFilledQuantity()
             object price = <object> cpp_limit_order_ptr.getPrice()
             object quote_balance = self.c_get_balance(quote_asset)
             object base_balance = self.c_get_balance(base_asset)
 
+        # Partially filled orders only execute their remaining amount
+        if filled_amount is not None and filled_amount.is_finite():
+            amount = amount - filled_amount
+
         order_candidate = OrderCandidate(
             trading_pair=trading_pair_str,
             is_maker=True,
@@ -715,12 +850,14 @@ cdef class PaperTradeExchange(ExchangeBase):
                 trading_pair_str,
                 TradeType.BUY,
                 OrderType.LIMIT,
-                <object> cpp_limit_order_ptr.getPrice(),
-                <object> cpp_limit_order_ptr.getQuantity(),
+                price,
+                amount,
                 fees,
                 exchange_trade_id=str(int(self._time() * 1e6))
             ))
 
+        previous_paid_amount, previous_acquired_amount = self._partial_fill_totals.get(order_id, (s_decimal_0,
+                                                                                                  s_decimal_0))
         self.c_trigger_event(
             self.BUY_ORDER_COMPLETED_EVENT_TAG,
             BuyOrderCompletedEvent(
@@ -728,8 +865,8 @@ cdef class PaperTradeExchange(ExchangeBase):
                 order_id,
                 base_asset,
                 quote_asset,
-                acquired_amount,
-                paid_amount,
+                previous_acquired_amount + acquired_amount,
+                previous_paid_amount + paid_amount,
                 OrderType.LIMIT
             ))
         self.c_delete_limit_order(limit_orders_map_ptr, map_it_ptr, orders_it)
@@ -745,10 +882,15 @@ cdef class PaperTradeExchange(ExchangeBase):
             str base_asset = cpp_limit_order_ptr.getBaseCurrency().decode("utf8")
             str order_id = cpp_limit_order_ptr.getClientOrderID().decode("utf8")
             object amount = <object> cpp_limit_order_ptr.getQuantity()
+            object filled_amount = <object> cpp_limit_order_ptr.getFilledQuantity()
             object price = <object> cpp_limit_order_ptr.getPrice()
             object quote_balance = self.c_get_balance(quote_asset)
             object base_balance = self.c_get_balance(base_asset)
 
+        # Partially filled orders only execute their remaining amount
+        if filled_amount is not None and filled_amount.is_finite():
+            amount = amount - filled_amount
+
         order_candidate = OrderCandidate(
             trading_pair=trading_pair_str,
             # Market orders are not maker orders
@@ -806,12 +948,14 @@ cdef class PaperTradeExchange(ExchangeBase):
                 trading_pair_str,
                 TradeType.SELL,
                 OrderType.LIMIT,
-                <object> cpp_limit_order_ptr.getPrice(),
-                <object> cpp_limit_order_ptr.getQuantity(),
+                price,
+                amount,
                 fees,
                 exchange_trade_id=str(int(self._time() * 1e6))
             ))
 
+        previous_sold_amount, previous_acquired_amount = self._partial_fill_totals.get(order_id, (s_decimal_0,
+                                                                                                  s_decimal_0))
         self.c_trigger_event(
             self.SELL_ORDER_COMPLETED_EVENT_TAG,
             SellOrderCompletedEvent(
@@ -819,8 +963,8 @@ cdef class PaperTradeExchange(ExchangeBase):
                 order_id,
                 base_asset,
                 quote_asset,
-                sold_amount,
-                acquired_amount,
+                previous_sold_amount + sold_amount,
+                previous_acquired_amount + acquired_amount,
                 OrderType.LIMIT
             ))
         self.c_delete_limit_order(limit_orders_map_ptr, map_it_ptr, orders_it)
@@ -838,6 +982,119 @@ cdef class PaperTradeExchange(ExchangeBase):
         except Exception as e:
             self.logger().error(f"Error processing limit order.", exc_info=True)
 
+    cdef c_process_limit_order_partial_fill(self,
+                                            bint is_buy,
+                                            LimitOrders *limit_orders_map_ptr,
+                                            LimitOrdersIterator *map_it_ptr,
+                                            SingleTradingPairLimitOrdersIterator orders_it,
+                                            object fill_amount):
+        """
+        Fills part of a resting limit order. The order stays in the book with its filled quantity increased, and the
+        fill totals are accumulated so the order completed event reports the whole order once it is fully filled.
+
+        :param is_buy: is the limit order on the bid side?
+        :param limit_orders_map_ptr: pointer to the limit orders map
+        :param map_it_ptr: limit orders map iterator, which implies the trading pair being processed
+        :param orders_it: iterator of the limit order being filled
+        :param fill_amount: the quantized amount filled
+        """
+        cdef:
+            const CPPLimitOrder *cpp_limit_order_ptr = address(deref(orders_it))
+            SingleTradingPairLimitOrders *orders_collection_ptr = address(deref(deref(map_it_ptr)).second)
+            str trading_pair_str = cpp_limit_order_ptr.getTradingPair().decode("utf8")
+            str quote_asset = cpp_limit_order_ptr.getQuoteCurrency().decode("utf8")
+            str base_asset = cpp_limit_order_ptr.getBaseCurrency().decode("utf8")
+            str order_id = cpp_limit_order_ptr.getClientOrderID().decode("utf8")
+            object price = <object> cpp_limit_order_ptr.getPrice()
+            object filled_amount = <object> cpp_limit_order_ptr.getFilledQuantity()
+            object quote_balance = self.c_get_balance(quote_asset)
+            object base_balance = self.c_get_balance(base_asset)
+            object trade_type = TradeType.BUY if is_buy else TradeType.SELL
+            CPPLimitOrder partially_filled_order = deref(orders_it)
+
+        if filled_amount is None or not filled_amount.is_finite():
+            filled_amount = s_decimal_0
+
+        order_candidate = OrderCandidate(
+            trading_pair=trading_pair_str,
+            is_maker=True,
+            order_type=OrderType.LIMIT,
+            order_side=trade_type,
+            amount=fill_amount,
+            price=price,
+            from_total_balances=True
+        )
+        adjusted_order_candidate = self._budget_checker.populate_collateral_entries(order_candidate)
+
+        # Quote currency paid for buys and base currency sold for sells, including fees.
+        collateral_amount = adjusted_order_candidate.order_collateral.amount
+        # Base currency acquired for buys and quote currency acquired for sells, including fees.
+        returns_amount = adjusted_order_candidate.potential_returns.amount
+
+        if (is_buy and collateral_amount > quote_balance) or (not is_buy and collateral_amount > base_balance):
+            self.logger().warning(f"Not enough balance to fill limit {trade_type.name.lower()} order "
+                                  f"{order_id} on {trading_pair_str}.")
+            self.c_delete_limit_order(limit_orders_map_ptr, map_it_ptr, orders_it)
+            self.c_trigger_event(self.MARKET_ORDER_CANCELED_EVENT_TAG,
+                                 OrderCancelledEvent(self._current_timestamp,
+                                                     order_id)
+                                 )
+            return
+
+        if is_buy:
+            self.c_set_balance(quote_asset, quote_balance - collateral_amount)
+            self.c_set_balance(base_asset, base_balance + returns_amount)
+        else:
+            self.c_set_balance(quote_asset, quote_balance + returns_amount)
+            self.c_set_balance(base_asset, base_balance - collateral_amount)
+
+        fees = build_trade_fee(
+            exchange=self.name,
+            is_maker=True,
+            base_currency="",
+            quote_currency="",
+            order_type=OrderType.LIMIT,
+            order_side=trade_type,
+            amount=Decimal("0"),
+            price=Decimal("0"),
+        )
+        self.c_trigger_event(
+            self.ORDER_FILLED_EVENT_TAG,
+            OrderFilledEvent(
+                self._current_timestamp,
+                order_id,
+                trading_pair_str,
+                trade_type,
+                OrderType.LIMIT,
+                price,
+                fill_amount,
+                fees,
+                exchange_trade_id=str(int(self._time() * 1e6))
+            ))
+
+        previous_collateral_amount, previous_returns_amount = self._partial_fill_totals.get(order_id, (s_decimal_0,
+                                                                                                       s_decimal_0))
+        self._partial_fill_totals[order_id] = (previous_collateral_amount + collateral_amount,
+                                               previous_returns_amount + returns_amount)
+
+        # The set elements are immutable, the order is replaced by a copy with the new filled quantity. The ordering
+        # only depends on the price and the order id, so the order keeps its place in the set.
+        filled_amount = filled_amount + fill_amount
+        orders_collection_ptr.erase(orders_it)
+        orders_collection_ptr.insert(CPPLimitOrder(
+            partially_filled_order.getClientOrderID(),
+            partially_filled_order.getTradingPair(),
+            partially_filled_order.getIsBuy(),
+            partially_filled_order.getBaseCurrency(),
+            partially_filled_order.getQuoteCurrency(),
+            partially_filled_order.getPrice(),
+            partially_filled_order.getQuantity(),
+            <PyObject *> filled_amount,
+            partially_filled_order.getCreationTimestamp(),
+            partially_filled_order.getStatus(),
+            partially_filled_order.getPosition(),
+        ))
+
     cdef c_process_crossed_limit_orders_for_trading_pair(self,
                                                          bint is_buy,
                                                          LimitOrders *limit_orders_map_ptr,
@@ -851,14 +1108,28 @@ cdef class PaperTradeExchange(ExchangeBase):
         :param map_it_ptr: limit orders map iterator, which implies the trading pair being processed
         """
         cdef:
-            str trading_pair = deref(deref(map_it_ptr)).first.decode("utf8")
+            string cpp_trading_pair = deref(deref(map_it_ptr)).first
+            str trading_pair = cpp_trading_pair.decode("utf8")
+            OrderPrices *best_prices_ptr = address(self._best_bid_order_prices) if is_buy else address(
+                self._best_ask_order_prices)
+            OrderPrices.iterator best_price_it = best_prices_ptr.find(cpp_trading_pair)
             object opposite_order_book_price = self.c_get_price(trading_pair, is_buy)
+            double opposite_price = float(opposite_order_book_price)
             SingleTradingPairLimitOrders *orders_collection_ptr = address(deref(deref(map_it_ptr)).second)
             SingleTradingPairLimitOrdersIterator orders_it = orders_collection_ptr.begin()
             SingleTradingPairLimitOrdersRIterator orders_rit = orders_collection_ptr.rbegin()
             vector[SingleTradingPairLimitOrdersIterator] process_order_its
             const CPPLimitOrder *cpp_limit_order_ptr = NULL
 
+        # Skip walking the limit orders when the most aggressive one is not crossed by the order book
+        if math.isnan(opposite_price):
+            return
+        if best_price_it != best_prices_ptr.end():
+            if is_buy and opposite_price > deref(best_price_it).second:
+                return
+            if not is_buy and opposite_price < deref(best_price_it).second:
+                return
+
         if is_buy:
             while orders_rit != orders_collection_ptr.rend():
                 cpp_limit_order_ptr = address(deref(orders_rit))
@@ -911,6 +1182,10 @@ cdef class PaperTradeExchange(ExchangeBase):
             LimitOrders *limit_orders_map_ptr = (address(self._bid_limit_orders)
                                                  if is_maker_buy
                                                  else address(self._ask_limit_orders))
+            OrderPrices *best_prices_ptr = (address(self._best_bid_order_prices)
+                                            if is_maker_buy
+                                            else address(self._best_ask_order_prices))
+            OrderPrices.iterator best_price_it
             LimitOrdersIterator map_it = limit_orders_map_ptr.find(cpp_trading_pair)
             SingleTradingPairLimitOrders *orders_collection_ptr = NULL
             SingleTradingPairLimitOrdersIterator orders_it
@@ -921,6 +1196,21 @@ cdef class PaperTradeExchange(ExchangeBase):
         if map_it == limit_orders_map_ptr.end():
             return
 
+        if self._queue_position_simulation:
+            self.c_match_trade_to_limit_orders_queue(is_maker_buy,
+                                                     float(trade_price),
+                                                     float(trade_quantity),
+                                                     limit_orders_map_ptr,
+                                                     address(map_it))
+            return
+
+        best_price_it = best_prices_ptr.find(cpp_trading_pair)
+        if best_price_it != best_prices_ptr.end():
+            if is_maker_buy and deref(best_price_it).second <= float(trade_price):
+                return
+            if not is_maker_buy and deref(best_price_it).second >= float(trade_price):
+                return
+
         orders_collection_ptr = address(deref(map_it).second)
         if is_maker_buy:
             orders_rit = orders_collection_ptr.rbegin()
@@ -943,6 +1233,115 @@ cdef class PaperTradeExchange(ExchangeBase):
         for orders_it in process_order_its:
             self.c_process_limit_order(is_maker_buy, limit_orders_map_ptr, address(map_it), orders_it)
 
+    cdef c_match_trade_to_limit_orders_queue(self,
+                                             bint is_maker_buy,
+                                             double trade_price,
+                                             double trade_quantity,
+                                             LimitOrders *limit_orders_map_ptr,
+                                             LimitOrdersIterator *map_it_ptr):
+        """
+        Matches a trade to the limit orders taking their queue position into account. Limit orders crossed by the
+        trade price are fully filled. The trade volume reduces the order book volume ahead of every limit order at the
+        trade price, and the volume left after an order's queue fills it, net of the fills of the paper orders ahead.
+
+        :param is_maker_buy: are the limit orders on the bid side?
+        :param trade_price: the trade price
+        :param trade_quantity: the trade amount
+        :param limit_orders_map_ptr: pointer to the limit orders map
+        :param map_it_ptr: limit orders map iterator, which implies the trading pair being processed
+        """
+        cdef:
+            str trading_pair = deref(deref(map_it_ptr)).first.decode("utf8")
+            SingleTradingPairLimitOrders *orders_collection_ptr = address(deref(deref(map_it_ptr)).second)
+            SingleTradingPairLimitOrdersIterator orders_it
+            SingleTradingPairLimitOrdersRIterator orders_rit
+            vector[SingleTradingPairLimitOrdersIterator] process_order_its
+            vector[SingleTradingPairLimitOrdersIterator] queued_order_its
+            const CPPLimitOrder *cpp_limit_order_ptr = NULL
+            string cpp_order_id
+            unordered_map[string, double].iterator queue_it
+            unordered_map[string, long long].iterator sequence_it
+            long long sequence
+            double order_price
+            double queue_ahead
+            double available_quantity
+            double allocated_quantity = 0
+            size_t i
+            list queued_orders = []
+            double order_remaining_quantity
+            double fill_quantity
+            object filled_amount
+            object fill_amount
+
+        if is_maker_buy:
+            orders_rit = orders_collection_ptr.rbegin()
+            while orders_rit != orders_collection_ptr.rend():
+                cpp_limit_order_ptr = address(deref(orders_rit))
+                order_price = float(<object> cpp_limit_order_ptr.getPrice())
+                if order_price < trade_price:
+                    break
+                if order_price > trade_price:
+                    process_order_its.push_back(getIteratorFromReverseIterator(
+                        <reverse_iterator[SingleTradingPairLimitOrdersIterator]>orders_rit))
+                else:
+                    queued_order_its.push_back(getIteratorFromReverseIterator(
+                        <reverse_iterator[SingleTradingPairLimitOrdersIterator]>orders_rit))
+                inc(orders_rit)
+        else:
+            orders_it = orders_collection_ptr.begin()
+            while orders_it != orders_collection_ptr.end():
+                cpp_limit_order_ptr = address(deref(orders_it))
+                order_price = float(<object> cpp_limit_order_ptr.getPrice())
+                if order_price > trade_price:
+                    break
+                if order_price < trade_price:
+                    process_order_its.push_back(orders_it)
+                else:
+                    queued_order_its.push_back(orders_it)
+                inc(orders_it)
+
+        # The whole trade volume goes through the order book queue ahead of every order at the trade price, so all of
+        # their queues are reduced before allocating fills. The volume beyond an order's queue is shared with the other
+        # paper orders at the price, starting with the ones closer to the front of the queue and, for the same queue,
+        # with the ones placed first.
+        for i in range(queued_order_its.size()):
+            cpp_order_id = address(deref(queued_order_its[i])).getClientOrderID()
+            queue_it = self._order_queue_ahead.find(cpp_order_id)
+            queue_ahead = deref(queue_it).second if queue_it != self._order_queue_ahead.end() else 0
+            self._order_queue_ahead[cpp_order_id] = max(queue_ahead - trade_quantity, 0)
+            sequence_it = self._order_queue_sequence.find(cpp_order_id)
+            sequence = deref(sequence_it).second if sequence_it != self._order_queue_sequence.end() else -1
+            queued_orders.append((queue_ahead, sequence, i))
+        queued_orders.sort()
+
+        # Orders at the trade price are resolved first, processing the crossed orders may remove the trading pair
+        for queue_ahead, sequence, i in queued_orders:
+            available_quantity = trade_quantity - queue_ahead - allocated_quantity
+            if available_quantity <= 0:
+                # The next orders have a longer queue ahead of them
+                break
+            orders_it = queued_order_its[i]
+            cpp_limit_order_ptr = address(deref(orders_it))
+            filled_amount = <object> cpp_limit_order_ptr.getFilledQuantity()
+            if filled_amount is None or not filled_amount.is_finite():
+                filled_amount = s_decimal_0
+            order_remaining_quantity = float(<object> cpp_limit_order_ptr.getQuantity() - filled_amount)
+            fill_quantity = min(available_quantity, order_remaining_quantity)
+            allocated_quantity += fill_quantity
+            if fill_quantity >= order_remaining_quantity:
+                process_order_its.push_back(orders_it)
+                continue
+            fill_amount = self.c_quantize_order_amount(trading_pair, Decimal(repr(fill_quantity)))
+            if fill_amount > s_decimal_0:
+                self.c_process_limit_order_partial_fill(is_maker_buy,
+                                                        limit_orders_map_ptr,
+                                                        map_it_ptr,
+                                                        orders_it,
+                                                        fill_amount)
+
+        for orders_it in process_order_its:
+            self.c_process_limit_order(is_maker_buy, limit_orders_map_ptr, map_it_ptr, orders_it)
+
     # </editor-fold>
 
     cdef object c_get_available_balance(self, str currency):
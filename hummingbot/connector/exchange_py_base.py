@@ -4,22 +4,24 @@ import logging
 import math
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, AsyncIterable, Callable, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, AsyncIterable, Callable, Dict, List, Optional, Tuple, Union
 
 from async_timeout import timeout
 
 from hummingbot.connector.client_order_tracker import ClientOrderTracker
 from hummingbot.connector.constants import MINUTE, TWELVE_HOURS, s_decimal_0, s_decimal_NaN
 from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.connector.gateway.common_types import CancelOrderResult, PlaceOrderResult
 from hummingbot.connector.time_synchronizer import TimeSynchronizer
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
 from hummingbot.core.api_throttler.data_types import RateLimit
 from hummingbot.core.data_type.cancellation_result import CancellationResult
-from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.common import OrderType, PositionAction, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
 from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.core.data_type.market_order import MarketOrder
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -45,6 +47,11 @@ class ExchangePyBase(ExchangeBase, ABC):
     TRADING_RULES_INTERVAL = 30 * MINUTE
     TRADING_FEES_INTERVAL = TWELVE_HOURS
     TICK_INTERVAL_LIMIT = 60.0
+    MAX_ORDERS_PER_BATCH_CREATE = 10
+    MAX_ORDERS_PER_BATCH_CANCEL = 10
+    ORDER_BOOK_COALESCE_DIFFS = False
+    ORDER_BOOK_MAX_DIFF_LAG = 0.0
+    ORDER_BOOK_DETECT_DIFF_GAPS = False
 
     def __init__(self, client_config_map: "ClientConfigAdapter"):
         super().__init__(client_config_map)
@@ -76,7 +83,10 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._set_order_book_tracker(OrderBookTracker(
             data_source=self._orderbook_ds,
             trading_pairs=self.trading_pairs,
-            domain=self.domain))
+            domain=self.domain,
+            coalesce_diffs=self.ORDER_BOOK_COALESCE_DIFFS,
+            max_diff_lag=self.ORDER_BOOK_MAX_DIFF_LAG,
+            detect_diff_gaps=self.ORDER_BOOK_DETECT_DIFF_GAPS))
 
         # init UserStream Data Source and Tracker
         self._user_stream_tracker = self._create_user_stream_tracker()
@@ -244,6 +254,15 @@ class ExchangePyBase(ExchangeBase, ABC):
             raise ValueError(f"No order book exists for '{trading_pair}'.")
         return self.order_book_tracker.order_books[trading_pair]
 
+    def get_order_book_age(self, trading_pair: str) -> float:
+        """
+        Returns the time in seconds since the order book for a particular market was last updated. Strategies can use
+        it to avoid acting on a stale order book.
+
+        :param trading_pair: the pair of tokens for which the order book age should be retrieved
+        """
+        return self.order_book_tracker.order_book_age(trading_pair)
+
     def tick(self, timestamp: float):
         """
         Includes the logic that has to be processed every time a new tick happens in the bot. Particularly it enables
@@ -332,6 +351,41 @@ class ExchangePyBase(ExchangeBase, ABC):
             **kwargs))
         return order_id
 
+    def batch_order_create(
+        self, orders_to_create: List[Union[LimitOrder, MarketOrder]]
+    ) -> List[Union[LimitOrder, MarketOrder]]:
+        """
+        Issues a batch order creation. Connectors implementing `_place_batch_order_create` send the orders in batch
+        requests of up to MAX_ORDERS_PER_BATCH_CREATE orders. For the rest of connectors the orders are sent one by one.
+
+        :param orders_to_create: A list of LimitOrder or MarketOrder objects representing the orders to create. The
+            order IDs can be blanc.
+
+        :return: A list of LimitOrder or MarketOrder objects representing the created orders, complete with the
+            generated order IDs.
+        """
+        orders_with_ids_to_create = []
+        for order in orders_to_create:
+            client_order_id = get_new_client_order_id(
+                is_buy=order.is_buy,
+                trading_pair=order.trading_pair,
+                hbot_order_id_prefix=self.client_order_id_prefix,
+                max_id_len=self.client_order_id_max_length,
+            )
+            orders_with_ids_to_create.append(order.copy_with_id(client_order_id=client_order_id))
+        safe_ensure_future(self._execute_batch_order_create(orders_to_create=orders_with_ids_to_create))
+        return orders_with_ids_to_create
+
+    def batch_order_cancel(self, orders_to_cancel: List[LimitOrder]):
+        """
+        Issues a batch order cancelation. Connectors implementing `_place_batch_order_cancel` send the cancelations in
+        batch requests of up to MAX_ORDERS_PER_BATCH_CANCEL orders. For the rest of connectors the orders are canceled
+        one by one.
+
+        :param orders_to_cancel: A list of the orders to cancel.
+        """
+        safe_ensure_future(self._execute_batch_order_cancel(orders_to_cancel=orders_to_cancel))
+
     def get_fee(self,
                 base_currency: str,
                 quote_currency: str,
@@ -378,20 +432,15 @@ class ExchangePyBase(ExchangeBase, ABC):
         :return: a list of CancellationResult instances, one for each of the orders to be cancelled
         """
         incomplete_orders = [o for o in self.in_flight_orders.values() if not o.is_done]
-        tasks = [self._execute_cancel(o.trading_pair, o.client_order_id) for o in incomplete_orders]
         order_id_set = set([o.client_order_id for o in incomplete_orders])
         successful_cancellations = []
 
         try:
             async with timeout(timeout_seconds):
-                cancellation_results = await safe_gather(*tasks, return_exceptions=True)
-                for cr in cancellation_results:
-                    if isinstance(cr, Exception):
-                        continue
-                    client_order_id = cr
-                    if client_order_id is not None:
-                        order_id_set.remove(client_order_id)
-                        successful_cancellations.append(CancellationResult(client_order_id, True))
+                cancelled_order_ids = await self._execute_orders_cancel(orders=incomplete_orders)
+                for client_order_id in cancelled_order_ids:
+                    order_id_set.remove(client_order_id)
+                    successful_cancellations.append(CancellationResult(client_order_id, True))
         except Exception:
             self.logger().network(
                 "Unexpected error cancelling orders.",
@@ -422,6 +471,37 @@ class ExchangePyBase(ExchangeBase, ABC):
         :param order_type: the type of order to create (MARKET, LIMIT, LIMIT_MAKER)
         :param price: the order price
         """
+        order = self._track_and_validate_order(
+            trade_type=trade_type,
+            order_id=order_id,
+            trading_pair=trading_pair,
+            amount=amount,
+            order_type=order_type,
+            price=price,
+            stop_price=stop_price,
+            call_back_rate=call_back_rate,
+            activation_price=activation_price,
+            **kwargs,
+        )
+        if order is not None:
+            await self._submit_order(order=order, **kwargs)
+
+    def _track_and_validate_order(self,
+                                  trade_type: TradeType,
+                                  order_id: str,
+                                  trading_pair: str,
+                                  amount: Decimal,
+                                  order_type: OrderType,
+                                  price: Optional[Decimal] = None,
+                                  stop_price: Optional[Decimal] = None,
+                                  call_back_rate: Optional[Decimal] = None,
+                                  activation_price: Optional[Decimal] = None,
+                                  **kwargs) -> Optional[InFlightOrder]:
+        """
+        Quantizes the order parameters, starts tracking the order and validates it against the trading rules.
+
+        :return: the tracked order, or None if the order is not valid (in that case it is already marked as failed)
+        """
         trading_rule = self._trading_rules[trading_pair]
 
         if order_type in [OrderType.LIMIT, OrderType.LIMIT_MAKER,
@@ -461,40 +541,107 @@ class ExchangePyBase(ExchangeBase, ABC):
         if order_type not in self.supported_order_types():
             self.logger().error(f"{order_type} is not in the list of supported order types")
             self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
-            return
+            return None
 
         elif quantized_amount < trading_rule.min_order_size:
             self.logger().warning(f"{trade_type.name.title()} order amount {amount} is lower than the minimum order "
                                   f"size {trading_rule.min_order_size}. The order will not be created, increase the "
                                   f"amount to be higher than the minimum order size.")
             self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
-            return
+            return None
 
         elif notional_size < trading_rule.min_notional_size:
             self.logger().warning(f"{trade_type.name.title()} order notional {notional_size} is lower than the "
                                   f"minimum notional size {trading_rule.min_notional_size}. The order will not be "
                                   f"created. Increase the amount or the price to be higher than the minimum notional.")
             self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
-            return
+            return None
+
+        return order
+
+    async def _submit_order(self, order: InFlightOrder, **kwargs):
         try:
             await self._place_order_and_process_update(order=order, **kwargs,)
 
         except asyncio.CancelledError:
             raise
         except Exception as ex:
-            self._on_order_failure(
-                order_id=order_id,
-                trading_pair=trading_pair,
-                amount=quantized_amount,
-                trade_type=trade_type,
+            self._on_in_flight_order_failure(order=order, exception=ex, **kwargs)
+
+    def _on_in_flight_order_failure(self, order: InFlightOrder, exception: Exception, **kwargs):
+        self._on_order_failure(
+            order_id=order.client_order_id,
+            trading_pair=order.trading_pair,
+            amount=order.amount,
+            trade_type=order.trade_type,
+            order_type=order.order_type,
+            price=order.price,
+            stop_price=order.stop_price,
+            call_back_rate=order.call_back_rate,
+            activation_price=order.activation_price,
+            exception=exception,
+            **kwargs,
+        )
+
+    async def _execute_batch_order_create(self, orders_to_create: List[Union[LimitOrder, MarketOrder]]):
+        orders_and_kwargs: List[Tuple[InFlightOrder, Dict[str, Any]]] = []
+        for order in orders_to_create:
+            order_type = order.order_type()
+            kwargs = {} if order.position == PositionAction.NIL else {"position_action": order.position}
+            in_flight_order = self._track_and_validate_order(
+                trade_type=TradeType.BUY if order.is_buy else TradeType.SELL,
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.quantity,
                 order_type=order_type,
-                price=price,
-                stop_price=stop_price,
-                call_back_rate=call_back_rate,
-                activation_price=activation_price,
-                exception=ex,
+                price=order.price if order_type == OrderType.LIMIT else s_decimal_NaN,
                 **kwargs,
             )
+            if in_flight_order is not None:
+                orders_and_kwargs.append((in_flight_order, kwargs))
+
+        chunks = [
+            orders_and_kwargs[i:i + self.MAX_ORDERS_PER_BATCH_CREATE]
+            for i in range(0, len(orders_and_kwargs), self.MAX_ORDERS_PER_BATCH_CREATE)
+        ]
+        await safe_gather(*[self._execute_batch_order_create_chunk(orders_and_kwargs=chunk) for chunk in chunks])
+
+    async def _execute_batch_order_create_chunk(self, orders_and_kwargs: List[Tuple[InFlightOrder, Dict[str, Any]]]):
+        orders = [order for order, _ in orders_and_kwargs]
+        try:
+            place_order_results = await self._place_batch_order_create(orders_to_create=orders)
+        except NotImplementedError:
+            await safe_gather(*[self._submit_order(order=order, **kwargs) for order, kwargs in orders_and_kwargs])
+            return
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:
+            self.logger().network("Batch order create failed.")
+            for order, kwargs in orders_and_kwargs:
+                self._on_in_flight_order_failure(order=order, exception=ex, **kwargs)
+            return
+
+        place_order_results_by_id = {result.client_order_id: result for result in place_order_results}
+        for order, kwargs in orders_and_kwargs:
+            place_order_result = place_order_results_by_id.get(order.client_order_id)
+            if place_order_result is None:
+                self._on_in_flight_order_failure(
+                    order=order,
+                    exception=IOError(f"The batch order create response has no result for {order.client_order_id}."),
+                    **kwargs,
+                )
+            elif place_order_result.exception is not None:
+                self._on_in_flight_order_failure(order=order, exception=place_order_result.exception, **kwargs)
+            else:
+                order_update: OrderUpdate = OrderUpdate(
+                    client_order_id=order.client_order_id,
+                    exchange_order_id=str(place_order_result.exchange_order_id),
+                    trading_pair=order.trading_pair,
+                    update_timestamp=place_order_result.update_timestamp,
+                    new_state=OrderState.OPEN,
+                    misc_updates=place_order_result.misc_updates,
+                )
+                self._order_tracker.process_order_update(order_update)
 
     async def _place_order_and_process_update(self, order: InFlightOrder, **kwargs) -> str:
         exchange_order_id, update_timestamp = await self._place_order(
@@ -604,6 +751,74 @@ class ExchangePyBase(ExchangeBase, ABC):
 
         return result
 
+    async def _execute_batch_order_cancel(self, orders_to_cancel: List[LimitOrder]) -> List[CancellationResult]:
+        tracked_orders_to_cancel = []
+        for order in orders_to_cancel:
+            tracked_order = self._order_tracker.fetch_tracked_order(order.client_order_id)
+            if tracked_order is not None:
+                tracked_orders_to_cancel.append(tracked_order)
+
+        cancelled_order_ids = set(await self._execute_orders_cancel(orders=tracked_orders_to_cancel))
+        return [
+            CancellationResult(order.client_order_id, order.client_order_id in cancelled_order_ids)
+            for order in orders_to_cancel
+        ]
+
+    async def _execute_orders_cancel(self, orders: List[InFlightOrder]) -> List[str]:
+        """
+        Requests the exchange to cancel the orders, in batches if the connector supports batch cancelations.
+
+        :return: the client ids of the orders successfully canceled
+        """
+        chunks = [
+            orders[i:i + self.MAX_ORDERS_PER_BATCH_CANCEL]
+            for i in range(0, len(orders), self.MAX_ORDERS_PER_BATCH_CANCEL)
+        ]
+        chunks_results = await safe_gather(*[self._execute_orders_cancel_chunk(orders=chunk) for chunk in chunks])
+        return [client_order_id for chunk_result in chunks_results for client_order_id in chunk_result]
+
+    async def _execute_orders_cancel_chunk(self, orders: List[InFlightOrder]) -> List[str]:
+        try:
+            cancel_order_results = await self._place_batch_order_cancel(orders_to_cancel=orders)
+        except NotImplementedError:
+            tasks = [self._execute_cancel(o.trading_pair, o.client_order_id) for o in orders]
+            cancellation_results = await safe_gather(*tasks, return_exceptions=True)
+            return [cr for cr in cancellation_results if cr is not None and not isinstance(cr, Exception)]
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().error(
+                f"Failed to cancel orders {', '.join([o.client_order_id for o in orders])}", exc_info=True
+            )
+            return []
+
+        cancelled_order_ids = []
+        for cancel_order_result in cancel_order_results:
+            if cancel_order_result.not_found:
+                self.logger().warning(f"Failed to cancel order {cancel_order_result.client_order_id} (order not found)")
+                await self._order_tracker.process_order_not_found(cancel_order_result.client_order_id)
+            elif cancel_order_result.exception is not None:
+                self.logger().error(
+                    f"Failed to cancel order {cancel_order_result.client_order_id}",
+                    exc_info=cancel_order_result.exception,
+                )
+            else:
+                update_timestamp = self.current_timestamp
+                if update_timestamp is None or math.isnan(update_timestamp):
+                    update_timestamp = self._time()
+                order_update: OrderUpdate = OrderUpdate(
+                    client_order_id=cancel_order_result.client_order_id,
+                    trading_pair=cancel_order_result.trading_pair,
+                    update_timestamp=update_timestamp,
+                    new_state=(OrderState.CANCELED
+                               if self.is_cancel_request_in_exchange_synchronous
+                               else OrderState.PENDING_CANCEL),
+                    misc_updates=cancel_order_result.misc_updates,
+                )
+                self._order_tracker.process_order_update(order_update)
+                cancelled_order_ids.append(cancel_order_result.client_order_id)
+        return cancelled_order_ids
+
     # === Order Tracking ===
 
     def restore_tracking_states(self, saved_states: Dict[str, Any]):
@@ -686,6 +901,20 @@ class ExchangePyBase(ExchangeBase, ABC):
                            ) -> Tuple[str, float]:
         raise NotImplementedError
 
+    async def _place_batch_order_create(self, orders_to_create: List[InFlightOrder]) -> List[PlaceOrderResult]:
+        """
+        Sends the orders to the exchange in a single request. Connectors for exchanges with a batch order endpoint
+        should override this method. The results must be returned in the same order as the orders to create.
+        """
+        raise NotImplementedError
+
+    async def _place_batch_order_cancel(self, orders_to_cancel: List[InFlightOrder]) -> List[CancelOrderResult]:
+        """
+        Sends the cancelations of the orders to the exchange in a single request. Connectors for exchanges with a batch
+        cancel endpoint should override this method.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def _get_fee(self,
                  base_currency: str,
@@ -1,7 +1,7 @@
 import asyncio
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
 
 from hummingbot.connector.constants import s_decimal_0, s_decimal_NaN
 from hummingbot.connector.derivative.perpetual_budget_checker import PerpetualBudgetChecker
@@ -11,6 +11,8 @@ from hummingbot.connector.perpetual_trading import PerpetualTrading
 from hummingbot.core.data_type.common import OrderType, PositionAction, PositionMode, TradeType
 from hummingbot.core.data_type.funding_info import FundingInfo
 from hummingbot.core.data_type.in_flight_order import PerpetualDerivativeInFlightOrder
+from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.core.data_type.market_order import MarketOrder
 from hummingbot.core.data_type.perpetual_api_order_book_data_source import PerpetualAPIOrderBookDataSource
 from hummingbot.core.data_type.trade_fee import TradeFeeBase
 from hummingbot.core.event.events import (
@@ -27,6 +29,10 @@ if TYPE_CHECKING:
 
 class PerpetualDerivativePyBase(ExchangePyBase, ABC):
     VALID_POSITION_ACTIONS = [PositionAction.OPEN, PositionAction.CLOSE]
+    # Maximum number of trading pairs initialized at the same time on start (the requests still go through the throttler)
+    FUNDING_INFO_INIT_CONCURRENCY = 10
+    # Position modes are set one pair at a time by default, because most exchanges use a single mode for the account
+    POSITION_MODE_SET_CONCURRENCY = 1
 
     def __init__(self, client_config_map: "ClientConfigAdapter"):
         super().__init__(client_config_map)
@@ -265,6 +271,18 @@ class PerpetualDerivativePyBase(ExchangePyBase, ABC):
             **kwargs,
         )
 
+    async def _execute_batch_order_create(self, orders_to_create: List[Union[LimitOrder, MarketOrder]]):
+        valid_orders = []
+        for order in orders_to_create:
+            if order.position not in self.VALID_POSITION_ACTIONS:
+                self.logger().error(
+                    f"Invalid position action {order.position} for order {order.client_order_id}. "
+                    f"Must be one of {self.VALID_POSITION_ACTIONS}"
+                )
+            else:
+                valid_orders.append(order)
+        await super()._execute_batch_order_create(orders_to_create=valid_orders)
+
     def get_fee(
         self,
         base_currency: str,
@@ -352,20 +370,40 @@ class PerpetualDerivativePyBase(ExchangePyBase, ABC):
     async def _execute_set_position_mode_for_pairs(
         self, mode: PositionMode, trading_pairs: List[str]
     ) -> Tuple[bool, List[str], str]:
-        successful_pairs = []
-        success = True
-        msg = ""
+        if self.POSITION_MODE_SET_CONCURRENCY <= 1:
+            successful_pairs = []
+            success = True
+            msg = ""
 
-        for trading_pair in trading_pairs:
-            if mode != self._perpetual_trading.position_mode:
-                success, msg = await self._trading_pair_position_mode_set(mode, trading_pair)
-            if success:
-                successful_pairs.append(trading_pair)
-            else:
-                self.logger().network(f"Error switching {trading_pair} mode to {mode}: {msg}")
-                break
+            for trading_pair in trading_pairs:
+                if mode != self._perpetual_trading.position_mode:
+                    success, msg = await self._trading_pair_position_mode_set(mode, trading_pair)
+                if success:
+                    successful_pairs.append(trading_pair)
+                else:
+                    self.logger().network(f"Error switching {trading_pair} mode to {mode}: {msg}")
+                    break
+
+            return success, successful_pairs, msg
+
+        if mode == self._perpetual_trading.position_mode:
+            return True, list(trading_pairs), ""
+
+        semaphore = asyncio.Semaphore(self.POSITION_MODE_SET_CONCURRENCY)
+
+        async def set_pair_position_mode(trading_pair: str) -> Tuple[bool, str]:
+            async with semaphore:
+                return await self._trading_pair_position_mode_set(mode, trading_pair)
+
+        results = await safe_gather(*[set_pair_position_mode(trading_pair) for trading_pair in trading_pairs])
+        successful_pairs = [trading_pair for trading_pair, (success, _) in zip(trading_pairs, results) if success]
+        msg = ""
+        for trading_pair, (success, pair_msg) in zip(trading_pairs, results):
+            if not success:
+                self.logger().network(f"Error switching {trading_pair} mode to {mode}: {pair_msg}")
+                msg = msg or pair_msg
 
-        return success, successful_pairs, msg
+        return len(successful_pairs) == len(trading_pairs), successful_pairs, msg
 
     async def _execute_set_leverage(self, trading_pair: str, leverage: int):
         success, msg = await self._set_trading_pair_leverage(trading_pair, leverage)
@@ -382,10 +420,34 @@ class PerpetualDerivativePyBase(ExchangePyBase, ABC):
         )
 
     async def _init_funding_info(self):
+        try:
+            funding_infos = await self._orderbook_ds.get_bulk_funding_info(self.trading_pairs)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().warning(
+                "Error requesting the funding info of all trading pairs, requesting it for each pair instead.",
+                exc_info=True,
+            )
+            funding_infos = {}
+
         for trading_pair in self.trading_pairs:
-            funding_info = await self._orderbook_ds.get_funding_info(trading_pair)
+            if trading_pair in funding_infos:
+                self._perpetual_trading.initialize_funding_info(funding_infos[trading_pair])
+
+        semaphore = asyncio.Semaphore(self.FUNDING_INFO_INIT_CONCURRENCY)
+
+        async def init_pair_funding_info(trading_pair: str):
+            async with semaphore:
+                funding_info = await self._orderbook_ds.get_funding_info(trading_pair)
             self._perpetual_trading.initialize_funding_info(funding_info)
 
+        await safe_gather(*[
+            init_pair_funding_info(trading_pair)
+            for trading_pair in self.trading_pairs
+            if trading_pair not in funding_infos
+        ])
+
     async def _funding_payment_polling_loop(self):
         """
         Periodically calls _update_funding_payment(), responsible for handling all funding payments.
@@ -0,0 +1,285 @@
+import logging
+from collections import defaultdict
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from hummingbot.connector.utils import combine_to_hb_trading_pair, split_hb_trading_pair
+from hummingbot.core.data_type.common import PositionAction, PositionMode, PositionSide, PriceType, TradeType
+from hummingbot.core.event.event_forwarder import EventForwarder
+from hummingbot.core.event.events import FundingPaymentCompletedEvent, MarketEvent, OrderFilledEvent
+from hummingbot.core.rate_oracle.rate_oracle import RateOracle
+from hummingbot.logger import HummingbotLogger
+
+if TYPE_CHECKING:
+    from hummingbot.connector.connector_base import ConnectorBase
+    from hummingbot.model.inventory_cost import InventoryCost
+
+s_decimal_0 = Decimal("0")
+s_decimal_nan = Decimal("NaN")
+
+
+@dataclass
+class LedgerPosition:
+    """
+    Position of a trading pair in a connector. The amount is signed (negative for net sold or short positions) and the
+    average cost is the quote price paid for the open amount. Perpetual connectors in hedge mode keep a position per
+    side, all other connectors keep a single net position with the BOTH side.
+    """
+    connector_name: str
+    trading_pair: str
+    position_side: PositionSide = PositionSide.BOTH
+    amount: Decimal = s_decimal_0
+    average_cost: Decimal = s_decimal_0
+    realized_pnl: Decimal = s_decimal_0
+    fees_in_quote: Decimal = s_decimal_0
+    funding_payments: Decimal = s_decimal_0
+    volume_in_quote: Decimal = s_decimal_0
+    fills_count: int = 0
+
+    @property
+    def quote_asset(self) -> str:
+        return split_hb_trading_pair(self.trading_pair)[1]
+
+    @property
+    def net_realized_pnl(self) -> Decimal:
+        return self.realized_pnl - self.fees_in_quote + self.funding_payments
+
+    def unrealized_pnl(self, price: Decimal) -> Decimal:
+        return self.amount * (price - self.average_cost)
+
+    def apply_fill(self, amount: Decimal, price: Decimal):
+        """
+        Updates the position with a fill, using the average cost method.
+
+        :param amount: the filled amount, positive for buys and negative for sells
+        :param price: the fill price
+        """
+        if self.amount == s_decimal_0 or (self.amount > s_decimal_0) == (amount > s_decimal_0):
+            new_amount = self.amount + amount
+            self.average_cost = (self.average_cost * abs(self.amount) + price * abs(amount)) / abs(new_amount)
+            self.amount = new_amount
+        else:
+            closed_amount = min(abs(amount), abs(self.amount))
+            direction = Decimal(1) if self.amount > s_decimal_0 else Decimal(-1)
+            self.realized_pnl += closed_amount * (price - self.average_cost) * direction
+            self.amount += amount
+            if self.amount == s_decimal_0:
+                self.average_cost = s_decimal_0
+            elif (self.amount > s_decimal_0) != (direction > s_decimal_0):
+                # The fill closed the position and opened one in the opposite direction
+                self.average_cost = price
+        self.volume_in_quote += abs(amount) * price
+        self.fills_count += 1
+
+
+class PortfolioLedger:
+    """
+    Keeps the positions, average costs and PnL of the connectors up to date while fill and funding events arrive.
+    Each event is applied in constant time, so strategies, the status command and MQTT can read the ledger without
+    recalculating anything from the trades history.
+    """
+
+    _logger = None
+
+    def __init__(self,
+                 connectors: List["ConnectorBase"],
+                 rate_provider: Optional[RateOracle] = None):
+        self._connectors: Dict[str, "ConnectorBase"] = {connector.name: connector for connector in connectors}
+        self._rate_provider = rate_provider
+        self._positions: Dict[Tuple[str, str, PositionSide], LedgerPosition] = {}
+        # Fees that could not be converted to the quote asset, by connector and token
+        self._unconverted_fees: Dict[str, Dict[str, Decimal]] = defaultdict(lambda: defaultdict(lambda: s_decimal_0))
+        self._fill_forwarders: Dict[str, EventForwarder] = {}
+        self._funding_forwarders: Dict[str, EventForwarder] = {}
+        self._started = False
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    @property
+    def rate_provider(self) -> RateOracle:
+        return self._rate_provider or RateOracle.get_instance()
+
+    @property
+    def positions(self) -> List[LedgerPosition]:
+        return list(self._positions.values())
+
+    def start(self):
+        if self._started:
+            return
+        for connector in self._connectors.values():
+            self._add_listeners(connector)
+        self._started = True
+
+    def stop(self):
+        if not self._started:
+            return
+        for connector in self._connectors.values():
+            connector.remove_listener(MarketEvent.OrderFilled, self._fill_forwarders.pop(connector.name))
+            connector.remove_listener(MarketEvent.FundingPaymentCompleted,
+                                      self._funding_forwarders.pop(connector.name))
+        self._started = False
+
+    def position(self,
+                 connector_name: str,
+                 trading_pair: str,
+                 position_side: PositionSide = PositionSide.BOTH) -> LedgerPosition:
+        key = (connector_name, trading_pair, position_side)
+        position = self._positions.get(key)
+        if position is None:
+            position = LedgerPosition(connector_name=connector_name,
+                                      trading_pair=trading_pair,
+                                      position_side=position_side)
+            self._positions[key] = position
+        return position
+
+    def seed_from_inventory_cost(self, connector_name: str, inventory_cost: "InventoryCost"):
+        """
+        Initializes the position of a trading pair with the inventory stored by the inventory cost price delegate.
+        """
+        position = self.position(connector_name,
+                                 combine_to_hb_trading_pair(inventory_cost.base_asset, inventory_cost.quote_asset))
+        base_volume = Decimal(inventory_cost.base_volume)
+        position.amount = base_volume
+        position.average_cost = (Decimal(inventory_cost.quote_volume) / base_volume
+                                 if base_volume != s_decimal_0
+                                 else s_decimal_0)
+
+    def process_fill(self, connector_name: str, fill_event: OrderFilledEvent):
+        position_side = self._fill_position_side(connector_name, fill_event)
+        position = self.position(connector_name, fill_event.trading_pair, position_side)
+        amount = fill_event.amount if fill_event.trade_type == TradeType.BUY else -fill_event.amount
+        position.apply_fill(amount=amount, price=fill_event.price)
+        self._register_fee(connector_name, position, fill_event)
+
+    def process_funding_payment(self, connector_name: str, funding_event: FundingPaymentCompletedEvent):
+        # Funding payments are reported for the trading pair, they are kept in the BOTH side position in hedge mode
+        position = self.position(connector_name, funding_event.trading_pair)
+        position.funding_payments += funding_event.amount
+
+    def unrealized_pnl(self,
+                       connector_name: str,
+                       trading_pair: str,
+                       price: Optional[Decimal] = None,
+                       position_side: PositionSide = PositionSide.BOTH) -> Decimal:
+        """
+        :param price: the price to value the open position at. The connector mid price is used when not provided.
+        :param position_side: the side of the position, only perpetual connectors in hedge mode use LONG and SHORT
+        """
+        position = self._positions.get((connector_name, trading_pair, position_side))
+        if position is None or position.amount == s_decimal_0:
+            return s_decimal_0
+        if price is None:
+            price = self._mid_price(connector_name, trading_pair)
+        return position.unrealized_pnl(price)
+
+    def total_pnl(self, valuation_token: str) -> Decimal:
+        """
+        Returns the realized and unrealized PnL of all the positions converted to the valuation token. Positions whose
+        quote asset has no conversion rate are not included.
+        """
+        total = s_decimal_0
+        for position in self._positions.values():
+            rate = self._conversion_rate(position.quote_asset, valuation_token)
+            if rate is None:
+                continue
+            pnl = position.net_realized_pnl
+            if position.amount != s_decimal_0:
+                pnl += position.unrealized_pnl(self._mid_price(position.connector_name, position.trading_pair))
+            if pnl.is_finite():
+                total += pnl * rate
+        return total
+
+    def snapshot(self) -> Dict[str, Dict[str, str]]:
+        """
+        Returns a JSON serializable copy of the positions, keyed by connector and trading pair. The side is added to
+        the key of the hedge mode positions.
+        """
+        return {
+            self._snapshot_key(position): {
+                "position_side": position.position_side.name,
+                "amount": str(position.amount),
+                "average_cost": str(position.average_cost),
+                "realized_pnl": str(position.realized_pnl),
+                "fees_in_quote": str(position.fees_in_quote),
+                "funding_payments": str(position.funding_payments),
+                "volume_in_quote": str(position.volume_in_quote),
+                "fills_count": str(position.fills_count),
+            }
+            for position in list(self._positions.values())
+        }
+
+    def asset_positions(self, connector_name: str) -> Dict[str, Decimal]:
+        """
+        Returns the net amount of each base asset traded in the connector, aggregated over its trading pairs.
+        """
+        amounts = defaultdict(lambda: s_decimal_0)
+        for position in self._positions.values():
+            if position.connector_name == connector_name:
+                amounts[split_hb_trading_pair(position.trading_pair)[0]] += position.amount
+        return dict(amounts)
+
+    def unconverted_fees(self, connector_name: str) -> Dict[str, Decimal]:
+        return dict(self._unconverted_fees.get(connector_name, {}))
+
+    def _fill_position_side(self, connector_name: str, fill_event: OrderFilledEvent) -> PositionSide:
+        """
+        Returns the position side a fill belongs to. Only perpetual connectors in hedge mode have separate long and
+        short positions, where opening buys and closing sells are long and opening sells and closing buys are short.
+        """
+        connector = self._connectors.get(connector_name)
+        if getattr(connector, "position_mode", None) != PositionMode.HEDGE:
+            return PositionSide.BOTH
+        if fill_event.position == PositionAction.OPEN.value:
+            return PositionSide.LONG if fill_event.trade_type == TradeType.BUY else PositionSide.SHORT
+        if fill_event.position == PositionAction.CLOSE.value:
+            return PositionSide.SHORT if fill_event.trade_type == TradeType.BUY else PositionSide.LONG
+        return PositionSide.BOTH
+
+    @staticmethod
+    def _snapshot_key(position: LedgerPosition) -> str:
+        key = f"{position.connector_name}:{position.trading_pair}"
+        if position.position_side != PositionSide.BOTH:
+            key = f"{key}:{position.position_side.name}"
+        return key
+
+    def _add_listeners(self, connector: "ConnectorBase"):
+        connector_name = connector.name
+        self._fill_forwarders[connector_name] = EventForwarder(
+            lambda event: self.process_fill(connector_name, event))
+        self._funding_forwarders[connector_name] = EventForwarder(
+            lambda event: self.process_funding_payment(connector_name, event))
+        connector.add_listener(MarketEvent.OrderFilled, self._fill_forwarders[connector_name])
+        connector.add_listener(MarketEvent.FundingPaymentCompleted, self._funding_forwarders[connector_name])
+
+    def _register_fee(self, connector_name: str, position: LedgerPosition, fill_event: OrderFilledEvent):
+        try:
+            position.fees_in_quote += fill_event.trade_fee.fee_amount_in_token(
+                trading_pair=fill_event.trading_pair,
+                price=fill_event.price,
+                order_amount=fill_event.amount,
+                token=position.quote_asset,
+                exchange=self._connectors.get(connector_name),
+                rate_source=self._rate_provider,
+            )
+        except Exception:
+            self.logger().debug(f"Could not convert the fees of the fill {fill_event.order_id} to "
+                                f"{position.quote_asset}.", exc_info=True)
+            for flat_fee in fill_event.trade_fee.flat_fees:
+                self._unconverted_fees[connector_name][flat_fee.token] += flat_fee.amount
+
+    def _mid_price(self, connector_name: str, trading_pair: str) -> Decimal:
+        connector = self._connectors.get(connector_name)
+        try:
+            return connector.get_price_by_type(trading_pair, PriceType.MidPrice)
+        except Exception:
+            return self.rate_provider.get_pair_rate(trading_pair) or s_decimal_nan
+
+    def _conversion_rate(self, token: str, valuation_token: str) -> Optional[Decimal]:
+        if token == valuation_token:
+            return Decimal(1)
+        return self.rate_provider.get_pair_rate(combine_to_hb_trading_pair(base=token, quote=valuation_token))
@@ -11,10 +11,12 @@ from aioresponses import aioresponses
 from aioresponses.core import RequestCall
 from bidict import bidict
 
+from hummingbot.connector.gateway.common_types import CancelOrderResult, PlaceOrderResult
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
+from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.trade_fee import TradeFeeBase
 from hummingbot.core.event.event_logger import EventLogger
 from hummingbot.core.event.events import (
@@ -1004,6 +1006,195 @@ class AbstractExchangeConnectorTests:
                     )
                 )
 
+        def _limit_orders_to_create(self) -> List[LimitOrder]:
+            return [
+                LimitOrder(
+                    client_order_id="",
+                    trading_pair=self.trading_pair,
+                    is_buy=True,
+                    base_currency=self.base_asset,
+                    quote_currency=self.quote_asset,
+                    price=Decimal("10000"),
+                    quantity=Decimal("100"),
+                ),
+                LimitOrder(
+                    client_order_id="",
+                    trading_pair=self.trading_pair,
+                    is_buy=False,
+                    base_currency=self.base_asset,
+                    quote_currency=self.quote_asset,
+                    price=Decimal("11000"),
+                    quantity=Decimal("100"),
+                ),
+            ]
+
+        def test_batch_order_create_sends_orders_in_batch_request(self):
+            self._simulate_trading_rules_initialized()
+            self.exchange._set_current_timestamp(1640780000)
+            batch_request_sent_event = asyncio.Event()
+
+            def place_batch_order_create(orders_to_create: List[InFlightOrder]) -> List[PlaceOrderResult]:
+                batch_request_sent_event.set()
+                return [
+                    PlaceOrderResult(
+                        update_timestamp=self.exchange.current_timestamp,
+                        client_order_id=order.client_order_id,
+                        exchange_order_id=f"{self.exchange_order_id_prefix}{i}",
+                        trading_pair=order.trading_pair,
+                    )
+                    for i, order in enumerate(orders_to_create)
+                ]
+
+            place_batch_mock = AsyncMock(side_effect=place_batch_order_create)
+            self.exchange._place_batch_order_create = place_batch_mock
+
+            created_orders = self.exchange.batch_order_create(orders_to_create=self._limit_orders_to_create())
+            self.async_run_with_timeout(batch_request_sent_event.wait())
+            self.async_run_with_timeout(asyncio.sleep(0.1))
+
+            self.assertEqual(1, place_batch_mock.call_count)
+            self.assertEqual(2, len(created_orders))
+            buy_order = self.exchange.in_flight_orders[created_orders[0].client_order_id]
+            sell_order = self.exchange.in_flight_orders[created_orders[1].client_order_id]
+            self.assertEqual(f"{self.exchange_order_id_prefix}0", buy_order.exchange_order_id)
+            self.assertEqual(f"{self.exchange_order_id_prefix}1", sell_order.exchange_order_id)
+            self.assertTrue(buy_order.is_open)
+            self.assertTrue(sell_order.is_open)
+
+            buy_event: BuyOrderCreatedEvent = self.buy_order_created_logger.event_log[0]
+            self.assertEqual(buy_order.client_order_id, buy_event.order_id)
+            sell_event: SellOrderCreatedEvent = self.sell_order_created_logger.event_log[0]
+            self.assertEqual(sell_order.client_order_id, sell_event.order_id)
+
+        def test_batch_order_create_marks_orders_failed_in_batch_result(self):
+            self._simulate_trading_rules_initialized()
+            self.exchange._set_current_timestamp(1640780000)
+
+            def place_batch_order_create(orders_to_create: List[InFlightOrder]) -> List[PlaceOrderResult]:
+                return [
+                    PlaceOrderResult(
+                        update_timestamp=self.exchange.current_timestamp,
+                        client_order_id=orders_to_create[0].client_order_id,
+                        exchange_order_id=f"{self.exchange_order_id_prefix}1",
+                        trading_pair=orders_to_create[0].trading_pair,
+                    ),
+                    PlaceOrderResult(
+                        update_timestamp=self.exchange.current_timestamp,
+                        client_order_id=orders_to_create[1].client_order_id,
+                        exchange_order_id=None,
+                        trading_pair=orders_to_create[1].trading_pair,
+                        exception=ValueError("Order rejected"),
+                    ),
+                ]
+
+            self.exchange._place_batch_order_create = AsyncMock(side_effect=place_batch_order_create)
+
+            created_orders = self.exchange.batch_order_create(orders_to_create=self._limit_orders_to_create())
+            self.async_run_with_timeout(asyncio.sleep(0.1))
+
+            self.assertIn(created_orders[0].client_order_id, self.exchange.in_flight_orders)
+            self.assertNotIn(created_orders[1].client_order_id, self.exchange.in_flight_orders)
+            self.assertEqual(1, len(self.buy_order_created_logger.event_log))
+            self.assertEqual(1, len(self.order_failure_logger.event_log))
+            failure_event: MarketOrderFailureEvent = self.order_failure_logger.event_log[0]
+            self.assertEqual(created_orders[1].client_order_id, failure_event.order_id)
+
+        def test_batch_order_create_marks_orders_missing_in_batch_result_as_failed(self):
+            self._simulate_trading_rules_initialized()
+            self.exchange._set_current_timestamp(1640780000)
+
+            def place_batch_order_create(orders_to_create: List[InFlightOrder]) -> List[PlaceOrderResult]:
+                return [
+                    PlaceOrderResult(
+                        update_timestamp=self.exchange.current_timestamp,
+                        client_order_id=orders_to_create[1].client_order_id,
+                        exchange_order_id=f"{self.exchange_order_id_prefix}1",
+                        trading_pair=orders_to_create[1].trading_pair,
+                    ),
+                ]
+
+            self.exchange._place_batch_order_create = AsyncMock(side_effect=place_batch_order_create)
+
+            created_orders = self.exchange.batch_order_create(orders_to_create=self._limit_orders_to_create())
+            self.async_run_with_timeout(asyncio.sleep(0.1))
+
+            self.assertNotIn(created_orders[0].client_order_id, self.exchange.in_flight_orders)
+            sell_order = self.exchange.in_flight_orders[created_orders[1].client_order_id]
+            self.assertEqual(f"{self.exchange_order_id_prefix}1", sell_order.exchange_order_id)
+            self.assertEqual(1, len(self.order_failure_logger.event_log))
+            failure_event: MarketOrderFailureEvent = self.order_failure_logger.event_log[0]
+            self.assertEqual(created_orders[0].client_order_id, failure_event.order_id)
+
+        def test_batch_order_cancel_sends_cancelations_in_batch_request(self):
+            self.exchange._set_current_timestamp(1640780000)
+
+            self.exchange.start_tracking_order(
+                order_id=self.client_order_id_prefix + "1",
+                exchange_order_id=self.exchange_order_id_prefix + "1",
+                trading_pair=self.trading_pair,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("100"),
+                order_type=OrderType.LIMIT,
+                stop_price=None,
+                call_back_rate=None,
+                activation_price=None,
+            )
+            order: InFlightOrder = self.exchange.in_flight_orders[self.client_order_id_prefix + "1"]
+
+            place_batch_mock = AsyncMock(return_value=[
+                CancelOrderResult(client_order_id=order.client_order_id, trading_pair=order.trading_pair),
+                CancelOrderResult(client_order_id="unknown", trading_pair=order.trading_pair, not_found=True),
+            ])
+            self.exchange._place_batch_order_cancel = place_batch_mock
+
+            cancellation_results = self.async_run_with_timeout(
+                self.exchange._execute_batch_order_cancel(orders_to_cancel=[order.to_limit_order()])
+            )
+
+            self.assertEqual(1, place_batch_mock.call_count)
+            self.assertEqual([CancellationResult(order.client_order_id, True)], cancellation_results)
+            if self.exchange.is_cancel_request_in_exchange_synchronous:
+                self.assertTrue(order.is_cancelled)
+                cancel_event: OrderCancelledEvent = self.order_cancelled_logger.event_log[0]
+                self.assertEqual(order.client_order_id, cancel_event.order_id)
+            else:
+                self.assertTrue(order.is_pending_cancel_confirmation)
+
+        @aioresponses()
+        def test_batch_order_cancel_without_batch_support_cancels_orders_one_by_one(self, mock_api):
+            request_sent_event = asyncio.Event()
+            self.exchange._set_current_timestamp(1640780000)
+
+            self.exchange.start_tracking_order(
+                order_id=self.client_order_id_prefix + "1",
+                exchange_order_id=self.exchange_order_id_prefix + "1",
+                trading_pair=self.trading_pair,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("100"),
+                order_type=OrderType.LIMIT,
+                stop_price=None,
+                call_back_rate=None,
+                activation_price=None,
+            )
+            order: InFlightOrder = self.exchange.in_flight_orders[self.client_order_id_prefix + "1"]
+
+            self.configure_successful_cancelation_response(
+                order=order,
+                mock_api=mock_api,
+                callback=lambda *args, **kwargs: request_sent_event.set())
+            self.exchange._place_batch_order_cancel = AsyncMock(side_effect=NotImplementedError)
+
+            self.exchange.batch_order_cancel(orders_to_cancel=[order.to_limit_order()])
+            self.async_run_with_timeout(request_sent_event.wait())
+            self.async_run_with_timeout(asyncio.sleep(0.1))
+
+            if self.exchange.is_cancel_request_in_exchange_synchronous:
+                self.assertTrue(order.is_cancelled)
+            else:
+                self.assertTrue(order.is_pending_cancel_confirmation)
+
         @aioresponses()
         def test_update_balances(self, mock_api):
             response = self.balance_request_mock_response_for_base_and_quote
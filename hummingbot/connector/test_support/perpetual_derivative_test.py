@@ -3,7 +3,7 @@ import json
 from abc import abstractmethod
 from decimal import Decimal
 from typing import Callable, List, Optional, Tuple
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, PropertyMock, patch
 
 from aioresponses import aioresponses
 
@@ -12,13 +12,16 @@ from hummingbot.connector.test_support.exchange_connector_test import AbstractEx
 from hummingbot.core.data_type.common import OrderType, PositionAction, PositionMode, PositionSide, TradeType
 from hummingbot.core.data_type.funding_info import FundingInfo
 from hummingbot.core.data_type.in_flight_order import InFlightOrder
+from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.event.event_logger import EventLogger
 from hummingbot.core.event.events import (
+    AccountEvent,
     BuyOrderCompletedEvent,
     BuyOrderCreatedEvent,
     FundingPaymentCompletedEvent,
     MarketEvent,
     OrderFilledEvent,
+    PositionModeChangeEvent,
     SellOrderCompletedEvent,
     SellOrderCreatedEvent,
 )
@@ -192,6 +195,40 @@ class AbstractPerpetualDerivativeTests:
             self.funding_payment_logger = EventLogger()
             self.exchange.add_listener(MarketEvent.FundingPaymentCompleted, self.funding_payment_logger)
 
+        def _limit_orders_to_create(self) -> List[LimitOrder]:
+            return [
+                LimitOrder(
+                    client_order_id=order.client_order_id,
+                    trading_pair=order.trading_pair,
+                    is_buy=order.is_buy,
+                    base_currency=order.base_currency,
+                    quote_currency=order.quote_currency,
+                    price=order.price,
+                    quantity=order.quantity,
+                    position=PositionAction.OPEN,
+                )
+                for order in super()._limit_orders_to_create()
+            ]
+
+        def test_batch_order_create_skips_orders_with_invalid_position_action(self):
+            self._simulate_trading_rules_initialized()
+            self.exchange._set_current_timestamp(1640780000)
+            place_batch_mock = AsyncMock(return_value=[])
+            self.exchange._place_batch_order_create = place_batch_mock
+
+            orders_to_create = AbstractExchangeConnectorTests.ExchangeConnectorTests._limit_orders_to_create(self)
+            self.async_run_with_timeout(self.exchange._execute_batch_order_create(orders_to_create=orders_to_create))
+
+            place_batch_mock.assert_not_called()
+            self.assertEqual(0, len(self.exchange.in_flight_orders))
+            self.assertTrue(
+                self.is_logged(
+                    "ERROR",
+                    f"Invalid position action {PositionAction.NIL} for order {orders_to_create[0].client_order_id}. "
+                    f"Must be one of {self.exchange.VALID_POSITION_ACTIONS}"
+                )
+            )
+
         def test_initial_status_dict(self):
             self.exchange._set_trading_pair_symbol_map(None)
             self.exchange._perpetual_trading._funding_info = {}
@@ -625,6 +662,93 @@ class AbstractPerpetualDerivativeTests:
                 )
             )
 
+        def test_set_position_mode_concurrently_with_partial_failure(self):
+            failed_trading_pair = f"FAILED-{self.quote_asset}"
+            trading_pairs = [self.trading_pair, failed_trading_pair, f"OTHER-{self.quote_asset}"]
+            error_msg = "Position mode not supported"
+            self.exchange.POSITION_MODE_SET_CONCURRENCY = 3
+            self.exchange._perpetual_trading.set_position_mode(PositionMode.ONEWAY)
+
+            async def trading_pair_position_mode_set(mode: PositionMode, trading_pair: str) -> Tuple[bool, str]:
+                return (False, error_msg) if trading_pair == failed_trading_pair else (True, "")
+
+            position_mode_set_mock = AsyncMock(side_effect=trading_pair_position_mode_set)
+            self.exchange._trading_pair_position_mode_set = position_mode_set_mock
+            failure_logger = EventLogger()
+            success_logger = EventLogger()
+            self.exchange.add_listener(AccountEvent.PositionModeChangeFailed, failure_logger)
+            self.exchange.add_listener(AccountEvent.PositionModeChangeSucceeded, success_logger)
+
+            with patch.object(type(self.exchange), "trading_pairs", new_callable=PropertyMock) as trading_pairs_mock:
+                trading_pairs_mock.return_value = trading_pairs
+                self.async_run_with_timeout(self.exchange._execute_set_position_mode(PositionMode.HEDGE))
+
+            # Unlike the sequential mode, every pair is requested even after a failure
+            self.assertEqual(
+                sorted(trading_pairs),
+                sorted(call.args[1] for call in position_mode_set_mock.call_args_list))
+            self.assertTrue(all(call.args[0] == PositionMode.HEDGE for call in position_mode_set_mock.call_args_list))
+            self.assertTrue(
+                self.is_logged(
+                    log_level="NETWORK",
+                    message=f"Error switching {failed_trading_pair} mode to {PositionMode.HEDGE}: {error_msg}"
+                )
+            )
+            self.assertFalse(
+                self.is_logged(
+                    log_level="NETWORK",
+                    message=f"Error switching {self.trading_pair} mode to {PositionMode.HEDGE}: "
+                )
+            )
+            self.assertEqual(0, len(success_logger.event_log))
+            self.assertEqual(len(trading_pairs), len(failure_logger.event_log))
+            for trading_pair, event in zip(trading_pairs, failure_logger.event_log):
+                self.assertIsInstance(event, PositionModeChangeEvent)
+                self.assertEqual(trading_pair, event.trading_pair)
+                self.assertEqual(PositionMode.HEDGE, event.position_mode)
+                self.assertEqual(error_msg, event.message)
+            self.assertEqual(PositionMode.ONEWAY, self.exchange.position_mode)
+
+        def test_init_funding_info_requests_each_pair_when_bulk_request_fails(self):
+            trading_pairs = [f"PAIR{i}-{self.quote_asset}" for i in range(5)]
+            self.exchange.FUNDING_INFO_INIT_CONCURRENCY = 2
+            concurrent_requests = 0
+            max_concurrent_requests = 0
+
+            async def get_funding_info(trading_pair: str) -> FundingInfo:
+                nonlocal concurrent_requests, max_concurrent_requests
+                concurrent_requests += 1
+                max_concurrent_requests = max(max_concurrent_requests, concurrent_requests)
+                await asyncio.sleep(0.01)
+                concurrent_requests -= 1
+                return FundingInfo(
+                    trading_pair=trading_pair,
+                    index_price=Decimal("100"),
+                    mark_price=Decimal("101"),
+                    next_funding_utc_timestamp=1640001112,
+                    rate=Decimal("0.0001"),
+                )
+
+            self.exchange._orderbook_ds.get_bulk_funding_info = AsyncMock(side_effect=Exception("Bulk request failed"))
+            get_funding_info_mock = AsyncMock(side_effect=get_funding_info)
+            self.exchange._orderbook_ds.get_funding_info = get_funding_info_mock
+
+            with patch.object(type(self.exchange), "trading_pairs", new_callable=PropertyMock) as trading_pairs_mock:
+                trading_pairs_mock.return_value = trading_pairs
+                self.async_run_with_timeout(self.exchange._init_funding_info())
+
+            self.assertTrue(
+                self.is_logged(
+                    log_level="WARNING",
+                    message="Error requesting the funding info of all trading pairs, requesting it for each pair "
+                            "instead."
+                )
+            )
+            self.assertEqual(len(trading_pairs), get_funding_info_mock.call_count)
+            self.assertEqual(2, max_concurrent_requests)
+            for trading_pair in trading_pairs:
+                self.assertEqual(Decimal("0.0001"), self.exchange.get_funding_info(trading_pair).rate)
+
         @aioresponses()
         def test_set_leverage_failure(self, mock_api):
             request_sent_event = asyncio.Event()
@@ -1,4 +1,7 @@
 # distutils: language=c++
+from libc.stdint cimport int64_t
+from libcpp.vector cimport vector
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
 from hummingbot.core.data_type.order_book cimport OrderBook
 
 cdef class CompositeOrderBook(OrderBook):
@@ -6,3 +9,4 @@ cdef class CompositeOrderBook(OrderBook):
         OrderBook _traded_order_book
 
     cdef double c_get_price(self, bint is_buy) except? -1
+    cdef vector[OrderBookEntry] c_get_levels(self, bint is_bid, double price_limit, int64_t max_levels)
@@ -5,6 +5,7 @@ from typing import Iterator
 
 from cython.operator cimport address as ref, dereference as deref, postincrement as inc
 from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+from libc.stdint cimport int64_t
 from libcpp.set cimport set
 from libcpp.vector cimport vector
 
@@ -28,6 +29,7 @@ cdef class CompositeOrderBook(OrderBook):
     def clear_traded_order_book(self):
         self._traded_order_book._bid_book.clear()
         self._traded_order_book._ask_book.clear()
+        self._version += 1
 
     def record_filled_order(self, order_fill_event):
         cdef:
@@ -71,6 +73,7 @@ cdef class CompositeOrderBook(OrderBook):
             cpp_bids.push_back(OrderBookEntry(price, amount, timestamp))
 
         self._traded_order_book.c_apply_diffs(cpp_bids, cpp_asks, timestamp)
+        self._version += 1
 
     def original_bid_entries(self) -> Iterator[OrderBookRow]:
         return super().bid_entries()
@@ -175,6 +178,18 @@ cdef class CompositeOrderBook(OrderBook):
 
         self._traded_order_book.c_apply_diffs(cpp_bids_changes, cpp_asks_changes, self._last_diff_uid)
 
+    cdef vector[OrderBookEntry] c_get_levels(self, bint is_bid, double price_limit, int64_t max_levels):
+        # The depth aggregations use the composite entries, that exclude the volume already traded
+        cdef:
+            vector[OrderBookEntry] levels
+        for row in (self.bid_entries() if is_bid else self.ask_entries()):
+            if <int64_t>levels.size() == max_levels:
+                break
+            if (row.price < price_limit) if is_bid else (row.price > price_limit):
+                break
+            levels.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
+        return levels
+
     cdef double c_get_price(self, bint is_buy) except? -1:
         cdef:
             set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
@@ -20,6 +20,9 @@ cdef class OrderBook(PubSub):
     cdef double _last_applied_trade
     cdef double _last_trade_price_rest_updated
     cdef bint _dex
+    cdef int64_t _version
+    cdef dict _depth_cache
+    cdef int64_t _depth_cache_version
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
@@ -37,3 +40,9 @@ cdef class OrderBook(PubSub):
     cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price)
     cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume)
     cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount)
+    cdef vector[OrderBookEntry] c_get_levels(self, bint is_bid, double price_limit, int64_t max_levels)
+    cdef double c_get_mid_price(self)
+    cdef tuple c_get_depth_buckets(self, double bucket_bps, int64_t num_buckets)
+    cdef tuple c_get_cumulative_depth(self, object distances_bps)
+    cdef double c_get_imbalance(self, int64_t depth)
+    cdef object c_get_cached_depth_value(self, tuple key, object compute)
@@ -19,6 +19,7 @@ from cython.operator cimport(
     dereference as deref,
     postincrement as inc,
 )
+from libc.math cimport isnan
 
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
@@ -55,6 +56,9 @@ cdef class OrderBook(PubSub):
         self._last_applied_trade = -1000.0
         self._last_trade_price_rest_updated = -1000
         self._dex = dex
+        self._version = 0
+        self._depth_cache = {}
+        self._depth_cache_version = -1
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -95,6 +99,7 @@ cdef class OrderBook(PubSub):
 
         # Remember the last diff update ID.
         self._last_diff_uid = update_id
+        self._version += 1
 
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -135,6 +140,7 @@ cdef class OrderBook(PubSub):
 
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
+        self._version += 1
 
     cdef c_apply_trade(self, object trade_event):
         self._last_trade_price = trade_event.price
@@ -475,6 +481,172 @@ cdef class OrderBook(PubSub):
     def get_quote_volume_for_price(self, is_buy: bool, price: float) -> OrderBookQueryResult:
         return self.c_get_quote_volume_for_price(is_buy, price)
 
+    cdef vector[OrderBookEntry] c_get_levels(self, bint is_bid, double price_limit, int64_t max_levels):
+        """
+        Returns the entries of one side of the book from the best price outwards, stopping at the first entry beyond the
+        price limit or when the maximum number of levels is reached (no maximum if negative).
+        """
+        cdef:
+            vector[OrderBookEntry] levels
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            OrderBookEntry entry
+
+        if is_bid:
+            while bid_it != self._bid_book.rend() and <int64_t>levels.size() != max_levels:
+                entry = deref(bid_it)
+                if entry.getPrice() < price_limit:
+                    break
+                levels.push_back(entry)
+                inc(bid_it)
+        else:
+            while ask_it != self._ask_book.end() and <int64_t>levels.size() != max_levels:
+                entry = deref(ask_it)
+                if entry.getPrice() > price_limit:
+                    break
+                levels.push_back(entry)
+                inc(ask_it)
+        return levels
+
+    cdef double c_get_mid_price(self):
+        cdef:
+            vector[OrderBookEntry] best_bid = self.c_get_levels(True, -np.inf, 1)
+            vector[OrderBookEntry] best_ask = self.c_get_levels(False, np.inf, 1)
+        if best_bid.size() == 0 or best_ask.size() == 0:
+            return NaN
+        return (best_bid[0].getPrice() + best_ask[0].getPrice()) / 2
+
+    cdef tuple c_get_depth_buckets(self, double bucket_bps, int64_t num_buckets):
+        cdef:
+            np.ndarray[np.float64_t, ndim=1] bid_depth = np.zeros(num_buckets, dtype=np.float64)
+            np.ndarray[np.float64_t, ndim=1] ask_depth = np.zeros(num_buckets, dtype=np.float64)
+            double mid_price = self.c_get_mid_price()
+            double bucket_size
+            vector[OrderBookEntry] levels
+            int64_t bucket
+            size_t i
+
+        if isnan(mid_price):
+            return bid_depth, ask_depth
+        bucket_size = mid_price * bucket_bps / 10000
+        levels = self.c_get_levels(True, mid_price - bucket_size * num_buckets, -1)
+        for i in range(levels.size()):
+            bucket = <int64_t>((mid_price - levels[i].getPrice()) / bucket_size)
+            if bucket < num_buckets:
+                bid_depth[bucket] += levels[i].getAmount()
+        levels = self.c_get_levels(False, mid_price + bucket_size * num_buckets, -1)
+        for i in range(levels.size()):
+            bucket = <int64_t>((levels[i].getPrice() - mid_price) / bucket_size)
+            if bucket < num_buckets:
+                ask_depth[bucket] += levels[i].getAmount()
+        return bid_depth, ask_depth
+
+    cdef tuple c_get_cumulative_depth(self, object distances_bps):
+        cdef:
+            np.ndarray[np.float64_t, ndim=1] distances = np.asarray(distances_bps, dtype=np.float64)
+            np.ndarray[np.float64_t, ndim=1] bid_depth = np.zeros(len(distances), dtype=np.float64)
+            np.ndarray[np.float64_t, ndim=1] ask_depth = np.zeros(len(distances), dtype=np.float64)
+            double mid_price = self.c_get_mid_price()
+            double max_distance
+            double distance
+            vector[OrderBookEntry] levels
+            size_t i
+            Py_ssize_t j
+
+        if isnan(mid_price) or len(distances) == 0:
+            return bid_depth, ask_depth
+        max_distance = mid_price * distances.max() / 10000
+        levels = self.c_get_levels(True, mid_price - max_distance, -1)
+        for i in range(levels.size()):
+            distance = (mid_price - levels[i].getPrice()) / mid_price * 10000
+            for j in range(len(distances)):
+                if distance <= distances[j]:
+                    bid_depth[j] += levels[i].getAmount()
+        levels = self.c_get_levels(False, mid_price + max_distance, -1)
+        for i in range(levels.size()):
+            distance = (levels[i].getPrice() - mid_price) / mid_price * 10000
+            for j in range(len(distances)):
+                if distance <= distances[j]:
+                    ask_depth[j] += levels[i].getAmount()
+        return bid_depth, ask_depth
+
+    cdef double c_get_imbalance(self, int64_t depth):
+        cdef:
+            vector[OrderBookEntry] bids = self.c_get_levels(True, -np.inf, depth)
+            vector[OrderBookEntry] asks = self.c_get_levels(False, np.inf, depth)
+            double bid_volume = 0
+            double ask_volume = 0
+            size_t i
+
+        for i in range(bids.size()):
+            bid_volume += bids[i].getAmount()
+        for i in range(asks.size()):
+            ask_volume += asks[i].getAmount()
+        if bid_volume + ask_volume == 0:
+            return NaN
+        return (bid_volume - ask_volume) / (bid_volume + ask_volume)
+
+    cdef object c_get_cached_depth_value(self, tuple key, object compute):
+        if self._depth_cache_version != self._version:
+            self._depth_cache.clear()
+            self._depth_cache_version = self._version
+        if key not in self._depth_cache:
+            value = compute()
+            if isinstance(value, tuple):
+                for array in value:
+                    array.setflags(write=False)
+            self._depth_cache[key] = value
+        return self._depth_cache[key]
+
+    def get_depth_buckets(self, bucket_bps: float, num_buckets: int, use_cache: bool = True) -> Tuple[np.ndarray,
+                                                                                                      np.ndarray]:
+        """
+        Aggregates the volume of each side of the book in buckets by distance to the mid price.
+
+        :param bucket_bps: the width of each bucket in basis points of the mid price
+        :param num_buckets: the number of buckets per side
+        :param use_cache: if True the result is reused until the order book changes, and the arrays are read-only
+        :return: the bid and ask volumes, where position i holds the volume at a distance from the mid price within
+            [i * bucket_bps, (i + 1) * bucket_bps) basis points
+        """
+        if bucket_bps <= 0 or num_buckets <= 0:
+            raise ValueError("The bucket width and the number of buckets must be positive.")
+        if not use_cache:
+            return self.c_get_depth_buckets(bucket_bps, num_buckets)
+        return self.c_get_cached_depth_value(
+            ("depth_buckets", bucket_bps, num_buckets),
+            lambda: self.c_get_depth_buckets(bucket_bps, num_buckets))
+
+    def get_cumulative_depth(self, distances_bps: List[float], use_cache: bool = True) -> Tuple[np.ndarray,
+                                                                                                 np.ndarray]:
+        """
+        Calculates the volume of each side of the book up to given distances from the mid price.
+
+        :param distances_bps: the distances to the mid price in basis points
+        :param use_cache: if True the result is reused until the order book changes, and the arrays are read-only
+        :return: the bid and ask volumes, where position i holds the volume within distances_bps[i] of the mid price
+        """
+        if not use_cache:
+            return self.c_get_cumulative_depth(distances_bps)
+        distances = tuple(distances_bps)
+        return self.c_get_cached_depth_value(
+            ("cumulative_depth", distances),
+            lambda: self.c_get_cumulative_depth(distances))
+
+    def get_imbalance(self, depth: int, use_cache: bool = True) -> float:
+        """
+        Calculates the volume imbalance of the top levels of the book, as (bid volume - ask volume) / total volume.
+
+        :param depth: the number of levels of each side to include
+        :param use_cache: if True the result is reused until the order book changes
+        :return: the imbalance between -1 (only asks) and 1 (only bids), or NaN if the book is empty
+        """
+        if depth <= 0:
+            raise ValueError("The depth must be positive.")
+        if not use_cache:
+            return self.c_get_imbalance(depth)
+        return self.c_get_cached_depth_value(("imbalance", depth), lambda: self.c_get_imbalance(depth))
+
     def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]):
         replay_position = bisect.bisect_right(diffs, snapshot)
         replay_diffs = diffs[replay_position:]
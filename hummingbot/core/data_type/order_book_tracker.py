@@ -2,6 +2,7 @@ import asyncio
 import logging
 import time
 from collections import defaultdict, deque
+from dataclasses import dataclass
 from enum import Enum
 from typing import Deque, Dict, List, Optional, Tuple
 
@@ -21,6 +22,28 @@ class OrderBookTrackerDataSourceType(Enum):
     EXCHANGE_API = 3
 
 
+@dataclass
+class OrderBookDiffMetrics:
+    """
+    Statistics of the diff messages processed by the tracker for a trading pair.
+
+    The lag is measured as the difference between the processing time and the message timestamp, in seconds.
+    """
+    queue_depth: int = 0
+    diffs_processed: int = 0
+    updates_applied: int = 0
+    last_lag: float = 0
+    max_lag: float = 0
+    stale_diffs_dropped: int = 0
+    gaps_detected: int = 0
+    resyncs: int = 0
+    last_update_timestamp: float = 0
+
+    @property
+    def coalescing_ratio(self) -> float:
+        return self.diffs_processed / self.updates_applied if self.updates_applied > 0 else 0
+
+
 class OrderBookTracker:
     PAST_DIFF_WINDOW_SIZE: int = 32
     _obt_logger: Optional[HummingbotLogger] = None
@@ -31,8 +54,31 @@ class OrderBookTracker:
             cls._obt_logger = logging.getLogger(__name__)
         return cls._obt_logger
 
-    def __init__(self, data_source: OrderBookTrackerDataSource, trading_pairs: List[str], domain: Optional[str] = None):
+    def __init__(self,
+                 data_source: OrderBookTrackerDataSource,
+                 trading_pairs: List[str],
+                 domain: Optional[str] = None,
+                 coalesce_diffs: bool = False,
+                 max_diff_lag: float = 0,
+                 detect_diff_gaps: bool = False):
+        """
+        :param data_source: the data source providing the order book messages
+        :param trading_pairs: the trading pairs to track
+        :param domain: the exchange domain, if any
+        :param coalesce_diffs: if True all the diffs queued for a trading pair are merged into a single net price level
+            update before being applied to the order book, instead of being applied one by one
+        :param max_diff_lag: in coalescing mode, the maximum time (in seconds) the tracker waits collecting more diffs
+            after receiving one before applying the merged update. With the default value of 0 only the diffs already
+            queued are merged.
+        :param detect_diff_gaps: if True the continuity of the diffs of each trading pair is validated (for the
+            exchanges providing the first update id of each diff). Diffs already covered by the order book are dropped,
+            and when a gap in the update ids is found the order book of the pair is resynchronized from a new snapshot
+        """
         self._domain: Optional[str] = domain
+        self._coalesce_diffs: bool = coalesce_diffs
+        self._max_diff_lag: float = max_diff_lag
+        self._detect_diff_gaps: bool = detect_diff_gaps
+        self._diff_metrics: Dict[str, OrderBookDiffMetrics] = defaultdict(OrderBookDiffMetrics)
         self._data_source: OrderBookTrackerDataSource = data_source
         self._trading_pairs: List[str] = trading_pairs
         self._order_books_initialized: asyncio.Event = asyncio.Event()
@@ -75,6 +121,25 @@ class OrderBookTracker:
             for trading_pair, order_book in self._order_books.items()
         }
 
+    @property
+    def diff_metrics(self) -> Dict[str, OrderBookDiffMetrics]:
+        """
+        Returns the diff processing statistics for each trading pair, with the current depth of its message queue
+        """
+        for trading_pair, message_queue in self._tracking_message_queues.items():
+            self._diff_metrics[trading_pair].queue_depth = (
+                message_queue.qsize() + len(self._saved_message_queues.get(trading_pair, ())))
+        return dict(self._diff_metrics)
+
+    def order_book_age(self, trading_pair: str) -> float:
+        """
+        Returns the time in seconds since the order book of the trading pair was last updated (by a diff or a snapshot)
+        """
+        if trading_pair not in self._order_books:
+            raise ValueError(f"No order book exists for '{trading_pair}'.")
+        last_update_timestamp = self._diff_metrics[trading_pair].last_update_timestamp
+        return max(0.0, time.time() - last_update_timestamp)
+
     def start(self):
         self.stop()
         self._init_order_books_task = safe_ensure_future(
@@ -178,6 +243,7 @@ class OrderBookTracker:
         """
         for index, trading_pair in enumerate(self._trading_pairs):
             self._order_books[trading_pair] = await self._initial_order_book_for_trading_pair(trading_pair)
+            self._diff_metrics[trading_pair].last_update_timestamp = time.time()
             self._tracking_message_queues[trading_pair] = asyncio.Queue()
             self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
             self.logger().info(f"Initialized order book for {trading_pair}. "
@@ -258,33 +324,66 @@ class OrderBookTracker:
 
         message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
         order_book: OrderBook = self._order_books[trading_pair]
+        metrics: OrderBookDiffMetrics = self._diff_metrics[trading_pair]
         last_message_timestamp: float = time.time()
         diff_messages_accepted: int = 0
+        pending_message: Optional[OrderBookMessage] = None
 
         while True:
             try:
                 saved_messages: Deque[OrderBookMessage] = self._saved_message_queues[trading_pair]
 
-                # Process saved messages first if there are any
-                if len(saved_messages) > 0:
+                # Process the message left over by the last coalescing round and the saved messages first
+                if pending_message is not None:
+                    message, pending_message = pending_message, None
+                elif len(saved_messages) > 0:
                     message = saved_messages.popleft()
                 else:
                     message = await message_queue.get()
 
                 if message.type is OrderBookMessageType.DIFF:
+                    if self._detect_diff_gaps:
+                        if message.update_id <= self._last_update_id(order_book):
+                            metrics.stale_diffs_dropped += 1
+                            continue
+                        if not self._is_continuous_diff(self._last_update_id(order_book), message):
+                            metrics.gaps_detected += 1
+                            self.logger().warning(
+                                f"Gap detected in the order book diffs for {trading_pair} (expected update "
+                                f"{self._last_update_id(order_book) + 1}, received {message.first_update_id}). "
+                                f"Resynchronizing the order book.")
+                            await self._resync_order_book(trading_pair)
+                            continue
+                    diffs: List[OrderBookMessage] = [message]
+                    if self._coalesce_diffs:
+                        message, diffs, pending_message = await self._coalesce_diff_messages(
+                            first_message=message,
+                            saved_messages=saved_messages,
+                            message_queue=message_queue)
                     order_book.apply_diffs(message.bids, message.asks, message.update_id)
-                    past_diffs_window.append(message)
-                    diff_messages_accepted += 1
+                    # The original diffs are kept, so a snapshot only replays the updates it does not include
+                    past_diffs_window.extend(diffs)
+                    diffs_count = len(diffs)
+                    diff_messages_accepted += diffs_count
 
-                    # Output some statistics periodically.
                     now: float = time.time()
+                    metrics.diffs_processed += diffs_count
+                    metrics.updates_applied += 1
+                    metrics.last_update_timestamp = now
+                    if message.timestamp is not None:
+                        metrics.last_lag = max(0.0, now - message.timestamp)
+                        metrics.max_lag = max(metrics.max_lag, metrics.last_lag)
+
+                    # Output some statistics periodically.
                     if int(now / 60.0) > int(last_message_timestamp / 60.0):
-                        self.logger().debug(f"Processed {diff_messages_accepted} order book diffs for {trading_pair}.")
+                        self.logger().debug(f"Processed {diff_messages_accepted} order book diffs for {trading_pair} "
+                                            f"(queue depth: {message_queue.qsize()}, lag: {metrics.last_lag:.3f}s).")
                         diff_messages_accepted = 0
                     last_message_timestamp = now
                 elif message.type is OrderBookMessageType.SNAPSHOT:
                     past_diffs: List[OrderBookMessage] = list(past_diffs_window)
                     order_book.restore_from_snapshot_and_diffs(message, past_diffs)
+                    metrics.last_update_timestamp = time.time()
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -295,6 +394,105 @@ class OrderBookTracker:
                 )
                 await asyncio.sleep(5.0)
 
+    async def _coalesce_diff_messages(
+            self,
+            first_message: OrderBookMessage,
+            saved_messages: Deque[OrderBookMessage],
+            message_queue: asyncio.Queue
+    ) -> Tuple[OrderBookMessage, List[OrderBookMessage], Optional[OrderBookMessage]]:
+        """
+        Merges the diff message with the consecutive diffs available for the same trading pair (saved or queued, and
+        those arriving before the max diff lag expires) into a single diff with the net update of each price level.
+
+        :returns the merged diff message, the original diffs merged, and the first non diff message found (if any),
+            that has to be processed after the merged diff
+        """
+        diffs: List[OrderBookMessage] = [first_message]
+        next_message: Optional[OrderBookMessage] = None
+        deadline = self._ev_loop.time() + self._max_diff_lag
+
+        while next_message is None:
+            if len(saved_messages) > 0:
+                message = saved_messages.popleft()
+            elif not message_queue.empty():
+                message = message_queue.get_nowait()
+            else:
+                remaining_time = deadline - self._ev_loop.time()
+                if remaining_time <= 0:
+                    break
+                try:
+                    message = await asyncio.wait_for(message_queue.get(), timeout=remaining_time)
+                except asyncio.TimeoutError:
+                    break
+            if (message.type is OrderBookMessageType.DIFF
+                    and (not self._detect_diff_gaps or self._is_continuous_diff(diffs[-1].update_id, message))):
+                diffs.append(message)
+            else:
+                # Snapshots and discontinuous diffs are processed after the merged diff
+                next_message = message
+
+        if len(diffs) == 1:
+            return first_message, diffs, next_message
+
+        bids: Dict[float, float] = {}
+        asks: Dict[float, float] = {}
+        for diff in diffs:
+            # The latest amount of each price level is its net update
+            bids.update((row.price, row.amount) for row in diff.bids)
+            asks.update((row.price, row.amount) for row in diff.asks)
+        last_diff = diffs[-1]
+        content = {
+            "trading_pair": last_diff.trading_pair,
+            "update_id": last_diff.update_id,
+            "bids": [[price, amount] for price, amount in bids.items()],
+            "asks": [[price, amount] for price, amount in asks.items()],
+        }
+        if "first_update_id" in diffs[0].content:
+            content["first_update_id"] = diffs[0].first_update_id
+        merged_message = OrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content=content,
+            timestamp=last_diff.timestamp,
+        )
+        return merged_message, diffs, next_message
+
+    @staticmethod
+    def _last_update_id(order_book: OrderBook) -> int:
+        return max(order_book.snapshot_uid, order_book.last_diff_uid)
+
+    @staticmethod
+    def _is_continuous_diff(last_update_id: int, message: OrderBookMessage) -> bool:
+        """
+        Checks the diff does not skip any update after the last update id. Only the diffs including the first update
+        id can be validated, because for the rest the update ids are not guaranteed to be consecutive.
+        """
+        return "first_update_id" not in message.content or message.first_update_id <= last_update_id + 1
+
+    async def _resync_order_book(self, trading_pair: str):
+        """
+        Replaces the order book of the trading pair with a new snapshot requested to the exchange. The past diffs are
+        discarded, and the diffs still queued that are already included in the snapshot are dropped when processed.
+        """
+        while True:
+            try:
+                snapshot: OrderBookMessage = await self._data_source.get_order_book_snapshot(trading_pair=trading_pair)
+                break
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(
+                    f"Unexpected error fetching the order book snapshot for {trading_pair}.",
+                    exc_info=True,
+                    app_warning_msg=f"Unexpected error resynchronizing the order book for {trading_pair}. "
+                                    f"Retrying after 5 seconds."
+                )
+                await self._sleep(5.0)
+        self._order_books[trading_pair].apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+        self._past_diffs_windows[trading_pair].clear()
+        metrics = self._diff_metrics[trading_pair]
+        metrics.resyncs += 1
+        metrics.last_update_timestamp = time.time()
+
     async def _emit_trade_event_loop(self):
         last_message_timestamp: float = time.time()
         messages_accepted: int = 0
@@ -67,6 +67,16 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
         order_book.apply_snapshot(snapshot_msg.bids, snapshot_msg.asks, snapshot_msg.update_id)
         return order_book
 
+    async def get_order_book_snapshot(self, trading_pair: str) -> OrderBookMessage:
+        """
+        Requests the current order book of a particular trading pair to the exchange
+
+        :param trading_pair: the trading pair for which the order book snapshot has to be retrieved
+
+        :return: a snapshot message with the current order book in the exchange
+        """
+        return await self._order_book_snapshot(trading_pair=trading_pair)
+
     async def listen_for_subscriptions(self):
         """
         Connects to the trade events and order diffs websocket endpoints and listens to the messages sent by the
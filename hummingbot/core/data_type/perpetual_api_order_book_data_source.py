@@ -18,6 +18,13 @@ class PerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource, ABC):
         """
         raise NotImplementedError
 
+    async def get_bulk_funding_info(self, trading_pairs: List[str]) -> Dict[str, FundingInfo]:
+        """
+        Return the funding information for several trading pairs with a single request, for the exchanges providing
+        one. The trading pairs not included in the result are requested individually with `get_funding_info`.
+        """
+        return {}
+
     async def listen_for_funding_info(self, output: asyncio.Queue):
         """
         Reads the funding info events queue and updates the local funding info information.
@@ -1,9 +1,13 @@
+import asyncio
+import copy
+import dataclasses
 import logging
 import re
 import ssl
+import time
 from decimal import Decimal
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 import aiohttp
 from aiohttp import ContentTypeError
@@ -12,6 +16,8 @@ from hummingbot.client.config.security import Security
 from hummingbot.core.data_type.common import OrderType, PositionSide
 from hummingbot.core.data_type.in_flight_order import InFlightOrder
 from hummingbot.core.event.events import TradeType
+from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.web_assistant.connections.http_transport_manager import HTTPTransportManager
 from hummingbot.logger import HummingbotLogger
 
 if TYPE_CHECKING:
@@ -48,6 +54,28 @@ class GatewayHttpClient:
     _shared_client: Optional[aiohttp.ClientSession] = None
     _base_url: str
 
+    TRANSPORT_SESSION_NAME = "gateway"
+
+    # The prices quoted by Gateway only change when a new block is produced, so the price cache TTL configured in
+    # `gateway_price_cache_ttl` is capped at about one block of the chain
+    DEFAULT_PRICE_CACHE_TTL = 1.0
+    PRICE_CACHE_TTLS: Dict[Union[str, Tuple[str, str]], float] = {
+        "ethereum": 12.0,
+        ("ethereum", "arbitrum_one"): 0.25,
+        ("ethereum", "optimism"): 2.0,
+        "polygon": 2.0,
+        "avalanche": 2.0,
+        "binance-smart-chain": 3.0,
+        "cronos": 6.0,
+        "harmony": 2.0,
+        "xdc": 2.0,
+        "algorand": 3.3,
+        "near": 1.0,
+        "tezos": 8.0,
+        "telos": 0.5,
+    }
+    PRICE_CACHE_MAX_SIZE = 1000
+
     __instance = None
 
     @staticmethod
@@ -65,6 +93,9 @@ class GatewayHttpClient:
         if GatewayHttpClient.__instance is None:
             self._base_url = f"https://{api_host}:{api_port}"
         self._client_config_map = client_config_map
+        self._price_cache_ttls: Dict[Union[str, Tuple[str, str]], float] = dict(self.PRICE_CACHE_TTLS)
+        self._price_cache: Dict[Tuple, Tuple[float, Dict[str, Any]]] = {}
+        self._price_requests: Dict[Tuple, asyncio.Task] = {}
         GatewayHttpClient.__instance = self
 
     @classmethod
@@ -84,8 +115,15 @@ class GatewayHttpClient:
             ssl_ctx.load_cert_chain(certfile=f"{cert_path}/client_cert.pem",
                                     keyfile=f"{cert_path}/client_key.pem",
                                     password=Security.secrets_manager.password.get_secret_value())
-            conn = aiohttp.TCPConnector(ssl_context=ssl_ctx)
-            cls._shared_client = aiohttp.ClientSession(connector=conn)
+            transport_manager = HTTPTransportManager.get_instance()
+            # Gateway runs locally, its connections are limited by `gateway_max_connections` (0 means no limit)
+            max_connections = client_config_map.gateway.gateway_max_connections
+            settings = dataclasses.replace(transport_manager.settings,
+                                           limit=max_connections,
+                                           limit_per_host=max_connections)
+            cls._shared_client = transport_manager.get_session(
+                name=cls.TRANSPORT_SESSION_NAME, ssl_context=ssl_ctx, re_init=True, settings=settings
+            )
         return cls._shared_client
 
     @classmethod
@@ -104,6 +142,24 @@ class GatewayHttpClient:
     def base_url(self, url: str):
         self._base_url = url
 
+    def price_cache_ttl(self, chain: str, network: str) -> float:
+        """
+        :returns the time in seconds the prices quoted for the chain and network are reused, 0 if they are not cached
+        """
+        block_time = self._price_cache_ttls.get(
+            (chain, network), self._price_cache_ttls.get(chain, self.DEFAULT_PRICE_CACHE_TTL))
+        return min(float(self._client_config_map.gateway.gateway_price_cache_ttl), block_time)
+
+    def set_price_cache_ttl(self, ttl: float, chain: str, network: Optional[str] = None):
+        """
+        Sets the maximum time the prices quoted for a chain (or only one of its networks) are reused. A TTL of 0
+        disables the cache, the concurrent requests for the same price are still sent only once.
+        """
+        self._price_cache_ttls[chain if network is None else (chain, network)] = ttl
+
+    def clear_price_cache(self):
+        self._price_cache.clear()
+
     def log_error_codes(self, resp: Dict[str, Any]):
         """
         If the API returns an error code, interpret the code, log a useful
@@ -409,12 +465,67 @@ class GatewayHttpClient:
             request_payload["poolId"] = pool_id
 
         # XXX(martin_kou): The amount is always output with 18 decimal places.
-        return await self.api_request(
-            "post",
-            "amm/price",
-            request_payload,
-            fail_silently=fail_silently,
-        )
+        request_key = tuple(sorted(request_payload.items())) + (("fail_silently", fail_silently),)
+        cached_price = self._price_cache.get(request_key)
+        if cached_price is not None and cached_price[0] > time.time():
+            return copy.deepcopy(cached_price[1])
+
+        # Identical requests sent while the first one is in flight wait for its response instead of quoting again
+        request = self._price_requests.get(request_key)
+        if request is None:
+            request = asyncio.ensure_future(self._request_price(request_key, request_payload, fail_silently))
+            request.add_done_callback(lambda task: task.cancelled() or task.exception())
+            self._price_requests[request_key] = request
+        # Every caller gets its own copy, so changes made by one caller are not seen by the others
+        return copy.deepcopy(await asyncio.shield(request))
+
+    async def get_prices(
+            self,
+            chain: str,
+            network: str,
+            connector: str,
+            base_asset: str,
+            quote_asset: str,
+            amounts: List[Decimal],
+            side: TradeType,
+            fail_silently: bool = False,
+            pool_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Quotes a ladder of amounts. Gateway quotes a single amount per request, so the requests are sent concurrently
+        (sharing the in flight requests and the cached prices of `get_price`).
+
+        :returns the price responses, in the order of the amounts
+        """
+        return await safe_gather(*[
+            self.get_price(chain, network, connector, base_asset, quote_asset, amount, side, fail_silently, pool_id)
+            for amount in amounts
+        ])
+
+    async def _request_price(
+            self, request_key: Tuple, request_payload: Dict[str, Any], fail_silently: bool) -> Dict[str, Any]:
+        try:
+            response = await self.api_request(
+                "post",
+                "amm/price",
+                request_payload,
+                fail_silently=fail_silently,
+            )
+            ttl = self.price_cache_ttl(request_payload["chain"], request_payload["network"])
+            if ttl > 0 and isinstance(response, dict) and "price" in response:
+                self._price_cache.pop(request_key, None)
+                if len(self._price_cache) >= self.PRICE_CACHE_MAX_SIZE:
+                    now = time.time()
+                    self._price_cache = {
+                        key: cached_price for key, cached_price in self._price_cache.items() if cached_price[0] > now
+                    }
+                    # Evict the oldest prices if the cache is still full
+                    for key in list(self._price_cache)[:len(self._price_cache) - self.PRICE_CACHE_MAX_SIZE + 1]:
+                        del self._price_cache[key]
+                self._price_cache[request_key] = (time.time() + ttl, copy.deepcopy(response))
+            return response
+        finally:
+            self._price_requests.pop(request_key, None)
 
     async def get_transaction_status(
             self,
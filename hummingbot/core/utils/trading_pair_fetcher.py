@@ -1,6 +1,12 @@
+import asyncio
+import json
 import logging
+import os
+import time
+from os.path import exists, join
 from typing import Any, Awaitable, Callable, Dict, List, Optional
 
+from hummingbot import data_path
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.client.settings import AllConnectorSettings, ConnectorSetting
 from hummingbot.logger import HummingbotLogger
@@ -10,6 +16,16 @@ from .async_utils import safe_ensure_future
 
 
 class TradingPairFetcher:
+    """
+    Fetches the trading pairs of the connectors for the client autocompletion and validations.
+
+    The fetched lists are kept in an on-disk snapshot. At startup the snapshot is served right away, and only the
+    connectors whose entry is older than SNAPSHOT_TTL are fetched again, at most MAX_CONCURRENT_FETCHES at a time.
+    """
+    SNAPSHOT_FILE_NAME = "trading_pairs_snapshot.json"
+    SNAPSHOT_TTL = 60 * 60 * 24
+    MAX_CONCURRENT_FETCHES = 5
+
     _sf_shared_instance: "TradingPairFetcher" = None
     _tpf_logger: Optional[HummingbotLogger] = None
 
@@ -27,9 +43,16 @@ class TradingPairFetcher:
         return cls._sf_shared_instance
 
     def __init__(self, client_config_map: ClientConfigAdapter):
-        self.ready = False
         self.trading_pairs: Dict[str, Any] = {}
         self.fetch_pairs_from_all_exchanges = client_config_map.fetch_pairs_from_all_exchanges
+        self._snapshot: Dict[str, Dict[str, Any]] = self._load_snapshot()
+        self.trading_pairs.update({
+            connector_name: entry["trading_pairs"] for connector_name, entry in self._snapshot.items()
+        })
+        # The snapshot can be served right away only when it has the pairs of every connector
+        self.ready = self._snapshot_covers_all_connectors()
+        self._fetch_semaphore: Optional[asyncio.Semaphore] = None
+        self._pending_fetches: List[asyncio.Future] = []
         self._fetch_task = safe_ensure_future(self.fetch_all(client_config_map))
 
     def _fetch_pairs_from_connector_setting(
@@ -37,11 +60,17 @@ class TradingPairFetcher:
             connector_setting: ConnectorSetting,
             connector_name: Optional[str] = None):
         connector_name = connector_name or connector_setting.name
+        if self._is_snapshot_fresh(connector_name):
+            return
         connector = connector_setting.non_trading_connector_instance_with_default_configuration()
-        safe_ensure_future(self.call_fetch_pairs(connector.all_trading_pairs(), connector_name))
+        self._pending_fetches.append(
+            safe_ensure_future(self._bounded_fetch_pairs(connector.all_trading_pairs(), connector_name))
+        )
 
     async def fetch_all(self, client_config_map: ClientConfigAdapter):
         await Security.wait_til_decryption_done()
+        self._fetch_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_FETCHES)
+        self._pending_fetches = []
         connector_settings = self._all_connector_settings()
         for conn_setting in connector_settings.values():
             # XXX(martin_kou): Some connectors, e.g. uniswap v3, aren't completed yet. Ignore if you can't find the
@@ -63,16 +92,74 @@ class TradingPairFetcher:
                 self.logger().exception(f"An error occurred when fetching trading pairs for {conn_setting.name}."
                                         "Please check the logs")
         self.ready = True
+        if len(self._pending_fetches) > 0:
+            await asyncio.gather(*self._pending_fetches, return_exceptions=True)
+            self._save_snapshot()
+
+    async def _bounded_fetch_pairs(self, fetch_fn: Callable[[], Awaitable[List[str]]], exchange_name: str):
+        async with self._fetch_semaphore:
+            await self.call_fetch_pairs(fetch_fn, exchange_name)
 
     async def call_fetch_pairs(self, fetch_fn: Callable[[], Awaitable[List[str]]], exchange_name: str):
         try:
             pairs = await fetch_fn
             self.trading_pairs[exchange_name] = pairs
+            self._snapshot[exchange_name] = {"timestamp": time.time(), "trading_pairs": list(pairs)}
         except Exception:
             self.logger().error(f"Connector {exchange_name} failed to retrieve its trading pairs. "
                                 f"Trading pairs autocompletion won't work.", exc_info=True)
-            # In case of error just assign empty list, this is st. the bot won't stop working
-            self.trading_pairs[exchange_name] = []
+            # In case of error keep serving the previous pairs, or assign an empty list so the bot won't stop working
+            if exchange_name not in self.trading_pairs:
+                self.trading_pairs[exchange_name] = []
+
+    def _is_snapshot_fresh(self, connector_name: str) -> bool:
+        entry = self._snapshot.get(connector_name)
+        return entry is not None and time.time() - entry["timestamp"] < self.SNAPSHOT_TTL
+
+    def _snapshot_covers_all_connectors(self) -> bool:
+        try:
+            connector_settings = self._all_connector_settings()
+        except Exception:
+            return False
+        return (len(self._snapshot) > 0
+                and all(conn_setting.name in self._snapshot for conn_setting in connector_settings.values()))
+
+    def _load_snapshot(self) -> Dict[str, Dict[str, Any]]:
+        snapshot_path = self._snapshot_path()
+        snapshot = {}
+        if exists(snapshot_path):
+            try:
+                with open(snapshot_path) as fd:
+                    snapshot = json.load(fd)
+            except (OSError, ValueError):
+                self.logger().warning(f"Could not read the trading pairs snapshot {snapshot_path}.")
+            if not self._is_valid_snapshot(snapshot):
+                self.logger().warning(f"Ignoring the malformed trading pairs snapshot {snapshot_path}.")
+                snapshot = {}
+        return snapshot
+
+    @staticmethod
+    def _is_valid_snapshot(snapshot: Any) -> bool:
+        return isinstance(snapshot, dict) and all(
+            isinstance(entry, dict)
+            and isinstance(entry.get("timestamp"), (int, float))
+            and isinstance(entry.get("trading_pairs"), list)
+            for entry in snapshot.values()
+        )
+
+    def _save_snapshot(self):
+        snapshot_path = self._snapshot_path()
+        temp_path = f"{snapshot_path}.tmp"
+        try:
+            with open(temp_path, "w") as fd:
+                json.dump(self._snapshot, fd)
+            os.replace(temp_path, snapshot_path)
+        except OSError:
+            self.logger().warning(f"Could not write the trading pairs snapshot {snapshot_path}.", exc_info=True)
+
+    def _snapshot_path(self) -> str:
+        # Method created to enabling patching in unit tests
+        return join(data_path(), self.SNAPSHOT_FILE_NAME)
 
     def _all_connector_settings(self) -> Dict[str, ConnectorSetting]:
         # Method created to enabling patching in unit tests
@@ -2,6 +2,8 @@ from typing import Optional
 
 import aiohttp
 
+from hummingbot.core.web_assistant.connections.http_transport_manager import HTTPTransportManager
+from hummingbot.core.web_assistant.connections.json_decoder import JSONDecoderBase
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
 from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
 
@@ -16,9 +18,19 @@ class ConnectionsFactory:
     `WebAssistantsFactory` to accommodate cases such as Bittrex that uses a specific WebSocket technology requiring
     a separate third-party library. In that case, a factory can be created that returns `RESTConnection`s using
     `aiohttp` and `WSConnection`s using `signalr_aio`.
+
+    When `use_shared_transport` is set, the connections are created on the process-wide session owned by the
+    `HTTPTransportManager` instead of a session private to this factory.
+
+    The payloads received by the connections are decoded with `json_decoder` if provided, or with the process-wide
+    default decoder otherwise (see `json_decoder.get_json_decoder`). The factory decoder is used for all the REST
+    responses and WS messages, so it has to be a generic one. Decoders with a schema are passed to
+    `get_ws_connection` for the connections of the channels they describe.
     """
 
-    def __init__(self):
+    def __init__(self, use_shared_transport: bool = False, json_decoder: Optional[JSONDecoderBase] = None):
+        self._use_shared_transport = use_shared_transport
+        self._json_decoder = json_decoder
         # _ws_independent_session is intended to be used only in unit tests
         self._ws_independent_session: Optional[aiohttp.ClientSession] = None
 
@@ -26,14 +38,20 @@ class ConnectionsFactory:
 
     async def get_rest_connection(self) -> RESTConnection:
         shared_client = await self._get_shared_client()
-        connection = RESTConnection(aiohttp_client_session=shared_client)
+        connection = RESTConnection(aiohttp_client_session=shared_client, json_decoder=self._json_decoder)
         return connection
 
-    async def get_ws_connection(self) -> WSConnection:
+    async def get_ws_connection(self, json_decoder: Optional[JSONDecoderBase] = None) -> WSConnection:
+        """
+        :param json_decoder: decoder for the messages of this connection only, the factory decoder is used if not set
+        """
         shared_client = self._ws_independent_session or await self._get_shared_client()
-        connection = WSConnection(aiohttp_client_session=shared_client)
+        connection = WSConnection(aiohttp_client_session=shared_client,
+                                  json_decoder=json_decoder or self._json_decoder)
         return connection
 
     async def _get_shared_client(self) -> aiohttp.ClientSession:
+        if self._use_shared_transport:
+            return HTTPTransportManager.get_instance().get_session()
         self._shared_client = self._shared_client or aiohttp.ClientSession()
         return self._shared_client
@@ -1,3 +1,4 @@
+import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
@@ -6,6 +7,8 @@ from typing import TYPE_CHECKING, Any, Mapping, Optional
 import aiohttp
 import ujson
 
+from hummingbot.core.web_assistant.connections.json_decoder import JSONDecoderBase, get_json_decoder
+
 if TYPE_CHECKING:
     from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
 
@@ -78,6 +81,9 @@ class EndpointRESTRequest(RESTRequest, ABC):
             raise ValueError("The `data` field should be used only for POST requests. Use `params` instead.")
 
 
+JSON_CONTENT_TYPE_RE = re.compile(r"^application/(?:[\w.+-]+?\+)?json")
+
+
 @dataclass(init=False)
 class RESTResponse:
     url: str
@@ -85,8 +91,9 @@ class RESTResponse:
     status: int
     headers: Optional[Mapping[str, str]]
 
-    def __init__(self, aiohttp_response: aiohttp.ClientResponse):
+    def __init__(self, aiohttp_response: aiohttp.ClientResponse, json_decoder: Optional[JSONDecoderBase] = None):
         self._aiohttp_response = aiohttp_response
+        self._json_decoder = json_decoder
 
     @property
     def url(self) -> str:
@@ -109,7 +116,13 @@ class RESTResponse:
         return headers_
 
     async def json(self) -> Any:
-        json_ = await self._aiohttp_response.json()
+        if JSON_CONTENT_TYPE_RE.match(self._aiohttp_response.content_type) is None:
+            # Let aiohttp raise the content type error
+            return await self._aiohttp_response.json()
+        body = (await self._aiohttp_response.read()).strip()
+        if not body:
+            return None
+        json_ = (self._json_decoder or get_json_decoder()).loads(body)
         return json_
 
     async def text(self) -> str:
@@ -0,0 +1,184 @@
+import logging
+import ssl
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from types import SimpleNamespace
+from typing import Any, Dict, Optional
+
+import aiohttp
+
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+
+
+@dataclass
+class HTTPTransportSettings:
+    """Connection pool parameters applied to every session created by the `HTTPTransportManager`.
+
+    `aiohttp` already enables TCP_NODELAY on every socket it opens, so there is no switch for it here.
+    """
+    limit: int = 100
+    limit_per_host: int = 20
+    keepalive_timeout: float = 30.0
+    use_dns_cache: bool = True
+    ttl_dns_cache: Optional[int] = 300
+
+
+@dataclass
+class HostPoolMetrics:
+    requests_started: int = 0
+    requests_finished: int = 0
+    requests_failed: int = 0
+    connections_created: int = 0
+    connections_reused: int = 0
+    in_flight: int = 0
+
+    @property
+    def reuse_ratio(self) -> float:
+        total = self.connections_created + self.connections_reused
+        return self.connections_reused / total if total > 0 else 0.0
+
+
+class HTTPTransportManager:
+    """Process-wide owner of the `aiohttp` sessions used for REST and WebSocket traffic.
+
+    Connectors and the gateway client opt in to share pooled, kept-alive connections instead of each creating
+    its own `aiohttp.ClientSession` with default settings. Sessions are identified by name so that clients with
+    specific requirements (e.g. the gateway client, which uses client certificates) get a pool of their own.
+    Per-host request and connection counters are collected through an `aiohttp.TraceConfig`.
+    """
+
+    DEFAULT_SESSION_NAME = "default"
+
+    _logger: Optional[HummingbotLogger] = None
+    _instance: Optional["HTTPTransportManager"] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    @classmethod
+    def get_instance(cls) -> "HTTPTransportManager":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, settings: Optional[HTTPTransportSettings] = None):
+        self._settings = settings or HTTPTransportSettings()
+        self._sessions: Dict[str, aiohttp.ClientSession] = {}
+        self._host_metrics: Dict[str, HostPoolMetrics] = defaultdict(HostPoolMetrics)
+
+    @property
+    def settings(self) -> HTTPTransportSettings:
+        return self._settings
+
+    def configure(self, settings: HTTPTransportSettings):
+        """Sets the pool parameters. Only sessions created after the call are affected."""
+        self._settings = settings
+
+    def get_session(
+        self,
+        name: str = DEFAULT_SESSION_NAME,
+        ssl_context: Optional[ssl.SSLContext] = None,
+        re_init: bool = False,
+        settings: Optional[HTTPTransportSettings] = None,
+    ) -> aiohttp.ClientSession:
+        """
+        :param name: identifier of the session pool
+        :param ssl_context: SSL context used by the pool connections (only considered when the session is created)
+        :param re_init: if True the existing session is closed and a new one is created
+        :param settings: pool parameters of this session, the manager settings are used if not provided (only
+            considered when the session is created)
+        :returns the shared session registered with the provided name
+        """
+        session = self._sessions.get(name)
+        if re_init or session is None or not self._is_usable(session):
+            if session is not None and not session.closed:
+                self._close_session(session)
+            session = self._create_session(ssl_context=ssl_context, settings=settings or self._settings)
+            self._sessions[name] = session
+        return session
+
+    def host_metrics(self) -> Dict[str, HostPoolMetrics]:
+        return dict(self._host_metrics)
+
+    def pool_status(self) -> Dict[str, Any]:
+        """
+        :returns a summary of the pool configuration, the active sessions and the per-host utilisation
+        """
+        hosts = {
+            host: {**asdict(metrics), "reuse_ratio": metrics.reuse_ratio}
+            for host, metrics in self._host_metrics.items()
+        }
+        return {
+            "settings": asdict(self._settings),
+            "sessions": [name for name, session in self._sessions.items() if not session.closed],
+            "hosts": hosts,
+        }
+
+    def reset_metrics(self):
+        self._host_metrics.clear()
+
+    async def close(self):
+        for session in self._sessions.values():
+            if not session.closed:
+                await session.close()
+        self._sessions.clear()
+
+    def _create_session(self,
+                        ssl_context: Optional[ssl.SSLContext],
+                        settings: HTTPTransportSettings) -> aiohttp.ClientSession:
+        connector_kwargs = dict(
+            limit=settings.limit,
+            limit_per_host=settings.limit_per_host,
+            keepalive_timeout=settings.keepalive_timeout,
+            use_dns_cache=settings.use_dns_cache,
+            ttl_dns_cache=settings.ttl_dns_cache,
+        )
+        if ssl_context is not None:
+            connector_kwargs["ssl"] = ssl_context
+        connector = aiohttp.TCPConnector(**connector_kwargs)
+        return aiohttp.ClientSession(connector=connector, trace_configs=[self._build_trace_config()])
+
+    @staticmethod
+    def _is_usable(session: aiohttp.ClientSession) -> bool:
+        loop = getattr(session, "_loop", None)
+        return not session.closed and (loop is None or not loop.is_closed())
+
+    def _close_session(self, session: aiohttp.ClientSession):
+        loop = getattr(session, "_loop", None)
+        if loop is not None and loop.is_running():
+            safe_ensure_future(session.close())
+
+    def _build_trace_config(self) -> aiohttp.TraceConfig:
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(self._on_request_start)
+        trace_config.on_request_end.append(self._on_request_end)
+        trace_config.on_request_exception.append(self._on_request_exception)
+        trace_config.on_connection_create_end.append(self._on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(self._on_connection_reuseconn)
+        return trace_config
+
+    async def _on_request_start(self, _: aiohttp.ClientSession, context: SimpleNamespace, params: Any):
+        context.host = params.url.host
+        metrics = self._host_metrics[context.host]
+        metrics.requests_started += 1
+        metrics.in_flight += 1
+
+    async def _on_request_end(self, _: aiohttp.ClientSession, context: SimpleNamespace, __: Any):
+        metrics = self._host_metrics[context.host]
+        metrics.requests_finished += 1
+        metrics.in_flight -= 1
+
+    async def _on_request_exception(self, _: aiohttp.ClientSession, context: SimpleNamespace, __: Any):
+        metrics = self._host_metrics[context.host]
+        metrics.requests_failed += 1
+        metrics.in_flight -= 1
+
+    async def _on_connection_create_end(self, _: aiohttp.ClientSession, context: SimpleNamespace, __: Any):
+        self._host_metrics[getattr(context, "host", None)].connections_created += 1
+
+    async def _on_connection_reuseconn(self, _: aiohttp.ClientSession, context: SimpleNamespace, __: Any):
+        self._host_metrics[getattr(context, "host", None)].connections_reused += 1
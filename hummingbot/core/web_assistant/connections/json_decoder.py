@@ -0,0 +1,147 @@
+import json
+import re
+from abc import ABC, abstractmethod
+from typing import Any, Optional, Type, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover
+    ujson = None
+
+JSONPayload = Union[str, bytes, bytearray]
+
+
+class JSONDecoderBase(ABC):
+    """Decodes the JSON payloads received through the web assistant connections.
+
+    Implementations must raise `json.JSONDecodeError` for invalid payloads, whatever the underlying library, so the
+    connections can handle decoding errors the same way regardless of the decoder in use.
+    """
+
+    name: str
+
+    @abstractmethod
+    def loads(self, payload: JSONPayload) -> Any:
+        ...
+
+    @staticmethod
+    def _decode_error(error: Exception, payload: JSONPayload) -> json.JSONDecodeError:
+        document = payload if isinstance(payload, str) else bytes(payload).decode("utf-8", errors="replace")
+        return json.JSONDecodeError(str(error), document, 0)
+
+
+class StdlibJSONDecoder(JSONDecoderBase):
+    name = "json"
+
+    def loads(self, payload: JSONPayload) -> Any:
+        return json.loads(payload)
+
+
+class UJSONDecoder(JSONDecoderBase):
+    name = "ujson"
+
+    def __init__(self):
+        if ujson is None:
+            raise ImportError("ujson is not installed.")
+
+    def loads(self, payload: JSONPayload) -> Any:
+        try:
+            return ujson.loads(payload)
+        except ValueError as e:
+            raise self._decode_error(e, payload) from e
+
+
+class OrjsonDecoder(JSONDecoderBase):
+    """Decoder based on `orjson`.
+
+    orjson rejects the NaN and Infinity literals accepted by the stdlib decoder, and depending on its version it either
+    rejects integers beyond 64 bits or decodes them as floats. Rejected documents that contain any of those tokens are
+    decoded again with the stdlib decoder. Other invalid documents raise orjson's error, which is a
+    `json.JSONDecodeError`, without a second parsing attempt.
+    """
+
+    name = "orjson"
+    # Tokens the stdlib decoder accepts and orjson may reject: NaN and Infinity literals and integers beyond 64 bits
+    _STDLIB_ONLY_TOKENS = r"NaN|Infinity|\d{20}"
+    _STDLIB_ONLY_TOKENS_STR_RE = re.compile(_STDLIB_ONLY_TOKENS)
+    _STDLIB_ONLY_TOKENS_BYTES_RE = re.compile(_STDLIB_ONLY_TOKENS.encode())
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("orjson is not installed.")
+
+    def loads(self, payload: JSONPayload) -> Any:
+        try:
+            return orjson.loads(payload)
+        except orjson.JSONDecodeError:
+            if not self._has_stdlib_only_tokens(payload):
+                raise
+            return json.loads(payload)
+
+    def _has_stdlib_only_tokens(self, payload: JSONPayload) -> bool:
+        token_re = self._STDLIB_ONLY_TOKENS_STR_RE if isinstance(payload, str) else self._STDLIB_ONLY_TOKENS_BYTES_RE
+        return token_re.search(payload) is not None
+
+
+class MsgspecDecoder(JSONDecoderBase):
+    """Decoder based on `msgspec`.
+
+    When a schema is provided (e.g. a `msgspec.Struct` or a union of them describing the messages of a channel) the
+    payloads are validated and decoded directly into instances of the schema types, which is faster than decoding into
+    dictionaries. This allows connectors to opt in to typed decoding for their highest volume channels, passing the
+    decoder to `WebAssistantsFactory.get_ws_assistant` for the assistants of those channels.
+    """
+
+    name = "msgspec"
+
+    def __init__(self, schema: Optional[Type] = None):
+        if msgspec is None:
+            raise ImportError("msgspec is not installed.")
+        self._decoder = msgspec.json.Decoder(schema) if schema is not None else msgspec.json.Decoder()
+
+    def loads(self, payload: JSONPayload) -> Any:
+        try:
+            return self._decoder.decode(payload)
+        except msgspec.ValidationError as e:
+            raise self._decode_error(e, payload) from e
+        except msgspec.DecodeError:
+            # Fall back to the stdlib decoder for documents msgspec does not support (e.g. integers beyond 64 bits)
+            return json.loads(payload)
+
+
+def create_default_json_decoder() -> JSONDecoderBase:
+    """
+    :returns the fastest decoder available, in order: orjson, msgspec, ujson, and the stdlib decoder as fallback
+    """
+    if orjson is not None:
+        return OrjsonDecoder()
+    if msgspec is not None:
+        return MsgspecDecoder()
+    if ujson is not None:
+        return UJSONDecoder()
+    return StdlibJSONDecoder()
+
+
+_default_json_decoder: JSONDecoderBase = create_default_json_decoder()
+
+
+def get_json_decoder() -> JSONDecoderBase:
+    return _default_json_decoder
+
+
+def set_json_decoder(decoder: JSONDecoderBase):
+    """
+    Replaces the decoder used by all the connections that were not configured with a specific decoder.
+    """
+    global _default_json_decoder
+    _default_json_decoder = decoder
@@ -1,4 +1,5 @@
 import asyncio
+import logging
 import time
 from json import JSONDecodeError
 from typing import Any, Dict, Mapping, Optional
@@ -6,11 +7,22 @@ from typing import Any, Dict, Mapping, Optional
 import aiohttp
 
 from hummingbot.core.web_assistant.connections.data_types import WSRequest, WSResponse
+from hummingbot.core.web_assistant.connections.json_decoder import JSONDecoderBase, get_json_decoder
+from hummingbot.logger import HummingbotLogger
 
 
 class WSConnection:
-    def __init__(self, aiohttp_client_session: aiohttp.ClientSession):
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, aiohttp_client_session: aiohttp.ClientSession, json_decoder: Optional[JSONDecoderBase] = None):
         self._client_session = aiohttp_client_session
+        self._json_decoder = json_decoder
         self._connection: Optional[aiohttp.ClientWebSocketResponse] = None
         self._connected = False
         self._message_timeout: Optional[float] = None
@@ -125,14 +137,29 @@ class WSConnection:
     async def _send_binary(self, payload: bytes):
         await self._connection.send_bytes(payload)
 
-    @staticmethod
-    def _build_resp(msg: aiohttp.WSMessage) -> WSResponse:
+    def _build_resp(self, msg: aiohttp.WSMessage) -> WSResponse:
         if msg.type == aiohttp.WSMsgType.BINARY:
             data = msg.data
         else:
-            try:
-                data = msg.json()
-            except JSONDecodeError:
-                data = msg.data
+            data = self._decode_text_message(msg.data)
         response = WSResponse(data)
         return response
+
+    def _decode_text_message(self, text: str) -> Any:
+        """
+        Decodes the text messages with the connection decoder. A connection decoder with a schema only accepts the
+        messages of its channel, the messages it rejects are decoded with the default decoder. Messages that are not
+        JSON documents (e.g. plain text heartbeats) are returned as received.
+        """
+        default_decoder = get_json_decoder()
+        if self._json_decoder is not None and self._json_decoder is not default_decoder:
+            try:
+                return self._json_decoder.loads(text)
+            except JSONDecodeError as e:
+                self.logger().debug(f"The {self._json_decoder.name} decoder rejected the WS message {text} ({e}), "
+                                    f"decoding it with the default decoder.")
+        try:
+            return default_decoder.loads(text)
+        except JSONDecodeError:
+            self.logger().debug(f"Received a WS message that is not a JSON document: {text}")
+            return text
@@ -3,6 +3,7 @@ from typing import List, Optional
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.connections_factory import ConnectionsFactory
+from hummingbot.core.web_assistant.connections.json_decoder import JSONDecoderBase
 from hummingbot.core.web_assistant.rest_assistant import RESTAssistant
 from hummingbot.core.web_assistant.rest_post_processors import RESTPostProcessorBase
 from hummingbot.core.web_assistant.rest_pre_processors import RESTPreProcessorBase
@@ -29,8 +30,12 @@ class WebAssistantsFactory:
         ws_pre_processors: Optional[List[WSPreProcessorBase]] = None,
         ws_post_processors: Optional[List[WSPostProcessorBase]] = None,
         auth: Optional[AuthBase] = None,
+        use_shared_transport: bool = False,
+        json_decoder: Optional[JSONDecoderBase] = None,
     ):
-        self._connections_factory = ConnectionsFactory()
+        self._connections_factory = ConnectionsFactory(
+            use_shared_transport=use_shared_transport, json_decoder=json_decoder
+        )
         self._rest_pre_processors = rest_pre_processors or []
         self._rest_post_processors = rest_post_processors or []
         self._ws_pre_processors = ws_pre_processors or []
@@ -57,8 +62,12 @@ class WebAssistantsFactory:
         )
         return assistant
 
-    async def get_ws_assistant(self) -> WSAssistant:
-        connection = await self._connections_factory.get_ws_connection()
+    async def get_ws_assistant(self, json_decoder: Optional[JSONDecoderBase] = None) -> WSAssistant:
+        """
+        :param json_decoder: decoder for the messages received by this assistant only, e.g. a `MsgspecDecoder` with the
+            schema of the channels it subscribes to. Messages the decoder rejects are decoded with the default decoder.
+        """
+        connection = await self._connections_factory.get_ws_connection(json_decoder=json_decoder)
         assistant = WSAssistant(
             connection, self._ws_pre_processors, self._ws_post_processors, self._auth
         )
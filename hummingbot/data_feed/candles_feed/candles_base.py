@@ -1,7 +1,7 @@
 import asyncio
 import os
 from collections import deque
-from typing import List, Optional
+from typing import Callable, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
@@ -10,7 +10,7 @@ from bidict import bidict
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
 from hummingbot.core.network_base import NetworkBase
 from hummingbot.core.network_iterator import NetworkStatus
-from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.core.web_assistant.connections.data_types import WSJSONRequest
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
@@ -160,23 +160,33 @@ class CandlesBase(NetworkBase):
         df.sort_values(by="timestamp", ascending=False, inplace=True)
         self._candles.extendleft(df.values.tolist())
 
-    async def get_historical_candles(self, config: HistoricalCandlesConfig):
+    async def get_historical_candles(self,
+                                     config: HistoricalCandlesConfig,
+                                     progress_callback: Optional[Callable[[int, int], None]] = None):
+        """
+        This method fetches the candles between the start and end time of the config. The time range is split in
+        page windows of candles_max_result_per_rest_request candles that are requested concurrently (the requests
+        are still limited by the feed throttler).
+        :param config: the historical candles configuration
+        :param progress_callback: optional function called with the number of fetched pages and the total pages
+        """
         try:
             await self.initialize_exchange_data()
-            all_candles = []
-            current_end_time = config.end_time + self.interval_in_seconds
-            current_start_time = config.start_time - self.interval_in_seconds
-            while current_end_time >= current_start_time:
-                missing_records = int((current_end_time - current_start_time) / self.interval_in_seconds)
-                fetched_candles = await self.fetch_candles(end_time=current_end_time, limit=missing_records)
-                if fetched_candles.size <= 1:
-                    break
-                all_candles.append(fetched_candles)
-                last_timestamp = self.ensure_timestamp_in_seconds(
-                    fetched_candles[0][0])  # Assuming the first column is the timestamp
-                current_end_time = last_timestamp - self.interval_in_seconds
-                self.check_candles_sorted_and_equidistant(all_candles)
-            final_candles = np.concatenate(all_candles[::-1], axis=0) if all_candles else np.array([])
+            page_windows = self._get_historical_candles_page_windows(config)
+            fetched_pages = 0
+
+            async def fetch_page(end_time: int, limit: int) -> np.ndarray:
+                nonlocal fetched_pages
+                page_candles = await self.fetch_candles(end_time=end_time, limit=limit)
+                fetched_pages += 1
+                if progress_callback is not None:
+                    progress_callback(fetched_pages, len(page_windows))
+                return page_candles
+
+            pages = await safe_gather(*[fetch_page(end_time, limit) for end_time, limit in page_windows])
+            # Windows are computed from the newest to the oldest, so the pages are reversed to keep the ascending order
+            all_candles = [page_candles for page_candles in pages[::-1] if page_candles.size > 1]
+            final_candles = np.concatenate(all_candles, axis=0) if all_candles else np.array([])
             candles_df = pd.DataFrame(final_candles, columns=self.columns)
             candles_df.drop_duplicates(subset=["timestamp"], inplace=True)
             candles_df = candles_df[
@@ -185,6 +195,22 @@ class CandlesBase(NetworkBase):
         except Exception as e:
             self.logger().exception(f"Error fetching historical candles: {str(e)}")
 
+    def _get_historical_candles_page_windows(self, config: HistoricalCandlesConfig) -> List[Tuple[int, int]]:
+        """
+        This method returns the (end_time, limit) pairs of the REST requests covering the historical candles range.
+        Consecutive windows share their boundary candle, the duplicates are dropped once the pages are merged.
+        :param config: the historical candles configuration
+        """
+        page_size = self.candles_max_result_per_rest_request - 1
+        current_end_time = config.end_time + self.interval_in_seconds
+        current_start_time = config.start_time - self.interval_in_seconds
+        page_windows = []
+        while current_end_time >= current_start_time:
+            missing_records = int((current_end_time - current_start_time) / self.interval_in_seconds)
+            page_windows.append((current_end_time, min(page_size, missing_records)))
+            current_end_time -= max(page_size, 1) * self.interval_in_seconds
+        return page_windows
+
     def check_candles_sorted_and_equidistant(self, candles: np.ndarray):
         """
         This method checks if the given candles are sorted by timestamp in ascending order and equidistant.
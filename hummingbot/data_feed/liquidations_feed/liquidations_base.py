@@ -2,8 +2,9 @@ import asyncio
 import time
 from dataclasses import dataclass, fields
 from enum import Enum
-from typing import Optional, Set
+from typing import Dict, Optional, Set
 
+import numpy as np
 import pandas as pd
 from bidict import bidict
 from pandas import DataFrame
@@ -36,6 +37,117 @@ class Liquidation:
     side: LiquidationSide
 
 
+class LiquidationsStore:
+    """
+    Columnar storage of the liquidations of a single trading pair, ordered by arrival. Expired liquidations are
+    dropped by moving the start of the live window, and the arrays are compacted only when half of them are stale.
+    Running sums of the liquidated notional per side allow rolling statistics without building a DataFrame.
+    """
+
+    def __init__(self, trading_pair: str, initial_capacity: int = 1024):
+        self._trading_pair = trading_pair
+        self._timestamps = np.empty(initial_capacity, dtype=np.int64)
+        self._quantities = np.empty(initial_capacity, dtype=np.float64)
+        self._prices = np.empty(initial_capacity, dtype=np.float64)
+        self._is_long = np.empty(initial_capacity, dtype=bool)
+        # Cumulative liquidated notional (quantity * price) per side, including the liquidation at each position
+        self._long_notional_sums = np.empty(initial_capacity, dtype=np.float64)
+        self._short_notional_sums = np.empty(initial_capacity, dtype=np.float64)
+        self._start = 0
+        self._end = 0
+        self._version = 0
+        self._df: Optional[DataFrame] = None
+
+    def __len__(self):
+        return self._end - self._start
+
+    @property
+    def version(self) -> int:
+        """
+        Number of changes applied to the store, used to detect outdated views built from it
+        """
+        return self._version
+
+    def append(self, liquidation: Liquidation):
+        if self._end == len(self._timestamps):
+            self._reallocate()
+        notional = liquidation.quantity * liquidation.price
+        is_long = liquidation.side == LiquidationSide.LONG
+        previous_long_sum = self._long_notional_sums[self._end - 1] if self._end > 0 else 0.0
+        previous_short_sum = self._short_notional_sums[self._end - 1] if self._end > 0 else 0.0
+        self._timestamps[self._end] = liquidation.timestamp
+        self._quantities[self._end] = liquidation.quantity
+        self._prices[self._end] = liquidation.price
+        self._is_long[self._end] = is_long
+        self._long_notional_sums[self._end] = previous_long_sum + (notional if is_long else 0.0)
+        self._short_notional_sums[self._end] = previous_short_sum + (0.0 if is_long else notional)
+        self._end += 1
+        self._version += 1
+        self._df = None
+
+    def expire(self, cutoff_timestamp: int):
+        """
+        Drops the liquidations with a timestamp lower or equal than the cutoff timestamp (in milliseconds)
+        """
+        new_start = self._start + int(np.searchsorted(self._timestamps[self._start:self._end],
+                                                      cutoff_timestamp,
+                                                      side="right"))
+        if new_start != self._start:
+            self._start = new_start
+            self._version += 1
+            self._df = None
+
+    def liquidated_notional(self, side: LiquidationSide, since_timestamp: int) -> float:
+        """
+        Returns the notional liquidated on the given side by the liquidations with a timestamp greater or equal than
+        since_timestamp (in milliseconds)
+        """
+        if self._end == self._start:
+            return 0.0
+        notional_sums = self._long_notional_sums if side == LiquidationSide.LONG else self._short_notional_sums
+        first = self._start + int(np.searchsorted(self._timestamps[self._start:self._end], since_timestamp, side="left"))
+        if first == self._end:
+            return 0.0
+        previous_sum = notional_sums[first - 1] if first > 0 else 0.0
+        return float(notional_sums[self._end - 1] - previous_sum)
+
+    def liquidations_df(self) -> DataFrame:
+        """
+        Returns the live liquidations as a DataFrame. The DataFrame is cached until the store changes, so it should
+        not be modified in place.
+        """
+        if self._df is None:
+            live = slice(self._start, self._end)
+            self._df = pd.DataFrame({
+                "timestamp": self._timestamps[live],
+                "trading_pair": self._trading_pair,
+                "quantity": self._quantities[live],
+                "price": self._prices[live],
+                "side": np.where(self._is_long[live], LiquidationSide.LONG, LiquidationSide.SHORT),
+            })
+        return self._df
+
+    def _reallocate(self):
+        # Stale rows are compacted away, and the arrays only grow when more than half of them are live
+        live_count = len(self)
+        capacity = len(self._timestamps)
+        new_capacity = capacity * 2 if live_count > capacity // 2 else capacity
+        for name in ("_timestamps", "_quantities", "_prices", "_is_long"):
+            current = getattr(self, name)
+            resized = np.empty(new_capacity, dtype=current.dtype)
+            resized[:live_count] = current[self._start:self._end]
+            setattr(self, name, resized)
+        # The running sums are rebased to start from zero at the first live liquidation
+        for name in ("_long_notional_sums", "_short_notional_sums"):
+            current = getattr(self, name)
+            baseline = current[self._start - 1] if self._start > 0 else 0.0
+            resized = np.empty(new_capacity, dtype=current.dtype)
+            resized[:live_count] = current[self._start:self._end] - baseline
+            setattr(self, name, resized)
+        self._start = 0
+        self._end = live_count
+
+
 class LiquidationsBase(NetworkBase):
     """
     This class serves as a base class for fetching and storing liquidation data from crypto exchanges. The storage
@@ -49,7 +161,9 @@ class LiquidationsBase(NetworkBase):
         self._api_factory = WebAssistantsFactory(throttler=async_throttler)
         self._max_retention_seconds = max_retention_seconds
         self._trading_pairs = trading_pairs
-        self._liquidations = {}
+        self._liquidations: Dict[str, LiquidationsStore] = {}
+        self._all_liquidations_df: Optional[DataFrame] = None
+        self._all_liquidations_df_sources = None
         self._listen_liquidations_task: Optional[asyncio.Task] = None
         self._cleanup_task: Optional[asyncio.Task] = None
         self._subscribed_to_channels = False
@@ -114,15 +228,18 @@ class LiquidationsBase(NetworkBase):
             self._cleanup_old_liquidations()
             await self._sleep(1.0)
 
+    def _add_liquidation(self, liquidation: Liquidation):
+        store = self._liquidations.get(liquidation.trading_pair)
+        if store is None:
+            store = LiquidationsStore(trading_pair=liquidation.trading_pair)
+            self._liquidations[liquidation.trading_pair] = store
+        store.append(liquidation)
+
     def _cleanup_old_liquidations(self):
         try:
-            current_time_ms = int(time.time() * 1000)
-            if self._liquidations:
-                for trading_pair, liquidations in list(self._liquidations.items()):
-                    self._liquidations[trading_pair] = [
-                        liq for liq in liquidations if
-                        current_time_ms - liq.timestamp < self._max_retention_seconds * 1000
-                    ]
+            cutoff_timestamp = int(time.time() * 1000) - self._max_retention_seconds * 1000
+            for store in self._liquidations.values():
+                store.expire(cutoff_timestamp)
         except Exception:
             self.logger().exception(
                 "Unexpected error occurred when cleaning up outdated liquidations. Retrying in 1 seconds...",
@@ -133,30 +250,37 @@ class LiquidationsBase(NetworkBase):
         This method returns the liquidations stored as a Pandas DataFrame.
         If no trading_pair is specified, all liquidations are returned in a single DataFrame.
         If the specified trading_pair has no data, an empty DataFrame is returned.
+        The DataFrames are cached until new liquidations arrive or old ones expire, so they should not be modified.
         """
         # Dynamically retrieve column names from the Liquidation dataclass
         column_names = [f.name for f in fields(Liquidation)]
 
-        # Check if a specific trading pair is requested
         if trading_pair:
-            # Retrieve the list of Liquidation objects for the specified trading pair
-            liquidations = self._liquidations.get(trading_pair)
-            # If no liquidations are found for the trading pair, return an empty DataFrame
-            if not liquidations:
-                return pd.DataFrame(columns=column_names)
-            # Convert the list of dataclass instances to a DataFrame
-            return pd.DataFrame([liq.__dict__ for liq in liquidations])
-        else:
-            # No specific trading pair is requested, combine all pairs
-            all_liquidations = []
-            # Iterate over all trading pairs and collect their liquidations
-            for pair_liquidations in self._liquidations.values():
-                all_liquidations.extend(pair_liquidations)
-            # If no liquidations are collected, return an empty DataFrame
-            if not all_liquidations:
+            store = self._liquidations.get(trading_pair)
+            if store is None or len(store) == 0:
                 return pd.DataFrame(columns=column_names)
-            # Convert the list of all liquidations to a DataFrame
-            return pd.DataFrame([liq.__dict__ for liq in all_liquidations])
+            return store.liquidations_df()
+
+        # No specific trading pair is requested, combine the cached DataFrames of all pairs
+        pair_dfs = [store.liquidations_df() for store in self._liquidations.values() if len(store) > 0]
+        if not pair_dfs:
+            return pd.DataFrame(columns=column_names)
+        sources = [(trading_pair, store.version) for trading_pair, store in self._liquidations.items()]
+        if self._all_liquidations_df is None or self._all_liquidations_df_sources != sources:
+            self._all_liquidations_df = pd.concat(pair_dfs, ignore_index=True)
+            self._all_liquidations_df_sources = sources
+        return self._all_liquidations_df
+
+    def liquidated_notional(self, trading_pair: str, side: LiquidationSide, window_seconds: int) -> float:
+        """
+        Returns the notional (quantity * price) liquidated on the given side of the trading pair during the last
+        window_seconds, without building a DataFrame.
+        """
+        store = self._liquidations.get(trading_pair)
+        if store is None:
+            return 0.0
+        since_timestamp = int(time.time() * 1000) - window_seconds * 1000
+        return store.liquidated_notional(side=side, since_timestamp=since_timestamp)
 
     def get_exchange_trading_pair(self, trading_pair):
         raise NotImplementedError
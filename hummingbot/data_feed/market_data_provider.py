@@ -1,6 +1,7 @@
 import time
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from hummingbot.connector.connector_base import ConnectorBase
@@ -8,12 +9,14 @@ from hummingbot.core.data_type.common import PriceType
 from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesFactory
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
+from hummingbot.data_feed.market_snapshot import MarketSnapshot
 
 
 class MarketDataProvider:
     def __init__(self, connectors: Dict[str, ConnectorBase]):
         self.candles_feeds = {}  # Stores instances of candle feeds
         self.connectors = connectors  # Stores instances of connectors
+        self._market_snapshot: Optional[MarketSnapshot] = None
 
     def stop(self):
         for candle_feed in self.candles_feeds.values():
@@ -30,6 +33,25 @@ class MarketDataProvider:
     def time(self):
         return time.time()
 
+    @property
+    def market_snapshot(self) -> MarketSnapshot:
+        """
+        Returns the market snapshot of the current tick, creating one if it was not initialized yet.
+        """
+        if self._market_snapshot is None:
+            self.update_market_snapshot()
+        return self._market_snapshot
+
+    def update_market_snapshot(self, timestamp: Optional[float] = None) -> MarketSnapshot:
+        """
+        Replaces the market snapshot with a new one. This should be called once per tick, before the controllers and
+        executors read the market state.
+        :param timestamp: timestamp of the tick, the provider time is used if not specified
+        :return: The new market snapshot.
+        """
+        self._market_snapshot = MarketSnapshot(self, timestamp if timestamp is not None else self.time())
+        return self._market_snapshot
+
     def initialize_candles_feed(self, config: CandlesConfig):
         """
         Initializes a candle feed based on the given configuration.
@@ -222,3 +244,42 @@ class MarketDataProvider:
         """
         order_book = self.get_order_book(connector_name, trading_pair)
         return order_book.get_vwap_for_volume(is_buy, volume)
+
+    def get_depth_buckets(self, connector_name: str, trading_pair: str, bucket_bps: float,
+                          num_buckets: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Gets the volume of each side of the order book aggregated in buckets by distance to the mid price.
+
+        :param connector_name: The name of the connector.
+        :param trading_pair: The trading pair for which to retrieve the data.
+        :param bucket_bps: The width of each bucket in basis points of the mid price.
+        :param num_buckets: The number of buckets per side.
+        :return: Tuple of read-only arrays with the bid and ask volume of each bucket, starting at the mid price.
+        """
+        order_book = self.get_order_book(connector_name, trading_pair)
+        return order_book.get_depth_buckets(bucket_bps, num_buckets)
+
+    def get_cumulative_depth(self, connector_name: str, trading_pair: str,
+                             distances_bps: List[float]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Gets the volume of each side of the order book up to the given distances from the mid price.
+
+        :param connector_name: The name of the connector.
+        :param trading_pair: The trading pair for which to retrieve the data.
+        :param distances_bps: The distances to the mid price in basis points.
+        :return: Tuple of read-only arrays with the bid and ask volume within each distance.
+        """
+        order_book = self.get_order_book(connector_name, trading_pair)
+        return order_book.get_cumulative_depth(distances_bps)
+
+    def get_order_book_imbalance(self, connector_name: str, trading_pair: str, depth: int) -> float:
+        """
+        Gets the volume imbalance of the top levels of the order book.
+
+        :param connector_name: The name of the connector.
+        :param trading_pair: The trading pair for which to retrieve the data.
+        :param depth: The number of levels of each side to include.
+        :return: (bid volume - ask volume) / total volume, or NaN if the order book is empty.
+        """
+        order_book = self.get_order_book(connector_name, trading_pair)
+        return order_book.get_imbalance(depth)
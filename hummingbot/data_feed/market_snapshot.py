@@ -0,0 +1,82 @@
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, NamedTuple
+
+from hummingbot.connector.trading_rule import TradingRule
+from hummingbot.core.data_type.common import PriceType
+from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
+
+if TYPE_CHECKING:
+    from hummingbot.data_feed.market_data_provider import MarketDataProvider
+
+
+class TopOfBook(NamedTuple):
+    best_bid: Decimal
+    best_ask: Decimal
+    mid_price: Decimal
+
+
+class MarketSnapshot:
+    """
+    Read-only view of the market state for a single tick.
+
+    Every value is read from the market data provider the first time it is requested and then returned unchanged for
+    the rest of the tick, so all the controllers and executors reading the snapshot during the tick see consistent
+    values and the underlying connectors are only queried once per value. Derived values (e.g. the price for a given
+    volume) can be memoized in the snapshot with `memoize`. Balances are not part of the snapshot, since they change
+    within the tick as soon as an order is placed.
+    """
+
+    def __init__(self, market_data_provider: "MarketDataProvider", timestamp: float):
+        self._market_data_provider = market_data_provider
+        self._timestamp = timestamp
+        self._values: Dict[Hashable, Any] = {}
+
+    @property
+    def timestamp(self) -> float:
+        return self._timestamp
+
+    def memoize(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Returns the value stored in the snapshot for the key, computing and storing it first if it is not present.
+        :param key: hashable identifier of the value
+        :param compute: function that calculates the value
+        """
+        if key not in self._values:
+            self._values[key] = compute()
+        return self._values[key]
+
+    def get_price_by_type(self, connector_name: str, trading_pair: str, price_type: PriceType) -> Decimal:
+        return self.memoize(
+            ("price", connector_name, trading_pair, price_type),
+            lambda: self._market_data_provider.get_price_by_type(connector_name, trading_pair, price_type))
+
+    def get_top_of_book(self, connector_name: str, trading_pair: str) -> TopOfBook:
+        return self.memoize(
+            ("top_of_book", connector_name, trading_pair),
+            lambda: TopOfBook(
+                best_bid=self.get_price_by_type(connector_name, trading_pair, PriceType.BestBid),
+                best_ask=self.get_price_by_type(connector_name, trading_pair, PriceType.BestAsk),
+                mid_price=self.get_price_by_type(connector_name, trading_pair, PriceType.MidPrice),
+            ))
+
+    def get_order_book(self, connector_name: str, trading_pair: str):
+        return self.memoize(
+            ("order_book", connector_name, trading_pair),
+            lambda: self._market_data_provider.get_order_book(connector_name, trading_pair))
+
+    def get_price_for_volume(self, connector_name: str, trading_pair: str, volume: float,
+                             is_buy: bool) -> OrderBookQueryResult:
+        return self.memoize(
+            ("price_for_volume", connector_name, trading_pair, volume, is_buy),
+            lambda: self._market_data_provider.get_price_for_volume(connector_name, trading_pair, volume, is_buy))
+
+    def get_vwap_for_volume(self, connector_name: str, trading_pair: str, volume: float,
+                            is_buy: bool) -> OrderBookQueryResult:
+        return self.memoize(
+            ("vwap_for_volume", connector_name, trading_pair, volume, is_buy),
+            lambda: self._market_data_provider.get_vwap_for_volume(connector_name, trading_pair, volume, is_buy))
+
+    def get_trading_rules(self, connector_name: str, trading_pair: str) -> TradingRule:
+        return self.memoize(
+            ("trading_rules", connector_name, trading_pair),
+            lambda: self._market_data_provider.get_connector(connector_name).trading_rules[trading_pair])
@@ -26,6 +26,14 @@ class InternalEventMessage(PubSubMessage):
     data: Optional[dict] = {}
 
 
+class InternalEventBatchMessage(PubSubMessage):
+    timestamp: Optional[int] = -1
+    count: Optional[int] = 0
+    encoding: Optional[str] = 'json'
+    events: Optional[List[dict]] = []
+    payload: Optional[str] = ''
+
+
 class LogMessage(PubSubMessage):
     timestamp: float = 0.0
     msg: str = ''
@@ -1,10 +1,13 @@
 #!/usr/bin/env python
 
 import asyncio
+import base64
 import functools
+import json
 import logging
 import threading
 import time
+import zlib
 from collections import deque
 from dataclasses import asdict, is_dataclass
 from datetime import datetime
@@ -39,6 +42,7 @@ from hummingbot.remote_iface.messages import (
     ExternalEventMessage,
     HistoryCommandMessage,
     ImportCommandMessage,
+    InternalEventBatchMessage,
     InternalEventMessage,
     LogMessage,
     NotifyMessage,
@@ -68,6 +72,7 @@ class TopicSpecs:
     COMMANDS: CommandTopicSpecs = CommandTopicSpecs()
     LOGS: str = '/log'
     INTERNAL_EVENTS: str = '/events'
+    INTERNAL_EVENTS_BATCH: str = '/events/batch'
     NOTIFICATIONS: str = '/notify'
     STATUS_UPDATES: str = '/status_updates'
     HEARTBEATS: str = '/hb'
@@ -290,6 +295,9 @@ class MQTTCommands:
                 response.status = MQTT_STATUS_CODE.ERROR
                 response.msg = 'No strategy is currently running!'
                 return response
+            portfolio_ledger = getattr(self._hb_app.strategy, "portfolio_ledger", None)
+            if portfolio_ledger is not None:
+                response.data = portfolio_ledger.snapshot()
             if msg.async_backend:
                 self._ev_loop.call_soon_threadsafe(
                     self._hb_app.status
@@ -409,6 +417,21 @@ class MQTTMarketEventForwarder:
         self.event_fw_pub = self._node.create_publisher(
             topic=self._topic, msg_type=InternalEventMessage
         )
+
+        # Events are buffered and forwarded as a single batch message when a batch interval is configured
+        mqtt_bridge = self._hb_app.client_config_map.mqtt_bridge
+        self._batch_interval: float = mqtt_bridge.mqtt_events_batch_interval
+        self._batch_size: int = mqtt_bridge.mqtt_events_batch_size
+        self._batch_compression: bool = mqtt_bridge.mqtt_events_batch_compression
+        self._event_batch: List[Tuple[float, str, Dict[str, Any]]] = []
+        self._batch_flush_handle: Optional[asyncio.TimerHandle] = None
+        self._batch_publish_lock = asyncio.Lock()
+        self.event_batch_pub = None
+        if self._batch_interval > 0:
+            self.event_batch_pub = self._node.create_publisher(
+                topic=f'{topic_prefix}{TopicSpecs.INTERNAL_EVENTS_BATCH}',
+                msg_type=InternalEventBatchMessage
+            )
         self._start_event_listeners()
 
     def _send_mqtt_event(self, event_tag: int, pubsub: PubSub, event):
@@ -457,6 +480,10 @@ class MQTTMarketEventForwarder:
         except KeyError:
             timestamp = datetime.now().timestamp()
 
+        if self.event_batch_pub is not None:
+            self._add_event_to_batch(timestamp, event_type, event_data)
+            return
+
         event_data = self._make_event_payload(event_data)
 
         self.event_fw_pub.publish(
@@ -488,6 +515,55 @@ class MQTTMarketEventForwarder:
                 self._make_event_payload(event_data[key])
         return event_data
 
+    def _add_event_to_batch(self, timestamp: float, event_type: str, event_data: Dict[str, Any]):
+        self._event_batch.append((timestamp, event_type, event_data))
+        if len(self._event_batch) >= self._batch_size:
+            self._flush_event_batch()
+        elif self._batch_flush_handle is None:
+            self._batch_flush_handle = self._ev_loop.call_later(self._batch_interval, self._flush_event_batch)
+
+    def _take_event_batch(self) -> List[Tuple[float, str, Dict[str, Any]]]:
+        if self._batch_flush_handle is not None:
+            self._batch_flush_handle.cancel()
+            self._batch_flush_handle = None
+        batch, self._event_batch = self._event_batch, []
+        return batch
+
+    def _flush_event_batch(self):
+        batch = self._take_event_batch()
+        if len(batch) > 0:
+            safe_ensure_future(self._publish_event_batch(batch))
+
+    async def _publish_event_batch(self, batch: List[Tuple[float, str, Dict[str, Any]]]):
+        # The lock keeps the batches in order while they are serialized outside the event loop
+        async with self._batch_publish_lock:
+            try:
+                msg = await self._ev_loop.run_in_executor(None, self._make_batch_message, batch)
+                self.event_batch_pub.publish(msg)
+            except Exception:
+                self.logger().error(f"Error forwarding a batch of {len(batch)} market events.", exc_info=True)
+
+    def _make_batch_message(self, batch: List[Tuple[float, str, Dict[str, Any]]]) -> InternalEventBatchMessage:
+        events_payload = [
+            {
+                'timestamp': int(timestamp),
+                'type': event_type,
+                'data': self._make_event_payload(event_data),
+            }
+            for timestamp, event_type, event_data in batch
+        ]
+        msg = InternalEventBatchMessage(
+            timestamp=int(time.time() * 1e3),
+            count=len(events_payload),
+        )
+        if self._batch_compression:
+            serialized = json.dumps(events_payload, separators=(',', ':'), default=str).encode()
+            msg.encoding = 'zlib+base64'
+            msg.payload = base64.b64encode(zlib.compress(serialized)).decode()
+        else:
+            msg.events = events_payload
+        return msg
+
     def _start_event_listeners(self):
         for market in self._markets:
             for event_pair in self._market_event_pairs:
@@ -500,6 +576,9 @@ class MQTTMarketEventForwarder:
         for market in self._markets:
             for event_pair in self._market_event_pairs:
                 market.remove_listener(event_pair[0], event_pair[1])
+        batch = self._take_event_batch()
+        if len(batch) > 0:
+            self.event_batch_pub.publish(self._make_batch_message(batch))
 
 
 class MQTTNotifier(NotifierBase):
@@ -725,6 +804,8 @@ class MQTTGateway(Node):
             self._market_events = MQTTMarketEventForwarder(self._hb_app, self)
             if self.state == NodeState.RUNNING:
                 self._market_events.event_fw_pub.run()
+                if self._market_events.event_batch_pub is not None:
+                    self._market_events.event_batch_pub.run()
 
     def _remove_market_event_listeners(self):
         if self._market_events is not None:
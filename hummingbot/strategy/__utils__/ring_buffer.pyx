@@ -1,11 +1,19 @@
 import numpy as np
 import logging
 cimport numpy as np
+from libc.math cimport isfinite, sqrt
 
 
 pmm_logger = None
 
 cdef class RingBuffer:
+    """
+    Fixed length buffer of floats keeping the mean and variance of its values up to date as they are added (using
+    Welford's algorithm over the sliding window), so reading them does not need to go through the whole buffer.
+
+    The running statistics are recalculated from the buffer once every `length` additions to bound the accumulated
+    rounding errors, and whenever a non finite value enters or leaves the buffer.
+    """
     @classmethod
     def logger(cls):
         global pmm_logger
@@ -13,23 +21,52 @@ cdef class RingBuffer:
             pmm_logger = logging.getLogger(__name__)
         return pmm_logger
 
-    def __cinit__(self, int length):
+    def __cinit__(self, int64_t length):
         self._length = length
         self._buffer = np.zeros(length, dtype=np.float64)
         self._delimiter = 0
         self._is_full = False
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._updates_since_refresh = 0
+        self._stats_dirty = True
 
     def __dealloc__(self):
         self._buffer = None
 
-    cdef void c_add_value(self, float val):
+    cdef void c_add_value(self, double val):
+        cdef double old_value = self._buffer[self._delimiter]
         self._buffer[self._delimiter] = val
+        if self._is_full:
+            self.c_update_stats(val, old_value)
         self.c_increment_delimiter()
 
     cdef void c_increment_delimiter(self):
         self._delimiter = (self._delimiter + 1) % self._length
         if not self._is_full and self._delimiter == 0:
             self._is_full = True
+            self._stats_dirty = True
+
+    cdef void c_update_stats(self, double new_value, double old_value):
+        cdef double old_mean
+        if self._stats_dirty:
+            # Recalculated on the next read
+            return
+        self._updates_since_refresh += 1
+        if (self._updates_since_refresh >= self._length
+                or not isfinite(new_value) or not isfinite(old_value)):
+            self._stats_dirty = True
+            return
+        old_mean = self._mean
+        self._mean = old_mean + (new_value - old_value) / self._length
+        self._m2 += (new_value - old_value) * (new_value - self._mean + old_value - old_mean)
+
+    cdef void c_refresh_stats(self):
+        cdef np.ndarray[np.double_t, ndim=1] values = np.asarray(self._buffer)
+        self._mean = np.mean(values)
+        self._m2 = np.var(values) * self._length
+        self._updates_since_refresh = 0
+        self._stats_dirty = False
 
     cdef bint c_is_empty(self):
         return (not self._is_full) and (0==self._delimiter)
@@ -37,44 +74,68 @@ cdef class RingBuffer:
     cdef double c_get_last_value(self):
         if self.c_is_empty():
             return np.nan
-        return self._buffer[self._delimiter-1]
+        return self._buffer[(self._delimiter - 1) % self._length]
 
     cdef bint c_is_full(self):
         return self._is_full
 
+    cdef int64_t c_get_size(self):
+        return self._length if self._is_full else self._delimiter
+
     cdef double c_mean_value(self):
-        result = np.nan
-        if self._is_full:
-            result=np.mean(self.c_get_as_numpy_array())
-        return result
+        if not self._is_full:
+            return np.nan
+        if self._stats_dirty:
+            self.c_refresh_stats()
+        return self._mean
 
     cdef double c_variance(self):
-        result = np.nan
-        if self._is_full:
-            result = np.var(self.c_get_as_numpy_array())
-        return result
+        if not self._is_full:
+            return np.nan
+        if self._stats_dirty:
+            self.c_refresh_stats()
+        return max(self._m2, 0.0) / self._length
 
     cdef double c_std_dev(self):
-        result = np.nan
-        if self._is_full:
-            result = np.std(self.c_get_as_numpy_array())
-        return result
+        cdef double variance = self.c_variance()
+        if variance != variance:
+            return variance
+        return sqrt(variance)
 
-    cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self):
-        cdef np.ndarray[np.int16_t, ndim=1] indexes
+    cdef tuple c_get_segments(self):
+        cdef:
+            np.ndarray[np.double_t, ndim=1] buffer = np.asarray(self._buffer)
+            np.ndarray[np.double_t, ndim=1] older
+            np.ndarray[np.double_t, ndim=1] newer
 
-        if not self._is_full:
-            indexes = np.arange(0, stop=self._delimiter, dtype=np.int16)
+        if self._is_full:
+            older = buffer[self._delimiter:]
+            newer = buffer[:self._delimiter]
         else:
-            indexes = np.arange(self._delimiter, stop=self._delimiter + self._length,
-                                dtype=np.int16) % self._length
-        return np.asarray(self._buffer)[indexes]
+            older = buffer[:self._delimiter]
+            newer = buffer[:0]
+        older.flags.writeable = False
+        newer.flags.writeable = False
+        return older, newer
+
+    cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self):
+        older, newer = self.c_get_segments()
+        if newer.size == 0:
+            return older.copy()
+        return np.concatenate((older, newer))
 
     def __init__(self, length):
         self._length = length
         self._buffer = np.zeros(length, dtype=np.double)
         self._delimiter = 0
         self._is_full = False
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._updates_since_refresh = 0
+        self._stats_dirty = True
+
+    def __len__(self):
+        return self.c_get_size()
 
     def add_value(self, val):
         self.c_add_value(val)
@@ -82,6 +143,14 @@ cdef class RingBuffer:
     def get_as_numpy_array(self):
         return self.c_get_as_numpy_array()
 
+    def get_segments(self):
+        """
+        Returns the content of the buffer without copying it, as two read only views: the oldest values and the newest
+        ones, which concatenated give the values in the order they were added. The views reflect the values added
+        afterwards, so they should not be kept beyond the current calculation.
+        """
+        return self.c_get_segments()
+
     def get_last_value(self):
         return self.c_get_last_value()
 
@@ -89,6 +158,10 @@ cdef class RingBuffer:
     def is_full(self):
         return self.c_is_full()
 
+    @property
+    def size(self) -> int:
+        return self.c_get_size()
+
     @property
     def mean_value(self):
         return self.c_mean_value()
@@ -113,6 +186,7 @@ cdef class RingBuffer:
         self._buffer = np.zeros(value, dtype=np.float64)
         self._delimiter = 0
         self._is_full = False
+        self._stats_dirty = True
 
         for val in data[-value:]:
             self.add_value(val)
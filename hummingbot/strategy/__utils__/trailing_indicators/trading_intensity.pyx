@@ -1,13 +1,10 @@
 # distutils: language=c++
 # distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
 
-import warnings
-from decimal import Decimal
+from bisect import bisect_left, insort
 from typing import Tuple
 
 import numpy as np
-from scipy.optimize import curve_fit
-from scipy.optimize import OptimizeWarning
 
 from hummingbot.core.data_type.common import (
     PriceType,
@@ -26,11 +23,28 @@ cdef class TradesForwarder(EventListener):
 
 
 cdef class TradingIntensityIndicator:
-
-    def __init__(self, order_book: OrderBook, price_delegate: AssetPriceDelegate, sampling_length: int = 30):
+    """
+    Estimates the trading intensity `alpha * exp(-kappa * price_level)` from the traded volume at each distance to the
+    mid price, over the last `sampling_length` samples.
+
+    The quotes are kept sorted by timestamp so each trade finds the last quote before it with a binary search, and the
+    volume by price level of the samples in the window is updated as samples are added and removed. The intensity is
+    estimated in closed form (weighted least squares over the log of the volumes) and refined with a few Gauss-Newton
+    steps, only when the volumes changed and at most once every `min_refit_interval` seconds.
+    """
+    FIT_REFINEMENT_STEPS = 5
+
+    def __init__(self,
+                 order_book: OrderBook,
+                 price_delegate: AssetPriceDelegate,
+                 sampling_length: int = 30,
+                 min_refit_interval: float = 0):
         self._alpha = 0
         self._kappa = 0
         self._trade_samples = {}
+        self._trade_samples_timestamps = []
+        self._volume_by_price_level = {}
+        self._trades_count_by_price_level = {}
         self._current_trade_sample = []
         self._trades_forwarder = TradesForwarder(self)
         self._order_book = order_book
@@ -38,9 +52,11 @@ cdef class TradingIntensityIndicator:
         self._price_delegate = price_delegate
         self._sampling_length = sampling_length
         self._samples_length = 0
-        self._last_quotes = []
-
-        warnings.simplefilter("ignore", OptimizeWarning)
+        self._quotes_timestamps = []
+        self._quotes_prices = []
+        self._min_refit_interval = min_refit_interval
+        self._last_fit_timestamp = 0
+        self._is_fit_outdated = False
 
     @property
     def current_value(self) -> Tuple[float, float]:
@@ -48,12 +64,12 @@ cdef class TradingIntensityIndicator:
 
     @property
     def is_sampling_buffer_full(self) -> bool:
-        return len(self._trade_samples.keys()) == self._sampling_length
+        return len(self._trade_samples) == self._sampling_length
 
     @property
     def is_sampling_buffer_changed(self) -> bool:
-        is_changed = self._samples_length != len(self._trade_samples.keys())
-        self._samples_length = len(self._trade_samples.keys())
+        is_changed = self._samples_length != len(self._trade_samples)
+        self._samples_length = len(self._trade_samples)
         return is_changed
 
     @property
@@ -64,57 +80,64 @@ cdef class TradingIntensityIndicator:
     def sampling_length(self, new_len: int):
         self._sampling_length = new_len
 
+    @property
+    def min_refit_interval(self) -> float:
+        return self._min_refit_interval
+
+    @min_refit_interval.setter
+    def min_refit_interval(self, value: float):
+        self._min_refit_interval = value
+
     @property
     def last_quotes(self) -> list:
         """A helper method to be used in unit tests"""
-        return self._last_quotes
+        return [{"timestamp": timestamp, "price": price}
+                for timestamp, price in zip(reversed(self._quotes_timestamps), reversed(self._quotes_prices))]
 
     @last_quotes.setter
     def last_quotes(self, value):
         """A helper method to be used in unit tests"""
-        self._last_quotes = value
+        # The quotes are received in descending order of timestamp
+        self._quotes_timestamps = [quote["timestamp"] for quote in reversed(value)]
+        self._quotes_prices = [float(quote["price"]) for quote in reversed(value)]
 
     def calculate(self, timestamp):
         """A helper method to be used in unit tests"""
         self.c_calculate(timestamp)
 
     cdef c_calculate(self, timestamp):
+        cdef:
+            int quote_index
+            int latest_processed_quote_index = -1
+
         price = self._price_delegate.get_price_by_type(PriceType.MidPrice)
-        # Descending order of price-timestamp quotes
-        self._last_quotes = [{'timestamp': timestamp, 'price': price}] + self._last_quotes
+        self._quotes_timestamps.append(timestamp)
+        self._quotes_prices.append(float(price))
 
-        latest_processed_quote_idx = None
         for trade in self._current_trade_sample:
-            for i, quote in enumerate(self._last_quotes):
-                if quote["timestamp"] < trade.timestamp:
-                    if latest_processed_quote_idx is None or i < latest_processed_quote_idx:
-                        latest_processed_quote_idx = i
-                    trade = {"price_level": abs(trade.price - float(quote["price"])), "amount": trade.amount}
-
-                    if quote["timestamp"] + 1 not in self._trade_samples.keys():
-                        self._trade_samples[quote["timestamp"] + 1] = []
-
-                    self._trade_samples[quote["timestamp"] + 1] += [trade]
-                    break
-
-        # THere are no trades left to process
+            # Last quote before the trade
+            quote_index = bisect_left(self._quotes_timestamps, trade.timestamp) - 1
+            if quote_index >= 0:
+                latest_processed_quote_index = max(latest_processed_quote_index, quote_index)
+                self.c_add_trade_sample(self._quotes_timestamps[quote_index] + 1,
+                                        abs(trade.price - self._quotes_prices[quote_index]),
+                                        trade.amount)
+
+        # There are no trades left to process
         self._current_trade_sample = []
         # Store quotes that happened after the latest trade + one before
-        if latest_processed_quote_idx is not None:
-            self._last_quotes = self._last_quotes[0:latest_processed_quote_idx + 1]
-
-        if len(self._trade_samples.keys()) > self._sampling_length:
-            timestamps = list(self._trade_samples.keys())
-            timestamps.sort()
-            timestamps = timestamps[-self._sampling_length:]
+        if latest_processed_quote_index > 0:
+            del self._quotes_timestamps[:latest_processed_quote_index]
+            del self._quotes_prices[:latest_processed_quote_index]
 
-            trade_samples = {}
-            for timestamp in timestamps:
-                trade_samples[timestamp] = self._trade_samples[timestamp]
-            self._trade_samples = trade_samples
+        while len(self._trade_samples_timestamps) > self._sampling_length:
+            self.c_remove_oldest_trade_sample()
 
-        if self.is_sampling_buffer_full:
+        if (self.is_sampling_buffer_full
+                and self._is_fit_outdated
+                and timestamp - self._last_fit_timestamp >= self._min_refit_interval):
             self.c_estimate_intensity()
+            self._last_fit_timestamp = timestamp
 
     def register_trade(self, trade):
         """A helper method to be used in unit tests"""
@@ -123,44 +146,80 @@ cdef class TradingIntensityIndicator:
     cdef c_register_trade(self, object trade):
         self._current_trade_sample.append(trade)
 
+    cdef c_add_trade_sample(self, double sample_timestamp, double price_level, double amount):
+        if sample_timestamp not in self._trade_samples:
+            self._trade_samples[sample_timestamp] = []
+            insort(self._trade_samples_timestamps, sample_timestamp)
+        self._trade_samples[sample_timestamp].append((price_level, amount))
+        self._volume_by_price_level[price_level] = self._volume_by_price_level.get(price_level, 0) + amount
+        self._trades_count_by_price_level[price_level] = self._trades_count_by_price_level.get(price_level, 0) + 1
+        self._is_fit_outdated = True
+
+    cdef c_remove_oldest_trade_sample(self):
+        sample_timestamp = self._trade_samples_timestamps.pop(0)
+        for price_level, amount in self._trade_samples.pop(sample_timestamp):
+            trades_count = self._trades_count_by_price_level[price_level] - 1
+            if trades_count == 0:
+                del self._trades_count_by_price_level[price_level]
+                del self._volume_by_price_level[price_level]
+            else:
+                self._trades_count_by_price_level[price_level] = trades_count
+                self._volume_by_price_level[price_level] -= amount
+        self._is_fit_outdated = True
+
     cdef c_estimate_intensity(self):
         cdef:
-            dict trades_consolidated
-            list lambdas
-            list price_levels
-
-        # Calculate lambdas / trading intensities
-        lambdas = []
-
-        trades_consolidated = {}
-        price_levels = []
-        for timestamp in self._trade_samples.keys():
-            tick = self._trade_samples[timestamp]
-            for trade in tick:
-                if trade['price_level'] not in trades_consolidated.keys():
-                    trades_consolidated[trade['price_level']] = 0
-                    price_levels += [trade['price_level']]
-
-                trades_consolidated[trade['price_level']] += trade['amount']
-
-        price_levels = sorted(price_levels, reverse=True)
-
-        for price_level in price_levels:
-            lambdas += [trades_consolidated[price_level]]
-
+            double weights_sum
+            double mean_price_level
+            double mean_log_lambda
+            double price_levels_variance
+            double slope
+
+        self._is_fit_outdated = False
+        price_levels = np.fromiter(self._volume_by_price_level.keys(), dtype=np.float64)
+        lambdas = np.fromiter(self._volume_by_price_level.values(), dtype=np.float64)
         # Adjust to be able to calculate log
-        lambdas_adj = [10**-10 if x==0 else x for x in lambdas]
-
-        # Fit the probability density function; reuse previously calculated parameters as initial values
-        try:
-            params = curve_fit(lambda t, a, b: a*np.exp(-b*t),
-                               price_levels,
-                               lambdas_adj,
-                               p0=(self._alpha, self._kappa),
-                               method='dogbox',
-                               bounds=([0, 0], [np.inf, np.inf]))
-
-            self._kappa = Decimal(str(params[0][1]))
-            self._alpha = Decimal(str(params[0][0]))
-        except (RuntimeError, ValueError) as e:
-            pass
+        lambdas[lambdas <= 0] = 1e-10
+
+        # Fitting log(lambda) = log(alpha) - kappa * price_level weighting each point with lambda^2 approximates the least
+        # squares fit of the exponential curve, without the bias the log transform gives to the levels with low volumes
+        weights = np.square(lambdas)
+        weights_sum = np.sum(weights)
+        mean_price_level = np.sum(weights * price_levels) / weights_sum
+        price_levels_variance = np.sum(weights * np.square(price_levels - mean_price_level))
+        if len(price_levels) < 2 or price_levels_variance <= 0:
+            return
+        log_lambdas = np.log(lambdas)
+        mean_log_lambda = np.sum(weights * log_lambdas) / weights_sum
+        slope = np.sum(weights * (price_levels - mean_price_level) * (log_lambdas - mean_log_lambda)) / price_levels_variance
+
+        if slope > 0:
+            # The intensity can't grow with the distance to the mid price, the best fit is a constant intensity
+            self._kappa = 0
+            self._alpha = np.mean(lambdas)
+            return
+
+        alpha = np.exp(mean_log_lambda - slope * mean_price_level)
+        kappa = -slope
+        # Refine the log-linear estimate with a few Gauss-Newton steps over the exponential curve itself
+        for _ in range(self.FIT_REFINEMENT_STEPS):
+            exponentials = np.exp(-kappa * price_levels)
+            residuals = lambdas - alpha * exponentials
+            alpha_derivatives = exponentials
+            kappa_derivatives = -alpha * price_levels * exponentials
+            jtj_aa = np.dot(alpha_derivatives, alpha_derivatives)
+            jtj_ak = np.dot(alpha_derivatives, kappa_derivatives)
+            jtj_kk = np.dot(kappa_derivatives, kappa_derivatives)
+            determinant = jtj_aa * jtj_kk - jtj_ak * jtj_ak
+            if determinant <= 0:
+                break
+            jtr_a = np.dot(alpha_derivatives, residuals)
+            jtr_k = np.dot(kappa_derivatives, residuals)
+            new_alpha = alpha + (jtj_kk * jtr_a - jtj_ak * jtr_k) / determinant
+            new_kappa = kappa + (jtj_aa * jtr_k - jtj_ak * jtr_a) / determinant
+            if new_alpha <= 0 or new_kappa < 0 or not np.isfinite(new_alpha) or not np.isfinite(new_kappa):
+                break
+            alpha, kappa = new_alpha, new_kappa
+
+        self._alpha = alpha
+        self._kappa = kappa
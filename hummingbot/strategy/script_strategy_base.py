@@ -7,11 +7,14 @@ import pandas as pd
 from pydantic import BaseModel
 
 from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.connector.portfolio_ledger import PortfolioLedger
 from hummingbot.connector.utils import split_hb_trading_pair
+from hummingbot.core.clock import Clock
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.event.events import OrderType, PositionAction
 from hummingbot.logger import HummingbotLogger
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.status_model import StatusModel
 from hummingbot.strategy.strategy_py_base import StrategyPyBase
 
 lsb_logger = None
@@ -57,6 +60,12 @@ class ScriptStrategyBase(StrategyPyBase):
         self.ready_to_trade: bool = False
         self.add_markets(list(connectors.values()))
         self.config = config
+        # Strategies can publish their status here to have it displayed by `status --live` without calling
+        # format_status on each refresh
+        self.status_model: StatusModel = StatusModel()
+        # Positions, average costs and PnL of the connectors, updated with each fill and funding payment
+        self.portfolio_ledger: PortfolioLedger = PortfolioLedger(connectors=list(connectors.values()))
+        self.portfolio_ledger.start()
 
     def tick(self, timestamp: float):
         """
@@ -81,6 +90,9 @@ class ScriptStrategyBase(StrategyPyBase):
         """
         pass
 
+    def stop(self, clock: Clock):
+        self.portfolio_ledger.stop()
+
     async def on_stop(self):
         pass
 
@@ -223,6 +235,32 @@ class ScriptStrategyBase(StrategyPyBase):
         df.sort_values(by=["Exchange", "Market", "Side"], inplace=True)
         return df
 
+    def ledger_positions_df(self) -> pd.DataFrame:
+        """
+        Return a data frame of the positions and PnL kept by the portfolio ledger for displaying purpose.
+        """
+        columns = ["Exchange", "Market", "Side", "Amount", "Avg Cost", "Realized PnL", "Unrealized PnL"]
+        data = []
+        for position in self.portfolio_ledger.positions:
+            if position.fills_count == 0 and position.amount == 0 and position.funding_payments == 0:
+                continue
+            data.append([
+                position.connector_name,
+                position.trading_pair,
+                position.position_side.name,
+                float(position.amount),
+                float(position.average_cost),
+                float(position.net_realized_pnl),
+                float(self.portfolio_ledger.unrealized_pnl(position.connector_name,
+                                                           position.trading_pair,
+                                                           position_side=position.position_side)),
+            ])
+        if not data:
+            raise ValueError
+        df = pd.DataFrame(data=data, columns=columns)
+        df.sort_values(by=["Exchange", "Market", "Side"], inplace=True)
+        return df
+
     def format_status(self) -> str:
         """
         Returns status of the current strategy on user balances and current active orders. This function is called
@@ -243,6 +281,12 @@ class ScriptStrategyBase(StrategyPyBase):
         except ValueError:
             lines.extend(["", "  No active maker orders."])
 
+        try:
+            df = self.ledger_positions_df()
+            lines.extend(["", "  Positions:"] + ["    " + line for line in df.to_string(index=False).split("\n")])
+        except ValueError:
+            pass
+
         warning_lines.extend(self.balance_warning(self.get_market_trading_pair_tuples()))
         if len(warning_lines) > 0:
             lines.extend(["", "*** WARNINGS ***"] + warning_lines)
@@ -0,0 +1,112 @@
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+
+
+class StatusSection:
+    """
+    Part of the status of a strategy, made of named fields and, optionally, a table with fixed columns.
+
+    The section keeps a version number that only changes when a field or a row gets a different value, so the renderers
+    can reuse the formatted output of the sections that did not change.
+    """
+
+    def __init__(self, title: str, columns: Optional[Sequence[str]] = None):
+        self._title = title
+        self._columns: Tuple[str, ...] = tuple(columns or ())
+        self._fields: Dict[str, Any] = {}
+        self._rows: Dict[Hashable, Tuple[Any, ...]] = {}
+        self._version = 0
+
+    @property
+    def title(self) -> str:
+        return self._title
+
+    @property
+    def columns(self) -> Tuple[str, ...]:
+        return self._columns
+
+    @property
+    def fields(self) -> Dict[str, Any]:
+        return self._fields
+
+    @property
+    def rows(self) -> List[Tuple[Any, ...]]:
+        return list(self._rows.values())
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def set_field(self, name: str, value: Any):
+        if name not in self._fields or self._fields[name] != value:
+            self._fields[name] = value
+            self._version += 1
+
+    def remove_field(self, name: str):
+        if name in self._fields:
+            del self._fields[name]
+            self._version += 1
+
+    def set_row(self, key: Hashable, values: Sequence[Any]):
+        """
+        Adds or replaces the row identified by the key. Rows are displayed in the order they were first added.
+        """
+        values = tuple(values)
+        if len(values) != len(self._columns):
+            raise ValueError(f"The row has {len(values)} values but the section has {len(self._columns)} columns.")
+        if self._rows.get(key) != values:
+            self._rows[key] = values
+            self._version += 1
+
+    def remove_row(self, key: Hashable):
+        if self._rows.pop(key, None) is not None:
+            self._version += 1
+
+    def set_rows(self, rows: Dict[Hashable, Sequence[Any]]):
+        """
+        Replaces all the rows of the section, keeping the version unchanged if the content is the same.
+        """
+        for key in [key for key in self._rows if key not in rows]:
+            self.remove_row(key)
+        for key, values in rows.items():
+            self.set_row(key, values)
+
+    def clear(self):
+        if len(self._fields) > 0 or len(self._rows) > 0:
+            self._fields.clear()
+            self._rows.clear()
+            self._version += 1
+
+
+class StatusModel:
+    """
+    Structured status that strategies can publish incrementally (e.g. when an order is created or filled) instead of
+    building the whole status text each time it is displayed. The live status display renders it with
+    `LiveStatusRenderer`, reformatting only the sections that changed.
+    """
+
+    def __init__(self):
+        self._sections: Dict[str, StatusSection] = {}
+        self._removed_sections = 0
+
+    @property
+    def sections(self) -> List[StatusSection]:
+        return list(self._sections.values())
+
+    @property
+    def version(self) -> Tuple[int, ...]:
+        return (self._removed_sections,) + tuple(section.version for section in self._sections.values())
+
+    def is_empty(self) -> bool:
+        return len(self._sections) == 0
+
+    def section(self, title: str, columns: Optional[Sequence[str]] = None) -> StatusSection:
+        """
+        Returns the section with the given title, creating it at the end of the status if it does not exist.
+        """
+        if title not in self._sections:
+            self._sections[title] = StatusSection(title=title, columns=columns)
+        return self._sections[title]
+
+    def remove_section(self, title: str):
+        if self._sections.pop(title, None) is not None:
+            self._removed_sections += 1
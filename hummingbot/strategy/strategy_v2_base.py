@@ -73,6 +73,13 @@ class StrategyV2ConfigBase(BaseClientModel):
             prompt=lambda mi: "Enter the config update interval in seconds (e.g. 60): ",
         )
     )
+    use_executor_scheduler: bool = Field(
+        default=False,
+        client_data=ClientFieldData(
+            prompt_on_new=False,
+            prompt=lambda mi: "Run the control tasks of all the executors from a shared scheduler? (Yes/No): ",
+        )
+    )
 
     @validator("controllers_config", pre=True, always=True)
     def parse_controllers_config(cls, v):
@@ -194,7 +201,9 @@ class StrategyV2Base(ScriptStrategyBase):
         super().__init__(connectors, config)
         # Initialize the executor orchestrator
         self.config = config
-        self.executor_orchestrator = ExecutorOrchestrator(strategy=self)
+        self.executor_orchestrator = ExecutorOrchestrator(
+            strategy=self,
+            use_executor_scheduler=config is not None and config.use_executor_scheduler)
 
         self.executors_info: Dict[str, List[ExecutorInfo]] = {}
 
@@ -286,6 +295,7 @@ class StrategyV2Base(ScriptStrategyBase):
         self.executor_orchestrator.store_all_executors()
 
     def on_tick(self):
+        self.market_data_provider.update_market_snapshot(self.current_timestamp)
         self.update_executors_info()
         self.update_controllers_configs()
         if self.market_data_provider.ready:
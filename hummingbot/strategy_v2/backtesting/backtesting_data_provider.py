@@ -1,5 +1,6 @@
+import functools
 from decimal import Decimal
-from typing import Dict
+from typing import Callable, Dict, Optional
 
 import pandas as pd
 
@@ -17,6 +18,8 @@ class BacktestingDataProvider(MarketDataProvider):
         self.end_time = None
         self.prices = {}
         self._time = None
+        # Called with the candles feed key, the fetched pages and the total pages while the candles are downloaded
+        self.candles_download_progress_callback: Optional[Callable[[str, int, int], None]] = None
 
     def time(self):
         return self._time
@@ -54,10 +57,15 @@ class BacktestingDataProvider(MarketDataProvider):
                 interval=config.interval,
                 start_time=self.start_time,
                 end_time=self.end_time,
-            ))
+            ), progress_callback=self._get_candles_download_progress_callback(key))
             self.candles_feeds[key] = candles_df
             return candles_df
 
+    def _get_candles_download_progress_callback(self, key: str) -> Optional[Callable[[int, int], None]]:
+        if self.candles_download_progress_callback is None:
+            return None
+        return functools.partial(self.candles_download_progress_callback, key)
+
     def get_candles_df(self, connector_name: str, trading_pair: str, interval: str, max_records: int = 500):
         """
         Retrieves the candles for a trading pair from the specified connector.
@@ -199,6 +199,7 @@ class BacktestingEngineBase:
         trading_pair = self.controller.config.trading_pair
         self.controller.market_data_provider.prices = {f"{connector_name}_{trading_pair}": Decimal(row["close_bt"])}
         self.controller.market_data_provider._time = row["timestamp"]
+        self.controller.market_data_provider.update_market_snapshot(row["timestamp"])
 
     def simulate_executor(self, config: Union[PositionExecutorConfig, DCAExecutorConfig], df: pd.DataFrame,
                           trade_cost: float) -> Optional[ExecutorSimulation]:
@@ -176,8 +176,9 @@ class DirectionalTradingControllerBase(ControllerBase):
         create_actions = []
         signal = self.processed_data["signal"]
         if signal != 0 and self.can_create_executor(signal):
-            price = self.market_data_provider.get_price_by_type(self.config.connector_name, self.config.trading_pair,
-                                                                PriceType.MidPrice)
+            price = self.market_data_provider.market_snapshot.get_price_by_type(self.config.connector_name,
+                                                                                self.config.trading_pair,
+                                                                                PriceType.MidPrice)
             # Default implementation distribute the total amount equally among the executors
             amount = self.config.total_amount_quote / price / Decimal(self.config.max_executors_per_side)
             trade_type = TradeType.BUY if signal > 0 else TradeType.SELL
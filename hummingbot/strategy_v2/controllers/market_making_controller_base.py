@@ -286,8 +286,9 @@ class MarketMakingControllerBase(ControllerBase):
         and spread multiplier based on the market data. By default, it will update the reference price as mid price and
         the spread multiplier as 1.
         """
-        reference_price = self.market_data_provider.get_price_by_type(self.config.connector_name,
-                                                                      self.config.trading_pair, PriceType.MidPrice)
+        reference_price = self.market_data_provider.market_snapshot.get_price_by_type(self.config.connector_name,
+                                                                                      self.config.trading_pair,
+                                                                                      PriceType.MidPrice)
         self.processed_data = {"reference_price": Decimal(reference_price), "spread_multiplier": Decimal("1")}
 
     def get_executor_config(self, level_id: str, price: Decimal, amount: Decimal):
@@ -150,6 +150,13 @@ class DCAExecutor(ExecutorBase):
         price_type = PriceType.BestBid if self.config.side == TradeType.BUY else PriceType.BestAsk
         return self.get_price(self.config.connector_name, self.config.trading_pair, price_type=price_type)
 
+    def get_executor_info_reference_price(self) -> Optional[Decimal]:
+        """
+        The PnL of the executor is calculated with the current market price, so the executor info only needs to be
+        rebuilt when it moves.
+        """
+        return self.current_market_price
+
     @property
     def close_price(self):
         """
@@ -344,12 +351,14 @@ class DCAExecutor(ExecutorBase):
             if not self._trailing_stop_trigger_pct:
                 if net_pnl_pct > self.config.trailing_stop.activation_price:
                     self._trailing_stop_trigger_pct = net_pnl_pct - self.config.trailing_stop.trailing_delta
+                    self.invalidate_executor_info()
             else:
                 if net_pnl_pct < self._trailing_stop_trigger_pct:
                     self.close_type = CloseType.TRAILING_STOP
                     self.place_close_order_and_cancel_open_orders()
                 if net_pnl_pct - self.config.trailing_stop.trailing_delta > self._trailing_stop_trigger_pct:
                     self._trailing_stop_trigger_pct = net_pnl_pct - self.config.trailing_stop.trailing_delta
+                    self.invalidate_executor_info()
 
     def control_take_profit(self):
         """
@@ -1,6 +1,6 @@
 from decimal import Decimal
 from functools import lru_cache
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from hummingbot.client.settings import AllConnectorSettings
 from hummingbot.connector.connector_base import ConnectorBase
@@ -18,8 +18,10 @@ from hummingbot.core.event.events import (
     SellOrderCompletedEvent,
     SellOrderCreatedEvent,
 )
+from hummingbot.data_feed.market_snapshot import MarketSnapshot
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 from hummingbot.strategy_v2.executors.data_types import ExecutorConfigBase
+from hummingbot.strategy_v2.executors.executor_scheduler import ExecutorScheduler
 from hummingbot.strategy_v2.models.base import RunnableStatus
 from hummingbot.strategy_v2.models.executors import CloseType
 from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
@@ -29,7 +31,12 @@ from hummingbot.strategy_v2.runnable_base import RunnableBase
 class ExecutorBase(RunnableBase):
     """
     Base class for all executors. Executors are responsible for executing orders based on the strategy.
+
+    The executor info is cached and only rebuilt when the executor state changes: order events, status or close type
+    transitions, explicit invalidations and, for active executors, moves of the reference price beyond
+    EXECUTOR_INFO_PRICE_CHANGE_THRESHOLD.
     """
+    EXECUTOR_INFO_PRICE_CHANGE_THRESHOLD = Decimal("0.0001")
 
     def __init__(self, strategy: ScriptStrategyBase, connectors: List[str], config: ExecutorConfigBase, update_interval: float = 0.5):
         """
@@ -44,17 +51,32 @@ class ExecutorBase(RunnableBase):
         self.close_type: Optional[CloseType] = None
         self.close_timestamp: Optional[float] = None
         self._strategy: ScriptStrategyBase = strategy
+        # When set, the control task is run by the shared scheduler instead of a dedicated control loop task
+        self.scheduler: Optional[ExecutorScheduler] = None
         self.connectors = {connector_name: connector for connector_name, connector in strategy.connectors.items() if
                            connector_name in connectors}
 
+        # Cached executor info and the state it was built from
+        self._executor_info_version: int = 0
+        self._executor_info: Optional[ExecutorInfo] = None
+        self._executor_info_state: Optional[Tuple[int, RunnableStatus, Optional[CloseType]]] = None
+        self._executor_info_reference_price: Optional[Decimal] = None
+
         # Event forwarders for different order events
-        self._create_buy_order_forwarder = SourceInfoEventForwarder(self.process_order_created_event)
-        self._create_sell_order_forwarder = SourceInfoEventForwarder(self.process_order_created_event)
-        self._fill_order_forwarder = SourceInfoEventForwarder(self.process_order_filled_event)
-        self._complete_buy_order_forwarder = SourceInfoEventForwarder(self.process_order_completed_event)
-        self._complete_sell_order_forwarder = SourceInfoEventForwarder(self.process_order_completed_event)
-        self._cancel_order_forwarder = SourceInfoEventForwarder(self.process_order_canceled_event)
-        self._failed_order_forwarder = SourceInfoEventForwarder(self.process_order_failed_event)
+        self._create_buy_order_forwarder = SourceInfoEventForwarder(
+            self._invalidating_executor_info(self.process_order_created_event))
+        self._create_sell_order_forwarder = SourceInfoEventForwarder(
+            self._invalidating_executor_info(self.process_order_created_event))
+        self._fill_order_forwarder = SourceInfoEventForwarder(
+            self._invalidating_executor_info(self.process_order_filled_event))
+        self._complete_buy_order_forwarder = SourceInfoEventForwarder(
+            self._invalidating_executor_info(self.process_order_completed_event))
+        self._complete_sell_order_forwarder = SourceInfoEventForwarder(
+            self._invalidating_executor_info(self.process_order_completed_event))
+        self._cancel_order_forwarder = SourceInfoEventForwarder(
+            self._invalidating_executor_info(self.process_order_canceled_event))
+        self._failed_order_forwarder = SourceInfoEventForwarder(
+            self._invalidating_executor_info(self.process_order_failed_event))
 
         # Pairs of market events and their corresponding event forwarders
         self._event_pairs: List[Tuple[MarketEvent, SourceInfoEventForwarder]] = [
@@ -105,8 +127,50 @@ class ExecutorBase(RunnableBase):
     @property
     def executor_info(self) -> ExecutorInfo:
         """
-        Returns the executor info.
+        Returns the executor info. The same instance is returned until the executor state changes.
+        """
+        state = (self._executor_info_version, self.status, self.close_type)
+        reference_price = self.get_executor_info_reference_price() if self.is_active else None
+        if (self._executor_info is None
+                or state != self._executor_info_state
+                or self._reference_price_changed(reference_price)):
+            self._executor_info = self._build_executor_info()
+            self._executor_info_state = state
+            self._executor_info_reference_price = reference_price
+        return self._executor_info
+
+    @property
+    def executor_info_version(self) -> int:
+        """
+        Returns the version of the executor info. It is increased every time the executor info is invalidated.
+        """
+        return self._executor_info_version
+
+    def invalidate_executor_info(self):
+        """
+        Forces the executor info to be rebuilt the next time it is requested.
+        """
+        self._executor_info_version += 1
+
+    def get_executor_info_reference_price(self) -> Optional[Decimal]:
+        """
+        Returns the price the executor PnL depends on. Subclasses that return a price allow the executor info of an
+        active executor to be cached until the price moves beyond EXECUTOR_INFO_PRICE_CHANGE_THRESHOLD. When None
+        is returned the executor info of an active executor is rebuilt on every request.
         """
+        return None
+
+    def _reference_price_changed(self, reference_price: Optional[Decimal]) -> bool:
+        if not self.is_active:
+            return False
+        if reference_price is None or self._executor_info_reference_price is None:
+            return True
+        if self._executor_info_reference_price == Decimal("0"):
+            return reference_price != self._executor_info_reference_price
+        change = abs(reference_price - self._executor_info_reference_price) / self._executor_info_reference_price
+        return change >= self.EXECUTOR_INFO_PRICE_CHANGE_THRESHOLD
+
+    def _build_executor_info(self) -> ExecutorInfo:
         return ExecutorInfo(
             id=self.config.id,
             timestamp=self.config.timestamp,
@@ -125,6 +189,12 @@ class ExecutorBase(RunnableBase):
             controller_id=self.config.controller_id,
         )
 
+    def _invalidating_executor_info(self, event_handler: Callable) -> Callable:
+        def handler(event_tag: int, market: ConnectorBase, event: Any):
+            self.invalidate_executor_info()
+            event_handler(event_tag, market, event)
+        return handler
+
     def get_custom_info(self) -> Dict:
         """
         Returns the custom info of the executor. Returns an empty dictionary by default, and can be reimplemented
@@ -132,6 +202,15 @@ class ExecutorBase(RunnableBase):
         """
         return {}
 
+    @property
+    def market_snapshot(self) -> Optional[MarketSnapshot]:
+        """
+        Returns the market snapshot of the current tick when the strategy provides one. Prices, order books and trading
+        rules are read from it so that all the executors see the same market state during the tick.
+        """
+        market_data_provider = getattr(self._strategy, "market_data_provider", None)
+        return market_data_provider.market_snapshot if market_data_provider is not None else None
+
     @staticmethod
     def is_perpetual_connector(connector_name: str):
         """
@@ -156,11 +235,21 @@ class ExecutorBase(RunnableBase):
         super().start()
         self.register_events()
 
+    def start_control_loop(self):
+        """
+        Runs the control task from the shared scheduler if the executor has one, or from its own control loop task.
+        """
+        if self.scheduler is not None:
+            self.scheduler.add_executor(self)
+        else:
+            super().start_control_loop()
+
     def stop(self):
         """
         Stops the executor and unregisters the events.
         """
         self.close_timestamp = self._strategy.current_timestamp
+        self.invalidate_executor_info()
         super().stop()
         self.unregister_events()
 
@@ -294,6 +383,9 @@ class ExecutorBase(RunnableBase):
         :param price_type: The type of the price.
         :return: The price.
         """
+        market_snapshot = self.market_snapshot
+        if market_snapshot is not None:
+            return market_snapshot.get_price_by_type(connector_name, trading_pair, price_type)
         return self.connectors[connector_name].get_price_by_type(trading_pair, price_type)
 
     def get_trading_rules(self, connector_name: str, trading_pair: str) -> TradingRule:
@@ -304,6 +396,9 @@ class ExecutorBase(RunnableBase):
         :param trading_pair: The trading pair.
         :return: The trading rules.
         """
+        market_snapshot = self.market_snapshot
+        if market_snapshot is not None:
+            return market_snapshot.get_trading_rules(connector_name, trading_pair)
         return self.connectors[connector_name].trading_rules[trading_pair]
 
     def get_order_book(self, connector_name: str, trading_pair: str):
@@ -314,6 +409,9 @@ class ExecutorBase(RunnableBase):
         :param trading_pair: The trading pair.
         :return: The order book.
         """
+        market_snapshot = self.market_snapshot
+        if market_snapshot is not None:
+            return market_snapshot.get_order_book(connector_name, trading_pair)
         return self.connectors[connector_name].get_order_book(connector_name, trading_pair)
 
     def get_balance(self, connector_name: str, asset: str):
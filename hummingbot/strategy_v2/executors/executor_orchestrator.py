@@ -1,6 +1,7 @@
 import logging
+from dataclasses import dataclass, field
 from decimal import Decimal
-from typing import Dict, List
+from typing import Dict, List, Optional, Set
 
 from hummingbot.connector.markets_recorder import MarketsRecorder
 from hummingbot.core.data_type.common import TradeType
@@ -10,6 +11,7 @@ from hummingbot.strategy_v2.executors.arbitrage_executor.arbitrage_executor impo
 from hummingbot.strategy_v2.executors.arbitrage_executor.data_types import ArbitrageExecutorConfig
 from hummingbot.strategy_v2.executors.dca_executor.data_types import DCAExecutorConfig
 from hummingbot.strategy_v2.executors.dca_executor.dca_executor import DCAExecutor
+from hummingbot.strategy_v2.executors.executor_scheduler import ExecutorScheduler
 from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig
 from hummingbot.strategy_v2.executors.position_executor.position_executor import PositionExecutor
 from hummingbot.strategy_v2.executors.twap_executor.data_types import TWAPExecutorConfig
@@ -26,9 +28,61 @@ from hummingbot.strategy_v2.models.executors import CloseType
 from hummingbot.strategy_v2.models.executors_info import ExecutorInfo, PerformanceReport
 
 
+@dataclass
+class PerformanceAggregate:
+    """
+    Running totals of the performance metrics of a set of executors.
+    """
+    realized_pnl_quote: Decimal = Decimal("0")
+    unrealized_pnl_quote: Decimal = Decimal("0")
+    volume_traded: Decimal = Decimal("0")
+    open_order_volume: Decimal = Decimal("0")
+    inventory_imbalance: Decimal = Decimal("0")
+    close_type_counts: Dict[CloseType, int] = field(default_factory=dict)
+
+    def add_executor(self, executor: ExecutorInfo):
+        close_type = executor.close_type
+        if close_type is not None:
+            self.close_type_counts[close_type] = self.close_type_counts.get(close_type, 0) + 1
+        if close_type == CloseType.FAILED:
+            return
+        if executor.is_active:  # For active executors
+            self.unrealized_pnl_quote += executor.net_pnl_quote
+            side = executor.custom_info.get("side", None)
+            if side:
+                self.inventory_imbalance += executor.filled_amount_quote if side == TradeType.BUY else -executor.filled_amount_quote
+            if executor.type == "dca_executor":
+                self.open_order_volume += sum(executor.config.amounts_quote) - executor.filled_amount_quote
+            elif executor.type == "position_executor":
+                self.open_order_volume += (executor.config.amount * executor.config.entry_price) - executor.filled_amount_quote
+        else:  # For closed executors
+            self.realized_pnl_quote += executor.net_pnl_quote
+        self.volume_traded += executor.filled_amount_quote
+
+    def combine(self, other: "PerformanceAggregate") -> "PerformanceAggregate":
+        close_type_counts = dict(self.close_type_counts)
+        for close_type, count in other.close_type_counts.items():
+            close_type_counts[close_type] = close_type_counts.get(close_type, 0) + count
+        return PerformanceAggregate(
+            realized_pnl_quote=self.realized_pnl_quote + other.realized_pnl_quote,
+            unrealized_pnl_quote=self.unrealized_pnl_quote + other.unrealized_pnl_quote,
+            volume_traded=self.volume_traded + other.volume_traded,
+            open_order_volume=self.open_order_volume + other.open_order_volume,
+            inventory_imbalance=self.inventory_imbalance + other.inventory_imbalance,
+            close_type_counts=close_type_counts,
+        )
+
+
 class ExecutorOrchestrator:
     """
     Orchestrator for various executors.
+
+    The performance of the executors already stored in the database is kept as a running aggregate per controller. It
+    is seeded from the database the first time a controller report is requested and then updated every time an
+    executor is stored, so reports only need to process the executors that are still in memory.
+
+    With `use_executor_scheduler` the control tasks of all the executors are run by a shared `ExecutorScheduler`
+    instead of one asyncio task per executor.
     """
     _logger = None
 
@@ -38,10 +92,15 @@ class ExecutorOrchestrator:
             cls._logger = logging.getLogger(__name__)
         return cls._logger
 
-    def __init__(self, strategy: ScriptStrategyBase, executors_update_interval: float = 1.0):
+    def __init__(self, strategy: ScriptStrategyBase, executors_update_interval: float = 1.0,
+                 use_executor_scheduler: bool = False):
         self.strategy = strategy
         self.executors_update_interval = executors_update_interval
+        self.executor_scheduler: Optional[ExecutorScheduler] = ExecutorScheduler() if use_executor_scheduler else None
         self.executors = {}
+        self._executors_report_cache: Dict[str, List[ExecutorInfo]] = {}
+        self._stored_performance: Dict[str, PerformanceAggregate] = {}
+        self._stored_executor_ids: Dict[str, Set[str]] = {}
 
     def stop(self):
         """
@@ -104,6 +163,7 @@ class ExecutorOrchestrator:
         else:
             raise ValueError("Unsupported executor config type")
 
+        executor.scheduler = self.executor_scheduler
         executor.start()
         self.executors[controller_id].append(executor)
         self.logger().debug(f"Created {type(executor).__name__} for controller {controller_id}")
@@ -139,6 +199,7 @@ class ExecutorOrchestrator:
             return
         MarketsRecorder.get_instance().store_or_update_executor(executor)
         self.executors[controller_id].remove(executor)
+        self._add_stored_executor(controller_id, executor.executor_info)
 
     def get_executors_report(self) -> Dict[str, List[ExecutorInfo]]:
         """
@@ -146,72 +207,82 @@ class ExecutorOrchestrator:
         """
         report = {}
         for controller_id, executors_list in self.executors.items():
-            report[controller_id] = [executor.executor_info for executor in executors_list if executor]
+            report[controller_id] = self.get_executors_info(controller_id)
         return report
 
+    def get_executors_info(self, controller_id: str) -> List[ExecutorInfo]:
+        """
+        Return the executors info of a controller. The same list is returned while none of the executors changed,
+        so consumers can skip their own processing by comparing the identity of the list.
+        """
+        executors_info = [executor.executor_info for executor in self.executors.get(controller_id, []) if executor]
+        cached_executors_info = self._executors_report_cache.get(controller_id)
+        if (cached_executors_info is not None
+                and len(cached_executors_info) == len(executors_info)
+                and all(cached is current for cached, current in zip(cached_executors_info, executors_info))):
+            return cached_executors_info
+        self._executors_report_cache[controller_id] = executors_info
+        return executors_info
+
     def generate_performance_report(self, controller_id: str) -> PerformanceReport:
-        # Fetch executors from database and active in-memory executors
-        db_executors = MarketsRecorder.get_instance().get_executors_by_controller(controller_id)
-        active_executor_ids = [executor.executor_info.id for executor in self.executors.get(controller_id, [])]
-        filtered_db_executors = [executor for executor in db_executors if executor.id not in active_executor_ids]
-        active_executors = [executor.executor_info for executor in self.executors.get(controller_id, [])]
-        combined_executors = active_executors + filtered_db_executors
-
-        # Initialize performance metrics
-        realized_pnl_quote = Decimal(0)
-        unrealized_pnl_quote = Decimal(0)
-        volume_traded = Decimal(0)
-        open_order_volume = Decimal(0)
-        inventory_imbalance = Decimal(0)
-        close_type_counts = {}
-
-        for executor in combined_executors:
-            close_type = executor.close_type
-            if close_type == CloseType.FAILED:
-                close_type_counts[close_type] = close_type_counts.get(close_type, 0) + 1
-                continue
-            elif close_type is not None:
-                if close_type in close_type_counts:
-                    close_type_counts[close_type] += 1
-                else:
-                    close_type_counts[close_type] = 1
-            if executor.is_active:  # For active executors
-                unrealized_pnl_quote += executor.net_pnl_quote
-                side = executor.custom_info.get("side", None)
-                if side:
-                    inventory_imbalance += executor.filled_amount_quote if side == TradeType.BUY else -executor.filled_amount_quote
-                if executor.type == "dca_executor":
-                    open_order_volume += sum(executor.config.amounts_quote) - executor.filled_amount_quote
-                elif executor.type == "position_executor":
-                    open_order_volume += (executor.config.amount * executor.config.entry_price) - executor.filled_amount_quote
-            else:  # For closed executors
-                realized_pnl_quote += executor.net_pnl_quote
-            volume_traded += executor.filled_amount_quote
+        active_executors = self.get_executors_info(controller_id)
+        active_executor_ids = {executor_info.id for executor_info in active_executors}
+        stored_performance = self._get_stored_performance(controller_id, active_executor_ids)
+
+        # Stored executors that are still in memory are accounted with their in-memory state
+        performance = PerformanceAggregate()
+        for executor in active_executors:
+            performance.add_executor(executor)
+        performance = stored_performance.combine(performance)
 
         # Calculate global PNL values
-        global_pnl_quote = unrealized_pnl_quote + realized_pnl_quote
+        volume_traded = performance.volume_traded
+        global_pnl_quote = performance.unrealized_pnl_quote + performance.realized_pnl_quote
         global_pnl_pct = (global_pnl_quote / volume_traded) * 100 if volume_traded != 0 else Decimal(0)
 
         # Calculate individual PNL percentages
-        unrealized_pnl_pct = (unrealized_pnl_quote / volume_traded) * 100 if volume_traded != 0 else Decimal(0)
-        realized_pnl_pct = (realized_pnl_quote / volume_traded) * 100 if volume_traded != 0 else Decimal(0)
+        unrealized_pnl_pct = (performance.unrealized_pnl_quote / volume_traded) * 100 if volume_traded != 0 else Decimal(0)
+        realized_pnl_pct = (performance.realized_pnl_quote / volume_traded) * 100 if volume_traded != 0 else Decimal(0)
 
         # Create Performance Report
         report = PerformanceReport(
-            realized_pnl_quote=realized_pnl_quote,
-            unrealized_pnl_quote=unrealized_pnl_quote,
+            realized_pnl_quote=performance.realized_pnl_quote,
+            unrealized_pnl_quote=performance.unrealized_pnl_quote,
             unrealized_pnl_pct=unrealized_pnl_pct,
             realized_pnl_pct=realized_pnl_pct,
             global_pnl_quote=global_pnl_quote,
             global_pnl_pct=global_pnl_pct,
             volume_traded=volume_traded,
-            open_order_volume=open_order_volume,
-            inventory_imbalance=inventory_imbalance,
-            close_type_counts=close_type_counts
+            open_order_volume=performance.open_order_volume,
+            inventory_imbalance=performance.inventory_imbalance,
+            close_type_counts=performance.close_type_counts
         )
 
         return report
 
+    def _get_stored_performance(self, controller_id: str, active_executor_ids: Set[str]) -> PerformanceAggregate:
+        """
+        Return the aggregated performance of the stored executors of a controller that are no longer in memory. The
+        database is only queried the first time the performance of the controller is requested.
+        """
+        if controller_id not in self._stored_performance:
+            self._stored_performance[controller_id] = PerformanceAggregate()
+            self._stored_executor_ids[controller_id] = set()
+            db_executors = MarketsRecorder.get_instance().get_executors_by_controller(controller_id)
+            for executor in db_executors:
+                if executor.id not in active_executor_ids:
+                    self._add_stored_executor(controller_id, executor)
+        return self._stored_performance[controller_id]
+
+    def _add_stored_executor(self, controller_id: str, executor_info: ExecutorInfo):
+        if controller_id not in self._stored_performance:
+            # The aggregate will include the executor when it is seeded from the database
+            return
+        if executor_info.id in self._stored_executor_ids[controller_id]:
+            return
+        self._stored_executor_ids[controller_id].add(executor_info.id)
+        self._stored_performance[controller_id].add_executor(executor_info)
+
     def generate_global_performance_report(self) -> PerformanceReport:
         global_realized_pnl_quote = Decimal(0)
         global_unrealized_pnl_quote = Decimal(0)
@@ -0,0 +1,133 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+
+if TYPE_CHECKING:
+    from hummingbot.strategy_v2.executors.executor_base import ExecutorBase
+
+
+@dataclass
+class ControlTaskLatency:
+    """
+    Execution time statistics of the control task of an executor, in seconds.
+    """
+    count: int = 0
+    last: float = 0.0
+    total: float = 0.0
+    max: float = 0.0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count > 0 else 0.0
+
+    def record(self, latency: float):
+        self.count += 1
+        self.last = latency
+        self.total += latency
+        self.max = max(self.max, latency)
+
+
+class ExecutorScheduler:
+    """
+    Runs the control task of many executors from a single asyncio task, instead of one task per executor.
+
+    Each executor is ticked at its own update interval. The control tasks of the executors due in the same cycle are
+    started in batches, yielding to the event loop between batches, and run concurrently. A slow control task (e.g. one
+    waiting for a network call) does not delay the other executors, and its executor is not ticked again until it
+    finishes. The market data shared between executors is read from the market snapshot of the strategy tick (see
+    `ExecutorBase.market_snapshot`), not cached by the scheduler.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    MAX_BATCH_SIZE = 50
+    MIN_SLEEP_INTERVAL = 0.01
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self):
+        self._executors: Dict[int, "ExecutorBase"] = {}
+        self._next_run: Dict[int, float] = {}
+        self._latencies: Dict[str, ControlTaskLatency] = {}
+        self._running_control_tasks: Dict[int, asyncio.Task] = {}
+        self._scheduler_task: Optional[asyncio.Task] = None
+
+    @property
+    def executors(self) -> List["ExecutorBase"]:
+        return list(self._executors.values())
+
+    @property
+    def is_running(self) -> bool:
+        return self._scheduler_task is not None and not self._scheduler_task.done()
+
+    def add_executor(self, executor: "ExecutorBase"):
+        """
+        Registers the executor and starts the scheduler if it is not running. The executor `on_start` is called
+        before its first control task, as in the per-task control loop.
+        """
+        self._executors[id(executor)] = executor
+        self._next_run.pop(id(executor), None)
+        if not self.is_running:
+            self._scheduler_task = safe_ensure_future(self._scheduler_loop())
+
+    def remove_executor(self, executor: "ExecutorBase"):
+        self._executors.pop(id(executor), None)
+        self._next_run.pop(id(executor), None)
+        self._latencies.pop(executor.config.id, None)
+
+    def latency_metrics(self) -> Dict[str, ControlTaskLatency]:
+        """
+        :return: the control task latency statistics of the registered executors, by executor id
+        """
+        return dict(self._latencies)
+
+    async def _scheduler_loop(self):
+        while len(self._executors) > 0:
+            now = time.perf_counter()
+            due_executors = [executor for key, executor in self._executors.items()
+                             if key not in self._running_control_tasks and self._next_run.get(key, now) <= now]
+            await self._run_cycle(due_executors, now)
+            next_runs = [next_run for key, next_run in self._next_run.items() if key not in self._running_control_tasks]
+            sleep_time = min(next_runs) - time.perf_counter() if len(next_runs) > 0 else 0
+            await asyncio.sleep(max(sleep_time, self.MIN_SLEEP_INTERVAL))
+
+    async def _run_cycle(self, executors: List["ExecutorBase"], cycle_start: float):
+        for i, executor in enumerate(executors):
+            if i > 0 and i % self.MAX_BATCH_SIZE == 0:
+                await asyncio.sleep(0)
+            key = id(executor)
+            task = safe_ensure_future(self._run_executor(executor, cycle_start))
+            self._running_control_tasks[key] = task
+            task.add_done_callback(lambda _, key=key: self._running_control_tasks.pop(key, None))
+
+    async def _run_executor(self, executor: "ExecutorBase", cycle_start: float):
+        key = id(executor)
+        if key not in self._next_run:
+            try:
+                executor.on_start()
+            except Exception as e:
+                self.logger().error(e, exc_info=True)
+                self.remove_executor(executor)
+                return
+        if executor.terminated.is_set():
+            self.remove_executor(executor)
+            executor.on_stop()
+            return
+        self._next_run[key] = cycle_start + executor.update_interval
+        start = time.perf_counter()
+        try:
+            await executor.control_task()
+        except Exception as e:
+            self.logger().error(e, exc_info=True)
+        finally:
+            if key in self._executors:
+                latency = self._latencies.setdefault(executor.config.id, ControlTaskLatency())
+                latency.record(time.perf_counter() - start)
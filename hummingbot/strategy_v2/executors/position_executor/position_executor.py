@@ -155,6 +155,13 @@ class PositionExecutor(ExecutorBase):
         price_type = PriceType.BestBid if self.config.side == TradeType.BUY else PriceType.BestAsk
         return self.get_price(self.config.connector_name, self.config.trading_pair, price_type=price_type)
 
+    def get_executor_info_reference_price(self) -> Optional[Decimal]:
+        """
+        The PnL of the executor is calculated with the current market price, so the executor info only needs to be
+        rebuilt when it moves.
+        """
+        return self.current_market_price
+
     @property
     def entry_price(self) -> Decimal:
         """
@@ -718,11 +725,13 @@ class PositionExecutor(ExecutorBase):
             if not self._trailing_stop_trigger_pct:
                 if net_pnl_pct > self.config.triple_barrier_config.trailing_stop.activation_price:
                     self._trailing_stop_trigger_pct = net_pnl_pct - self.config.triple_barrier_config.trailing_stop.trailing_delta
+                    self.invalidate_executor_info()
             else:
                 if net_pnl_pct < self._trailing_stop_trigger_pct:
                     self.place_close_order_and_cancel_open_orders(close_type=CloseType.TRAILING_STOP)
                 if net_pnl_pct - self.config.triple_barrier_config.trailing_stop.trailing_delta > self._trailing_stop_trigger_pct:
                     self._trailing_stop_trigger_pct = net_pnl_pct - self.config.triple_barrier_config.trailing_stop.trailing_delta
+                    self.invalidate_executor_info()
 
     def validate_sufficient_balance(self):
         if self.is_perpetual:
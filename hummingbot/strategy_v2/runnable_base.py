@@ -47,7 +47,14 @@ class RunnableBase(ABC):
         if self._status == RunnableStatus.NOT_STARTED:
             self.terminated.clear()
             self._status = RunnableStatus.RUNNING
-            safe_ensure_future(self.control_loop())
+            self.start_control_loop()
+
+    def start_control_loop(self):
+        """
+        Schedule the control loop of the smart component in its own task.
+        This method can be overridden in subclasses to run the control task from a different scheduler.
+        """
+        safe_ensure_future(self.control_loop())
 
     def stop(self):
         """
@@ -1,21 +1,24 @@
+import asyncio
+import functools
 import os
-from typing import Dict
+import time
+from typing import Dict, Optional
 
 from hummingbot import data_path
 from hummingbot.client.hummingbot_application import HummingbotApplication
 from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesFactory
-from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
+from hummingbot.data_feed.candles_feed.data_types import CandlesConfig, HistoricalCandlesConfig
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 
 
 class DownloadCandles(ScriptStrategyBase):
     """
     This script provides an example of how to use the Candles Feed to download and store historical data.
-    It downloads 3-minute candles for 3 Binance trading pairs ["APE-USDT", "BTC-USDT", "BNB-USDT"] and stores them in
-    CSV files in the /data directory. The script stops after it has downloaded 50,000 max_records records for each pair.
-    Is important to notice that the component will fail if all the candles are not available since the idea of it is to
-    use it in production based on candles needed to compute technical indicators.
+    It downloads the candles of the configured trading pairs and intervals for the last DAYS_TO_DOWNLOAD days and stores
+    them in CSV files in the /data directory. The pages of each download are fetched concurrently, and the progress is
+    reported while they arrive. The script stops after all the downloads are finished.
     """
     exchange = os.getenv("EXCHANGE", "binance")
     trading_pairs = os.getenv("TRADING_PAIRS", "BTC-USDT,ETH-USDT").split(",")
@@ -24,39 +27,51 @@ class DownloadCandles(ScriptStrategyBase):
     # we can initialize any trading pair since we only need the candles
     markets = {"kucoin_paper_trade": {"BTC-USDT"}}
 
-    @staticmethod
-    def get_max_records(days_to_download: int, interval: str) -> int:
-        conversion = {"s": 1 / 60, "m": 1, "h": 60, "d": 1440}
-        unit = interval[-1]
-        quantity = int(interval[:-1])
-        return int(days_to_download * 24 * 60 / (quantity * conversion[unit]))
-
     def __init__(self, connectors: Dict[str, ConnectorBase]):
         super().__init__(connectors)
-        combinations = [(trading_pair, interval) for trading_pair in self.trading_pairs for interval in self.intervals]
+        self.end_time = int(time.time())
+        self.start_time = self.end_time - self.days_to_download * 24 * 60 * 60
+        self.combinations = [(trading_pair, interval) for trading_pair in self.trading_pairs for interval in self.intervals]
+        self.download_progress = {f"{trading_pair}_{interval}": (0, 0) for trading_pair, interval in self.combinations}
+        self.download_task: Optional[asyncio.Task] = None
 
-        self.candles = {f"{combinations[0]}_{combinations[1]}": {} for combinations in combinations}
-        # we need to initialize the candles for each trading pair
-        for combination in combinations:
+    def on_tick(self):
+        if self.download_task is None:
+            self.download_task = safe_ensure_future(self.download_all_candles())
 
-            candle = CandlesFactory.get_candle(CandlesConfig(connector=self.exchange, trading_pair=combination[0], interval=combination[1], max_records=self.get_max_records(self.days_to_download, combination[1])))
-            candle.start()
-            # we are storing the candles object and the csv path to save the candles
-            self.candles[f"{combination[0]}_{combination[1]}"]["candles"] = candle
-            self.candles[f"{combination[0]}_{combination[1]}"][
-                "csv_path"] = data_path() + f"/candles_{self.exchange}_{combination[0]}_{combination[1]}.csv"
+    async def download_all_candles(self):
+        await safe_gather(*[self.download_candles(trading_pair, interval)
+                            for trading_pair, interval in self.combinations])
+        HummingbotApplication.main_application().stop()
 
-    def on_tick(self):
-        for trading_pair, candles_info in self.candles.items():
-            if not candles_info["candles"].ready:
-                self.logger().info(f"Candles not ready yet for {trading_pair}! Missing {candles_info['candles']._candles.maxlen - len(candles_info['candles']._candles)}")
-                pass
-            else:
-                df = candles_info["candles"].candles_df
-                df.to_csv(candles_info["csv_path"], index=False)
-        if all(candles_info["candles"].ready for candles_info in self.candles.values()):
-            HummingbotApplication.main_application().stop()
+    async def download_candles(self, trading_pair: str, interval: str):
+        key = f"{trading_pair}_{interval}"
+        candles = CandlesFactory.get_candle(CandlesConfig(connector=self.exchange, trading_pair=trading_pair, interval=interval))
+        candles_df = await candles.get_historical_candles(
+            config=HistoricalCandlesConfig(
+                connector_name=self.exchange,
+                trading_pair=trading_pair,
+                interval=interval,
+                start_time=self.start_time,
+                end_time=self.end_time,
+            ),
+            progress_callback=functools.partial(self.on_download_progress, key),
+        )
+        if candles_df is None:
+            self.logger().error(f"Candles download failed for {key}.")
+            return
+        candles_df.to_csv(data_path() + f"/candles_{self.exchange}_{key}.csv", index=False)
+        self.logger().info(f"Stored {len(candles_df)} candles for {key}.")
+
+    def on_download_progress(self, key: str, fetched_pages: int, total_pages: int):
+        self.download_progress[key] = (fetched_pages, total_pages)
+
+    def format_status(self) -> str:
+        lines = ["Candles download progress:"]
+        for key, (fetched_pages, total_pages) in self.download_progress.items():
+            lines.append(f"  {key}: {fetched_pages}/{total_pages} pages")
+        return "\n".join(lines)
 
     async def on_stop(self):
-        for candles_info in self.candles.values():
-            candles_info["candles"].stop()
+        if self.download_task is not None and not self.download_task.done():
+            self.download_task.cancel()
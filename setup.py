@@ -84,6 +84,7 @@ def main():
         "nose",
         "nose-exclude",
         "numpy==1.26.4",
+        "orjson",
         "pandas",
         "pip",
         "pre-commit",
@@ -79,12 +79,17 @@ class ConfigCommandTest(unittest.TestCase):
                            "    | ∟ mqtt_notifier                   | True                 |\n"
                            "    | ∟ mqtt_commands                   | True                 |\n"
                            "    | ∟ mqtt_events                     | True                 |\n"
+                           "    | ∟ mqtt_events_batch_interval      | 0.0                  |\n"
+                           "    | ∟ mqtt_events_batch_size          | 100                  |\n"
+                           "    | ∟ mqtt_events_batch_compression   | False                |\n"
                            "    | ∟ mqtt_external_events            | True                 |\n"
                            "    | ∟ mqtt_autostart                  | False                |\n"
                            "    | send_error_logs                   | True                 |\n"
                            "    | gateway                           |                      |\n"
                            "    | ∟ gateway_api_host                | localhost            |\n"
                            "    | ∟ gateway_api_port                | 15888                |\n"
+                           "    | ∟ gateway_price_cache_ttl         | 0.0                  |\n"
+                           "    | ∟ gateway_max_connections         | 0                    |\n"
                            "    | rate_oracle_source                | binance              |\n"
                            "    | global_token                      |                      |\n"
                            "    | ∟ global_token_name               | USDT                 |\n"
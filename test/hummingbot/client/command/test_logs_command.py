@@ -0,0 +1,48 @@
+import asyncio
+import unittest
+from typing import Awaitable
+from unittest.mock import MagicMock, patch
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter, read_system_configs_from_yml
+from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.client.ui.log_pane_buffer import LogPaneBuffer
+
+
+class LogsCommandTest(unittest.TestCase):
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher")
+    def setUp(self, _: MagicMock) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+
+        self.async_run_with_timeout(read_system_configs_from_yml())
+        self.client_config_map = ClientConfigAdapter(ClientConfigMap())
+
+        self.app = HummingbotApplication(client_config_map=self.client_config_map)
+        self.log_buffer = LogPaneBuffer(max_line_count=10)
+        self.log_buffer.append_lines(["order 1 created", "order 1 filled", "order 2 created"])
+        self.app.app.log_field = MagicMock(log_buffer=self.log_buffer)
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    @patch("hummingbot.client.hummingbot_application.HummingbotApplication.notify")
+    def test_logs_shows_matching_lines(self, notify_mock):
+        captures = []
+        notify_mock.side_effect = lambda s: captures.append(s)
+
+        self.app.logs("created")
+
+        self.assertEqual(["\n  Log lines matching created:\n    order 1 created\n    order 2 created"], captures)
+
+    @patch("hummingbot.client.hummingbot_application.HummingbotApplication.notify")
+    def test_logs_without_matches_or_with_invalid_pattern(self, notify_mock):
+        captures = []
+        notify_mock.side_effect = lambda s: captures.append(s)
+
+        self.app.logs("canceled")
+        self.app.logs("order (")
+
+        self.assertEqual("\nNo log lines match canceled.", captures[0])
+        self.assertTrue(captures[1].startswith("\nInvalid search pattern order (:"))
@@ -7,6 +7,8 @@ from unittest.mock import MagicMock, patch
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter, read_system_configs_from_yml
 from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.client.ui.live_status_renderer import LiveStatusRenderer
+from hummingbot.strategy.status_model import StatusModel
 
 
 class StatusCommandTest(unittest.TestCase):
@@ -74,3 +76,28 @@ class StatusCommandTest(unittest.TestCase):
                 msg="\nA network error prevented the connection check to complete. See logs for more details."
             )
         )
+
+    def test_live_status_from_model_replaces_the_previous_frame(self):
+        status_model = StatusModel()
+        section = status_model.section("Balances")
+        section.set_field("USDT", 100)
+        self.app.strategy = MagicMock()
+        self.app.app.live_updates = True
+        output_buffer = MagicMock()
+        self.app.app.output_field = MagicMock(buffer=output_buffer)
+
+        async def update_and_stop():
+            await asyncio.sleep(0.02)
+            section.set_field("USDT", 200)
+            await asyncio.sleep(0.02)
+            self.app.app.live_updates = False
+
+        with patch("hummingbot.client.command.status_command.LiveStatusRenderer",
+                   return_value=LiveStatusRenderer(min_refresh_interval=0.005)):
+            self.async_run_with_timeout(
+                asyncio.gather(self.app._live_status_from_model(status_model), update_and_stop()))
+
+        self.assertEqual(2, output_buffer.save_to_undo_stack.call_count)
+        self.assertEqual(2, output_buffer.undo.call_count)
+        self.assertTrue(self.cli_mock_assistant.check_log_called_with(
+            msg="\n\n  Balances:\n    USDT: 200\n\n Press escape key to stop update."))
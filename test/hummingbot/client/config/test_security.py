@@ -3,6 +3,7 @@ import unittest
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import Awaitable
+from unittest.mock import patch
 
 from hummingbot.client.config import config_crypt, config_helpers, security
 from hummingbot.client.config.config_crypt import ETHKeyFileSecretManger, store_password_verification, validate_password
@@ -14,6 +15,7 @@ from hummingbot.client.config.config_helpers import (
 )
 from hummingbot.client.config.security import Security
 from hummingbot.connector.exchange.binance.binance_utils import BinanceConfigMap
+from hummingbot.connector.exchange.kucoin.kucoin_utils import KuCoinConfigMap
 from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
 
 
@@ -77,6 +79,7 @@ class SecurityTest(unittest.TestCase):
         Security.__instance = None
         Security.secrets_manager = None
         Security._secure_configs = {}
+        Security._all_configs_decrypted = False
         Security._decryption_done = asyncio.Event()
 
     def test_password_process(self):
@@ -150,3 +153,61 @@ class SecurityTest(unittest.TestCase):
         binance_loaded_config = Security.decrypted_value(binance_config.connector)
 
         self.assertEqual(binance_config, binance_loaded_config)
+
+    def store_kucoin_config(self) -> ClientConfigAdapter:
+        config_map = ClientConfigAdapter(
+            KuCoinConfigMap(
+                kucoin_api_key=self.api_key, kucoin_secret_key=self.api_secret, kucoin_passphrase="somePassphrase"
+            )
+        )
+        file_path = get_connector_config_yml_path("kucoin")
+        save_to_yml(file_path, config_map)
+        return config_map
+
+    def test_decrypt_all_decrypts_configs_in_parallel(self):
+        secrets_manager = ETHKeyFileSecretManger("som-password")
+        store_password_verification(secrets_manager)
+        Security.secrets_manager = secrets_manager
+        binance_config = self.store_binance_config()
+        kucoin_config = self.store_kucoin_config()
+
+        Security.decrypt_all()
+
+        self.assertTrue(Security.is_decryption_done())
+        self.assertEqual(binance_config, Security.decrypted_value("binance"))
+        self.assertEqual(kucoin_config, Security.decrypted_value("kucoin"))
+
+    def test_decrypt_only_required_connectors(self):
+        secrets_manager = ETHKeyFileSecretManger("som-password")
+        store_password_verification(secrets_manager)
+        Security.secrets_manager = secrets_manager
+        binance_config = self.store_binance_config()
+        kucoin_config = self.store_kucoin_config()
+
+        Security.decrypt_all(connector_names=["binance"])
+
+        self.assertTrue(Security.is_decryption_done())
+        self.assertEqual(["binance"], list(Security._secure_configs.keys()))
+
+        # other connector configs are decrypted when they are requested
+        self.assertEqual(kucoin_config, Security.decrypted_value("kucoin"))
+        all_values = Security.all_decrypted_values()
+        self.assertEqual({"binance": binance_config, "kucoin": kucoin_config}, all_values)
+
+    def test_derived_keys_are_cached(self):
+        config_crypt.clear_derived_keys_cache()
+        self.addCleanup(config_crypt.clear_derived_keys_cache)
+        secrets_manager = ETHKeyFileSecretManger("som-password")
+        encrypted_value = secrets_manager.encrypt_secret_value("someAttr", "someValue")
+
+        with patch(
+            "hummingbot.client.config.config_crypt._derive_key", wraps=config_crypt._derive_key
+        ) as derive_key_mock:
+            self.assertEqual("someValue", secrets_manager.decrypt_secret_value("someAttr", encrypted_value))
+            self.assertEqual("someValue", secrets_manager.decrypt_secret_value("someAttr", encrypted_value))
+
+        self.assertEqual(1, derive_key_mock.call_count)
+        self.assertFalse(any("som-password" in cache_key for cache_key in config_crypt._derived_keys_cache))
+
+        with self.assertRaises(ValueError):
+            ETHKeyFileSecretManger("another-password").decrypt_secret_value("someAttr", encrypted_value)
@@ -0,0 +1,62 @@
+"""
+Compares the client startup time spent building the connector settings with and without the connector manifest.
+
+Each measurement runs in a new interpreter, so the connector modules imported by a previous run are not reused.
+
+Run from the repository root with:
+    python -m test.hummingbot.client.connector_manifest_benchmark
+"""
+import statistics
+import subprocess
+import sys
+from typing import Dict, List
+
+RUNS = 5
+
+TIMING_SCRIPT = """
+import sys
+import time
+start = time.perf_counter()
+from hummingbot.client.settings import AllConnectorSettings
+AllConnectorSettings.create_connector_settings(use_manifest={use_manifest})
+elapsed = time.perf_counter() - start
+connector_modules = [name for name in sys.modules if name.startswith("hummingbot.connector.exchange.")]
+print(elapsed, len(connector_modules))
+"""
+
+
+def measure(use_manifest: bool) -> List[float]:
+    """
+    :returns the startup time in seconds and the number of imported exchange modules of the run
+    """
+    output = subprocess.run([sys.executable, "-c", TIMING_SCRIPT.format(use_manifest=use_manifest)],
+                            capture_output=True,
+                            check=True,
+                            text=True).stdout.split()
+    return [float(output[0]), float(output[1])]
+
+
+def run_benchmark(runs: int = RUNS) -> Dict[str, Dict[str, float]]:
+    # Writes an up-to-date manifest before the measured runs
+    measure(use_manifest=True)
+    results = {}
+    for name, use_manifest in (("scan", False), ("manifest", True)):
+        measurements = [measure(use_manifest=use_manifest) for _ in range(runs)]
+        results[name] = {
+            "median_seconds": statistics.median(elapsed for elapsed, _ in measurements),
+            "imported_exchange_modules": measurements[-1][1],
+        }
+    return results
+
+
+def main():
+    results = run_benchmark()
+    baseline = results["scan"]["median_seconds"]
+    for name, result in results.items():
+        print(f"{name:<9} {result['median_seconds'] * 1000:8.1f} ms  "
+              f"({baseline / result['median_seconds']:.1f}x vs scan, "
+              f"{int(result['imported_exchange_modules'])} exchange modules imported)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,26 @@
+import json
+import sys
 import unittest
+from decimal import Decimal
+from pathlib import Path
+from tempfile import TemporaryDirectory
 from unittest.mock import MagicMock, patch
 
 from pydantic import SecretStr
 
-from hummingbot.client.settings import ConnectorSetting, ConnectorType
+from hummingbot.client.settings import (
+    AllConnectorSettings,
+    ConnectorConfigKeysLoader,
+    ConnectorSetting,
+    ConnectorType,
+    LazyConnectorSetting,
+)
 from hummingbot.connector.exchange.binance.binance_utils import BinanceConfigMap
 from hummingbot.connector.gateway.clob_spot.data_sources.injective.injective_api_data_source import (
     InjectiveAPIDataSource,
 )
 from hummingbot.connector.gateway.clob_spot.data_sources.kujira.kujira_api_data_source import KujiraAPIDataSource
-from hummingbot.core.data_type.trade_fee import TradeFeeSchema
+from hummingbot.core.data_type.trade_fee import TokenAmount, TradeFeeSchema
 
 
 class SettingsTest(unittest.TestCase):
@@ -195,3 +206,104 @@ class SettingsTest(unittest.TestCase):
 
         self.assertIsInstance(api_data_source, KujiraAPIDataSource)
         self.assertEqual(expected_params_without_api_data_source, params)
+
+
+class ConnectorManifestTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = TemporaryDirectory()
+        self.manifest_path = str(Path(self.temp_dir.name) / "connector_manifest.json")
+        path_patcher = patch(
+            "hummingbot.client.settings.AllConnectorSettings.connector_manifest_path",
+            return_value=self.manifest_path,
+        )
+        path_patcher.start()
+        self.addCleanup(path_patcher.stop)
+        self.addCleanup(self.temp_dir.cleanup)
+
+    def tearDown(self) -> None:
+        AllConnectorSettings.create_connector_settings(use_manifest=False)
+        super().tearDown()
+
+    def test_create_connector_settings_writes_manifest(self):
+        settings = AllConnectorSettings.create_connector_settings()
+
+        with open(self.manifest_path) as fd:
+            manifest = json.load(fd)
+
+        self.assertEqual(AllConnectorSettings._connector_manifest_fingerprint(), manifest["fingerprint"])
+        manifest_names = {entry["name"] for entry in manifest["connectors"]}
+        self.assertIn("binance", manifest_names)
+        self.assertIn("binance_us", manifest_names)
+        self.assertTrue(manifest_names.issubset(settings.keys()))
+
+    def test_settings_from_manifest_match_scanned_settings(self):
+        scanned_settings = AllConnectorSettings.create_connector_settings(use_manifest=False)
+        AllConnectorSettings.create_connector_settings()  # writes the manifest
+        manifest_settings = AllConnectorSettings.create_connector_settings()
+
+        self.assertEqual(scanned_settings.keys(), manifest_settings.keys())
+        for name, setting in scanned_settings.items():
+            manifest_setting = manifest_settings[name]
+            self.assertEqual(setting.type, manifest_setting.type)
+            self.assertEqual(setting.example_pair, manifest_setting.example_pair)
+            self.assertEqual(setting.trade_fee_schema, manifest_setting.trade_fee_schema)
+            self.assertEqual(setting.parent_name, manifest_setting.parent_name)
+            self.assertEqual(setting.domain_parameter, manifest_setting.domain_parameter)
+            self.assertEqual(type(setting.config_keys), type(manifest_setting.config_keys))
+
+    def test_outdated_manifest_is_rebuilt(self):
+        with open(self.manifest_path, "w") as fd:
+            json.dump({"fingerprint": "outdated", "connectors": []}, fd)
+
+        settings = AllConnectorSettings.create_connector_settings()
+
+        self.assertIn("binance", settings)
+        with open(self.manifest_path) as fd:
+            self.assertEqual(AllConnectorSettings._connector_manifest_fingerprint(), json.load(fd)["fingerprint"])
+
+    def test_manifest_startup_does_not_import_connector_modules(self):
+        AllConnectorSettings.create_connector_settings()  # writes the manifest
+        util_module_path = "hummingbot.connector.exchange.binance.binance_utils"
+        sys.modules.pop(util_module_path, None)
+
+        settings = AllConnectorSettings.create_connector_settings()
+
+        self.assertNotIn(util_module_path, sys.modules)
+        self.assertIsInstance(settings["binance"], LazyConnectorSetting)
+
+        self.assertEqual("binance", settings["binance"].config_keys.connector)
+        self.assertIn(util_module_path, sys.modules)
+
+    def test_lazy_setting_keeps_replaced_config_keys(self):
+        config_keys = BinanceConfigMap(binance_api_key="someKey", binance_api_secret="someSecret")
+        lazy_setting = LazyConnectorSetting(
+            name="binance",
+            type=ConnectorType.Exchange,
+            example_pair="BTC-USDT",
+            centralised=True,
+            use_ethereum_wallet=False,
+            trade_fee_schema=TradeFeeSchema(),
+            config_keys=ConnectorConfigKeysLoader("hummingbot.connector.exchange.binance.binance_utils"),
+            is_sub_domain=False,
+            parent_name=None,
+            domain_parameter=None,
+            use_eth_gas_lookup=False,
+        )
+
+        self.assertIsInstance(lazy_setting.config_keys, BinanceConfigMap)
+        self.assertIs(config_keys, lazy_setting._replace(config_keys=config_keys).config_keys)
+
+    def test_trade_fee_schema_json_round_trip(self):
+        schema = TradeFeeSchema(
+            percent_fee_token="BNB",
+            maker_percent_fee_decimal=Decimal("0.001"),
+            taker_percent_fee_decimal=Decimal("0.002"),
+            maker_fixed_fees=[TokenAmount("ETH", Decimal("0.01"))],
+        )
+
+        restored = AllConnectorSettings._trade_fee_schema_from_json(
+            json.loads(json.dumps(AllConnectorSettings._trade_fee_schema_to_json(schema)))
+        )
+
+        self.assertEqual(schema, restored)
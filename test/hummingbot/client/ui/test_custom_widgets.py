@@ -70,6 +70,20 @@ class CustomWidgetUnitTests(unittest.TestCase):
         self.assertEqual(7, len(line_fragments))
         self.assertEqual(expected_fragments, line_fragments)
 
+    def test_get_line_lexes_each_distinct_line_once(self):
+        TEXT = "SOME RANDOM TEXT WITH &cSPECIAL_WORD\nOTHER TEXT"
+        get_line = self.lexer.lex_document(Document(text=TEXT))
+        first_fragments = get_line(0)
+        get_line(1)
+
+        get_line = self.lexer.lex_document(Document(text=TEXT + "\nNEW LINE"))
+
+        self.assertEqual(first_fragments, get_line(0))
+        self.assertEqual([("", "NEW LINE")], get_line(2))
+        cache_info = self.lexer._lex_line.cache_info()
+        self.assertEqual(1, cache_info.hits)
+        self.assertEqual(3, cache_info.misses)
+
     def test_get_line_no_match_found(self):
         TEXT = "SOME RANDOM TEXT WITHOUT SPECIAL_WORD"
         document = Document(text=TEXT)
@@ -0,0 +1,60 @@
+import unittest
+from decimal import Decimal
+
+from hummingbot.client.ui.live_status_renderer import LiveStatusRenderer
+from hummingbot.strategy.status_model import StatusModel
+
+
+class LiveStatusRendererTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.model = StatusModel()
+        self.renderer = LiveStatusRenderer(min_refresh_interval=1, indent=4)
+
+    def test_render_fields_and_table(self):
+        balances = self.model.section("Balances")
+        balances.set_field("USDT", Decimal("1000.5"))
+        orders = self.model.section("Orders", columns=["Market", "Side", "Price"])
+        orders.set_row("order1", ["ETH-USDT", "buy", 1500.123456789])
+        orders.set_row("order2", ["BTC-USDT", "sell", Decimal("30000")])
+
+        frame = self.renderer.render(self.model, timestamp=10)
+
+        self.assertEqual(
+            [
+                "",
+                "  Balances:",
+                "    USDT: 1000.5",
+                "",
+                "  Orders:",
+                "      Market Side   Price",
+                "    ETH-USDT  buy 1500.12",
+                "    BTC-USDT sell   30000",
+            ],
+            frame.lines)
+
+    def test_render_is_rate_limited_and_skipped_without_changes(self):
+        section = self.model.section("Balances")
+        section.set_field("USDT", 100)
+        self.assertIsNotNone(self.renderer.render(self.model, timestamp=10))
+
+        section.set_field("USDT", 200)
+        self.assertIsNone(self.renderer.render(self.model, timestamp=10.5))
+
+        frame = self.renderer.render(self.model, timestamp=11)
+        self.assertEqual(["", "  Balances:", "    USDT: 200"], frame.lines)
+
+        self.assertIsNone(self.renderer.render(self.model, timestamp=20))
+
+    def test_unchanged_sections_are_not_reformatted(self):
+        self.model.section("Balances").set_field("USDT", 100)
+        orders = self.model.section("Orders", columns=["Market"])
+        orders.set_row("order1", ["ETH-USDT"])
+        self.renderer.render(self.model, timestamp=10)
+        balance_lines = self.renderer._section_lines[id(self.model.section("Balances"))][1]
+
+        orders.remove_row("order1")
+        frame = self.renderer.render(self.model, timestamp=20)
+
+        self.assertIs(balance_lines, self.renderer._section_lines[id(self.model.section("Balances"))][1])
+        self.assertEqual(["", "  Balances:", "    USDT: 100", "", "  Orders:"], frame.lines)
@@ -0,0 +1,78 @@
+import os
+import tempfile
+import unittest
+
+from hummingbot.client.ui.log_pane_buffer import LogPaneBuffer
+
+
+class LogPaneBufferTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.spill_file_path = os.path.join(self.temp_dir.name, "logs", "log_pane_history.log")
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def test_buffer_keeps_last_lines(self):
+        buffer = LogPaneBuffer(max_line_count=3)
+
+        buffer.append_lines(["line 1", "line 2"])
+        self.assertEqual("line 1\nline 2", buffer.text)
+
+        buffer.append_lines(["line 3", "line 4"])
+        self.assertEqual(["line 2", "line 3", "line 4"], list(buffer.lines))
+        self.assertEqual("line 2\nline 3\nline 4", buffer.text)
+
+        buffer.clear()
+        self.assertEqual("", buffer.text)
+
+    def test_evicted_lines_are_spilled_and_searchable(self):
+        buffer = LogPaneBuffer(max_line_count=2, spill_file_path=self.spill_file_path)
+
+        buffer.append_lines(["order 1 created", "order 2 created", "order 1 filled"])
+        buffer.append_lines(["order 3 created", "order 2 filled", "order 3 canceled", "order 4 created"])
+
+        with open(self.spill_file_path) as spill_file:
+            self.assertEqual(
+                ["order 1 created", "order 2 created", "order 1 filled", "order 3 created", "order 2 filled"],
+                spill_file.read().splitlines())
+        self.assertEqual(["order 3 canceled", "order 4 created"], list(buffer.lines))
+        self.assertEqual(["order 1 filled", "order 2 filled"], buffer.search("FILLED"))
+        self.assertEqual(["order 3 canceled", "order 4 created"], buffer.search("canceled|order 4"))
+        self.assertEqual(["order 4 created"], buffer.search("created", max_results=1))
+        self.assertEqual([], buffer.search("FILLED", ignore_case=False))
+        buffer.close()
+
+    def test_spill_file_is_rotated(self):
+        buffer = LogPaneBuffer(max_line_count=1, spill_file_path=self.spill_file_path, max_spill_file_size=20)
+
+        buffer.append_lines([f"line {i}" for i in range(6)])
+        buffer.append_lines(["line 6"])
+
+        self.assertTrue(os.path.exists(f"{self.spill_file_path}.1"))
+        self.assertEqual([f"line {i}" for i in range(7)], buffer.search("line"))
+        buffer.close()
+
+    def test_spill_files_of_previous_run_are_removed(self):
+        os.makedirs(os.path.dirname(self.spill_file_path))
+        for path in (self.spill_file_path, f"{self.spill_file_path}.1"):
+            with open(path, "w") as spill_file:
+                spill_file.write("old line\n")
+
+        buffer = LogPaneBuffer(max_line_count=1, spill_file_path=self.spill_file_path)
+
+        self.assertFalse(os.path.exists(self.spill_file_path))
+        self.assertFalse(os.path.exists(f"{self.spill_file_path}.1"))
+        self.assertEqual([], buffer.search("line"))
+
+    def test_spill_errors_disable_spilling(self):
+        file_path = os.path.join(self.temp_dir.name, "file")
+        open(file_path, "w").close()
+        buffer = LogPaneBuffer(max_line_count=1, spill_file_path=os.path.join(file_path, "log_pane_history.log"))
+
+        buffer.append_lines(["line 1", "line 2"])
+
+        self.assertIsNone(buffer.spill_file_path)
+        self.assertEqual(["line 2"], list(buffer.lines))
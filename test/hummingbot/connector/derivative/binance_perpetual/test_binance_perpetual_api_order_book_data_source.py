@@ -259,6 +259,34 @@ class BinancePerpetualAPIOrderBookDataSourceUnitTests(unittest.TestCase):
         self.assertEqual(result.next_funding_utc_timestamp, int(mock_response["nextFundingTime"] * 1e-3))
         self.assertEqual(result.rate, Decimal(mock_response["lastFundingRate"]))
 
+    @aioresponses()
+    def test_get_bulk_funding_info_filters_requested_pairs(self, mock_api):
+        url = web_utils.public_rest_url(CONSTANTS.MARK_PRICE_URL, domain=self.domain)
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+
+        symbol_info = {
+            "symbol": self.ex_trading_pair,
+            "markPrice": "46382.32704603",
+            "indexPrice": "46385.80064948",
+            "estimatedSettlePrice": "46510.13598963",
+            "lastFundingRate": "0.00010000",
+            "interestRate": "0.00010000",
+            "nextFundingTime": 1641312000000,
+            "time": 1641288825000,
+        }
+        other_symbol_info = dict(symbol_info, symbol="OTHERHBOT")
+        mock_api.get(regex_url, body=json.dumps([other_symbol_info, symbol_info]))
+
+        result = self.async_run_with_timeout(self.data_source.get_bulk_funding_info(trading_pairs=[self.trading_pair]))
+
+        self.assertEqual([self.trading_pair], list(result))
+        funding_info = result[self.trading_pair]
+        self.assertEqual(funding_info.trading_pair, self.trading_pair)
+        self.assertEqual(funding_info.index_price, Decimal(symbol_info["indexPrice"]))
+        self.assertEqual(funding_info.mark_price, Decimal(symbol_info["markPrice"]))
+        self.assertEqual(funding_info.next_funding_utc_timestamp, int(symbol_info["nextFundingTime"] * 1e-3))
+        self.assertEqual(funding_info.rate, Decimal(symbol_info["lastFundingRate"]))
+
     @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
     @patch("hummingbot.core.data_type.order_book_tracker_data_source.OrderBookTrackerDataSource._sleep")
     def test_listen_for_subscriptions_cancelled_when_connecting(self, _, mock_ws):
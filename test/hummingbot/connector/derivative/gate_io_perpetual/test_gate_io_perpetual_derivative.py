@@ -1312,6 +1312,11 @@ class GateIoPerpetualDerivativeTests(AbstractPerpetualDerivativeTests.PerpetualD
         expected_result = [PositionMode.ONEWAY, PositionMode.HEDGE]
         self.assertEqual(expected_result, linear_connector.supported_position_modes())
 
+    def test_set_position_mode_concurrently_with_partial_failure(self):
+        # This test does not apply for Gate.io. The position mode is set for the whole account,
+        # so the connector always switches it sequentially (check _execute_set_position_mode_for_pairs)
+        pass
+
     def test_get_buy_and_sell_collateral_tokens(self):
         self._simulate_trading_rules_initialized()
         buy_collateral_token = self.exchange.get_buy_collateral_token(self.trading_pair)
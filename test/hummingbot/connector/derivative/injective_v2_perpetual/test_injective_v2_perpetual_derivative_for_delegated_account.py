@@ -944,6 +944,37 @@ class InjectiveV2PerpetualDerivativeTests(AbstractPerpetualDerivativeTests.Perpe
 
         self.assertEqual(0, len(result))
 
+    def test_batch_order_create_sends_orders_in_batch_request(self):
+        # This test does not apply for Injective. The connector sends the batch orders in its own transactions
+        # and does not use the generic batch order hooks.
+        pass
+
+    def test_batch_order_create_marks_orders_failed_in_batch_result(self):
+        # This test does not apply for Injective. The connector sends the batch orders in its own transactions
+        # and does not use the generic batch order hooks.
+        pass
+
+    def test_batch_order_create_marks_orders_missing_in_batch_result_as_failed(self):
+        # This test does not apply for Injective. The connector sends the batch orders in its own transactions
+        # and does not use the generic batch order hooks.
+        pass
+
+    def test_batch_order_cancel_sends_cancelations_in_batch_request(self):
+        # This test does not apply for Injective. The connector sends the batch orders in its own transactions
+        # and does not use the generic batch order hooks.
+        pass
+
+    @aioresponses()
+    def test_batch_order_cancel_without_batch_support_cancels_orders_one_by_one(self, mock_api):
+        # This test does not apply for Injective. The connector sends the batch orders in its own transactions
+        # and does not use the generic batch order hooks.
+        pass
+
+    def test_batch_order_create_skips_orders_with_invalid_position_action(self):
+        # This test does not apply for Injective. The connector sends the batch orders in its own transactions
+        # and does not use the generic batch order hooks.
+        pass
+
     def test_batch_order_create(self):
         request_sent_event = asyncio.Event()
         self.exchange._set_current_timestamp(1640780000)
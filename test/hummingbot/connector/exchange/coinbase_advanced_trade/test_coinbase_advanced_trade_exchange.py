@@ -1547,6 +1547,11 @@ class CoinbaseAdvancedTradeExchangeTests(AbstractExchangeConnectorTests.Exchange
 
         self.assertEqual(result, expected_client_order_id)
 
+    def test_batch_order_cancel_sends_cancelations_in_batch_request(self):
+        # Coinbase Advanced Trade always sends the cancelations through its batch cancel endpoint in
+        # _execute_orders_cancel, so the generic batch cancel hook is not used
+        pass
+
     @aioresponses()
     def test_cancel_two_orders_with_cancel_all_and_one_fails(self, mock_api):
         self.exchange._set_current_timestamp(1640780000)
@@ -1,11 +1,34 @@
+import asyncio
+from decimal import Decimal
 from unittest import TestCase
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.client.settings import AllConnectorSettings
 from hummingbot.connector.exchange.binance.binance_api_order_book_data_source import BinanceAPIOrderBookDataSource
 from hummingbot.connector.exchange.kucoin.kucoin_api_order_book_data_source import KucoinAPIOrderBookDataSource
-from hummingbot.connector.exchange.paper_trade import create_paper_trade_market, get_order_book_tracker
+from hummingbot.connector.exchange.paper_trade import (
+    create_mirror_paper_trade_market,
+    create_paper_trade_market,
+    get_order_book_tracker,
+)
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import QuantizationParams
+from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import MarketEvent, OrderBookEvent, OrderBookTradeEvent
+
+
+class FixedOrderIdPaperExchange(MockPaperExchange):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.next_order_ids = []
+
+    def random_order_id(self, order_side: str, trading_pair: str) -> str:
+        return f"{order_side}://{trading_pair}/{self.next_order_ids.pop(0)}"
 
 
 class PaperTradeExchangeTests(TestCase):
@@ -29,3 +52,152 @@ class PaperTradeExchangeTests(TestCase):
             client_config_map=ClientConfigAdapter(ClientConfigMap()),
             trading_pairs=["COINALPHA-HBOT"])
         self.assertEqual(KucoinAPIOrderBookDataSource, type(paper_exchange.order_book_tracker.data_source))
+
+    def test_create_mirror_paper_trade_markets_share_the_live_connector_order_books(self):
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        live_connector = AllConnectorSettings.get_connector_settings()[
+            "binance"].non_trading_connector_instance_with_default_configuration(trading_pairs=["COINALPHA-HBOT"])
+
+        first_mirror = create_mirror_paper_trade_market(connector=live_connector, client_config_map=client_config_map)
+        second_mirror = create_mirror_paper_trade_market(connector=live_connector, client_config_map=client_config_map)
+
+        self.assertTrue(first_mirror.shared_order_book_tracker)
+        self.assertIs(live_connector.order_book_tracker, first_mirror.order_book_tracker)
+        self.assertIs(live_connector.order_book_tracker, second_mirror.order_book_tracker)
+        # The live connector keeps creating regular order books
+        self.assertEqual(OrderBook, type(live_connector.order_book_tracker.data_source.order_book_create_function()))
+        self.assertEqual(Decimal("1"), first_mirror.get_balance("BTC"))
+
+    def test_mirror_paper_trade_market_trade_listeners_follow_the_shared_order_books(self):
+        trading_pair = "COINALPHA-HBOT"
+        live_connector = AllConnectorSettings.get_connector_settings()[
+            "binance"].non_trading_connector_instance_with_default_configuration(trading_pairs=[trading_pair])
+        order_book = OrderBook()
+        live_connector.order_book_tracker.order_books[trading_pair] = order_book
+        mirror = create_mirror_paper_trade_market(connector=live_connector,
+                                                  client_config_map=ClientConfigAdapter(ClientConfigMap()))
+
+        mirror.init_paper_trade_market()
+        self.assertEqual(1, len(order_book.get_listeners(OrderBookEvent.TradeEvent)))
+
+        asyncio.get_event_loop().run_until_complete(mirror.stop_network())
+        self.assertEqual(0, len(order_book.get_listeners(OrderBookEvent.TradeEvent)))
+
+        # The live connector replaced the order book while the mirror was stopped
+        new_order_book = OrderBook()
+        live_connector.order_book_tracker.order_books[trading_pair] = new_order_book
+        asyncio.get_event_loop().run_until_complete(mirror.start_network())
+        self.assertEqual(0, len(order_book.get_listeners(OrderBookEvent.TradeEvent)))
+        self.assertEqual(1, len(new_order_book.get_listeners(OrderBookEvent.TradeEvent)))
+
+    def test_queue_position_simulation_fills_limit_orders_partially(self):
+        trading_pair = "COINALPHA-HBOT"
+        exchange = MockPaperExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        exchange.set_balanced_order_book(trading_pair=trading_pair,
+                                         mid_price=100,
+                                         min_price=50,
+                                         max_price=150,
+                                         price_step_size=1,
+                                         volume_step_size=10)
+        exchange.set_quantization_param(QuantizationParams(trading_pair, 6, 6, 6, 6))
+        exchange.set_balance("COINALPHA", Decimal("100"))
+        exchange.set_balance("HBOT", Decimal("10000"))
+        exchange.queue_position_simulation = True
+        fill_logger = EventLogger()
+        completed_logger = EventLogger()
+        exchange.add_listener(MarketEvent.OrderFilled, fill_logger)
+        exchange.add_listener(MarketEvent.BuyOrderCompleted, completed_logger)
+
+        # The best bid level at 99.5 has 10 units resting ahead of the new order
+        order_id = exchange.buy(trading_pair, Decimal("5"), OrderType.LIMIT, Decimal("99.5"))
+        order_book = exchange.get_order_book(trading_pair)
+
+        order_book.apply_trade(OrderBookTradeEvent(trading_pair, 1, TradeType.SELL, Decimal("99.5"), Decimal("12")))
+
+        self.assertEqual(1, len(fill_logger.event_log))
+        self.assertEqual(order_id, fill_logger.event_log[0].order_id)
+        self.assertEqual(Decimal("2"), fill_logger.event_log[0].amount)
+        self.assertEqual(0, len(completed_logger.event_log))
+        self.assertEqual(Decimal("2"), exchange.limit_orders[0].filled_quantity)
+        self.assertEqual(Decimal("102"), exchange.get_balance("COINALPHA"))
+
+        order_book.apply_trade(OrderBookTradeEvent(trading_pair, 2, TradeType.SELL, Decimal("99.5"), Decimal("3")))
+
+        self.assertEqual(2, len(fill_logger.event_log))
+        self.assertEqual(Decimal("3"), fill_logger.event_log[1].amount)
+        self.assertEqual(1, len(completed_logger.event_log))
+        self.assertEqual(Decimal("5"), completed_logger.event_log[0].base_asset_amount)
+        self.assertEqual(0, len(exchange.limit_orders))
+
+    def test_queue_position_simulation_reduces_the_queue_of_every_order_at_the_trade_price(self):
+        trading_pair = "COINALPHA-HBOT"
+        exchange = MockPaperExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        exchange.set_balanced_order_book(trading_pair=trading_pair,
+                                         mid_price=100,
+                                         min_price=50,
+                                         max_price=150,
+                                         price_step_size=1,
+                                         volume_step_size=10)
+        exchange.set_quantization_param(QuantizationParams(trading_pair, 6, 6, 6, 6))
+        exchange.set_balance("COINALPHA", Decimal("100"))
+        exchange.set_balance("HBOT", Decimal("10000"))
+        exchange.queue_position_simulation = True
+        fill_logger = EventLogger()
+        exchange.add_listener(MarketEvent.OrderFilled, fill_logger)
+
+        # Both orders have the 10 units resting at 99.5 ahead of them
+        first_order_id = exchange.buy(trading_pair, Decimal("5"), OrderType.LIMIT, Decimal("99.5"))
+        second_order_id = exchange.buy(trading_pair, Decimal("5"), OrderType.LIMIT, Decimal("99.5"))
+        order_book = exchange.get_order_book(trading_pair)
+
+        order_book.apply_trade(OrderBookTradeEvent(trading_pair, 1, TradeType.SELL, Decimal("99.5"), Decimal("12")))
+
+        # The volume beyond the queue is only allocated once
+        self.assertEqual(1, len(fill_logger.event_log))
+        self.assertEqual(Decimal("2"), fill_logger.event_log[0].amount)
+
+        order_book.apply_trade(OrderBookTradeEvent(trading_pair, 2, TradeType.SELL, Decimal("99.5"), Decimal("6")))
+
+        fills = {(event.order_id, event.amount) for event in fill_logger.event_log[1:]}
+        self.assertEqual({(first_order_id, Decimal("3")), (second_order_id, Decimal("3"))}, fills)
+        self.assertEqual(1, len(exchange.limit_orders))
+        self.assertEqual(Decimal("3"), exchange.limit_orders[0].filled_quantity)
+
+    def test_queue_position_simulation_fills_orders_with_the_same_queue_in_placement_order(self):
+        trading_pair = "COINALPHA-HBOT"
+        exchange = FixedOrderIdPaperExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        exchange.set_balanced_order_book(trading_pair=trading_pair,
+                                         mid_price=100,
+                                         min_price=50,
+                                         max_price=150,
+                                         price_step_size=1,
+                                         volume_step_size=10)
+        exchange.set_quantization_param(QuantizationParams(trading_pair, 6, 6, 6, 6))
+        exchange.set_balance("COINALPHA", Decimal("100"))
+        exchange.set_balance("HBOT", Decimal("10000"))
+        exchange.queue_position_simulation = True
+        fill_logger = EventLogger()
+        exchange.add_listener(MarketEvent.OrderFilled, fill_logger)
+        order_book = exchange.get_order_book(trading_pair)
+
+        # The limit orders are stored sorted by client order id, the first order placed gets the greater id
+        exchange.next_order_ids = ["0002", "0001"]
+        first_sell_order_id = exchange.sell(trading_pair, Decimal("5"), OrderType.LIMIT, Decimal("100.5"))
+        exchange.sell(trading_pair, Decimal("5"), OrderType.LIMIT, Decimal("100.5"))
+
+        order_book.apply_trade(OrderBookTradeEvent(trading_pair, 1, TradeType.BUY, Decimal("100.5"), Decimal("12")))
+
+        self.assertEqual(1, len(fill_logger.event_log))
+        self.assertEqual(first_sell_order_id, fill_logger.event_log[0].order_id)
+        self.assertEqual(Decimal("2"), fill_logger.event_log[0].amount)
+
+        # The bid orders are walked from the greatest id, so the first order placed gets the lower id
+        exchange.next_order_ids = ["0001", "0002"]
+        first_buy_order_id = exchange.buy(trading_pair, Decimal("5"), OrderType.LIMIT, Decimal("99.5"))
+        exchange.buy(trading_pair, Decimal("5"), OrderType.LIMIT, Decimal("99.5"))
+
+        order_book.apply_trade(OrderBookTradeEvent(trading_pair, 2, TradeType.SELL, Decimal("99.5"), Decimal("12")))
+
+        self.assertEqual(2, len(fill_logger.event_log))
+        self.assertEqual(first_buy_order_id, fill_logger.event_log[1].order_id)
+        self.assertEqual(Decimal("2"), fill_logger.event_log[1].amount)
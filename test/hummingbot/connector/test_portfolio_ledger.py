@@ -0,0 +1,112 @@
+from decimal import Decimal
+from unittest import TestCase
+from unittest.mock import MagicMock, PropertyMock
+
+from hummingbot.connector.portfolio_ledger import PortfolioLedger
+from hummingbot.core.data_type.common import OrderType, PositionAction, PositionMode, PositionSide, TradeType
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount
+from hummingbot.core.event.events import FundingPaymentCompletedEvent, OrderFilledEvent
+from hummingbot.core.rate_oracle.rate_oracle import RateOracle
+
+
+class PortfolioLedgerTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.connector_name = "test_connector"
+        self.trading_pair = "COINALPHA-HBOT"
+        self.rate_oracle = RateOracle()
+        self.connector_mock = MagicMock()
+        type(self.connector_mock).name = PropertyMock(return_value=self.connector_name)
+        self.ledger = PortfolioLedger(connectors=[self.connector_mock], rate_provider=self.rate_oracle)
+
+    def _fill(self, trade_type: TradeType, amount: str, price: str, fee: AddedToCostTradeFee = None):
+        self.ledger.process_fill(self.connector_name, OrderFilledEvent(
+            timestamp=1000,
+            order_id="OID1",
+            trading_pair=self.trading_pair,
+            trade_type=trade_type,
+            order_type=OrderType.LIMIT,
+            price=Decimal(price),
+            amount=Decimal(amount),
+            trade_fee=fee or AddedToCostTradeFee(),
+        ))
+
+    def test_fills_update_average_cost_and_realized_pnl(self):
+        self._fill(TradeType.BUY, "1", "100")
+        self._fill(TradeType.BUY, "3", "200")
+
+        position = self.ledger.position(self.connector_name, self.trading_pair)
+        self.assertEqual(Decimal("4"), position.amount)
+        self.assertEqual(Decimal("175"), position.average_cost)
+
+        self._fill(TradeType.SELL, "2", "225")
+
+        self.assertEqual(Decimal("2"), position.amount)
+        self.assertEqual(Decimal("175"), position.average_cost)
+        self.assertEqual(Decimal("100"), position.realized_pnl)
+        self.assertEqual(Decimal("50"), self.ledger.unrealized_pnl(self.connector_name, self.trading_pair,
+                                                                   price=Decimal("200")))
+        self.assertEqual(3, position.fills_count)
+
+    def test_fill_reversing_the_position_resets_the_average_cost(self):
+        self._fill(TradeType.BUY, "1", "100")
+        self._fill(TradeType.SELL, "3", "110")
+
+        position = self.ledger.position(self.connector_name, self.trading_pair)
+        self.assertEqual(Decimal("-2"), position.amount)
+        self.assertEqual(Decimal("110"), position.average_cost)
+        self.assertEqual(Decimal("10"), position.realized_pnl)
+
+    def test_fees_and_funding_payments_are_included_in_net_realized_pnl(self):
+        self._fill(TradeType.BUY, "1", "100", fee=AddedToCostTradeFee(flat_fees=[TokenAmount("HBOT", Decimal("1"))]))
+        self._fill(TradeType.SELL, "1", "110")
+        self.ledger.process_funding_payment(self.connector_name, FundingPaymentCompletedEvent(
+            timestamp=1000,
+            market=self.connector_name,
+            trading_pair=self.trading_pair,
+            amount=Decimal("-2"),
+            funding_rate=Decimal("0.0001"),
+        ))
+
+        position = self.ledger.position(self.connector_name, self.trading_pair)
+        self.assertEqual(Decimal("1"), position.fees_in_quote)
+        self.assertEqual(Decimal("7"), position.net_realized_pnl)
+
+    def test_total_pnl_in_valuation_token(self):
+        self.rate_oracle._prices = {"HBOT-USDT": Decimal("2")}
+        self._fill(TradeType.BUY, "1", "100")
+        self._fill(TradeType.SELL, "1", "110")
+
+        self.assertEqual(Decimal("20"), self.ledger.total_pnl("USDT"))
+        self.assertEqual("10", self.ledger.snapshot()[f"{self.connector_name}:{self.trading_pair}"]["realized_pnl"])
+
+    def test_hedge_mode_fills_are_kept_in_separate_long_and_short_positions(self):
+        self.connector_mock.position_mode = PositionMode.HEDGE
+        for trade_type, position_action, amount, price in [(TradeType.BUY, PositionAction.OPEN, "2", "100"),
+                                                           (TradeType.SELL, PositionAction.OPEN, "1", "110"),
+                                                           (TradeType.SELL, PositionAction.CLOSE, "1", "120")]:
+            self.ledger.process_fill(self.connector_name, OrderFilledEvent(
+                timestamp=1000,
+                order_id="OID1",
+                trading_pair=self.trading_pair,
+                trade_type=trade_type,
+                order_type=OrderType.LIMIT,
+                price=Decimal(price),
+                amount=Decimal(amount),
+                trade_fee=AddedToCostTradeFee(),
+                position=position_action.value,
+            ))
+
+        long_position = self.ledger.position(self.connector_name, self.trading_pair, PositionSide.LONG)
+        short_position = self.ledger.position(self.connector_name, self.trading_pair, PositionSide.SHORT)
+        self.assertEqual(Decimal("1"), long_position.amount)
+        self.assertEqual(Decimal("100"), long_position.average_cost)
+        self.assertEqual(Decimal("20"), long_position.realized_pnl)
+        self.assertEqual(Decimal("-1"), short_position.amount)
+        self.assertEqual(Decimal("110"), short_position.average_cost)
+        self.assertEqual(Decimal("0"), short_position.realized_pnl)
+
+        snapshot = self.ledger.snapshot()
+        self.assertEqual("LONG", snapshot[f"{self.connector_name}:{self.trading_pair}:LONG"]["position_side"])
+        self.assertEqual("-1", snapshot[f"{self.connector_name}:{self.trading_pair}:SHORT"]["amount"])
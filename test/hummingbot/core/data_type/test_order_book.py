@@ -1,7 +1,11 @@
 #!/usr/bin/env python
 
 import logging
+import math
 import unittest
+from types import SimpleNamespace
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
 from hummingbot.core.data_type.order_book import OrderBook
 import numpy as np
 
@@ -50,6 +54,67 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    @staticmethod
+    def depth_order_book(order_book: OrderBook = None) -> OrderBook:
+        order_book = order_book or OrderBook()
+        bids_array = np.array([[99.95, 1, 1], [99.85, 2, 1], [99.45, 3, 1], [98, 4, 1]], dtype=np.float64)
+        asks_array = np.array([[100.05, 1, 1], [100.25, 5, 1], [101, 3, 1]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+        return order_book
+
+    def test_depth_buckets(self):
+        order_book = self.depth_order_book()
+
+        bids, asks = order_book.get_depth_buckets(bucket_bps=10, num_buckets=6)
+
+        self.assertEqual([1, 2, 0, 0, 0, 3], bids.tolist())
+        self.assertEqual([1, 0, 5, 0, 0, 0], asks.tolist())
+        with self.assertRaises(ValueError):
+            order_book.get_depth_buckets(bucket_bps=0, num_buckets=6)
+
+    def test_cumulative_depth(self):
+        order_book = self.depth_order_book()
+
+        bids, asks = order_book.get_cumulative_depth([10, 60, 300])
+
+        self.assertEqual([1, 6, 10], bids.tolist())
+        self.assertEqual([1, 6, 9], asks.tolist())
+
+    def test_imbalance(self):
+        order_book = self.depth_order_book()
+
+        self.assertEqual(0, order_book.get_imbalance(1))
+        self.assertAlmostEqual(-1 / 3, order_book.get_imbalance(2))
+        self.assertTrue(math.isnan(OrderBook().get_imbalance(5)))
+
+    def test_depth_aggregations_of_empty_book(self):
+        bids, asks = OrderBook().get_depth_buckets(bucket_bps=10, num_buckets=3)
+
+        self.assertEqual([0, 0, 0], bids.tolist())
+        self.assertEqual([0, 0, 0], asks.tolist())
+
+    def test_depth_aggregations_are_cached_until_book_changes(self):
+        order_book = self.depth_order_book()
+
+        depth = order_book.get_depth_buckets(bucket_bps=10, num_buckets=6)
+        self.assertIs(depth, order_book.get_depth_buckets(bucket_bps=10, num_buckets=6))
+        self.assertFalse(depth[0].flags.writeable)
+        self.assertIsNot(depth, order_book.get_depth_buckets(bucket_bps=10, num_buckets=6, use_cache=False))
+
+        order_book.apply_numpy_diffs(np.array([[99.95, 0, 2]], dtype=np.float64), np.empty((0, 3)))
+        bids, _ = order_book.get_depth_buckets(bucket_bps=10, num_buckets=6)
+
+        self.assertEqual([0, 2, 0, 0, 0, 3], bids.tolist())
+
+    def test_composite_order_book_depth_excludes_traded_volume(self):
+        order_book = self.depth_order_book(CompositeOrderBook())
+        self.assertEqual([1, 0, 5], order_book.get_depth_buckets(bucket_bps=10, num_buckets=3)[1].tolist())
+
+        order_book.record_filled_order(
+            SimpleNamespace(price=100.05, amount=0.4, timestamp=2, trade_type=TradeType.BUY))
+
+        self.assertEqual([0.6, 0, 5], order_book.get_depth_buckets(bucket_bps=10, num_buckets=3)[1].tolist())
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
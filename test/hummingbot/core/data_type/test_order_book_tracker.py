@@ -0,0 +1,220 @@
+import asyncio
+import time
+import unittest
+from typing import Awaitable, List, Optional
+from unittest.mock import AsyncMock, MagicMock
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+
+
+class OrderBookTrackerTests(unittest.TestCase):
+    trading_pair = "COINALPHA-HBOT"
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.tracking_task: Optional[asyncio.Task] = None
+
+    def tearDown(self) -> None:
+        self.tracking_task and self.tracking_task.cancel()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def create_tracker(
+            self, coalesce_diffs: bool, max_diff_lag: float = 0, detect_diff_gaps: bool = False) -> OrderBookTracker:
+        tracker = OrderBookTracker(
+            data_source=MagicMock(spec=OrderBookTrackerDataSource),
+            trading_pairs=[self.trading_pair],
+            coalesce_diffs=coalesce_diffs,
+            max_diff_lag=max_diff_lag,
+            detect_diff_gaps=detect_diff_gaps)
+        order_book = OrderBook()
+        order_book.apply_snapshot(*self.rows(bids=[[99, 1], [98, 2]], asks=[[101, 1], [102, 2]], update_id=1))
+        tracker._order_books[self.trading_pair] = order_book
+        tracker._tracking_message_queues[self.trading_pair] = asyncio.Queue()
+        return tracker
+
+    def rows(self, bids: List[List[float]], asks: List[List[float]], update_id: int):
+        message = self.diff_message(bids=bids, asks=asks, update_id=update_id)
+        return message.bids, message.asks, update_id
+
+    def diff_message(
+            self,
+            bids: List[List[float]],
+            asks: List[List[float]],
+            update_id: int,
+            first_update_id: Optional[int] = None) -> OrderBookMessage:
+        content = {"trading_pair": self.trading_pair, "update_id": update_id, "bids": bids, "asks": asks}
+        if first_update_id is not None:
+            content["first_update_id"] = first_update_id
+        return OrderBookMessage(message_type=OrderBookMessageType.DIFF, content=content, timestamp=time.time())
+
+    def snapshot_message(self, bids: List[List[float]], asks: List[List[float]], update_id: int) -> OrderBookMessage:
+        return OrderBookMessage(
+            message_type=OrderBookMessageType.SNAPSHOT,
+            content={"trading_pair": self.trading_pair, "update_id": update_id, "bids": bids, "asks": asks},
+            timestamp=time.time())
+
+    def run_tracking(self, tracker: OrderBookTracker, duration: float = 0.1):
+        self.tracking_task = self.ev_loop.create_task(tracker._track_single_book(self.trading_pair))
+        self.ev_loop.run_until_complete(asyncio.sleep(duration))
+
+    def book_levels(self, tracker: OrderBookTracker):
+        order_book = tracker.order_books[self.trading_pair]
+        bids = [(row.price, row.amount) for row in order_book.bid_entries()]
+        asks = [(row.price, row.amount) for row in order_book.ask_entries()]
+        return bids, asks
+
+    def queue_diffs(self, tracker: OrderBookTracker):
+        queue = tracker._tracking_message_queues[self.trading_pair]
+        queue.put_nowait(self.diff_message(bids=[[99, 3], [97, 1]], asks=[[101, 0]], update_id=2, first_update_id=2))
+        queue.put_nowait(self.diff_message(bids=[[97, 0]], asks=[[103, 1]], update_id=3, first_update_id=3))
+        queue.put_nowait(self.diff_message(bids=[[99, 4]], asks=[[101, 5]], update_id=4, first_update_id=4))
+
+    def test_diffs_applied_one_by_one_by_default(self):
+        tracker = self.create_tracker(coalesce_diffs=False)
+        self.queue_diffs(tracker)
+
+        self.run_tracking(tracker)
+
+        bids, asks = self.book_levels(tracker)
+        self.assertEqual([(99, 4), (98, 2)], bids)
+        self.assertEqual([(101, 5), (102, 2), (103, 1)], asks)
+        metrics = tracker.diff_metrics[self.trading_pair]
+        self.assertEqual(3, metrics.diffs_processed)
+        self.assertEqual(3, metrics.updates_applied)
+        self.assertEqual(0, metrics.queue_depth)
+
+    def test_queued_diffs_are_coalesced_into_single_update(self):
+        tracker = self.create_tracker(coalesce_diffs=True)
+        self.queue_diffs(tracker)
+
+        self.run_tracking(tracker)
+
+        bids, asks = self.book_levels(tracker)
+        self.assertEqual([(99, 4), (98, 2)], bids)
+        self.assertEqual([(101, 5), (102, 2), (103, 1)], asks)
+        self.assertEqual(4, tracker.order_books[self.trading_pair].last_diff_uid)
+        metrics = tracker.diff_metrics[self.trading_pair]
+        self.assertEqual(3, metrics.diffs_processed)
+        self.assertEqual(1, metrics.updates_applied)
+        self.assertEqual(3, metrics.coalescing_ratio)
+        past_diffs = list(tracker._past_diffs_windows[self.trading_pair])
+        self.assertEqual([2, 3, 4], [diff.update_id for diff in past_diffs])
+
+    def test_coalescing_stops_at_snapshot(self):
+        books = []
+        for coalesce_diffs in (False, True):
+            tracker = self.create_tracker(coalesce_diffs=coalesce_diffs)
+            queue = tracker._tracking_message_queues[self.trading_pair]
+            queue.put_nowait(self.diff_message(bids=[[99, 3]], asks=[], update_id=2))
+            queue.put_nowait(self.diff_message(bids=[[98, 0]], asks=[], update_id=3))
+            queue.put_nowait(self.snapshot_message(bids=[[90, 1]], asks=[[110, 1]], update_id=4))
+            queue.put_nowait(self.diff_message(bids=[[91, 1]], asks=[], update_id=5))
+
+            self.run_tracking(tracker)
+            self.tracking_task.cancel()
+            books.append(self.book_levels(tracker))
+
+        self.assertEqual(books[0], books[1])
+        self.assertEqual([(110, 1)], books[1][1])
+        metrics = tracker.diff_metrics[self.trading_pair]
+        self.assertEqual(3, metrics.diffs_processed)
+        self.assertEqual(2, metrics.updates_applied)
+
+    def test_coalescing_waits_for_diffs_up_to_max_lag(self):
+        tracker = self.create_tracker(coalesce_diffs=True, max_diff_lag=0.2)
+        queue = tracker._tracking_message_queues[self.trading_pair]
+        queue.put_nowait(self.diff_message(bids=[[99, 3]], asks=[], update_id=2))
+        self.ev_loop.call_later(0.05, queue.put_nowait, self.diff_message(bids=[[99, 5]], asks=[], update_id=3))
+
+        self.run_tracking(tracker, duration=0.1)
+        # The merged update is not applied before the max lag expires
+        self.assertEqual([(99, 1), (98, 2)], self.book_levels(tracker)[0])
+
+        self.ev_loop.run_until_complete(asyncio.sleep(0.2))
+        bids, _ = self.book_levels(tracker)
+        self.assertEqual([(99, 5), (98, 2)], bids)
+        metrics = tracker.diff_metrics[self.trading_pair]
+        self.assertEqual(2, metrics.diffs_processed)
+        self.assertEqual(1, metrics.updates_applied)
+        self.assertGreaterEqual(metrics.max_lag, 0)
+
+    def test_diff_metrics_report_queue_depth(self):
+        tracker = self.create_tracker(coalesce_diffs=True)
+        self.queue_diffs(tracker)
+        tracker._saved_message_queues[self.trading_pair].append(self.diff_message(bids=[], asks=[], update_id=5))
+
+        self.assertEqual(4, tracker.diff_metrics[self.trading_pair].queue_depth)
+
+    def test_gap_detection_drops_stale_diffs(self):
+        tracker = self.create_tracker(coalesce_diffs=False, detect_diff_gaps=True)
+        queue = tracker._tracking_message_queues[self.trading_pair]
+        queue.put_nowait(self.diff_message(bids=[[99, 7]], asks=[], update_id=1, first_update_id=1))
+        queue.put_nowait(self.diff_message(bids=[[99, 3]], asks=[], update_id=3, first_update_id=1))
+
+        self.run_tracking(tracker)
+
+        bids, _ = self.book_levels(tracker)
+        self.assertEqual([(99, 3), (98, 2)], bids)
+        metrics = tracker.diff_metrics[self.trading_pair]
+        self.assertEqual(1, metrics.stale_diffs_dropped)
+        self.assertEqual(0, metrics.gaps_detected)
+
+    def test_gap_in_diffs_resyncs_order_book_from_snapshot(self):
+        for coalesce_diffs in (False, True):
+            tracker = self.create_tracker(coalesce_diffs=coalesce_diffs, detect_diff_gaps=True)
+            tracker.data_source.get_order_book_snapshot = AsyncMock(
+                return_value=self.snapshot_message(bids=[[95, 1]], asks=[[105, 1]], update_id=10))
+            queue = tracker._tracking_message_queues[self.trading_pair]
+            queue.put_nowait(self.diff_message(bids=[[99, 3]], asks=[], update_id=2, first_update_id=2))
+            queue.put_nowait(self.diff_message(bids=[[98, 5]], asks=[], update_id=3, first_update_id=3))
+            queue.put_nowait(self.diff_message(bids=[[99, 9]], asks=[], update_id=6, first_update_id=5))
+            queue.put_nowait(self.diff_message(bids=[[96, 1]], asks=[], update_id=9, first_update_id=7))
+            queue.put_nowait(self.diff_message(bids=[[94, 1]], asks=[], update_id=11, first_update_id=11))
+
+            self.run_tracking(tracker)
+            self.tracking_task.cancel()
+
+            tracker.data_source.get_order_book_snapshot.assert_awaited_once_with(trading_pair=self.trading_pair)
+            bids, asks = self.book_levels(tracker)
+            self.assertEqual([(95, 1), (94, 1)], bids)
+            self.assertEqual([(105, 1)], asks)
+            metrics = tracker.diff_metrics[self.trading_pair]
+            self.assertEqual(1, metrics.gaps_detected)
+            self.assertEqual(1, metrics.resyncs)
+            self.assertEqual(1, metrics.stale_diffs_dropped)
+            self.assertEqual([11], [diff.update_id for diff in tracker._past_diffs_windows[self.trading_pair]])
+
+    def test_diffs_without_first_update_id_are_not_validated(self):
+        tracker = self.create_tracker(coalesce_diffs=False, detect_diff_gaps=True)
+        queue = tracker._tracking_message_queues[self.trading_pair]
+        queue.put_nowait(self.diff_message(bids=[[99, 3]], asks=[], update_id=100))
+
+        self.run_tracking(tracker)
+
+        self.assertEqual(0, tracker.diff_metrics[self.trading_pair].gaps_detected)
+        self.assertEqual(100, tracker.order_books[self.trading_pair].last_diff_uid)
+
+    def test_order_book_age(self):
+        tracker = self.create_tracker(coalesce_diffs=False)
+        tracker._diff_metrics[self.trading_pair].last_update_timestamp = time.time() - 10
+
+        self.assertAlmostEqual(10, tracker.order_book_age(self.trading_pair), delta=0.5)
+
+        self.queue_diffs(tracker)
+        self.run_tracking(tracker)
+
+        self.assertLess(tracker.order_book_age(self.trading_pair), 0.5)
+        with self.assertRaises(ValueError):
+            tracker.order_book_age("UNKNOWN-PAIR")
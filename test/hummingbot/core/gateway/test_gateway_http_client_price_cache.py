@@ -0,0 +1,138 @@
+import asyncio
+from decimal import Decimal
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from typing import Any, Dict
+from unittest.mock import patch
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.core.event.events import TradeType
+from hummingbot.core.gateway.gateway_http_client import GatewayHttpClient
+
+
+class GatewayHttpClientPriceCacheTest(IsolatedAsyncioWrapperTestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.client_config_map = ClientConfigAdapter(ClientConfigMap())
+        self.client_config_map.gateway.gateway_price_cache_ttl = 60
+        self.client = GatewayHttpClient(self.client_config_map)
+        self.requests = []
+        self.request_delay = 0.05
+
+    async def mock_api_request(self, method: str, path_url: str, params: Dict[str, Any], fail_silently: bool = False):
+        self.requests.append(params)
+        await asyncio.sleep(self.request_delay)
+        if params["amount"].startswith("0.0"):
+            raise ValueError("Invalid amount")
+        return {"price": str(Decimal(params["amount"]) * 2), "gasCost": "0.001"}
+
+    def get_price(self, amount: Decimal, side: TradeType = TradeType.BUY, network: str = "mainnet"):
+        return self.client.get_price("ethereum", network, "uniswap", "WETH", "DAI", amount, side)
+
+    async def test_concurrent_identical_requests_are_sent_once(self):
+        with patch.object(self.client, "api_request", new=self.mock_api_request):
+            responses = await asyncio.gather(
+                self.get_price(Decimal("1")),
+                self.get_price(Decimal("1")),
+                self.get_price(Decimal("1"), side=TradeType.SELL),
+            )
+
+        self.assertEqual(2, len(self.requests))
+        self.assertEqual(responses[0], responses[1])
+        self.assertEqual(0, len(self.client._price_requests))
+
+    async def test_prices_are_cached_for_the_chain_block_time(self):
+        self.client.set_price_cache_ttl(0.1, "ethereum")
+        with patch.object(self.client, "api_request", new=self.mock_api_request):
+            await self.get_price(Decimal("1"))
+            await self.get_price(Decimal("1"))
+            self.assertEqual(1, len(self.requests))
+
+            await asyncio.sleep(0.1)
+            await self.get_price(Decimal("1"))
+            self.assertEqual(2, len(self.requests))
+
+    async def test_prices_are_not_cached_by_default(self):
+        self.client_config_map.gateway.gateway_price_cache_ttl = ClientConfigMap().gateway.gateway_price_cache_ttl
+
+        self.assertEqual(0, self.client.price_cache_ttl("ethereum", "mainnet"))
+        with patch.object(self.client, "api_request", new=self.mock_api_request):
+            await self.get_price(Decimal("1"))
+            await self.get_price(Decimal("1"))
+        self.assertEqual(2, len(self.requests))
+
+    async def test_configured_ttl_is_capped_at_the_chain_block_time(self):
+        self.client_config_map.gateway.gateway_price_cache_ttl = 5
+
+        self.assertEqual(5, self.client.price_cache_ttl("ethereum", "mainnet"))
+        self.assertEqual(2, self.client.price_cache_ttl("polygon", "mainnet"))
+
+    async def test_callers_get_copies_of_the_cached_price(self):
+        with patch.object(self.client, "api_request", new=self.mock_api_request):
+            responses = await asyncio.gather(self.get_price(Decimal("1")), self.get_price(Decimal("1")))
+            responses[0]["price"] = "0"
+            cached_response = await self.get_price(Decimal("1"))
+            cached_response["gasCost"] = "0"
+
+            self.assertEqual("2.000000000000000000", responses[1]["price"])
+            self.assertEqual({"price": "2.000000000000000000", "gasCost": "0.001"}, await self.get_price(Decimal("1")))
+        self.assertEqual(1, len(self.requests))
+
+    async def test_price_cache_size_is_bounded(self):
+        self.request_delay = 0
+        with patch.object(GatewayHttpClient, "PRICE_CACHE_MAX_SIZE", 2):
+            with patch.object(self.client, "api_request", new=self.mock_api_request):
+                for amount in ("1", "2", "3"):
+                    await self.get_price(Decimal(amount))
+                self.assertEqual(2, len(self.client._price_cache))
+
+                await self.get_price(Decimal("3"))
+                self.assertEqual(3, len(self.requests))
+                await self.get_price(Decimal("1"))
+                self.assertEqual(4, len(self.requests))
+
+    async def test_price_cache_ttl_by_network(self):
+        self.client.set_price_cache_ttl(0, "ethereum", "goerli")
+
+        self.assertEqual(12, self.client.price_cache_ttl("ethereum", "mainnet"))
+        self.assertEqual(0, self.client.price_cache_ttl("ethereum", "goerli"))
+        self.assertEqual(GatewayHttpClient.DEFAULT_PRICE_CACHE_TTL, self.client.price_cache_ttl("unknown", "mainnet"))
+
+        with patch.object(self.client, "api_request", new=self.mock_api_request):
+            await self.get_price(Decimal("1"), network="goerli")
+            await self.get_price(Decimal("1"), network="goerli")
+        self.assertEqual(2, len(self.requests))
+
+    async def test_errors_are_shared_and_not_cached(self):
+        with patch.object(self.client, "api_request", new=self.mock_api_request):
+            results = await asyncio.gather(
+                self.get_price(Decimal("0.01")), self.get_price(Decimal("0.01")), return_exceptions=True)
+            self.assertEqual(1, len(self.requests))
+            self.assertTrue(all(isinstance(result, ValueError) for result in results))
+
+            with self.assertRaises(ValueError):
+                await self.get_price(Decimal("0.01"))
+        self.assertEqual(2, len(self.requests))
+
+    async def test_cancelled_caller_does_not_cancel_shared_request(self):
+        with patch.object(self.client, "api_request", new=self.mock_api_request):
+            first_caller = asyncio.ensure_future(self.get_price(Decimal("1")))
+            await asyncio.sleep(0.01)
+            second_caller = asyncio.ensure_future(self.get_price(Decimal("1")))
+            await asyncio.sleep(0.01)
+            first_caller.cancel()
+
+            response = await second_caller
+
+        self.assertEqual("2.000000000000000000", response["price"])
+        self.assertEqual(1, len(self.requests))
+
+    async def test_get_prices_ladder(self):
+        with patch.object(self.client, "api_request", new=self.mock_api_request):
+            responses = await self.client.get_prices(
+                "ethereum", "mainnet", "uniswap", "WETH", "DAI", [Decimal("1"), Decimal("2"), Decimal("1")], TradeType.BUY)
+
+        self.assertEqual(["2.000000000000000000", "4.000000000000000000", "2.000000000000000000"],
+                         [response["price"] for response in responses])
+        self.assertEqual(2, len(self.requests))
@@ -1,7 +1,10 @@
 import asyncio
 import json
+import time
 import unittest
 from decimal import Decimal
+from pathlib import Path
+from tempfile import TemporaryDirectory
 from typing import Any, Awaitable, Dict
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -36,6 +39,15 @@ class TestTradingPairFetcher(unittest.TestCase):
         self._original_async_loop = asyncio.get_event_loop()
         self.async_loop = asyncio.new_event_loop()
         asyncio.set_event_loop(self.async_loop)
+        self.snapshot_dir = TemporaryDirectory()
+        self.addCleanup(self.snapshot_dir.cleanup)
+        self.snapshot_path = str(Path(self.snapshot_dir.name) / TradingPairFetcher.SNAPSHOT_FILE_NAME)
+        snapshot_path_patcher = patch(
+            "hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._snapshot_path",
+            return_value=self.snapshot_path,
+        )
+        snapshot_path_patcher.start()
+        self.addCleanup(snapshot_path_patcher.stop)
 
     def tearDown(self) -> None:
         super().tearDown()
@@ -292,3 +304,129 @@ class TestTradingPairFetcher(unittest.TestCase):
         self.assertEqual(1, len(perp_pairs))
         self.assertIn("ABC-USD", perp_pairs)
         self.assertNotIn("WETH-USDT", perp_pairs)
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    def test_fetched_trading_pairs_are_stored_in_snapshot(self, mock_connector_settings):
+        connector = AsyncMock()
+        connector.all_trading_pairs.return_value = ["MOCK-HBOT"]
+        mock_connector_settings.return_value = {
+            "mock_exchange_1": self.MockConnectorSetting(name="mockConnector", connector=connector),
+        }
+
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.fetch_pairs_from_all_exchanges = True
+        trading_pair_fetcher = TradingPairFetcher(client_config_map)
+        self.async_run_with_timeout(trading_pair_fetcher._fetch_task)
+
+        with open(self.snapshot_path) as fd:
+            snapshot = json.load(fd)
+
+        self.assertEqual(["mockConnector"], list(snapshot.keys()))
+        self.assertEqual(["MOCK-HBOT"], snapshot["mockConnector"]["trading_pairs"])
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    def test_fresh_snapshot_is_served_without_fetching(self, mock_connector_settings):
+        with open(self.snapshot_path, "w") as fd:
+            json.dump({"mockConnector": {"timestamp": time.time(), "trading_pairs": ["SNAP-HBOT"]}}, fd)
+        connector = AsyncMock()
+        connector.all_trading_pairs.return_value = ["MOCK-HBOT"]
+        mock_connector_settings.return_value = {
+            "mock_exchange_1": self.MockConnectorSetting(name="mockConnector", connector=connector),
+        }
+
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.fetch_pairs_from_all_exchanges = True
+        trading_pair_fetcher = TradingPairFetcher(client_config_map)
+
+        self.assertTrue(trading_pair_fetcher.ready)
+        self.assertEqual({"mockConnector": ["SNAP-HBOT"]}, trading_pair_fetcher.trading_pairs)
+
+        self.async_run_with_timeout(trading_pair_fetcher._fetch_task)
+
+        connector.all_trading_pairs.assert_not_called()
+        self.assertEqual({"mockConnector": ["SNAP-HBOT"]}, trading_pair_fetcher.trading_pairs)
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    def test_expired_snapshot_is_served_and_refreshed(self, mock_connector_settings):
+        expired_timestamp = time.time() - TradingPairFetcher.SNAPSHOT_TTL - 1
+        with open(self.snapshot_path, "w") as fd:
+            json.dump({"mockConnector": {"timestamp": expired_timestamp, "trading_pairs": ["SNAP-HBOT"]}}, fd)
+        connector = AsyncMock()
+        connector.all_trading_pairs.return_value = ["MOCK-HBOT"]
+        mock_connector_settings.return_value = {
+            "mock_exchange_1": self.MockConnectorSetting(name="mockConnector", connector=connector),
+        }
+
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.fetch_pairs_from_all_exchanges = True
+        trading_pair_fetcher = TradingPairFetcher(client_config_map)
+
+        self.assertEqual({"mockConnector": ["SNAP-HBOT"]}, trading_pair_fetcher.trading_pairs)
+
+        self.async_run_with_timeout(trading_pair_fetcher._fetch_task)
+
+        self.assertEqual({"mockConnector": ["MOCK-HBOT"]}, trading_pair_fetcher.trading_pairs)
+        with open(self.snapshot_path) as fd:
+            self.assertEqual(["MOCK-HBOT"], json.load(fd)["mockConnector"]["trading_pairs"])
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    def test_partial_snapshot_is_not_ready_until_fetched(self, mock_connector_settings):
+        with open(self.snapshot_path, "w") as fd:
+            json.dump({"mockConnector": {"timestamp": time.time(), "trading_pairs": ["SNAP-HBOT"]}}, fd)
+        connector = AsyncMock()
+        connector.all_trading_pairs.return_value = ["MOCK-HBOT"]
+        mock_connector_settings.return_value = {
+            "mock_exchange_1": self.MockConnectorSetting(name="mockConnector", connector=connector),
+            "mock_exchange_2": self.MockConnectorSetting(name="mockConnector2", connector=connector),
+        }
+
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.fetch_pairs_from_all_exchanges = True
+        trading_pair_fetcher = TradingPairFetcher(client_config_map)
+
+        self.assertFalse(trading_pair_fetcher.ready)
+
+        self.async_run_with_timeout(trading_pair_fetcher._fetch_task)
+
+        self.assertTrue(trading_pair_fetcher.ready)
+        self.assertEqual({"mockConnector": ["SNAP-HBOT"], "mockConnector2": ["MOCK-HBOT"]},
+                         trading_pair_fetcher.trading_pairs)
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    def test_malformed_snapshot_is_ignored(self, mock_connector_settings):
+        with open(self.snapshot_path, "w") as fd:
+            json.dump({"mockConnector": ["SNAP-HBOT"]}, fd)
+        connector = AsyncMock()
+        connector.all_trading_pairs.return_value = ["MOCK-HBOT"]
+        mock_connector_settings.return_value = {
+            "mock_exchange_1": self.MockConnectorSetting(name="mockConnector", connector=connector),
+        }
+
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.fetch_pairs_from_all_exchanges = True
+        trading_pair_fetcher = TradingPairFetcher(client_config_map)
+
+        self.assertFalse(trading_pair_fetcher.ready)
+        self.assertEqual({}, trading_pair_fetcher.trading_pairs)
+
+        self.async_run_with_timeout(trading_pair_fetcher._fetch_task)
+
+        self.assertEqual({"mockConnector": ["MOCK-HBOT"]}, trading_pair_fetcher.trading_pairs)
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    def test_failed_refresh_keeps_snapshot_pairs(self, mock_connector_settings):
+        expired_timestamp = time.time() - TradingPairFetcher.SNAPSHOT_TTL - 1
+        with open(self.snapshot_path, "w") as fd:
+            json.dump({"mockConnector": {"timestamp": expired_timestamp, "trading_pairs": ["SNAP-HBOT"]}}, fd)
+        connector = AsyncMock()
+        connector.all_trading_pairs.side_effect = Exception("Test error")
+        mock_connector_settings.return_value = {
+            "mock_exchange_1": self.MockConnectorSetting(name="mockConnector", connector=connector),
+        }
+
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.fetch_pairs_from_all_exchanges = True
+        trading_pair_fetcher = TradingPairFetcher(client_config_map)
+        self.async_run_with_timeout(trading_pair_fetcher._fetch_task)
+
+        self.assertEqual({"mockConnector": ["SNAP-HBOT"]}, trading_pair_fetcher.trading_pairs)
@@ -0,0 +1,95 @@
+"""
+Compares the JSON decoders available for the web assistant connections on representative exchange payloads.
+
+Run from the repository root with:
+    python -m test.hummingbot.core.web_assistant.connections.json_decoder_benchmark
+"""
+import json
+import timeit
+from typing import Dict, List
+
+from hummingbot.core.web_assistant.connections import json_decoder
+from hummingbot.core.web_assistant.connections.json_decoder import (
+    JSONDecoderBase,
+    OrjsonDecoder,
+    StdlibJSONDecoder,
+    UJSONDecoder,
+)
+
+ITERATIONS = 20000
+
+
+def depth_update_payload(levels: int = 20) -> str:
+    return json.dumps({
+        "stream": "btcusdt@depth@100ms",
+        "data": {
+            "e": "depthUpdate",
+            "E": 1672515782136,
+            "s": "BTCUSDT",
+            "U": 157,
+            "u": 160,
+            "b": [[f"{16500 - i * 0.1:.2f}", f"{0.001 * (i + 1):.6f}"] for i in range(levels)],
+            "a": [[f"{16501 + i * 0.1:.2f}", f"{0.002 * (i + 1):.6f}"] for i in range(levels)],
+        },
+    })
+
+
+def trade_payload() -> str:
+    return json.dumps({
+        "stream": "btcusdt@trade",
+        "data": {
+            "e": "trade", "E": 1672515782136, "s": "BTCUSDT", "t": 12345, "p": "16500.12", "q": "0.00100000",
+            "b": 88, "a": 50, "T": 1672515782136, "m": True, "M": True,
+        },
+    })
+
+
+def order_update_payload() -> str:
+    return json.dumps({
+        "e": "executionReport", "E": 1672515782136, "s": "BTCUSDT", "c": "HBOTBSTUT6290b4a8c88b46e8b9e5",
+        "S": "BUY", "o": "LIMIT", "f": "GTC", "q": "1.00000000", "p": "16500.00000000", "P": "0.00000000",
+        "F": "0.00000000", "g": -1, "C": "", "x": "TRADE", "X": "PARTIALLY_FILLED", "r": "NONE", "i": 4293153,
+        "l": "0.50000000", "z": "0.50000000", "L": "16500.00000000", "n": "0.00050000", "N": "BTC",
+        "T": 1672515782136, "t": 12345, "I": 8641984, "w": False, "m": True, "M": True, "O": 1672515782136,
+        "Z": "8250.00000000", "Y": "8250.00000000", "Q": "0.00000000",
+    })
+
+
+def available_decoders() -> List[JSONDecoderBase]:
+    decoders = [StdlibJSONDecoder(), UJSONDecoder()]
+    if json_decoder.orjson is not None:
+        decoders.append(OrjsonDecoder())
+    if json_decoder.msgspec is not None:
+        decoders.append(json_decoder.MsgspecDecoder())
+    return decoders
+
+
+def run_benchmark(iterations: int = ITERATIONS) -> Dict[str, Dict[str, float]]:
+    """
+    :returns the average decoding time in microseconds by payload and decoder
+    """
+    payloads = {
+        "depth_update": depth_update_payload(),
+        "trade": trade_payload(),
+        "order_update": order_update_payload(),
+    }
+    results = {}
+    for payload_name, payload in payloads.items():
+        encoded_payload = payload.encode()
+        results[payload_name] = {
+            decoder.name: timeit.timeit(lambda: decoder.loads(encoded_payload), number=iterations) / iterations * 1e6
+            for decoder in available_decoders()
+        }
+    return results
+
+
+def main():
+    for payload_name, timings in run_benchmark().items():
+        baseline = timings[StdlibJSONDecoder.name]
+        print(f"{payload_name}:")
+        for decoder_name, timing in sorted(timings.items(), key=lambda item: item[1]):
+            print(f"  {decoder_name:<8} {timing:8.2f} us  ({baseline / timing:.1f}x vs stdlib)")
+
+
+if __name__ == "__main__":
+    main()
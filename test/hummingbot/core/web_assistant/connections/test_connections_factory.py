@@ -5,6 +5,7 @@ from typing import Awaitable
 from hummingbot.core.web_assistant.connections.connections_factory import (
     ConnectionsFactory
 )
+from hummingbot.core.web_assistant.connections.json_decoder import StdlibJSONDecoder, UJSONDecoder
 from hummingbot.core.web_assistant.connections.rest_connection import (
     RESTConnection
 )
@@ -34,3 +35,16 @@ class ConnectionsFactoryTest(unittest.TestCase):
         rest_connection = self.async_run_with_timeout(factory.get_ws_connection())
 
         self.assertIsInstance(rest_connection, WSConnection)
+
+    def test_get_ws_connection_with_its_own_decoder(self):
+        factory_decoder = StdlibJSONDecoder()
+        connection_decoder = UJSONDecoder()
+        factory = ConnectionsFactory(json_decoder=factory_decoder)
+
+        ws_connection = self.async_run_with_timeout(factory.get_ws_connection(json_decoder=connection_decoder))
+        other_ws_connection = self.async_run_with_timeout(factory.get_ws_connection())
+        rest_connection = self.async_run_with_timeout(factory.get_rest_connection())
+
+        self.assertIs(connection_decoder, ws_connection._json_decoder)
+        self.assertIs(factory_decoder, other_ws_connection._json_decoder)
+        self.assertIs(factory_decoder, rest_connection._json_decoder)
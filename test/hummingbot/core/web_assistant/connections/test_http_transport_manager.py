@@ -0,0 +1,104 @@
+import asyncio
+import unittest
+from types import SimpleNamespace
+from typing import Awaitable
+
+from yarl import URL
+
+from hummingbot.core.web_assistant.connections.connections_factory import ConnectionsFactory
+from hummingbot.core.web_assistant.connections.http_transport_manager import (
+    HTTPTransportManager,
+    HTTPTransportSettings,
+)
+
+
+class HTTPTransportManagerTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.manager = HTTPTransportManager(settings=HTTPTransportSettings(limit=10, limit_per_host=2))
+        HTTPTransportManager._instance = self.manager
+
+    def tearDown(self) -> None:
+        self.async_run_with_timeout(self.manager.close())
+        HTTPTransportManager._instance = None
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    async def _get_session(self, **kwargs):
+        return self.manager.get_session(**kwargs)
+
+    def test_get_instance_returns_singleton(self):
+        self.assertIs(self.manager, HTTPTransportManager.get_instance())
+
+    def test_session_uses_configured_pool_settings(self):
+        session = self.async_run_with_timeout(self._get_session())
+
+        self.assertEqual(10, session.connector.limit)
+        self.assertEqual(2, session.connector.limit_per_host)
+
+    def test_session_with_its_own_pool_settings(self):
+        session = self.async_run_with_timeout(
+            self._get_session(name="gateway", settings=HTTPTransportSettings(limit=0, limit_per_host=0))
+        )
+
+        self.assertEqual(0, session.connector.limit)
+        self.assertEqual(0, session.connector.limit_per_host)
+        self.assertEqual(10, self.async_run_with_timeout(self._get_session()).connector.limit)
+
+    def test_same_session_returned_for_same_name(self):
+        default_session = self.async_run_with_timeout(self._get_session())
+        other_session = self.async_run_with_timeout(self._get_session(name="gateway"))
+
+        self.assertIs(default_session, self.async_run_with_timeout(self._get_session()))
+        self.assertIsNot(default_session, other_session)
+
+    def test_closed_or_reinitialized_session_is_replaced(self):
+        session = self.async_run_with_timeout(self._get_session())
+        self.async_run_with_timeout(session.close())
+
+        new_session = self.async_run_with_timeout(self._get_session())
+        self.assertIsNot(session, new_session)
+
+        reinitialized_session = self.async_run_with_timeout(self._get_session(re_init=True))
+        self.assertIsNot(new_session, reinitialized_session)
+
+    def test_request_metrics_are_collected_per_host(self):
+        params = SimpleNamespace(url=URL("https://test.url/api/endpoint"))
+        first_context, second_context = SimpleNamespace(), SimpleNamespace()
+
+        self.async_run_with_timeout(self.manager._on_request_start(None, first_context, params))
+        self.async_run_with_timeout(self.manager._on_connection_create_end(None, first_context, None))
+        self.async_run_with_timeout(self.manager._on_request_end(None, first_context, None))
+        self.async_run_with_timeout(self.manager._on_request_start(None, second_context, params))
+        self.async_run_with_timeout(self.manager._on_connection_reuseconn(None, second_context, None))
+
+        metrics = self.manager.host_metrics()["test.url"]
+        self.assertEqual(2, metrics.requests_started)
+        self.assertEqual(1, metrics.requests_finished)
+        self.assertEqual(1, metrics.in_flight)
+        self.assertEqual(0.5, metrics.reuse_ratio)
+
+        self.async_run_with_timeout(self.manager._on_request_exception(None, second_context, None))
+
+        host_status = self.manager.pool_status()["hosts"]["test.url"]
+        self.assertEqual(1, host_status["requests_failed"])
+        self.assertEqual(0, host_status["in_flight"])
+
+    def test_connections_factory_uses_shared_transport_when_enabled(self):
+        shared_factory = ConnectionsFactory(use_shared_transport=True)
+        private_factory = ConnectionsFactory()
+
+        shared_session = self.async_run_with_timeout(shared_factory._get_shared_client())
+        private_session = self.async_run_with_timeout(private_factory._get_shared_client())
+
+        self.assertIs(self.async_run_with_timeout(self._get_session()), shared_session)
+        self.assertIsNot(shared_session, private_session)
+        self.async_run_with_timeout(private_session.close())
@@ -0,0 +1,187 @@
+import asyncio
+import json
+import math
+import unittest
+from typing import Any, Awaitable
+from unittest.mock import AsyncMock, patch
+
+import aiohttp
+from aioresponses import aioresponses
+
+from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
+from hummingbot.core.web_assistant.connections import json_decoder
+from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest
+from hummingbot.core.web_assistant.connections.json_decoder import (
+    JSONDecoderBase,
+    JSONPayload,
+    OrjsonDecoder,
+    StdlibJSONDecoder,
+    UJSONDecoder,
+    get_json_decoder,
+    set_json_decoder,
+)
+from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
+from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
+
+
+class TaggingJSONDecoder(JSONDecoderBase):
+    name = "tagging"
+
+    def loads(self, payload: JSONPayload) -> Any:
+        return {"decoded_by": self.name, "payload": json.loads(payload)}
+
+
+class ChannelJSONDecoder(JSONDecoderBase):
+    """Accepts only the messages of the channel, like a decoder with a schema."""
+    name = "channel"
+
+    def loads(self, payload: JSONPayload) -> Any:
+        message = json.loads(payload)
+        if "channel" not in message:
+            raise json.JSONDecodeError("The message does not belong to the channel", payload, 0)
+        return {"decoded_by": self.name, "payload": message}
+
+
+class JSONDecoderTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.default_decoder = get_json_decoder()
+
+    def tearDown(self) -> None:
+        set_json_decoder(self.default_decoder)
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def _available_decoders(self):
+        decoders = [StdlibJSONDecoder(), UJSONDecoder()]
+        if json_decoder.orjson is not None:
+            decoders.append(OrjsonDecoder())
+        if json_decoder.msgspec is not None:
+            decoders.append(json_decoder.MsgspecDecoder())
+        return decoders
+
+    def test_decoders_decode_str_and_bytes_payloads(self):
+        payload = '{"e": "depthUpdate", "b": [["0.0024", "10"]], "u": 160, "x": 1.5, "ok": true, "n": null}'
+        expected = json.loads(payload)
+
+        for decoder in self._available_decoders():
+            self.assertEqual(expected, decoder.loads(payload), decoder.name)
+            self.assertEqual(expected, decoder.loads(payload.encode()), decoder.name)
+
+    def test_decoders_raise_json_decode_error_for_invalid_payloads(self):
+        for decoder in self._available_decoders():
+            with self.assertRaises(json.JSONDecodeError, msg=decoder.name):
+                decoder.loads("not a json")
+
+    def test_default_decoder_falls_back_to_ujson(self):
+        with patch.object(json_decoder, "orjson", None), patch.object(json_decoder, "msgspec", None):
+            decoder = json_decoder.create_default_json_decoder()
+
+        self.assertIsInstance(decoder, UJSONDecoder)
+
+    @patch.object(json_decoder, "ujson", None)
+    @patch.object(json_decoder, "msgspec", None)
+    @patch.object(json_decoder, "orjson", None)
+    def test_default_decoder_falls_back_to_stdlib(self):
+        decoder = json_decoder.create_default_json_decoder()
+
+        self.assertIsInstance(decoder, StdlibJSONDecoder)
+
+    @unittest.skipIf(json_decoder.orjson is None, "orjson is not installed")
+    def test_orjson_decoder_falls_back_to_stdlib_for_unsupported_documents(self):
+        self.assertEqual([float("inf")], OrjsonDecoder().loads("[Infinity]"))
+        self.assertTrue(math.isnan(OrjsonDecoder().loads(b"[NaN]")[0]))
+
+    @unittest.skipIf(json_decoder.orjson is None, "orjson is not installed")
+    def test_orjson_decoder_does_not_parse_invalid_documents_twice(self):
+        with patch.object(json_decoder.json, "loads") as stdlib_loads_mock:
+            with self.assertRaises(json.JSONDecodeError):
+                OrjsonDecoder().loads("not a json")
+
+        stdlib_loads_mock.assert_not_called()
+
+    @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_ws_connection_uses_configured_decoder(self, ws_connect_mock):
+        mocking_assistant = NetworkMockingAssistant()
+        ws_connect_mock.return_value = mocking_assistant.create_websocket_mock()
+        client_session = aiohttp.ClientSession(loop=self.ev_loop)
+        set_json_decoder(TaggingJSONDecoder())
+        connection = WSConnection(client_session)
+        self.async_run_with_timeout(connection.connect("ws://some/url"))
+        mocking_assistant.add_websocket_aiohttp_message(ws_connect_mock.return_value, message='{"one": 1}')
+        mocking_assistant.add_websocket_aiohttp_message(ws_connect_mock.return_value, message="not a json")
+
+        response = self.async_run_with_timeout(connection.receive())
+        self.assertEqual({"decoded_by": "tagging", "payload": {"one": 1}}, response.data)
+
+        response = self.async_run_with_timeout(connection.receive())
+        self.assertEqual("not a json", response.data)
+
+        self.async_run_with_timeout(connection.disconnect())
+        self.async_run_with_timeout(client_session.close())
+
+    @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_ws_connection_decodes_messages_rejected_by_its_decoder_with_default_decoder(self, ws_connect_mock):
+        mocking_assistant = NetworkMockingAssistant()
+        ws_connect_mock.return_value = mocking_assistant.create_websocket_mock()
+        client_session = aiohttp.ClientSession(loop=self.ev_loop)
+        set_json_decoder(TaggingJSONDecoder())
+        connection = WSConnection(client_session, json_decoder=ChannelJSONDecoder())
+        self.async_run_with_timeout(connection.connect("ws://some/url"))
+        mocking_assistant.add_websocket_aiohttp_message(ws_connect_mock.return_value, message='{"channel": "trades"}')
+        mocking_assistant.add_websocket_aiohttp_message(ws_connect_mock.return_value, message='{"event": "pong"}')
+        mocking_assistant.add_websocket_aiohttp_message(ws_connect_mock.return_value, message="pong")
+
+        with self.assertLogs("hummingbot.core.web_assistant.connections.ws_connection", level="DEBUG") as logs:
+            response = self.async_run_with_timeout(connection.receive())
+            self.assertEqual({"decoded_by": "channel", "payload": {"channel": "trades"}}, response.data)
+
+            response = self.async_run_with_timeout(connection.receive())
+            self.assertEqual({"decoded_by": "tagging", "payload": {"event": "pong"}}, response.data)
+
+            response = self.async_run_with_timeout(connection.receive())
+            self.assertEqual("pong", response.data)
+
+        self.assertTrue(any("not a JSON document: pong" in line for line in logs.output))
+
+        self.async_run_with_timeout(connection.disconnect())
+        self.async_run_with_timeout(client_session.close())
+
+    @aioresponses()
+    def test_rest_connection_uses_connection_decoder(self, mocked_api):
+        url = "https://www.test.com/url"
+        mocked_api.get(url, body='{"one": 1}', content_type="application/json")
+        mocked_api.get(url, body="", content_type="application/json")
+        client_session = aiohttp.ClientSession(loop=self.ev_loop)
+        connection = RESTConnection(client_session, json_decoder=TaggingJSONDecoder())
+        request = RESTRequest(method=RESTMethod.GET, url=url)
+
+        response = self.async_run_with_timeout(connection.call(request))
+        self.assertEqual({"decoded_by": "tagging", "payload": {"one": 1}}, self.async_run_with_timeout(response.json()))
+
+        response = self.async_run_with_timeout(connection.call(request))
+        self.assertIsNone(self.async_run_with_timeout(response.json()))
+
+        self.async_run_with_timeout(client_session.close())
+
+    @aioresponses()
+    def test_rest_response_with_non_json_content_type_raises_content_type_error(self, mocked_api):
+        url = "https://www.test.com/url"
+        mocked_api.get(url, body="<html></html>", content_type="text/html")
+        client_session = aiohttp.ClientSession(loop=self.ev_loop)
+        connection = RESTConnection(client_session)
+        request = RESTRequest(method=RESTMethod.GET, url=url)
+
+        response = self.async_run_with_timeout(connection.call(request))
+        with self.assertRaises(aiohttp.ContentTypeError):
+            self.async_run_with_timeout(response.json())
+
+        self.async_run_with_timeout(client_session.close())
@@ -8,11 +8,13 @@ from collections import deque
 from typing import Awaitable
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import numpy as np
 import pandas as pd
 from aioresponses import aioresponses
 
 from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
 from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.data_types import HistoricalCandlesConfig
 
 
 class TestCandlesBase(unittest.TestCase, ABC):
@@ -174,6 +176,28 @@ class TestCandlesBase(unittest.TestCase, ABC):
         self.assertEqual(resp.shape[0], len(self.get_fetch_candles_data_mock()))
         self.assertEqual(resp.shape[1], 10)
 
+    def test_get_historical_candles_merges_concurrent_pages(self):
+        interval = self.data_feed.interval_in_seconds
+        page_size = self.data_feed.candles_max_result_per_rest_request - 1
+        start_time = interval * 10 ** 6
+        end_time = start_time + interval * (2 * page_size + 5)
+
+        async def fetch_candles(end_time: int, limit: int):
+            timestamps = np.arange(end_time - limit * interval, end_time + interval, interval)
+            return np.column_stack([timestamps] + [np.ones(len(timestamps))] * 9).astype(float)
+
+        progress = []
+        self.data_feed.initialize_exchange_data = AsyncMock()
+        self.data_feed.fetch_candles = AsyncMock(side_effect=fetch_candles)
+        candles_df = self.async_run_with_timeout(self.data_feed.get_historical_candles(
+            config=HistoricalCandlesConfig(connector_name=self.data_feed.name, trading_pair=self.trading_pair,
+                                           interval=self.interval, start_time=start_time, end_time=end_time),
+            progress_callback=lambda fetched, total: progress.append((fetched, total))))
+
+        self.assertEqual(3, self.data_feed.fetch_candles.call_count)
+        self.assertEqual([(1, 3), (2, 3), (3, 3)], progress)
+        self.assertEqual(list(range(start_time, end_time + interval, interval)), candles_df["timestamp"].tolist())
+
     @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
     def test_listen_for_subscriptions_subscribes_to_klines(self, ws_connect_mock):
         ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
@@ -0,0 +1,61 @@
+import unittest
+
+from hummingbot.data_feed.liquidations_feed.liquidations_base import Liquidation, LiquidationSide, LiquidationsStore
+
+
+class LiquidationsStoreTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.trading_pair = "BTC-USDT"
+        self.store = LiquidationsStore(trading_pair=self.trading_pair, initial_capacity=4)
+
+    def _add(self, timestamp: int, quantity: float, price: float, side: LiquidationSide):
+        self.store.append(Liquidation(timestamp=timestamp,
+                                      trading_pair=self.trading_pair,
+                                      quantity=quantity,
+                                      price=price,
+                                      side=side))
+
+    def test_expire_drops_old_liquidations(self):
+        self._add(1000, 1, 10, LiquidationSide.LONG)
+        self._add(2000, 2, 10, LiquidationSide.SHORT)
+        self._add(3000, 3, 10, LiquidationSide.LONG)
+
+        self.store.expire(cutoff_timestamp=2000)
+
+        self.assertEqual(1, len(self.store))
+        df = self.store.liquidations_df()
+        self.assertEqual([3000], df["timestamp"].tolist())
+        self.assertEqual(LiquidationSide.LONG, df["side"][0])
+        self.assertEqual(self.trading_pair, df["trading_pair"][0])
+
+    def test_liquidations_df_is_cached_until_the_store_changes(self):
+        self._add(1000, 1, 10, LiquidationSide.LONG)
+        df = self.store.liquidations_df()
+
+        self.assertIs(df, self.store.liquidations_df())
+
+        self._add(2000, 1, 10, LiquidationSide.LONG)
+
+        self.assertIsNot(df, self.store.liquidations_df())
+        self.assertEqual(2, len(self.store.liquidations_df()))
+
+    def test_liquidated_notional_per_side_and_window(self):
+        self._add(1000, 1, 10, LiquidationSide.LONG)
+        self._add(2000, 2, 10, LiquidationSide.SHORT)
+        self._add(3000, 3, 10, LiquidationSide.LONG)
+
+        self.assertEqual(40.0, self.store.liquidated_notional(side=LiquidationSide.LONG, since_timestamp=0))
+        self.assertEqual(30.0, self.store.liquidated_notional(side=LiquidationSide.LONG, since_timestamp=1500))
+        self.assertEqual(20.0, self.store.liquidated_notional(side=LiquidationSide.SHORT, since_timestamp=1500))
+        self.assertEqual(0.0, self.store.liquidated_notional(side=LiquidationSide.SHORT, since_timestamp=2500))
+
+    def test_compaction_keeps_live_liquidations_and_statistics(self):
+        for timestamp in range(1, 11):
+            self._add(timestamp * 1000, 1, 10, LiquidationSide.LONG)
+            self.store.expire(cutoff_timestamp=(timestamp - 3) * 1000)
+
+        self.assertEqual(3, len(self.store))
+        self.assertEqual([8000, 9000, 10000], self.store.liquidations_df()["timestamp"].tolist())
+        self.assertEqual(30.0, self.store.liquidated_notional(side=LiquidationSide.LONG, since_timestamp=0))
+        self.assertEqual(20.0, self.store.liquidated_notional(side=LiquidationSide.LONG, since_timestamp=8500))
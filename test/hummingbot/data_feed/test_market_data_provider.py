@@ -1,9 +1,11 @@
 import unittest
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pandas as pd
 
 from hummingbot.core.data_type.common import PriceType
+from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
 from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
@@ -90,6 +92,20 @@ class TestMarketDataProvider(unittest.TestCase):
         result = self.provider.get_vwap_for_volume("mock_connector", "BTC-USDT", 1, True)
         self.assertIsInstance(result, OrderBookQueryResult)
 
+    def test_get_depth_aggregations(self):
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(np.array([[99.95, 1, 1], [99.85, 2, 1]], dtype=np.float64),
+                                        np.array([[100.05, 3, 1]], dtype=np.float64))
+        self.mock_connector.get_order_book.return_value = order_book
+
+        bids, asks = self.provider.get_depth_buckets("mock_connector", "BTC-USDT", 10, 2)
+        self.assertEqual([1, 2], bids.tolist())
+        self.assertEqual([3, 0], asks.tolist())
+        bids, asks = self.provider.get_cumulative_depth("mock_connector", "BTC-USDT", [10, 20])
+        self.assertEqual([1, 3], bids.tolist())
+        self.assertEqual([3, 3], asks.tolist())
+        self.assertEqual(-0.5, self.provider.get_order_book_imbalance("mock_connector", "BTC-USDT", 1))
+
     def test_stop_candle_feed(self):
         # Mocking a candle feed
         mock_candles_feed = MagicMock()
@@ -118,3 +134,34 @@ class TestMarketDataProvider(unittest.TestCase):
         self.mock_connector.ready = True
         mock_candles_feed.ready = False
         self.assertFalse(self.provider.ready)
+
+    def test_market_snapshot_reads_each_value_once_per_tick(self):
+        self.mock_connector.get_price_by_type.return_value = 10000
+        snapshot = self.provider.update_market_snapshot(timestamp=1234)
+
+        self.assertEqual(1234, snapshot.timestamp)
+        self.assertIs(snapshot, self.provider.market_snapshot)
+        self.assertEqual(10000, snapshot.get_price_by_type("mock_connector", "BTC-USDT", PriceType.MidPrice))
+        self.mock_connector.get_price_by_type.return_value = 10001
+        self.assertEqual(10000, snapshot.get_price_by_type("mock_connector", "BTC-USDT", PriceType.MidPrice))
+        self.mock_connector.get_price_by_type.assert_called_once_with("BTC-USDT", PriceType.MidPrice)
+
+        new_snapshot = self.provider.update_market_snapshot(timestamp=1235)
+        self.assertEqual(10001, new_snapshot.get_price_by_type("mock_connector", "BTC-USDT", PriceType.MidPrice))
+
+    def test_market_snapshot_memoizes_derived_values(self):
+        mock_order_book = MagicMock()
+        mock_order_book.get_price_for_volume.return_value = OrderBookQueryResult(100, 2, 100, 2)
+        self.mock_connector.get_order_book.return_value = mock_order_book
+        self.mock_connector.get_price_by_type.side_effect = lambda trading_pair, price_type: {
+            PriceType.BestBid: 99, PriceType.BestAsk: 101, PriceType.MidPrice: 100}[price_type]
+        snapshot = self.provider.market_snapshot
+
+        top_of_book = snapshot.get_top_of_book("mock_connector", "BTC-USDT")
+        self.assertEqual((99, 101, 100), top_of_book)
+        snapshot.get_price_for_volume("mock_connector", "BTC-USDT", 2, True)
+        result = snapshot.get_price_for_volume("mock_connector", "BTC-USDT", 2, True)
+
+        self.assertEqual(100, result.result_price)
+        mock_order_book.get_price_for_volume.assert_called_once_with(True, 2)
+        self.assertEqual(3, self.mock_connector.get_price_by_type.call_count)
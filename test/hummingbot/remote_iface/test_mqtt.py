@@ -1,4 +1,7 @@
 import asyncio
+import base64
+import json
+import zlib
 from decimal import Decimal
 from typing import Awaitable
 from unittest import TestCase
@@ -827,6 +830,27 @@ class RemoteIfaceMQTTTests(TestCase):
         self.assertTrue(self.is_msg_received(topic, msg, msg_key='data'))
         self.hbapp.strategy = None
 
+    @patch("hummingbot.client.command.status_command.StatusCommand.strategy_status", new_callable=AsyncMock)
+    def test_mqtt_command_status_includes_portfolio_ledger_snapshot(
+        self,
+        strategy_status_mock: AsyncMock
+    ):
+        strategy_status_mock.side_effect = self._create_exception_and_unlock_test_with_event_async
+        snapshot = {"binance:HBOT-USDT": {"position_side": "BOTH", "amount": "1"}}
+        strategy = MagicMock()
+        strategy.portfolio_ledger.snapshot.return_value = snapshot
+        self.hbapp.strategy = strategy
+        self.start_mqtt()
+        self.fake_mqtt_broker.publish_to_subscription(
+            self.get_topic_for(self.STATUS_URI),
+            {'async_backend': 1}
+        )
+        topic = f"test_reply/hbot/{self.instance_id}/status"
+        msg = {'status': 200, 'msg': '', 'data': snapshot}
+        self.async_run_with_timeout(self.wait_for_rcv(topic, msg, msg_key='data'), timeout=10)
+        self.assertTrue(self.is_msg_received(topic, msg, msg_key='data'))
+        self.hbapp.strategy = None
+
     @patch("hummingbot.client.command.status_command.StatusCommand.strategy_status", new_callable=AsyncMock)
     def test_mqtt_command_status_sync(
         self,
@@ -966,6 +990,38 @@ class RemoteIfaceMQTTTests(TestCase):
         self.async_run_with_timeout(self.wait_for_rcv(events_topic, evt_type, msg_key = 'type'), timeout=10)
         self.assertTrue(self.is_msg_received(events_topic, evt_type, msg_key = 'type'))
 
+    def test_mqtt_event_batch_forwarding(self):
+        self.client_config_map.mqtt_bridge.mqtt_events_batch_interval = 0.1
+        self.start_mqtt()
+
+        self.emit_order_expired_event(self.test_market)
+        self.emit_order_expired_event(self.test_market)
+
+        batch_topic = f"hbot/{self.instance_id}/events/batch"
+
+        self.async_run_with_timeout(self.wait_for_rcv(batch_topic, 2, msg_key='count'), timeout=10)
+        batch_msg = self.fake_mqtt_broker.received_msgs[batch_topic][0]
+        self.assertEqual("json", batch_msg["encoding"])
+        self.assertEqual(["OrderExpired", "OrderExpired"], [event["type"] for event in batch_msg["events"]])
+        self.assertFalse(self.is_msg_received(f"hbot/{self.instance_id}/events"))
+
+    def test_mqtt_event_batch_forwarding_flushes_on_batch_size(self):
+        self.client_config_map.mqtt_bridge.mqtt_events_batch_interval = 60
+        self.client_config_map.mqtt_bridge.mqtt_events_batch_size = 2
+        self.client_config_map.mqtt_bridge.mqtt_events_batch_compression = True
+        self.start_mqtt()
+
+        self.emit_order_expired_event(self.test_market)
+        self.emit_order_expired_event(self.test_market)
+
+        batch_topic = f"hbot/{self.instance_id}/events/batch"
+
+        self.async_run_with_timeout(self.wait_for_rcv(batch_topic, 2, msg_key='count'), timeout=10)
+        batch_msg = self.fake_mqtt_broker.received_msgs[batch_topic][0]
+        self.assertEqual("zlib+base64", batch_msg["encoding"])
+        events = json.loads(zlib.decompress(base64.b64decode(batch_msg["payload"])))
+        self.assertEqual(["OrderExpired", "OrderExpired"], [event["type"] for event in events])
+
     def test_mqtt_subscribed_topics(self):
         self.start_mqtt()
         self.assertTrue(self.gateway is not None)
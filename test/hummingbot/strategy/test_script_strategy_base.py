@@ -10,7 +10,7 @@ from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import Quant
 from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
 from hummingbot.core.clock import Clock
 from hummingbot.core.clock_mode import ClockMode
-from hummingbot.core.event.events import OrderType
+from hummingbot.core.event.events import MarketEvent, OrderType
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 
@@ -126,6 +126,26 @@ class ScriptStrategyBaseTest(unittest.TestCase):
         self.assertTrue(expected_status in self.strategy.format_status())
         self.assertTrue("mock_paper_exchange HBOT-USDT sell    110     1.1 " in self.strategy.format_status())
 
+    def test_format_status_shows_ledger_positions(self):
+        self.clock.add_iterator(self.strategy)
+        self.clock.backtest_til(self.start_timestamp + self.clock_tick_size)
+        self.strategy.buy(self.connector_name, self.trading_pair, Decimal("1"), OrderType.MARKET)
+        self.clock.backtest_til(self.start_timestamp + self.clock_tick_size * 2)
+
+        self.assertEqual(Decimal("1"), self.strategy.portfolio_ledger.position(self.connector_name,
+                                                                               self.trading_pair).amount)
+        status = self.strategy.format_status()
+        self.assertIn("  Positions:", status)
+        self.assertIn("mock_paper_exchange HBOT-USDT BOTH", status)
+
+    def test_stop_stops_the_portfolio_ledger(self):
+        fill_forwarder = self.strategy.portfolio_ledger._fill_forwarders[self.connector_name]
+        self.assertIn(fill_forwarder, self.connector.get_listeners(MarketEvent.OrderFilled))
+
+        self.strategy.stop(self.clock)
+
+        self.assertNotIn(fill_forwarder, self.connector.get_listeners(MarketEvent.OrderFilled))
+
     def test_cancel_buy_order(self):
         self.clock.add_iterator(self.strategy)
         self.clock.backtest_til(self.start_timestamp)
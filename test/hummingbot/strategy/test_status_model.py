@@ -0,0 +1,54 @@
+import unittest
+
+from hummingbot.strategy.status_model import StatusModel
+
+
+class StatusModelTest(unittest.TestCase):
+    def test_section_version_changes_only_with_new_values(self):
+        model = StatusModel()
+        section = model.section("Orders", columns=["Market", "Side", "Price"])
+
+        section.set_row("order1", ["ETH-USDT", "buy", 100])
+        version = section.version
+        section.set_row("order1", ["ETH-USDT", "buy", 100])
+        self.assertEqual(version, section.version)
+
+        section.set_row("order1", ["ETH-USDT", "buy", 101])
+        self.assertEqual(version + 1, section.version)
+        self.assertEqual([("ETH-USDT", "buy", 101)], section.rows)
+
+        section.set_field("Spread", "1%")
+        section.set_field("Spread", "1%")
+        self.assertEqual(version + 2, section.version)
+
+    def test_set_rows_replaces_rows(self):
+        section = StatusModel().section("Orders", columns=["Market", "Side"])
+        section.set_rows({"order1": ["ETH-USDT", "buy"], "order2": ["ETH-USDT", "sell"]})
+        version = section.version
+
+        section.set_rows({"order2": ["ETH-USDT", "sell"], "order3": ["BTC-USDT", "buy"]})
+
+        self.assertEqual([("ETH-USDT", "sell"), ("BTC-USDT", "buy")], section.rows)
+        self.assertEqual(version + 2, section.version)
+
+    def test_set_row_with_wrong_number_of_values_fails(self):
+        section = StatusModel().section("Orders", columns=["Market", "Side"])
+
+        with self.assertRaises(ValueError):
+            section.set_row("order1", ["ETH-USDT"])
+
+    def test_model_version_changes_with_sections(self):
+        model = StatusModel()
+        self.assertTrue(model.is_empty())
+
+        section = model.section("Balances")
+        self.assertIs(section, model.section("Balances"))
+        version = model.version
+
+        section.set_field("USDT", 100)
+        self.assertNotEqual(version, model.version)
+        version = model.version
+
+        model.remove_section("Balances")
+        model.section("Balances").set_field("USDT", 100)
+        self.assertNotEqual(version, model.version)
@@ -0,0 +1,80 @@
+"""
+Compares the RingBuffer statistics with the previous implementation, which rebuilt an ordered copy of the buffer (using
+a fancy index array) on every read.
+
+Run from the repository root with:
+    python -m test.hummingbot.strategy.utils.ring_buffer_benchmark
+"""
+import timeit
+from typing import Dict
+
+import numpy as np
+
+from hummingbot.strategy.__utils__.ring_buffer import RingBuffer
+
+ITERATIONS = 2000
+LENGTHS = (30, 1_000, 30_000)
+
+
+class PreviousRingBuffer:
+    def __init__(self, length: int):
+        self._length = length
+        self._buffer = np.zeros(length, dtype=np.float64)
+        self._delimiter = 0
+        self._is_full = False
+
+    def add_value(self, val: float):
+        self._buffer[self._delimiter] = val
+        self._delimiter = (self._delimiter + 1) % self._length
+        if not self._is_full and self._delimiter == 0:
+            self._is_full = True
+
+    def get_as_numpy_array(self) -> np.ndarray:
+        if not self._is_full:
+            indexes = np.arange(0, stop=self._delimiter)
+        else:
+            indexes = np.arange(self._delimiter, stop=self._delimiter + self._length) % self._length
+        return self._buffer[indexes]
+
+    @property
+    def mean_value(self) -> float:
+        return np.mean(self.get_as_numpy_array()) if self._is_full else np.nan
+
+    @property
+    def std_dev(self) -> float:
+        return np.std(self.get_as_numpy_array()) if self._is_full else np.nan
+
+
+def tick(buffer, value: float):
+    buffer.add_value(value)
+    return buffer.mean_value, buffer.std_dev
+
+
+def run_benchmark(iterations: int = ITERATIONS) -> Dict[int, Dict[str, float]]:
+    """
+    :returns the average time in microseconds of adding a value and reading the mean and standard deviation, by buffer
+    length and implementation
+    """
+    results = {}
+    values = np.random.default_rng(0).normal(100, 1, iterations)
+    for length in LENGTHS:
+        results[length] = {}
+        for name, buffer_class in (("previous", PreviousRingBuffer), ("current", RingBuffer)):
+            buffer = buffer_class(length)
+            for value in np.random.default_rng(1).normal(100, 1, length):
+                buffer.add_value(value)
+            values_iterator = iter(values)
+            elapsed = timeit.timeit(lambda: tick(buffer, next(values_iterator)), number=iterations)
+            results[length][name] = elapsed / iterations * 1e6
+    return results
+
+
+def main():
+    for length, timings in run_benchmark().items():
+        print(f"length {length}:")
+        for name, timing in timings.items():
+            print(f"  {name:<8} {timing:10.2f} us  ({timings['previous'] / timing:.1f}x vs previous)")
+
+
+if __name__ == "__main__":
+    main()
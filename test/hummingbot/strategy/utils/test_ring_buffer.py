@@ -107,3 +107,71 @@ class RingBufferTest(unittest.TestCase):
         self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.array([0, 1, 2, 3])))
         buffer.add_value(4)
         self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.array([1, 2, 3, 4])))
+
+    def test_running_statistics_match_buffer_content(self):
+        buffer = RingBuffer(7)
+        values = np.random.default_rng(42).normal(100, 5, 50)
+        for value in values:
+            buffer.add_value(value)
+            if buffer.is_full:
+                content = buffer.get_as_numpy_array()
+                self.assertAlmostEqual(np.mean(content), buffer.mean_value, places=9)
+                self.assertAlmostEqual(np.var(content), buffer.variance, places=9)
+                self.assertAlmostEqual(np.std(content), buffer.std_dev, places=9)
+
+    def test_running_statistics_recover_after_nan_leaves_buffer(self):
+        buffer = RingBuffer(3)
+        for value in [1, np.nan, 2, 3]:
+            buffer.add_value(value)
+        self.assertTrue(np.isnan(buffer.mean_value))
+
+        buffer.add_value(4)
+        self.assertEqual(3, buffer.mean_value)
+        self.assertAlmostEqual(2 / 3, buffer.variance)
+
+    def test_segments(self):
+        buffer = RingBuffer(4)
+        older, newer = buffer.get_segments()
+        self.assertEqual(0, older.size + newer.size)
+
+        for i in range(6):
+            buffer.add_value(i)
+
+        older, newer = buffer.get_segments()
+        self.assertTrue(np.array_equal(older, np.array([2, 3])))
+        self.assertTrue(np.array_equal(newer, np.array([4, 5])))
+        self.assertFalse(older.flags.writeable)
+        self.assertEqual(4, buffer.size)
+        self.assertEqual(4, len(buffer))
+
+    def test_numpy_array_is_a_copy(self):
+        buffer = RingBuffer(3)
+        for i in range(3):
+            buffer.add_value(i)
+
+        values = buffer.get_as_numpy_array()
+        buffer.add_value(10)
+
+        self.assertTrue(np.array_equal(values, np.array([0, 1, 2])))
+
+    def test_long_buffer(self):
+        length = 100_000
+        buffer = RingBuffer(length)
+        for i in range(length + 10):
+            buffer.add_value(i)
+
+        values = buffer.get_as_numpy_array()
+        self.assertEqual(length, values.size)
+        self.assertEqual(10, values[0])
+        self.assertEqual(length + 9, values[-1])
+        self.assertEqual(length + 9, buffer.get_last_value())
+        self.assertAlmostEqual(np.mean(values), buffer.mean_value)
+
+    def test_change_length(self):
+        for i in range(6):
+            self.buffer.add_value(i)
+
+        self.buffer.length = 4
+
+        self.assertTrue(np.array_equal(self.buffer.get_as_numpy_array(), np.array([2, 3, 4, 5])))
+        self.assertEqual(3.5, self.buffer.mean_value)
@@ -259,3 +259,46 @@ class TradingIntensityTest(unittest.TestCase):
 
         self.assertAlmostEqual(a, alpha, 10)
         self.assertAlmostEqual(b, kappa, 10)
+
+    def register_exponential_trades(self, indicator: TradingIntensityIndicator, timestamp: float, a: float, b: float):
+        for price_level in [1, 2, 3, 4]:
+            indicator.register_trade(OrderBookTradeEvent(
+                trading_pair="COINALPHAHBOT",
+                timestamp=timestamp,
+                price=self.initial_mid_price + price_level,
+                amount=a * np.exp(-b * price_level),
+                type=TradeType.BUY,
+            ))
+
+    def test_oldest_samples_leave_the_estimation(self):
+        indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 2)
+        timestamp = self.start_timestamp
+        for a, b in [(5, 0.5), (2, 0.1), (2, 0.1)]:
+            indicator.calculate(timestamp)
+            self.register_exponential_trades(indicator, timestamp + 0.5, a, b)
+            timestamp += 1
+        indicator.calculate(timestamp)
+
+        self.assertTrue(indicator.is_sampling_buffer_full)
+        alpha, kappa = indicator.current_value
+        # Both samples in the window have the same trades, the amounts are doubled
+        self.assertAlmostEqual(4, alpha, 10)
+        self.assertAlmostEqual(0.1, kappa, 10)
+        # Only the quote before the last trades and the newer ones are kept
+        self.assertEqual(2, len(indicator.last_quotes))
+
+    def test_refit_is_throttled(self):
+        indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 1, min_refit_interval=10)
+        timestamp = self.start_timestamp
+        indicator.calculate(timestamp)
+        self.register_exponential_trades(indicator, timestamp + 0.5, 2, 0.1)
+        indicator.calculate(timestamp + 1)
+        self.assertAlmostEqual(2, indicator.current_value[0], 10)
+
+        self.register_exponential_trades(indicator, timestamp + 1.5, 3, 0.2)
+        indicator.calculate(timestamp + 2)
+        self.assertAlmostEqual(2, indicator.current_value[0], 10)
+
+        indicator.calculate(timestamp + 11)
+        self.assertAlmostEqual(3, indicator.current_value[0], 10)
+        self.assertAlmostEqual(0.2, indicator.current_value[1], 10)
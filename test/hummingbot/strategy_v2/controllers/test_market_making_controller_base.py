@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 from hummingbot.core.data_type.common import OrderType, PositionMode, TradeType
 from hummingbot.data_feed.market_data_provider import MarketDataProvider
+from hummingbot.data_feed.market_snapshot import MarketSnapshot
 from hummingbot.strategy_v2.controllers.market_making_controller_base import (
     MarketMakingControllerBase,
     MarketMakingControllerConfigBase,
@@ -35,6 +36,7 @@ class TestMarketMakingControllerBase(IsolatedAsyncioWrapperTestCase):
 
         # Mocking dependencies
         self.mock_market_data_provider = MagicMock(spec=MarketDataProvider)
+        self.mock_market_data_provider.market_snapshot = MarketSnapshot(self.mock_market_data_provider, 1234)
         self.mock_actions_queue = AsyncMock(spec=asyncio.Queue)
 
         # Instantiating the MarketMakingControllerBase
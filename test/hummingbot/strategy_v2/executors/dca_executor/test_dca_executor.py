@@ -472,6 +472,29 @@ class TestDCAExecutor(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
         await executor.control_task()
         self.assertEqual(executor.active_close_orders[0].order_id, "OID-SELL-1")
 
+    @patch.object(DCAExecutor, "get_net_pnl_pct")
+    @patch.object(DCAExecutor, "get_price", MagicMock(return_value=Decimal("100")))
+    def test_trailing_stop_trigger_update_refreshes_executor_info(self, get_net_pnl_pct_mock):
+        config = DCAExecutorConfig(id="test", timestamp=123, side=TradeType.BUY, connector_name="binance",
+                                   trading_pair="ETH-USDT",
+                                   amounts_quote=[Decimal(10), Decimal(20)],
+                                   prices=[Decimal(100), Decimal(90)],
+                                   trailing_stop=TrailingStop(activation_price=Decimal("0.05"),
+                                                              trailing_delta=Decimal("0.01")))
+        executor = self.get_dca_executor_from_config(config)
+        executor._status = RunnableStatus.RUNNING
+        get_net_pnl_pct_mock.return_value = Decimal("0.04")
+        self.assertIsNone(executor.executor_info.custom_info["trailing_stop_trigger_pct"])
+
+        # The price does not move, only the trailing stop trigger changes
+        get_net_pnl_pct_mock.return_value = Decimal("0.06")
+        executor.control_trailing_stop()
+        self.assertEqual(Decimal("0.05"), executor.executor_info.custom_info["trailing_stop_trigger_pct"])
+
+        get_net_pnl_pct_mock.return_value = Decimal("0.07")
+        executor.control_trailing_stop()
+        self.assertEqual(Decimal("0.06"), executor.executor_info.custom_info["trailing_stop_trigger_pct"])
+
     def test_process_order_failed_event_open_order(self):
         config = DCAExecutorConfig(id="test", timestamp=123, side=TradeType.BUY, connector_name="binance",
                                    trading_pair="ETH-USDT",
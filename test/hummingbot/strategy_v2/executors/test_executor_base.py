@@ -19,6 +19,7 @@ from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 from hummingbot.strategy_v2.executors.data_types import ExecutorConfigBase
 from hummingbot.strategy_v2.executors.executor_base import ExecutorBase
 from hummingbot.strategy_v2.models.base import RunnableStatus
+from hummingbot.strategy_v2.models.executors import CloseType
 
 
 class TestExecutorBase(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
@@ -162,6 +163,47 @@ class TestExecutorBase(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
         executor_info = self.component.executor_info
         self.assertEqual(executor_info.id, "test")
 
+    @patch.object(ExecutorBase, "get_net_pnl_pct")
+    @patch.object(ExecutorBase, "get_net_pnl_quote")
+    @patch.object(ExecutorBase, "get_cum_fees_quote")
+    def test_executor_info_is_cached_until_state_changes(self, cum_fees_quote_mock, net_pnl_quote_mock,
+                                                         net_pnl_pct_mock):
+        net_pnl_pct_mock.return_value = Decimal("0.01")
+        net_pnl_quote_mock.return_value = Decimal("1.0")
+        cum_fees_quote_mock.return_value = Decimal("0.1")
+        self.component._status = RunnableStatus.TERMINATED
+
+        executor_info = self.component.executor_info
+        self.assertIs(executor_info, self.component.executor_info)
+        self.assertEqual(1, net_pnl_quote_mock.call_count)
+
+        self.component._fill_order_forwarder(MagicMock())
+        self.assertIsNot(executor_info, self.component.executor_info)
+        self.assertEqual(1, self.component.executor_info_version)
+
+        executor_info = self.component.executor_info
+        self.component.close_type = CloseType.EARLY_STOP
+        self.assertIsNot(executor_info, self.component.executor_info)
+
+    @patch.object(ExecutorBase, "get_net_pnl_pct")
+    @patch.object(ExecutorBase, "get_net_pnl_quote")
+    @patch.object(ExecutorBase, "get_cum_fees_quote")
+    @patch.object(ExecutorBase, "get_executor_info_reference_price")
+    def test_active_executor_info_refreshed_on_reference_price_change(self, reference_price_mock, cum_fees_quote_mock,
+                                                                      net_pnl_quote_mock, net_pnl_pct_mock):
+        net_pnl_pct_mock.return_value = Decimal("0.01")
+        net_pnl_quote_mock.return_value = Decimal("1.0")
+        cum_fees_quote_mock.return_value = Decimal("0.1")
+        reference_price_mock.return_value = Decimal("1000")
+        self.component._status = RunnableStatus.RUNNING
+
+        executor_info = self.component.executor_info
+        reference_price_mock.return_value = Decimal("1000.01")
+        self.assertIs(executor_info, self.component.executor_info)
+
+        reference_price_mock.return_value = Decimal("1001")
+        self.assertIsNot(executor_info, self.component.executor_info)
+
     def test_get_price_by_type(self):
         price = self.component.get_price("connector1", "EHT-USDT", PriceType.MidPrice)
         self.assertEqual(price, Decimal("1000.0"))
@@ -102,6 +102,37 @@ class TestExecutorOrchestrator(unittest.TestCase):
         self.orchestrator.execute_actions(actions)
         self.assertEqual(len(self.orchestrator.executors["test"]), 0)
 
+    def test_get_executors_report_reuses_unchanged_controller_views(self):
+        config = PositionExecutorConfig(
+            timestamp=1234, trading_pair="ETH-USDT", connector_name="binance",
+            side=TradeType.BUY, amount=Decimal(10), entry_price=Decimal(100),
+        )
+
+        def executor_info(executor_id: str) -> ExecutorInfo:
+            return ExecutorInfo(
+                id=executor_id, timestamp=1234, type="position_executor",
+                status=RunnableStatus.TERMINATED, config=config,
+                filled_amount_quote=Decimal(0), net_pnl_quote=Decimal(0), net_pnl_pct=Decimal(0),
+                cum_fees_quote=Decimal(0), is_trading=False, is_active=False, custom_info={}
+            )
+
+        first_executor = MagicMock(spec=PositionExecutor)
+        first_executor.executor_info = executor_info("1")
+        second_executor = MagicMock(spec=PositionExecutor)
+        second_executor.executor_info = executor_info("2")
+        self.orchestrator.executors["controller_1"] = [first_executor]
+        self.orchestrator.executors["controller_2"] = [second_executor]
+
+        report = self.orchestrator.get_executors_report()
+        second_report = self.orchestrator.get_executors_report()
+        self.assertIs(report["controller_1"], second_report["controller_1"])
+        self.assertIs(report["controller_2"], second_report["controller_2"])
+
+        second_executor.executor_info = executor_info("2")
+        third_report = self.orchestrator.get_executors_report()
+        self.assertIs(report["controller_1"], third_report["controller_1"])
+        self.assertIsNot(report["controller_2"], third_report["controller_2"])
+
     @patch('hummingbot.connector.markets_recorder.MarketsRecorder.get_instance')
     def test_generate_performance_report(self, mock_get_instance):
         # Create a mock for MarketsRecorder and its get_executors_by_controller method
@@ -148,6 +179,43 @@ class TestExecutorOrchestrator(unittest.TestCase):
         self.assertEqual(report.realized_pnl_quote, Decimal(10))
         self.assertEqual(report.unrealized_pnl_quote, Decimal(10))
 
+    @patch('hummingbot.connector.markets_recorder.MarketsRecorder.get_instance')
+    def test_generate_performance_report_uses_running_aggregate_of_stored_executors(self, mock_get_instance):
+        config = PositionExecutorConfig(
+            timestamp=1234, trading_pair="ETH-USDT", connector_name="binance",
+            side=TradeType.BUY, amount=Decimal(10), entry_price=Decimal(100),
+        )
+
+        def executor_info(executor_id: str, net_pnl_quote: Decimal) -> ExecutorInfo:
+            return ExecutorInfo(
+                id=executor_id, timestamp=1234, type="position_executor",
+                status=RunnableStatus.TERMINATED, config=config, close_type=CloseType.TAKE_PROFIT,
+                filled_amount_quote=Decimal(100), net_pnl_quote=net_pnl_quote, net_pnl_pct=Decimal(1),
+                cum_fees_quote=Decimal(1), is_trading=False, is_active=False, custom_info={"side": TradeType.BUY}
+            )
+
+        mock_markets_recorder = MagicMock(spec=MarketsRecorder)
+        mock_markets_recorder.get_executors_by_controller.return_value = [executor_info("db", Decimal(5))]
+        mock_get_instance.return_value = mock_markets_recorder
+        in_memory_executor = MagicMock(spec=PositionExecutor)
+        in_memory_executor.config = MagicMock(id="memory")
+        in_memory_executor.is_active = False
+        in_memory_executor.executor_info = executor_info("memory", Decimal(10))
+        self.orchestrator.executors["test"] = [in_memory_executor]
+
+        report = self.orchestrator.generate_performance_report(controller_id="test")
+        self.assertEqual(Decimal(15), report.realized_pnl_quote)
+        self.assertEqual(Decimal(200), report.volume_traded)
+        self.assertEqual({CloseType.TAKE_PROFIT: 2}, report.close_type_counts)
+
+        self.orchestrator.execute_action(StoreExecutorAction(executor_id="memory", controller_id="test"))
+        report = self.orchestrator.generate_performance_report(controller_id="test")
+
+        self.assertEqual(Decimal(15), report.realized_pnl_quote)
+        self.assertEqual(Decimal(200), report.volume_traded)
+        self.assertEqual({CloseType.TAKE_PROFIT: 2}, report.close_type_counts)
+        mock_markets_recorder.get_executors_by_controller.assert_called_once_with("test")
+
     @patch('hummingbot.connector.markets_recorder.MarketsRecorder.get_instance')
     def test_generate_global_performance_report(self, mock_get_instance):
         # Mock MarketsRecorder and its get_executors_by_controller method
@@ -0,0 +1,100 @@
+import asyncio
+from decimal import Decimal
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from unittest.mock import MagicMock, PropertyMock
+
+from hummingbot.connector.exchange_py_base import ExchangePyBase
+from hummingbot.core.data_type.common import PriceType
+from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
+from hummingbot.strategy_v2.executors.data_types import ExecutorConfigBase
+from hummingbot.strategy_v2.executors.executor_base import ExecutorBase
+from hummingbot.strategy_v2.executors.executor_scheduler import ExecutorScheduler
+from hummingbot.strategy_v2.models.base import RunnableStatus
+
+
+class ScheduledExecutor(ExecutorBase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.control_task_calls = 0
+        self.prices = []
+
+    def validate_sufficient_balance(self):
+        pass
+
+    def early_stop(self):
+        self.stop()
+
+    async def control_task(self):
+        self.control_task_calls += 1
+        self.prices.append(self.get_price("connector1", "ETH-USDT", PriceType.MidPrice))
+
+
+class SlowScheduledExecutor(ScheduledExecutor):
+    async def control_task(self):
+        self.control_task_calls += 1
+        await asyncio.sleep(0.2)
+
+
+class TestExecutorScheduler(IsolatedAsyncioWrapperTestCase):
+    def setUp(self):
+        self.strategy = self.create_mock_strategy()
+        self.scheduler = ExecutorScheduler()
+
+    def create_mock_strategy(self):
+        strategy = MagicMock(spec=ScriptStrategyBase)
+        type(strategy).current_timestamp = PropertyMock(return_value=1234567890)
+        self.connector = MagicMock(spec=ExchangePyBase)
+        self.connector.get_price_by_type.return_value = Decimal("1000")
+        strategy.connectors = {"connector1": self.connector}
+        return strategy
+
+    def create_executor(self, executor_id: str, update_interval: float = 0.01) -> ScheduledExecutor:
+        config = ExecutorConfigBase(id=executor_id, type="test", timestamp=1234567890)
+        executor = ScheduledExecutor(strategy=self.strategy, connectors=["connector1"], config=config,
+                                     update_interval=update_interval)
+        executor.scheduler = self.scheduler
+        return executor
+
+    async def test_executors_run_from_shared_scheduler(self):
+        executors = [self.create_executor("1"), self.create_executor("2")]
+        for executor in executors:
+            executor.start()
+
+        self.assertEqual(RunnableStatus.RUNNING, executors[0].status)
+        self.assertTrue(self.scheduler.is_running)
+        await asyncio.sleep(0.05)
+
+        for executor in executors:
+            self.assertGreater(executor.control_task_calls, 1)
+        latencies = self.scheduler.latency_metrics()
+        self.assertEqual({"1", "2"}, set(latencies.keys()))
+        self.assertEqual(executors[0].control_task_calls, latencies["1"].count)
+
+    async def test_terminated_executor_is_removed_and_scheduler_stops(self):
+        executor = self.create_executor("1")
+        executor.on_stop = MagicMock()
+        executor.start()
+        await asyncio.sleep(0.02)
+
+        executor.stop()
+        await asyncio.sleep(0.05)
+
+        executor.on_stop.assert_called_once()
+        self.assertEqual([], self.scheduler.executors)
+        self.assertEqual({}, self.scheduler.latency_metrics())
+        self.assertFalse(self.scheduler.is_running)
+
+    async def test_slow_executor_does_not_delay_the_others(self):
+        config = ExecutorConfigBase(id="slow", type="test", timestamp=1234567890)
+        slow_executor = SlowScheduledExecutor(strategy=self.strategy, connectors=["connector1"], config=config,
+                                              update_interval=0.01)
+        slow_executor.scheduler = self.scheduler
+        fast_executor = self.create_executor("fast")
+        slow_executor.start()
+        fast_executor.start()
+
+        await asyncio.sleep(0.1)
+
+        # The slow executor is not ticked again while its first control task runs
+        self.assertEqual(1, slow_executor.control_task_calls)
+        self.assertGreater(fast_executor.control_task_calls, 3)